@@ -0,0 +1,301 @@
+"""ClaudeExecutor 종단 간 벤치마크
+
+로컬 fake soul-server(seosoyoung.testing.FakeSoulServer)를 띄우고, 실제
+ClaudeExecutor → ClaudeServiceAdapter → SoulServiceClient(SSE) → 프레젠테이션
+콜백 경로로 여러 턴을 동시에 실행합니다. Slack 호출은 기본적으로 기록만 하는
+가짜 클라이언트로 받아내고, --fake-slack이면 실제 slack_sdk WebClient로 fake
+Slack 서버(seosoyoung.testing.FakeSlackServer)를 호출해 응답 지연과 티어별
+rate limit까지 반영합니다.
+
+보고 항목: events/sec, 턴 지연 p50/p99, 최대 RSS, Slack API 호출 수
+(--trace면 단계별 지연 요약도 함께 보고하므로 켜고 끈 결과로 추적 오버헤드를 비교할 수 있습니다)
+
+사용법:
+    python benchmarks/executor_e2e.py --turns 200 --concurrency 16
+    python benchmarks/executor_e2e.py --rate 400 --drop 0.2 --json
+    python benchmarks/executor_e2e.py --recording turn.jsonl
+    python benchmarks/executor_e2e.py --fake-slack --slack-median-ms 40 --slack-p99-ms 400
+    python benchmarks/executor_e2e.py --trace --trace-export traces.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+# clean 모드의 지연 삭제를 즉시 처리 (설정 모듈 없이 실행)
+os.environ.setdefault("SOULSTREAM_EVENT_DELETE_DELAY", "0")
+os.environ.setdefault("SOULSTREAM_THINKING_DELETE_DELAY", "0")
+
+from seosoyoung.slackbot import tracing  # noqa: E402
+from seosoyoung.slackbot.presentation.execution import run_with_event_callbacks  # noqa: E402
+from seosoyoung.slackbot.presentation.types import PresentationContext  # noqa: E402
+from seosoyoung.slackbot.slack.formatting import update_message  # noqa: E402
+from seosoyoung.slackbot.slack.helpers import send_long_message  # noqa: E402
+from seosoyoung.slackbot.soulstream.executor import ClaudeExecutor  # noqa: E402
+from seosoyoung.slackbot.soulstream.service_client import SoulServiceClient  # noqa: E402
+from seosoyoung.slackbot.soulstream.session import SessionManager, SessionRuntime  # noqa: E402
+from seosoyoung.testing import (  # noqa: E402
+    FailurePlan,
+    FakeSlackServer,
+    FakeSoulServer,
+    LatencyModel,
+    RateLimits,
+    StreamProfile,
+    load_recording,
+)
+
+CHANNEL = "CBENCH"
+USER = "UBENCH"
+
+
+class RecordingSlackClient:
+    """Slack WebClient 대용: 호출 수만 세고 고유 ts를 돌려준다"""
+
+    def __init__(self):
+        self.calls: Counter = Counter()
+        self._ts = count(1)
+        self._lock = threading.Lock()
+
+    def _record(self, method: str) -> None:
+        with self._lock:
+            self.calls[method] += 1
+
+    def chat_postMessage(self, **kwargs):
+        self._record("chat.postMessage")
+        with self._lock:
+            ts = f"1800000000.{next(self._ts):06d}"
+        return {"ok": True, "channel": kwargs.get("channel"), "ts": ts}
+
+    def __getattr__(self, name):
+        method = name.replace("_", ".", 1)
+
+        def call(**kwargs):
+            self._record(method)
+            return {"ok": True}
+
+        return call
+
+
+class _BenchExecutor(ClaudeExecutor):
+    """설정 대신 fake soul-server URL로 클라이언트를 만드는 executor"""
+
+    def _get_service_adapter(self):
+        from seosoyoung.slackbot.soulstream.service_adapter import ClaudeServiceAdapter
+
+        return ClaudeServiceAdapter(
+            client=SoulServiceClient(base_url=self.soul_url),
+            parse_markers_fn=self._parse_markers_fn,
+        )
+
+
+class _ServerThread:
+    """fake 서버들을 별도 스레드의 이벤트 루프에서 실행"""
+
+    def __init__(self):
+        self.servers: list = []
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def start(self, server) -> str:
+        url = asyncio.run_coroutine_threadsafe(server.start(), self.loop).result()
+        self.servers.append(server)
+        return url
+
+    def stop(self) -> None:
+        for server in self.servers:
+            asyncio.run_coroutine_threadsafe(server.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+
+def _slack_client(args, server_thread: _ServerThread):
+    """(Slack 클라이언트, FakeSlackServer 또는 None)"""
+    if not args.fake_slack:
+        return RecordingSlackClient(), None
+    from slack_sdk import WebClient
+
+    fake = FakeSlackServer(
+        latency=LatencyModel(median_ms=args.slack_median_ms, p99_ms=args.slack_p99_ms),
+        rate_limits=RateLimits(enabled=args.slack_rate_limits),
+        seed=args.seed,
+    )
+    return WebClient(token="xoxb-fake", base_url=server_thread.start(fake)), fake
+
+
+def _percentile(values: list[float], pct: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def run_benchmark(args) -> dict:
+    profile = StreamProfile(
+        thinking_blocks=args.thinking,
+        text_deltas=args.deltas,
+        delta_size=args.delta_size,
+        tool_calls=args.tools,
+        events_per_second=args.rate,
+    )
+    failures = FailurePlan(drop_probability=args.drop, seed=args.seed)
+    recording = load_recording(args.recording) if args.recording else None
+    server = FakeSoulServer(profile=profile, failures=failures, recording=recording)
+    server_thread = _ServerThread()
+    soul_url = server_thread.start(server)
+    slack, fake_slack = _slack_client(args, server_thread)
+    tracer = tracing.configure(enabled=args.trace, export_path=args.trace_export)
+    workdir = tempfile.TemporaryDirectory(prefix="ssy-bench-")
+    session_manager = SessionManager(session_dir=Path(workdir.name))
+    executor = _BenchExecutor(
+        session_manager=session_manager,
+        session_runtime=SessionRuntime(),
+        restart_manager=None,
+        send_long_message=send_long_message,
+        send_restart_confirmation=lambda **kwargs: None,
+        update_message_fn=update_message,
+        role_tools={"admin": []},
+        soul_url=soul_url,
+    )
+
+    outcomes: list[bool] = []
+    crashes: Counter = Counter()
+    outcomes_lock = threading.Lock()
+
+    def on_result(result, thread_ts, user_message=None):
+        with outcomes_lock:
+            outcomes.append(bool(result.success))
+
+    def run_turn(i: int) -> float:
+        thread_ts = f"1700000000.{i:06d}"
+        session_manager.create(thread_ts=thread_ts, channel_id=CHANNEL, user_id=USER, role="admin")
+
+        def say(text, thread_ts=None, **kwargs):
+            return slack.chat_postMessage(channel=CHANNEL, thread_ts=thread_ts, text=text)
+
+        pctx = PresentationContext(
+            channel=CHANNEL, thread_ts=thread_ts, msg_ts=thread_ts,
+            say=say, client=slack, effective_role="admin",
+        )
+        started = time.perf_counter()
+        try:
+            with tracing.trace("bench.turn"):
+                run_with_event_callbacks(
+                    pctx,
+                    executor.run,
+                    dict(
+                        prompt=f"벤치마크 턴 {i}",
+                        thread_ts=thread_ts,
+                        msg_ts=thread_ts,
+                        presentation=pctx,
+                        role="admin",
+                        on_result=on_result,
+                    ),
+                    mode=args.mode,
+                )
+        except Exception as e:
+            # 예: rate limit에 걸린 placeholder 게시 (봇 클라이언트는 429를 재시도하지 않음)
+            with outcomes_lock:
+                crashes[type(e).__name__] += 1
+        return time.perf_counter() - started
+
+    wall_started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            latencies = list(pool.map(run_turn, range(args.turns)))
+    finally:
+        wall = time.perf_counter() - wall_started
+        server_thread.stop()
+        workdir.cleanup()
+        tracer.close()
+
+    trace_summary = tracer.summary()
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_rss_kb //= 1024
+    return {
+        "turns": args.turns,
+        "concurrency": args.concurrency,
+        "mode": args.mode,
+        "succeeded": sum(outcomes),
+        "failed": args.turns - sum(outcomes),
+        "crashed": dict(crashes),
+        "wall_seconds": round(wall, 3),
+        "events": server.stats["events_sent"],
+        "events_per_sec": round(server.stats["events_sent"] / wall, 1) if wall else 0.0,
+        "turns_per_sec": round(args.turns / wall, 2) if wall else 0.0,
+        "latency_p50_ms": round(_percentile(latencies, 50) * 1000, 1),
+        "latency_p99_ms": round(_percentile(latencies, 99) * 1000, 1),
+        "peak_rss_mb": round(peak_rss_kb / 1024, 1),
+        "slack_calls": dict(fake_slack.calls if fake_slack else slack.calls),
+        "slack_rate_limited": dict(fake_slack.rate_limited) if fake_slack else {},
+        "server": dict(server.stats),
+        "tracing": {key: trace_summary[key] for key in ("spans", "marks")} if args.trace else {},
+    }
+
+
+def _print_report(report: dict) -> None:
+    print(f"turns          {report['turns']} (concurrency {report['concurrency']}, mode {report['mode']})")
+    print(f"succeeded      {report['succeeded']} / failed {report['failed']}")
+    if report["crashed"]:
+        print(f"crashed        {report['crashed']}")
+    print(f"wall           {report['wall_seconds']:.3f}s ({report['turns_per_sec']} turns/s)")
+    print(f"events         {report['events']} ({report['events_per_sec']} events/s)")
+    print(f"latency        p50 {report['latency_p50_ms']}ms / p99 {report['latency_p99_ms']}ms")
+    print(f"peak RSS       {report['peak_rss_mb']} MB")
+    calls = ", ".join(f"{k}={v}" for k, v in sorted(report["slack_calls"].items()))
+    print(f"slack calls    {calls}")
+    if report["slack_rate_limited"]:
+        limited = ", ".join(f"{k}={v}" for k, v in sorted(report["slack_rate_limited"].items()))
+        print(f"slack 429s     {limited}")
+    print(f"soul server    reconnects={report['server']['reconnects']} dropped={report['server']['dropped']}")
+    for kind in ("spans", "marks"):
+        for name, stat in report["tracing"].get(kind, {}).items():
+            print(f"  {name:<24} p50 {stat['p50_ms']}ms / p99 {stat['p99_ms']}ms (n={stat['count']})")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="ClaudeExecutor end-to-end benchmark")
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--mode", choices=("clean", "keep"), default="clean")
+    parser.add_argument("--rate", type=float, default=0, help="턴당 초당 이벤트 수 (0=최대 속도)")
+    parser.add_argument("--thinking", type=int, default=1)
+    parser.add_argument("--deltas", type=int, default=20)
+    parser.add_argument("--delta-size", type=int, default=32)
+    parser.add_argument("--tools", type=int, default=2)
+    parser.add_argument("--drop", type=float, default=0.0, help="스트림 연결을 끊을 확률")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--recording", type=Path, default=None, help="재생할 JSONL 녹화 파일")
+    parser.add_argument("--fake-slack", action="store_true", help="WebClient로 fake Slack 서버 호출")
+    parser.add_argument("--slack-median-ms", type=float, default=0.0)
+    parser.add_argument("--slack-p99-ms", type=float, default=0.0)
+    parser.add_argument("--slack-rate-limits", action="store_true", help="티어별 rate limit 적용")
+    parser.add_argument("--trace", action="store_true", help="턴 지연 추적을 켜고 단계별 요약 보고")
+    parser.add_argument("--trace-export", type=Path, default=None, help="trace JSONL 기록 파일 (--trace와 함께)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    report = run_benchmark(args)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        _print_report(report)
+
+
+if __name__ == "__main__":
+    main()
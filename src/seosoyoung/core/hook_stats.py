@@ -0,0 +1,173 @@
+"""Per-plugin, per-hook dispatch accounting.
+
+``HookStats`` records handler latency into a fixed-bucket histogram and
+counts outcomes (ok / error / timeout / skipped). ``CircuitBreaker`` opens
+after a run of consecutive failures so that a misbehaving handler is
+skipped for a cooldown period instead of delaying every dispatch.
+
+Dispatch runs on several threads at once (one event loop per
+``run_in_new_loop`` call), so both classes guard their state with a
+``threading.Lock``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+# Histogram upper bounds in milliseconds. The last bucket is open-ended.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    closed:    calls pass through; failures are counted.
+    open:      calls are rejected until ``cooldown`` seconds have passed.
+    half-open: after the cooldown one trial call is let through;
+               success closes the breaker, failure re-opens it.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 60.0) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state_locked(time.monotonic())
+
+    def _state_locked(self, now: float) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if now - self._opened_at >= self.cooldown:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed."""
+        if self.threshold <= 0:
+            return True
+        with self._lock:
+            state = self._state_locked(time.monotonic())
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Give back the half-open trial slot without a verdict.
+
+        Used when the trial call ends without success or failure being
+        recorded (e.g. it was cancelled), so the next call can retry.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Record a failure. Returns True if this call opened the breaker."""
+        if self.threshold <= 0:
+            return False
+        with self._lock:
+            was_open = self._opened_at is not None
+            self._failures += 1
+            self._trial_in_flight = False
+            if was_open or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+                return not was_open
+            return False
+
+
+class HookStats:
+    """Latency histogram and outcome counters for one (plugin, hook) pair."""
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        self.breaker = breaker
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.skipped = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ms: float, outcome: str = "ok") -> None:
+        """Record one handler call. ``outcome`` is ok, error or timeout."""
+        index = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self.calls += 1
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+            self.buckets[index] += 1
+            if outcome == "error":
+                self.errors += 1
+            elif outcome == "timeout":
+                self.timeouts += 1
+
+    def record_skip(self) -> None:
+        with self._lock:
+            self.skipped += 1
+
+    def percentile(self, q: float) -> float:
+        """Estimate the q-th percentile (0-100) from the histogram.
+
+        Returns the upper bound of the bucket holding the percentile; the
+        open-ended bucket reports the observed maximum.
+        """
+        with self._lock:
+            if self.calls == 0:
+                return 0.0
+            target = self.calls * q / 100
+            seen = 0
+            for i, count in enumerate(self.buckets):
+                seen += count
+                if seen >= target and count:
+                    if i < len(LATENCY_BUCKETS_MS):
+                        return min(float(LATENCY_BUCKETS_MS[i]), self.max_ms)
+                    return self.max_ms
+            return self.max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON-serializable summary."""
+        p50 = self.percentile(50)
+        p99 = self.percentile(99)
+        with self._lock:
+            mean = self.total_ms / self.calls if self.calls else 0.0
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "timeouts": self.timeouts,
+                "skipped": self.skipped,
+                "mean_ms": round(mean, 2),
+                "p50_ms": round(p50, 2),
+                "p99_ms": round(p99, 2),
+                "max_ms": round(self.max_ms, 2),
+                "histogram": {
+                    **{
+                        f"le_{int(bound)}ms": count
+                        for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)
+                    },
+                    "inf": self.buckets[-1],
+                },
+                "breaker": self.breaker.state,
+            }
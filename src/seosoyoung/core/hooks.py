@@ -6,12 +6,20 @@ This module re-exports from plugin_sdk for backward compatibility.
 
 from seosoyoung.plugin_sdk.hooks import (
     HookContext,
+    HookMode,
     HookPriority,
     HookResult,
+    get_hook_mode,
+    interceptor,
+    observer,
 )
 
 __all__ = [
     "HookContext",
+    "HookMode",
     "HookPriority",
     "HookResult",
+    "get_hook_mode",
+    "interceptor",
+    "observer",
 ]
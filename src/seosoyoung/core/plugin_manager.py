@@ -5,31 +5,139 @@ hook chains. Priority and dependencies are explicit load() parameters.
 
 Notification is delegated to an async callable injected at construction.
 The manager does not know about Slack — it only calls the notifier.
+
+Handlers are interceptors (ordered chain, may STOP or contribute
+results) unless declared observers, which run concurrently on a
+background loop and never delay the caller.
+
+Plugins may declare ``EventFilter`` subscriptions per hook. They are
+precompiled into a per-hook index so that ``should_dispatch`` can reject
+an event no plugin cares about before the caller pays for the async
+bridge.
+
+Every handler call in ``dispatch`` is timed into a per-plugin, per-hook
+histogram. Hooks can be given deadlines, and a circuit breaker skips a
+handler after repeated timeouts or exceptions.
+
+Startup loading (``load_all``) imports plugin modules concurrently in
+worker threads and runs ``on_load`` coroutines in parallel on one loop,
+with per-plugin timeouts. Plugins marked lazy are only registered by
+name and hook list, and are loaded on the first dispatch of one of
+their hooks.
 """
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import importlib
 import logging
 import sys
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable
 
-from seosoyoung.plugin_sdk.hooks import HookContext, HookPriority, HookResult
+from seosoyoung.core.hook_stats import CircuitBreaker, HookStats
+from seosoyoung.plugin_sdk.filters import EventFilter, event_channel
+from seosoyoung.plugin_sdk.hooks import (
+    HookContext,
+    HookMode,
+    HookPriority,
+    HookResult,
+    get_hook_mode,
+)
 from seosoyoung.plugin_sdk.plugin import Plugin
+from seosoyoung.utils.async_bridge import BackgroundLoop
 
 logger = logging.getLogger(__name__)
 
 Notifier = Callable[[str], Awaitable[None]]
 
+DEFAULT_LOAD_TIMEOUT = 30.0
+
+
+@dataclass
+class PluginSpec:
+    """A plugin registry entry, resolved and ready to load.
+
+    Attributes:
+        name: Registry name (must match ``PluginMeta.name``).
+        module: Dotted import path.
+        config: Configuration dict passed to ``on_load()``.
+        priority: Hook execution priority.
+        depends_on: Plugin names that must be loaded first.
+        lazy: Defer loading until one of ``hooks`` is dispatched.
+        hooks: Hook names the plugin handles (required when lazy).
+        timeout: ``on_load`` timeout in seconds (None = manager default).
+    """
+
+    name: str
+    module: str
+    config: dict[str, Any] = field(default_factory=dict)
+    priority: int = HookPriority.NORMAL
+    depends_on: list[str] = field(default_factory=list)
+    lazy: bool = False
+    hooks: list[str] = field(default_factory=list)
+    timeout: float | None = None
+
+
+@dataclass
+class PluginLoadReport:
+    """Outcome and timing of a single plugin load.
+
+    ``status`` is one of ``loaded``, ``lazy``, ``failed``, ``timeout``.
+    """
+
+    name: str
+    module: str
+    status: str = "pending"
+    import_ms: float = 0.0
+    on_load_ms: float = 0.0
+    error: str = ""
+
+    @property
+    def total_ms(self) -> float:
+        return self.import_ms + self.on_load_ms
+
+
+@dataclass(frozen=True)
+class _FilterIndex:
+    """Precompiled subscriptions for one hook.
+
+    ``match_all`` is set when any handler has no filter. Otherwise
+    channel-scoped filters are looked up by channel and the rest are
+    checked in order.
+    """
+
+    match_all: bool
+    by_channel: dict[str, tuple[EventFilter, ...]]
+    any_channel: tuple[EventFilter, ...]
+
 
 class PluginManager:
     """Manages plugin lifecycle and hook dispatch.
 
     Priority and dependencies are explicit ``load()`` parameters,
     not buried in plugin config dicts.
+
+    Args:
+        notifier: Async callable for operator notifications.
+        hook_timeouts: Per-hook handler deadline in seconds. Hooks not
+            listed have no deadline.
+        breaker_threshold: Consecutive failures (errors or timeouts)
+            before a handler is skipped. 0 disables the breaker.
+        breaker_cooldown: Seconds a tripped handler is skipped before a
+            single trial call is allowed.
     """
 
-    def __init__(self, notifier: Notifier | None = None) -> None:
+    def __init__(
+        self,
+        notifier: Notifier | None = None,
+        hook_timeouts: dict[str, float] | None = None,
+        breaker_threshold: int = 5,
+        breaker_cooldown: float = 60.0,
+    ) -> None:
         self._plugins: dict[str, Plugin] = {}
         self._priorities: dict[str, int] = {}
         self._modules: dict[str, str] = {}
@@ -37,12 +145,57 @@ class PluginManager:
         self._depends: dict[str, list[str]] = {}
         self._hook_handlers: dict[str, list[tuple[int, str, Any]]] = {}
         self._notifier = notifier
+        self._lazy: dict[str, PluginSpec] = {}
+        self._lazy_hooks: dict[str, list[str]] = {}
+        # Loop-agnostic: dispatches on other threads' loops wait on these
+        self._lazy_loading: dict[str, concurrent.futures.Future[None]] = {}
+        self._lazy_lock = threading.Lock()
+        self._load_reports: dict[str, PluginLoadReport] = {}
+        self._hook_timeouts = dict(hook_timeouts or {})
+        self._breaker_threshold = breaker_threshold
+        self._breaker_cooldown = breaker_cooldown
+        self._stats: dict[tuple[str, str], HookStats] = {}
+        self._observer_loop = BackgroundLoop(name="plugin-observers")
+        self._observer_pending: set[Any] = set()
+        self._filters: dict[tuple[str, str], EventFilter] = {}
+        self._filter_index: dict[str, _FilterIndex] = {}
+        self._dispatch_counts: dict[str, dict[str, int]] = {}
+        self._counts_lock = threading.Lock()
 
     @property
     def plugins(self) -> dict[str, Plugin]:
         """Snapshot of currently loaded plugins."""
         return dict(self._plugins)
 
+    @property
+    def lazy_plugins(self) -> dict[str, PluginSpec]:
+        """Snapshot of lazy plugins that have not been loaded yet."""
+        return dict(self._lazy)
+
+    @property
+    def load_reports(self) -> dict[str, PluginLoadReport]:
+        """Snapshot of the latest load report per plugin name."""
+        return dict(self._load_reports)
+
+    def hook_stats(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Dispatch statistics as ``{plugin: {hook: summary}}``."""
+        result: dict[str, dict[str, dict[str, Any]]] = {}
+        for (plugin_name, hook_name), stats in list(self._stats.items()):
+            result.setdefault(plugin_name, {})[hook_name] = stats.snapshot()
+        return result
+
+    def _stats_for(self, plugin_name: str, hook_name: str) -> HookStats:
+        key = (plugin_name, hook_name)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats.setdefault(
+                key,
+                HookStats(CircuitBreaker(
+                    self._breaker_threshold, self._breaker_cooldown
+                )),
+            )
+        return stats
+
     async def load(
         self,
         module: str,
@@ -68,19 +221,209 @@ class PluginManager:
         config = config if config is not None else {}
         depends_on = depends_on if depends_on is not None else []
 
+        self._check_dependencies(module, depends_on)
+        mod = await self._import_module(module)
+        return await self._activate(module, mod, config, priority, depends_on)
+
+    async def load_all(
+        self,
+        specs: list[PluginSpec],
+        default_timeout: float | None = DEFAULT_LOAD_TIMEOUT,
+    ) -> list[PluginLoadReport]:
+        """Load plugins concurrently at startup.
+
+        Modules are imported in worker threads and ``on_load`` runs in
+        parallel on the current loop. A plugin waits only for the
+        dependencies that precede it in ``specs`` (the same ordering rule
+        sequential loading imposes). Lazy specs are registered and loaded
+        on first use, unless an eager plugin depends on them.
+
+        Failures do not raise; they are reported per plugin.
+
+        Returns:
+            One report per spec, in ``specs`` order.
+        """
+        eager_deps = {dep for spec in specs if not spec.lazy for dep in spec.depends_on}
+        reports: dict[str, PluginLoadReport] = {}
+        done: dict[str, asyncio.Event] = {}
+        tasks = []
+
+        for spec in specs:
+            if spec.lazy and spec.name not in eager_deps:
+                if spec.hooks:
+                    self.register_lazy(spec)
+                    reports[spec.name] = PluginLoadReport(
+                        spec.name, spec.module, status="lazy"
+                    )
+                    continue
+                logger.warning(
+                    "Lazy plugin %s declares no hooks, loading eagerly", spec.name
+                )
+
+            known = set(done)
+            done[spec.name] = asyncio.Event()
+            report = PluginLoadReport(spec.name, spec.module)
+            reports[spec.name] = report
+            tasks.append(
+                self._load_spec(spec, report, done, known, default_timeout)
+            )
+
+        started = time.perf_counter()
+        await asyncio.gather(*tasks)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        self._load_reports.update(reports)
+        ordered = [reports[spec.name] for spec in specs if spec.name in reports]
+        loaded = sum(1 for r in ordered if r.status == "loaded")
+        logger.info(
+            "Plugins loaded: %d/%d eager in %.0fms (lazy=%d)",
+            loaded,
+            len(tasks),
+            elapsed_ms,
+            sum(1 for r in ordered if r.status == "lazy"),
+        )
+        return ordered
+
+    def register_lazy(self, spec: PluginSpec) -> None:
+        """Register a plugin to be loaded on first dispatch of its hooks."""
+        self._lazy[spec.name] = spec
+        for hook_name in spec.hooks:
+            names = self._lazy_hooks.setdefault(hook_name, [])
+            if spec.name not in names:
+                names.append(spec.name)
+        logger.info(
+            "Plugin registered lazily: %s (hooks=%s)", spec.name, spec.hooks
+        )
+
+    async def _load_spec(
+        self,
+        spec: PluginSpec,
+        report: PluginLoadReport,
+        done: dict[str, asyncio.Event],
+        known: set[str],
+        default_timeout: float | None,
+    ) -> None:
+        """Import, wait for dependencies, and activate a single spec."""
+        timeout = spec.timeout if spec.timeout is not None else default_timeout
+        mod = None
+        try:
+            started = time.perf_counter()
+            mod = await self._import_module(spec.module, threaded=True)
+            report.import_ms = (time.perf_counter() - started) * 1000
+
+            for dep in spec.depends_on:
+                if dep in known:
+                    await done[dep].wait()
+            self._check_dependencies(spec.module, spec.depends_on)
+
+            started = time.perf_counter()
+            try:
+                await self._activate(
+                    spec.module, mod, spec.config, spec.priority,
+                    spec.depends_on, timeout=timeout,
+                )
+            finally:
+                report.on_load_ms = (time.perf_counter() - started) * 1000
+            report.status = "loaded"
+        except asyncio.TimeoutError:
+            report.status = "timeout"
+            report.error = f"on_load exceeded {timeout}s"
+            logger.error("Plugin load timed out: %s (%s)", spec.name, report.error)
+        except Exception as e:
+            if mod is not None:
+                self._cleanup_module(spec.module)
+            report.status = "failed"
+            report.error = str(e)
+            logger.error("Plugin load failed: %s: %s", spec.name, e)
+        finally:
+            done[spec.name].set()
+
+        logger.info(
+            "Plugin load %s: %s import=%.0fms on_load=%.0fms",
+            report.status,
+            spec.name,
+            report.import_ms,
+            report.on_load_ms,
+        )
+
+    async def _load_lazy(self, hook_name: str) -> None:
+        """Load pending lazy plugins that handle ``hook_name``."""
+        for name in list(self._lazy_hooks.get(hook_name, [])):
+            await self._load_lazy_plugin(name, frozenset())
+
+    async def _load_lazy_plugin(self, name: str, chain: frozenset[str]) -> None:
+        """Load one lazy plugin, loading its lazy dependencies first.
+
+        A plugin another dispatch (possibly on another thread's loop) is
+        already loading is awaited rather than loaded twice. Its hooks stay
+        registered as lazy until the load settles, so concurrent dispatches
+        and ``should_dispatch`` keep treating them as pending. ``chain``
+        holds the plugins waiting on this one so a dependency cycle fails
+        the dependency check instead of deadlocking.
+        """
+        with self._lazy_lock:
+            spec = self._lazy.pop(name, None)
+            if spec is None:
+                loading = self._lazy_loading.get(name)
+            else:
+                loading = self._lazy_loading[name] = concurrent.futures.Future()
+        if spec is None:
+            if loading is not None and name not in chain:
+                await asyncio.wrap_future(loading)
+            return
+
+        try:
+            for dep in spec.depends_on:
+                await self._load_lazy_plugin(dep, chain | {name})
+            report = PluginLoadReport(spec.name, spec.module)
+            await self._load_spec(
+                spec, report, {name: asyncio.Event()}, set(), DEFAULT_LOAD_TIMEOUT
+            )
+            self._load_reports[name] = report
+        finally:
+            with self._lazy_lock:
+                for hook in spec.hooks:
+                    names = self._lazy_hooks.get(hook, [])
+                    if name in names:
+                        names.remove(name)
+                    if not names:
+                        self._lazy_hooks.pop(hook, None)
+                del self._lazy_loading[name]
+            loading.set_result(None)
+
+    def _check_dependencies(self, module: str, depends_on: list[str]) -> None:
+        """Raise ValueError if any dependency is not loaded."""
         missing = [dep for dep in depends_on if dep not in self._plugins]
         if missing:
             raise ValueError(
                 f"Missing dependencies for module '{module}': {missing}"
             )
 
+    async def _import_module(self, module: str, threaded: bool = False) -> Any:
+        """Import a plugin module, notifying and cleaning up on failure.
+
+        With ``threaded=True`` the import runs in a worker thread so that
+        several plugin modules can be imported concurrently.
+        """
         try:
-            mod = importlib.import_module(module)
+            if threaded:
+                return await asyncio.to_thread(importlib.import_module, module)
+            return importlib.import_module(module)
         except Exception:
             self._cleanup_module(module)
             await self._notify(f"❌ Plugin load failed (import): `{module}`")
             raise
 
+    async def _activate(
+        self,
+        module: str,
+        mod: Any,
+        config: dict[str, Any],
+        priority: int,
+        depends_on: list[str],
+        timeout: float | None = None,
+    ) -> Plugin:
+        """Instantiate the plugin class in ``mod``, run on_load, register hooks."""
         plugin_cls = self._find_plugin_class(mod)
         if plugin_cls is None:
             self._cleanup_module(module)
@@ -91,7 +434,14 @@ class PluginManager:
 
         try:
             plugin = plugin_cls()
-            await plugin.on_load(config)
+            if timeout is None:
+                await plugin.on_load(config)
+            else:
+                await asyncio.wait_for(plugin.on_load(config), timeout)
+        except asyncio.TimeoutError:
+            self._cleanup_module(module)
+            await self._notify(f"❌ Plugin load failed (on_load timeout): `{module}`")
+            raise
         except Exception:
             self._cleanup_module(module)
             await self._notify(f"❌ Plugin load failed (on_load): `{module}`")
@@ -117,6 +467,11 @@ class PluginManager:
                 key=lambda x: x[0], reverse=True
             )
 
+        for hook_name, event_filter in plugin.register_filters().items():
+            if hook_name in hooks:
+                self._filters[(name, hook_name)] = event_filter
+        self._rebuild_filter_index()
+
         await self._notify(
             f"✅ Plugin loaded: `{name}` v{plugin.meta.version}"
         )
@@ -159,6 +514,12 @@ class PluginManager:
             if not self._hook_handlers[hook_name]:
                 del self._hook_handlers[hook_name]
 
+        for key in [k for k in self._stats if k[0] == name]:
+            del self._stats[key]
+        for key in [k for k in self._filters if k[0] == name]:
+            del self._filters[key]
+        self._rebuild_filter_index()
+
         del self._plugins[name]
         del self._priorities[name]
         del self._modules[name]
@@ -210,29 +571,52 @@ class PluginManager:
     async def dispatch(self, hook_name: str, context: HookContext) -> HookContext:
         """Dispatch a hook through registered handlers in priority order.
 
-        Each handler returns ``(HookResult, value)``:
+        Interceptor handlers (the default) form the chain. Each returns
+        ``(HookResult, value)``:
           - CONTINUE: append value, call next handler.
           - STOP: append value, halt the chain.
           - SKIP: discard value, call next handler.
 
+        Observer handlers (see ``plugin_sdk.hooks.observer``) are started
+        first on a background loop with a copy of the context and are not
+        awaited, so they add no latency and cannot affect the chain.
+
+        If ``context.args["event"]`` is a Slack event, handlers whose
+        ``EventFilter`` rejects it are not called.
+
         Handler exceptions are logged and skipped (do not break the chain).
+        A handler that exceeds the hook's deadline is cancelled and skipped.
+        Handlers whose circuit breaker is open are not called.
+        Lazy plugins handling ``hook_name`` are loaded before the chain runs.
         """
+        if hook_name in self._lazy_hooks:
+            await self._load_lazy(hook_name)
+
         handlers = self._hook_handlers.get(hook_name, [])
+        timeout = self._hook_timeouts.get(hook_name)
 
+        event = context.args.get("event")
+        interceptors = []
         for _priority, plugin_name, handler in handlers:
+            if isinstance(event, dict) and self._filters:
+                event_filter = self._filters.get((plugin_name, hook_name))
+                if event_filter is not None and not event_filter.matches(event):
+                    continue
+            if get_hook_mode(handler) is HookMode.OBSERVER:
+                self._fire_observer(hook_name, plugin_name, handler, context, timeout)
+            else:
+                interceptors.append((plugin_name, handler))
+
+        for plugin_name, handler in interceptors:
             if context.stopped:
                 break
 
-            try:
-                result, value = await handler(context)
-            except Exception:
-                logger.error(
-                    "Hook handler error: hook=%s plugin=%s",
-                    hook_name,
-                    plugin_name,
-                    exc_info=True,
-                )
+            outcome = await self._invoke(
+                hook_name, plugin_name, handler, context, timeout
+            )
+            if outcome is None:
                 continue
+            result, value = outcome
 
             if result == HookResult.CONTINUE:
                 context.results.append(value)
@@ -243,6 +627,192 @@ class PluginManager:
 
         return context
 
+    def has_subscribers(self, hook_name: str) -> bool:
+        """Return True if any loaded or lazy plugin handles ``hook_name``.
+
+        For hooks without a Slack event, where ``should_dispatch`` filters
+        do not apply.
+        """
+        return hook_name in self._lazy_hooks or bool(self._hook_handlers.get(hook_name))
+
+    def should_dispatch(self, hook_name: str, event: dict[str, Any]) -> bool:
+        """Return True if any subscriber of ``hook_name`` wants ``event``.
+
+        Meant to be called on the Slack listener thread before scheduling a
+        dispatch. Skipped and executed decisions are counted per hook.
+        """
+        if hook_name in self._lazy_hooks:
+            wanted = True
+        else:
+            index = self._filter_index.get(hook_name)
+            if index is None:
+                wanted = False
+            elif index.match_all:
+                wanted = True
+            else:
+                candidates = index.by_channel.get(event_channel(event), ())
+                wanted = any(f.matches(event) for f in candidates) or any(
+                    f.matches(event) for f in index.any_channel
+                )
+
+        with self._counts_lock:
+            counts = self._dispatch_counts.setdefault(
+                hook_name, {"executed": 0, "skipped": 0}
+            )
+            counts["executed" if wanted else "skipped"] += 1
+        return wanted
+
+    def dispatch_counts(self) -> dict[str, dict[str, int]]:
+        """``should_dispatch`` decisions as ``{hook: {executed, skipped}}``."""
+        with self._counts_lock:
+            return {hook: dict(c) for hook, c in self._dispatch_counts.items()}
+
+    def _rebuild_filter_index(self) -> None:
+        """Recompute the subscription index after a load or unload."""
+        index: dict[str, _FilterIndex] = {}
+        for hook_name, handlers in self._hook_handlers.items():
+            match_all = False
+            by_channel: dict[str, list[EventFilter]] = {}
+            any_channel: list[EventFilter] = []
+            for _priority, plugin_name, _handler in handlers:
+                event_filter = self._filters.get((plugin_name, hook_name))
+                if event_filter is None:
+                    match_all = True
+                    break
+                if event_filter.channels is None:
+                    any_channel.append(event_filter)
+                else:
+                    for channel in event_filter.channels:
+                        by_channel.setdefault(channel, []).append(event_filter)
+            index[hook_name] = _FilterIndex(
+                match_all=match_all,
+                by_channel={ch: tuple(fs) for ch, fs in by_channel.items()},
+                any_channel=tuple(any_channel),
+            )
+        self._filter_index = index
+
+    async def drain_observers(self, timeout: float | None = None) -> bool:
+        """Wait for in-flight observer handlers to finish.
+
+        Returns:
+            True if all observers finished within ``timeout``.
+        """
+        pending = list(self._observer_pending)
+        if not pending:
+            return True
+        _done, not_done = await asyncio.wait(
+            [asyncio.wrap_future(f) for f in pending], timeout=timeout
+        )
+        return not not_done
+
+    async def shutdown_observers(self, timeout: float | None = None) -> bool:
+        """Drain in-flight observer handlers, then stop their loop.
+
+        Returns:
+            True if all observers finished within ``timeout``.
+        """
+        drained = await self.drain_observers(timeout)
+        if not drained:
+            logger.warning(
+                "Observer handlers still running after %ss, abandoning %d",
+                timeout,
+                len(self._observer_pending),
+            )
+        self._observer_loop.stop()
+        return drained
+
+    def _fire_observer(
+        self,
+        hook_name: str,
+        plugin_name: str,
+        handler: Any,
+        context: HookContext,
+        timeout: float | None,
+    ) -> None:
+        """Start an observer handler on the background loop without waiting."""
+        snapshot = HookContext(hook_name=context.hook_name, args=dict(context.args))
+        future = self._observer_loop.submit(
+            self._invoke(hook_name, plugin_name, handler, snapshot, timeout)
+        )
+        self._observer_pending.add(future)
+        future.add_done_callback(self._observer_pending.discard)
+
+    async def _invoke(
+        self,
+        hook_name: str,
+        plugin_name: str,
+        handler: Any,
+        context: HookContext,
+        timeout: float | None,
+    ) -> tuple[HookResult, Any] | None:
+        """Call one handler with breaker, deadline, and latency accounting.
+
+        Returns:
+            The handler's ``(HookResult, value)``, or None if it was skipped,
+            timed out, or raised.
+        """
+        stats = self._stats_for(plugin_name, hook_name)
+        if not stats.breaker.allow():
+            stats.record_skip()
+            return None
+
+        started = time.perf_counter()
+        settled = False
+        try:
+            if timeout is None:
+                outcome = await handler(context)
+            else:
+                outcome = await asyncio.wait_for(handler(context), timeout)
+            settled = True
+        except asyncio.TimeoutError:
+            settled = True
+            stats.record((time.perf_counter() - started) * 1000, "timeout")
+            logger.warning(
+                "Hook handler timeout: hook=%s plugin=%s (%.1fs)",
+                hook_name,
+                plugin_name,
+                timeout,
+            )
+            await self._record_failure(stats, plugin_name, hook_name)
+            return None
+        except Exception:
+            settled = True
+            stats.record((time.perf_counter() - started) * 1000, "error")
+            logger.error(
+                "Hook handler error: hook=%s plugin=%s",
+                hook_name,
+                plugin_name,
+                exc_info=True,
+            )
+            await self._record_failure(stats, plugin_name, hook_name)
+            return None
+        finally:
+            # A cancelled call (BaseException) records no verdict; free the
+            # half-open trial slot or the breaker stays open for good.
+            if not settled:
+                stats.breaker.release_trial()
+
+        stats.record((time.perf_counter() - started) * 1000)
+        stats.breaker.record_success()
+        return outcome
+
+    async def _record_failure(
+        self, stats: HookStats, plugin_name: str, hook_name: str
+    ) -> None:
+        """Count a handler failure and notify when its breaker trips."""
+        if not stats.breaker.record_failure():
+            return
+        logger.error(
+            "Circuit breaker opened: hook=%s plugin=%s (skipping for %.0fs)",
+            hook_name,
+            plugin_name,
+            self._breaker_cooldown,
+        )
+        await self._notify(
+            f"⚠️ Plugin handler disabled: `{plugin_name}` `{hook_name}` "
+            f"(repeated failures, retry in {self._breaker_cooldown:.0f}s)"
+        )
+
     async def _notify(self, message: str) -> None:
         """Send a notification if a notifier is configured."""
         if self._notifier is None:
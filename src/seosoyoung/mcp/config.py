@@ -15,3 +15,12 @@ WORKSPACE_ROOT = os.getenv(
 )
 
 MAX_FILE_SIZE = 20 * 1024 * 1024  # 20MB
+
+# 스레드 파일 다운로드: 파일당 최대 크기와 동시 다운로드 수
+MAX_DOWNLOAD_SIZE = int(os.getenv("MCP_MAX_DOWNLOAD_SIZE", str(100 * 1024 * 1024)))
+DOWNLOAD_CONCURRENCY = int(os.getenv("MCP_DOWNLOAD_CONCURRENCY", "4"))
+
+# 아바타 캐시: 보관할 최대 이미지 수(LRU), 프로필 스냅샷 유효 시간, 재검증 주기 (초)
+AVATAR_CACHE_MAX_FILES = int(os.getenv("AVATAR_CACHE_MAX_FILES", "200"))
+AVATAR_PROFILE_TTL = float(os.getenv("AVATAR_PROFILE_TTL", "3600"))
+AVATAR_REVALIDATE_AFTER = float(os.getenv("AVATAR_REVALIDATE_AFTER", "86400"))
@@ -1,6 +1,8 @@
 """seosoyoung MCP 서버 정의"""
 
 import logging
+import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
 
@@ -10,15 +12,22 @@ from starlette.responses import JSONResponse
 
 from cogito import Reflector
 
-from seosoyoung.mcp.tools.attach import attach_file
-from seosoyoung.mcp.tools.image_gen import generate_and_upload_image
-from seosoyoung.mcp.tools.slack_messaging import post_message
-from seosoyoung.mcp.tools.thread_files import download_thread_files
-from seosoyoung.mcp.tools.user_profile import download_user_avatar, get_user_profile
-
 logger = logging.getLogger(__name__)
 
-mcp = FastMCP("seosoyoung-attach")
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """서버 종료 시 도구들이 공유한 Slack 세션을 닫음"""
+    try:
+        yield {}
+    finally:
+        # 도구가 한 번도 호출되지 않았으면 slack_client는 import되지 않았다
+        slack_client = sys.modules.get("seosoyoung.mcp.slack_client")
+        if slack_client is not None:
+            await slack_client.close_async_client()
+
+
+mcp = FastMCP("seosoyoung-attach", lifespan=_lifespan)
 
 
 async def _get_tools_compat() -> dict:
@@ -41,6 +50,11 @@ reflect = Reflector(
 
 
 # --- MCP Tools with cogito annotations ---
+#
+# 도구 스키마(시그니처/docstring)는 여기서 바로 선언하지만, 구현 모듈은
+# 첫 호출 때 import한다. openai, slack_sdk, aiohttp 등을 서버 기동 경로에서
+# 빼서 봇 재시작 시 MCP 서버 준비 시간을 줄인다.
+# (tests/mcp/test_mcp_import_time.py가 이 예산을 검사한다)
 
 
 @mcp.tool()
@@ -50,7 +64,7 @@ reflect = Reflector(
     tools=["slack_attach_file"],
 )
 @reflect.config("SLACK_BOT_TOKEN", sensitive=True)
-def slack_attach_file(file_path: str, channel: str, thread_ts: str) -> dict:
+async def slack_attach_file(file_path: str, channel: str, thread_ts: str) -> dict:
     """슬랙에 파일을 첨부합니다.
 
     workspace(slackbot_workspace) 내부 파일만 허용됩니다.
@@ -62,7 +76,9 @@ def slack_attach_file(file_path: str, channel: str, thread_ts: str) -> dict:
         channel: 슬랙 채널 ID
         thread_ts: 스레드 타임스탬프
     """
-    return attach_file(file_path, channel, thread_ts)
+    from seosoyoung.mcp.tools.attach import attach_file
+
+    return await attach_file(file_path, channel, thread_ts)
 
 
 @mcp.tool()
@@ -72,7 +88,7 @@ def slack_attach_file(file_path: str, channel: str, thread_ts: str) -> dict:
     tools=["slack_post_message"],
 )
 @reflect.config("SLACK_BOT_TOKEN", sensitive=True)
-def slack_post_message(
+async def slack_post_message(
     channel: str,
     text: str,
     thread_ts: Optional[str] = None,
@@ -89,7 +105,9 @@ def slack_post_message(
         thread_ts: 스레드 타임스탬프 (선택)
         file_paths: 파일 경로, 쉼표 구분 (선택)
     """
-    return post_message(channel, text, thread_ts or "", file_paths or "")
+    from seosoyoung.mcp.tools.slack_messaging import post_message
+
+    return await post_message(channel, text, thread_ts or "", file_paths or "")
 
 
 @mcp.tool()
@@ -120,6 +138,8 @@ async def slack_generate_image(
         size: 이미지 크기 - "1024x1024"(기본값), "1024x1536", "1536x1024", "auto" (선택)
         quality: 이미지 품질 - "low", "medium", "high" (선택)
     """
+    from seosoyoung.mcp.tools.image_gen import generate_and_upload_image
+
     return await generate_and_upload_image(
         prompt,
         channel,
@@ -147,6 +167,8 @@ async def slack_download_thread_files(channel: str, thread_ts: str) -> dict:
         channel: 슬랙 채널 ID
         thread_ts: 스레드 타임스탬프
     """
+    from seosoyoung.mcp.tools.thread_files import download_thread_files
+
     return await download_thread_files(channel, thread_ts)
 
 
@@ -157,7 +179,7 @@ async def slack_download_thread_files(channel: str, thread_ts: str) -> dict:
     tools=["slack_get_user_profile", "slack_download_user_avatar"],
 )
 @reflect.config("SLACK_BOT_TOKEN", sensitive=True)
-def slack_get_user_profile(user_id: str) -> dict:
+async def slack_get_user_profile(user_id: str) -> dict:
     """Slack 사용자의 프로필 정보를 조회합니다.
 
     display_name, real_name, title, status, email, 프로필 이미지 URL 등을 반환합니다.
@@ -165,7 +187,9 @@ def slack_get_user_profile(user_id: str) -> dict:
     Args:
         user_id: Slack User ID (예: U08HWT0C6K1)
     """
-    return get_user_profile(user_id)
+    from seosoyoung.mcp.tools.user_profile import get_user_profile
+
+    return await get_user_profile(user_id)
 
 
 # NOTE: user_profile capability에 논리적으로 속하지만, cogito는
@@ -183,6 +207,8 @@ async def slack_download_user_avatar(
         user_id: Slack User ID (예: U08HWT0C6K1)
         size: 이미지 크기 (24, 32, 48, 72, 192, 512, 1024). 기본값 512.
     """
+    from seosoyoung.mcp.tools.user_profile import download_user_avatar
+
     return await download_user_avatar(user_id, size)
 
 
@@ -0,0 +1,205 @@
+"""MCP 서버 프로세스 범위 Slack 클라이언트
+
+도구 호출마다 WebClient를 새로 만들지 않고, 프로세스에서 공유하는
+클라이언트를 제공합니다.
+
+- get_async_client(): 이벤트 루프별 AsyncWebClient. aiohttp 세션을 공유하여
+  keep-alive 연결을 재사용합니다.
+- limit(method): Slack 메서드 티어별 동시 호출 수 제한. 한 메서드가 몰려도
+  다른 티어의 호출은 막히지 않습니다.
+- upload_files(): 여러 파일을 동시에 외부 업로드하고 완료 호출은 한 번만 합니다.
+
+asyncio 프리미티브와 aiohttp 세션은 루프에 묶이므로 루프별로 따로 보관합니다.
+FastMCP 서버는 단일 루프에서 동작하므로 실제로는 한 벌만 만들어집니다.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator
+
+import aiohttp
+from slack_sdk.http_retry.async_handler import AsyncRetryHandler
+from slack_sdk.http_retry.builtin_async_handlers import AsyncRateLimitErrorRetryHandler
+from slack_sdk.web.async_client import AsyncWebClient
+
+from seosoyoung.mcp.config import SLACK_BOT_TOKEN
+
+logger = logging.getLogger(__name__)
+
+# 티어별 동시 호출 상한 (Slack Web API 티어: 1=1+/min ... 4=100+/min)
+TIER_CONCURRENCY: dict[int, int] = {1: 1, 2: 2, 3: 5, 4: 10}
+
+# 이 서버가 사용하는 메서드의 티어. 목록에 없는 메서드는 DEFAULT_TIER.
+# chat.postMessage는 "special" 티어(채널당 초당 1건)이지만 채널이 다양하므로 4로 둔다.
+METHOD_TIERS: dict[str, int] = {
+    "chat.postMessage": 4,
+    "chat.update": 3,
+    "conversations.replies": 3,
+    "conversations.history": 3,
+    "files.getUploadURLExternal": 4,
+    "files.completeUploadExternal": 4,
+    "files.upload_v2": 4,
+    "users.info": 4,
+}
+DEFAULT_TIER = 3
+
+# 공유 aiohttp 세션의 연결 풀 크기
+_POOL_SIZE = 32
+
+
+@dataclass
+class _LoopClient:
+    """이벤트 루프 하나에 묶인 비동기 클라이언트와 세션"""
+
+    client: AsyncWebClient
+    session: aiohttp.ClientSession
+
+
+# 루프가 사라지면 항목도 함께 사라지도록 약한 참조로 보관
+_loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_loop_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[int, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def tier_of(method: str) -> int:
+    """Slack 메서드 이름의 티어"""
+    return METHOD_TIERS.get(method, DEFAULT_TIER)
+
+
+def get_async_client() -> AsyncWebClient:
+    """현재 이벤트 루프의 공유 AsyncWebClient 반환 (코루틴 안에서 호출)"""
+    loop = asyncio.get_running_loop()
+    entry = _loop_clients.get(loop)
+    if entry is None or entry.session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=_POOL_SIZE),
+        )
+        retry_handlers: list[AsyncRetryHandler] = [
+            AsyncRateLimitErrorRetryHandler(max_retry_count=2)
+        ]
+        client = AsyncWebClient(
+            token=SLACK_BOT_TOKEN,
+            session=session,
+            retry_handlers=retry_handlers,
+        )
+        entry = _LoopClient(client=client, session=session)
+        _loop_clients[loop] = entry
+    return entry.client
+
+
+@asynccontextmanager
+async def limit(method: str) -> AsyncIterator[None]:
+    """메서드 티어의 동시 호출 슬롯을 점유
+
+    Example::
+
+        async with limit("users.info"):
+            resp = await client.users_info(user=user_id)
+    """
+    loop = asyncio.get_running_loop()
+    semaphores = _loop_semaphores.setdefault(loop, {})
+    tier = tier_of(method)
+    semaphore = semaphores.get(tier)
+    if semaphore is None:
+        semaphore = semaphores.setdefault(
+            tier, asyncio.Semaphore(TIER_CONCURRENCY.get(tier, 1))
+        )
+    async with semaphore:
+        yield
+
+
+async def close_async_client() -> None:
+    """현재 루프의 공유 세션을 닫음 (종료 시/테스트 정리용)"""
+    loop = asyncio.get_running_loop()
+    entry = _loop_clients.pop(loop, None)
+    if entry is not None and not entry.session.closed:
+        await entry.session.close()
+
+
+@dataclass
+class UploadResult:
+    """upload_files의 파일별 결과"""
+
+    path: Path
+    file_id: str = ""
+    error: str = ""
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+async def _stream_upload(client: AsyncWebClient, url: str, path: Path) -> None:
+    """발급받은 업로드 URL로 파일을 스트리밍 전송
+
+    파일 객체를 그대로 넘기면 aiohttp가 청크 단위로 읽어 보내므로
+    파일 전체를 메모리에 올리지 않습니다.
+    """
+    with path.open("rb") as fp:
+        async with client.session.post(url, data=fp) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                raise RuntimeError(f"업로드 실패 (status={resp.status}): {body[:200]}")
+
+
+async def _upload_one(client: AsyncWebClient, path: Path) -> UploadResult:
+    result = UploadResult(path=path)
+    start = time.perf_counter()
+    try:
+        async with limit("files.getUploadURLExternal"):
+            url_resp = await client.files_getUploadURLExternal(
+                filename=path.name, length=path.stat().st_size
+            )
+        async with limit("files.upload_v2"):
+            await _stream_upload(client, url_resp["upload_url"], path)
+        result.file_id = url_resp["file_id"]
+    except Exception as e:
+        result.error = str(e)
+    result.elapsed_ms = (time.perf_counter() - start) * 1000
+    return result
+
+
+async def upload_files(
+    client: AsyncWebClient,
+    paths: list[Path],
+    channel: str,
+    thread_ts: str = "",
+) -> list[UploadResult]:
+    """여러 파일을 동시에 업로드하고 한 번의 completeUploadExternal로 게시
+
+    파일별 URL 발급/전송은 병렬로 진행하고, 성공한 파일만 모아 완료
+    호출을 한 번 보냅니다. 완료 호출이 실패하면 해당 파일 모두 실패로
+    기록합니다. 결과는 paths와 같은 순서입니다.
+    """
+    if not paths:
+        return []
+    results = list(await asyncio.gather(*(_upload_one(client, p) for p in paths)))
+
+    done = [r for r in results if r.ok]
+    if done:
+        start = time.perf_counter()
+        kwargs: dict = {
+            "files": [{"id": r.file_id, "title": r.path.name} for r in done],
+            "channel_id": channel,
+        }
+        if thread_ts:
+            kwargs["thread_ts"] = thread_ts
+        try:
+            async with limit("files.completeUploadExternal"):
+                await client.files_completeUploadExternal(**kwargs)
+        except Exception as e:
+            for r in done:
+                r.error = f"completeUploadExternal 실패: {e}"
+        complete_ms = (time.perf_counter() - start) * 1000
+        for r in done:
+            r.elapsed_ms += complete_ms
+    return results
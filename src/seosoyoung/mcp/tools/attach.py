@@ -4,20 +4,20 @@ import logging
 import os
 from pathlib import Path
 
-from slack_sdk import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
 
+from seosoyoung.mcp import slack_client
 from seosoyoung.mcp.config import (
     MAX_FILE_SIZE,
-    SLACK_BOT_TOKEN,
     WORKSPACE_ROOT,
 )
 
 logger = logging.getLogger(__name__)
 
 
-def _get_slack_client() -> WebClient:
-    """Slack WebClient 인스턴스 반환"""
-    return WebClient(token=SLACK_BOT_TOKEN)
+def _get_async_slack_client() -> AsyncWebClient:
+    """프로세스 공유 Slack AsyncWebClient 반환"""
+    return slack_client.get_async_client()
 
 
 def get_slack_context() -> dict:
@@ -32,48 +32,62 @@ def get_slack_context() -> dict:
     }
 
 
-def attach_file(file_path: str, channel: str, thread_ts: str) -> dict:
-    """슬랙에 파일을 첨부
-
-    Args:
-        file_path: 첨부할 파일의 절대 경로
-        channel: 슬랙 채널 ID
-        thread_ts: 스레드 타임스탬프
-
-    Returns:
-        dict: success(bool), message(str) 키를 포함하는 결과 딕셔너리
-    """
+def _resolve_attachment(file_path: str) -> tuple[Path | None, str | None]:
+    """첨부 대상 파일 검증. (resolved 경로, None) 또는 (None, 에러 메시지) 반환"""
     resolved = Path(file_path).resolve()
 
     if not resolved.exists():
-        return {"success": False, "message": f"파일이 존재하지 않음: {file_path}"}
+        return None, f"파일이 존재하지 않음: {file_path}"
 
     if not resolved.is_file():
-        return {"success": False, "message": f"파일이 아님: {file_path}"}
+        return None, f"파일이 아님: {file_path}"
 
     # workspace 내부 파일만 허용
     workspace = Path(WORKSPACE_ROOT).resolve()
     try:
         resolved.relative_to(workspace)
     except ValueError:
-        return {"success": False, "message": f"workspace 외부 파일은 허용되지 않음: {file_path}"}
+        return None, f"workspace 외부 파일은 허용되지 않음: {file_path}"
 
     # 파일 크기 검증
     file_size = resolved.stat().st_size
     if file_size > MAX_FILE_SIZE:
         size_mb = file_size / (1024 * 1024)
-        return {"success": False, "message": f"파일 크기 초과: {size_mb:.1f}MB (최대 20MB)"}
+        return None, f"파일 크기 초과: {size_mb:.1f}MB (최대 20MB)"
+
+    return resolved, None
+
+
+def _upload_kwargs(resolved: Path, channel: str, thread_ts: str) -> dict:
+    return {
+        "channel": channel,
+        "thread_ts": thread_ts,
+        "file": str(resolved),
+        "filename": resolved.name,
+        "initial_comment": f"📎 `{resolved.name}`",
+    }
+
+
+async def attach_file(file_path: str, channel: str, thread_ts: str) -> dict:
+    """슬랙에 파일을 첨부
+
+    Args:
+        file_path: 첨부할 파일의 절대 경로
+        channel: 슬랙 채널 ID
+        thread_ts: 스레드 타임스탬프
+
+    Returns:
+        dict: success(bool), message(str) 키를 포함하는 결과 딕셔너리
+    """
+    resolved, error = _resolve_attachment(file_path)
+    if error:
+        return {"success": False, "message": error}
 
     # 슬랙 업로드
     try:
-        client = _get_slack_client()
-        client.files_upload_v2(
-            channel=channel,
-            thread_ts=thread_ts,
-            file=str(resolved),
-            filename=resolved.name,
-            initial_comment=f"📎 `{resolved.name}`",
-        )
+        client = _get_async_slack_client()
+        async with slack_client.limit("files.upload_v2"):
+            await client.files_upload_v2(**_upload_kwargs(resolved, channel, thread_ts))
         logger.info(f"파일 첨부 성공: {file_path}")
         return {"success": True, "message": f"첨부 완료: {resolved.name}"}
     except Exception as e:
@@ -2,23 +2,40 @@
 
 OpenAI gpt-image-2 API를 호출하여 이미지를 생성하고, 슬랙 스레드에 업로드합니다.
 레퍼런스 이미지를 함께 전달하면 images.edit() 엔드포인트로 처리합니다.
+
+이미지 백엔드는 IMAGE_GEN_BACKEND 환경변수로 고릅니다.
+- openai (기본): 프로세스 수명 동안 AsyncOpenAI 클라이언트 하나를 재사용
+- stub: 네트워크 없이 고정 PNG를 반환 (오프라인 벤치마크/개발용)
 """
 
+import asyncio
 import base64
 import logging
 import os
+import struct
 import time
+import uuid
+import weakref
+import zlib
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Protocol
 
 from openai import AsyncOpenAI
-from slack_sdk import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
 
-from seosoyoung.mcp.config import SLACK_BOT_TOKEN
+from seosoyoung.mcp import slack_client
 
 _OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 _MODEL = "gpt-image-2"
+_BACKEND_NAME = os.environ.get("IMAGE_GEN_BACKEND", "openai")
+# 동시 생성 상한 (이미지 API는 호출당 수십 초가 걸리고 응답이 수 MB)
+_CONCURRENCY = int(os.environ.get("IMAGE_GEN_CONCURRENCY", "2"))
+# stub 백엔드의 인위적 지연 (초)
+_STUB_LATENCY = float(os.environ.get("IMAGE_GEN_STUB_LATENCY", "0"))
+
+# base64 디코딩 청크 크기 (4의 배수여야 경계에서 잘리지 않음)
+_B64_CHUNK = 64 * 1024
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +52,133 @@ VALID_SIZES = {"1024x1024", "1024x1536", "1536x1024", "auto"}
 VALID_QUALITIES = {"low", "medium", "high"}
 
 
+def _get_async_slack_client() -> AsyncWebClient:
+    """프로세스 공유 Slack AsyncWebClient 반환"""
+    return slack_client.get_async_client()
+
+
+class ImageBackend(Protocol):
+    """이미지 생성 백엔드. 두 메서드 모두 base64 PNG 문자열을 반환"""
+
+    async def generate(self, **kwargs: Any) -> str: ...
+
+    async def edit(self, **kwargs: Any) -> str: ...
+
+
+def _first_b64(response: Any) -> str:
+    """OpenAI images 응답에서 첫 이미지의 base64 데이터 추출"""
+    if not response.data:
+        raise RuntimeError("OpenAI API가 빈 응답을 반환했습니다.")
+    b64_json = response.data[0].b64_json
+    if not b64_json:
+        raise RuntimeError("OpenAI API 응답에서 이미지 데이터를 찾을 수 없습니다.")
+    return b64_json
+
+
+class OpenAIImageBackend:
+    """AsyncOpenAI 클라이언트를 재사용하는 백엔드 (연결 풀 유지)"""
+
+    def __init__(self) -> None:
+        self._client: AsyncOpenAI | None = None
+
+    def _get_client(self) -> AsyncOpenAI:
+        if not _OPENAI_API_KEY:
+            raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
+        if self._client is None:
+            self._client = AsyncOpenAI(api_key=_OPENAI_API_KEY)
+        return self._client
+
+    async def generate(self, **kwargs: Any) -> str:
+        response = await self._get_client().images.generate(model=_MODEL, **kwargs)
+        return _first_b64(response)
+
+    async def edit(self, **kwargs: Any) -> str:
+        response = await self._get_client().images.edit(model=_MODEL, **kwargs)
+        return _first_b64(response)
+
+
+def _stub_png() -> bytes:
+    """1x1 PNG 바이트 생성"""
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data)) + tag + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+        )
+
+    ihdr = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+    idat = zlib.compress(b"\x00\xff\x99\x33")
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr) + chunk(b"IDAT", idat) + chunk(b"IEND", b"")
+
+
+class StubImageBackend:
+    """네트워크 없이 고정 PNG를 반환하는 백엔드
+
+    latency만큼 대기하여 실제 API 호출 시간을 흉내 냅니다.
+    """
+
+    def __init__(self, latency: float = 0.0, payload: bytes | None = None) -> None:
+        self.latency = latency
+        self._b64 = base64.b64encode(payload or _stub_png()).decode()
+        self.calls = 0
+
+    async def generate(self, **kwargs: Any) -> str:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._b64
+
+    async def edit(self, **kwargs: Any) -> str:
+        return await self.generate(**kwargs)
+
+
+_backend: ImageBackend | None = None
+
+
+def get_backend() -> ImageBackend:
+    """프로세스 공유 이미지 백엔드 반환 (IMAGE_GEN_BACKEND로 선택)"""
+    global _backend
+    if _backend is None:
+        if _BACKEND_NAME == "stub":
+            _backend = StubImageBackend(latency=_STUB_LATENCY)
+        else:
+            _backend = OpenAIImageBackend()
+    return _backend
+
+
+def set_backend(backend: ImageBackend | None) -> None:
+    """이미지 백엔드 교체 (None이면 다음 호출 때 환경변수로 다시 선택)"""
+    global _backend
+    _backend = backend
+
+
+_generation_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _generation_slot() -> asyncio.Semaphore:
+    """현재 루프의 동시 생성 제한 세마포어"""
+    loop = asyncio.get_running_loop()
+    slot = _generation_slots.get(loop)
+    if slot is None:
+        slot = _generation_slots.setdefault(loop, asyncio.Semaphore(max(1, _CONCURRENCY)))
+    return slot
+
+
+def _decode_to_file(b64_data: str, file_path: Path) -> int:
+    """base64 문자열을 청크 단위로 디코딩하며 파일에 기록, 기록한 바이트 수 반환
+
+    디코딩된 전체 바이트열을 메모리에 따로 만들지 않습니다.
+    """
+    written = 0
+    with open(file_path, "wb") as f:
+        for i in range(0, len(b64_data), _B64_CHUNK):
+            chunk = base64.b64decode(b64_data[i:i + _B64_CHUNK])
+            f.write(chunk)
+            written += len(chunk)
+    return written
+
+
 @dataclass
 class GeneratedImage:
     """생성된 이미지 결과"""
@@ -80,9 +224,6 @@ async def generate_image(
         ValueError: API 키가 설정되지 않은 경우, 또는 잘못된 파라미터
         RuntimeError: 이미지 생성에 실패한 경우
     """
-    if not _OPENAI_API_KEY:
-        raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
-
     if size and size not in VALID_SIZES:
         raise ValueError(
             f"지원하지 않는 이미지 크기: {size}. "
@@ -101,60 +242,29 @@ async def generate_image(
         f"{f', quality={quality}' if quality else ''}"
     )
 
-    client = AsyncOpenAI(api_key=_OPENAI_API_KEY)
+    backend = get_backend()
+    options = {"prompt": prompt, "n": 1, "size": size or "auto", "quality": quality or "auto"}
 
-    # 레퍼런스 이미지가 있으면 images.edit() 사용
-    if reference_images:
-        validated_paths = _validate_reference_images(reference_images)
+    async with _generation_slot():
+        # 레퍼런스 이미지가 있으면 images.edit() 사용
+        validated_paths = _validate_reference_images(reference_images) if reference_images else []
         if validated_paths:
             logger.info(f"레퍼런스 이미지 {len(validated_paths)}개 포함하여 요청")
             image_files = [open(p, "rb") for p in validated_paths]
             try:
-                response = await client.images.edit(
-                    model=_MODEL,
-                    image=image_files,
-                    prompt=prompt,
-                    n=1,
-                    size=size or "auto",
-                    quality=quality or "auto",
-                )
+                b64_json = await backend.edit(image=image_files, **options)
             finally:
                 for f in image_files:
                     f.close()
         else:
-            # 유효한 레퍼런스가 없으면 text-to-image 폴백
-            response = await client.images.generate(
-                model=_MODEL,
-                prompt=prompt,
-                n=1,
-                size=size or "auto",
-                quality=quality or "auto",
-            )
-    else:
-        # text-to-image
-        response = await client.images.generate(
-            model=_MODEL,
-            prompt=prompt,
-            n=1,
-            size=size or "auto",
-            quality=quality or "auto",
-        )
-
-    # 응답에서 이미지 데이터 추출
-    if not response.data:
-        raise RuntimeError("OpenAI API가 빈 응답을 반환했습니다.")
-
-    b64_json = response.data[0].b64_json
-    if not b64_json:
-        raise RuntimeError("OpenAI API 응답에서 이미지 데이터를 찾을 수 없습니다.")
-
-    image_bytes = base64.b64decode(b64_json)
+            # text-to-image (유효한 레퍼런스가 없을 때의 폴백 포함)
+            b64_json = await backend.generate(**options)
 
     IMAGE_GEN_DIR.mkdir(parents=True, exist_ok=True)
-    filename = f"generated_{int(time.time() * 1000)}.png"
+    filename = f"generated_{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}.png"
     file_path = IMAGE_GEN_DIR / filename
-    file_path.write_bytes(image_bytes)
-    logger.info(f"이미지 저장 완료: {file_path} (image/png, {len(image_bytes)} bytes)")
+    size_bytes = await asyncio.to_thread(_decode_to_file, b64_json, file_path)
+    logger.info(f"이미지 저장 완료: {file_path} (image/png, {size_bytes} bytes)")
 
     return GeneratedImage(
         path=file_path,
@@ -204,14 +314,15 @@ async def generate_and_upload_image(
 
     # 슬랙 업로드
     try:
-        client = WebClient(token=SLACK_BOT_TOKEN)
-        client.files_upload_v2(
-            channel=channel,
-            thread_ts=thread_ts,
-            file=str(generated.path),
-            filename=generated.path.name,
-            initial_comment=f"\U0001f3a8 `{prompt[:80]}`",
-        )
+        client = _get_async_slack_client()
+        async with slack_client.limit("files.upload_v2"):
+            await client.files_upload_v2(
+                channel=channel,
+                thread_ts=thread_ts,
+                file=str(generated.path),
+                filename=generated.path.name,
+                initial_comment=f"\U0001f3a8 `{prompt[:80]}`",
+            )
         file_name = generated.path.name
         logger.info(f"이미지 생성 및 업로드 성공: {file_name}")
     except Exception as e:
@@ -3,20 +3,20 @@
 import logging
 from pathlib import Path
 
-from slack_sdk import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
 
+from seosoyoung.mcp import slack_client
 from seosoyoung.mcp.config import (
     MAX_FILE_SIZE,
-    SLACK_BOT_TOKEN,
     WORKSPACE_ROOT,
 )
 
 logger = logging.getLogger(__name__)
 
 
-def _get_slack_client() -> WebClient:
-    """Slack WebClient 인스턴스 반환"""
-    return WebClient(token=SLACK_BOT_TOKEN)
+def _get_async_slack_client() -> AsyncWebClient:
+    """프로세스 공유 Slack AsyncWebClient 반환"""
+    return slack_client.get_async_client()
 
 
 def _validate_file(file_path: str) -> str | None:
@@ -43,7 +43,40 @@ def _validate_file(file_path: str) -> str | None:
     return None
 
 
-def post_message(
+def _parse_file_paths(file_paths: str) -> tuple[list[Path], str | None]:
+    """쉼표 구분 파일 경로를 검증하여 (경로 목록, 에러 메시지) 반환"""
+    files_to_upload: list[Path] = []
+    if file_paths.strip():
+        for fp in file_paths.split(","):
+            fp = fp.strip()
+            if not fp:
+                continue
+            error = _validate_file(fp)
+            if error:
+                return [], error
+            files_to_upload.append(Path(fp).resolve())
+    return files_to_upload, None
+
+
+def _message_kwargs(channel: str, text: str, thread_ts: str) -> dict:
+    msg_kwargs: dict = {"channel": channel, "text": text}
+    if thread_ts:
+        msg_kwargs["thread_ts"] = thread_ts
+    return msg_kwargs
+
+
+def _build_result(msg_ts: str, uploaded_files: list[str], file_errors: list[str]) -> dict:
+    """전송/업로드 결과 딕셔너리 조립"""
+    result: dict = {"success": True, "message": f"메시지 전송 완료 (ts: {msg_ts})"}
+    if uploaded_files:
+        result["uploaded_files"] = uploaded_files
+    if file_errors:
+        result["file_errors"] = file_errors
+        result["message"] += f" / 파일 업로드 실패: {', '.join(file_errors)}"
+    return result
+
+
+async def post_message(
     channel: str,
     text: str,
     thread_ts: str = "",
@@ -51,6 +84,9 @@ def post_message(
 ) -> dict:
     """슬랙 채널에 메시지를 전송하고 선택적으로 파일을 첨부
 
+    첨부 파일은 slack_client.upload_files로 병렬 업로드하며, 결과에
+    파일별 소요 시간(file_timings_ms)을 함께 담습니다.
+
     Args:
         channel: 채널 ID (필수)
         text: 메시지 텍스트 (필수)
@@ -61,57 +97,43 @@ def post_message(
         dict: success(bool), message(str) 키를 포함하는 결과 딕셔너리
     """
     # 파일 경로 파싱 및 검증 (파일이 있으면 먼저 검증)
-    files_to_upload: list[Path] = []
-    if file_paths.strip():
-        for fp in file_paths.split(","):
-            fp = fp.strip()
-            if not fp:
-                continue
-            error = _validate_file(fp)
-            if error:
-                return {"success": False, "message": error}
-            files_to_upload.append(Path(fp).resolve())
+    files_to_upload, error = _parse_file_paths(file_paths)
+    if error:
+        return {"success": False, "message": error}
 
     try:
-        client = _get_slack_client()
+        client = _get_async_slack_client()
 
         # 텍스트 메시지 전송
-        msg_kwargs: dict = {"channel": channel, "text": text}
-        if thread_ts:
-            msg_kwargs["thread_ts"] = thread_ts
-
-        response = client.chat_postMessage(**msg_kwargs)
+        async with slack_client.limit("chat.postMessage"):
+            response = await client.chat_postMessage(
+                **_message_kwargs(channel, text, thread_ts)
+            )
         msg_ts = response.get("ts", "")
 
-        # 파일 첨부
         file_errors: list[str] = []
         uploaded_files: list[str] = []
+        file_timings: dict[str, float] = {}
         # 파일은 메시지의 스레드에 첨부 (thread_ts가 있으면 그 스레드, 없으면 방금 보낸 메시지의 ts)
         attach_thread_ts = thread_ts or msg_ts
 
-        for resolved in files_to_upload:
-            try:
-                client.files_upload_v2(
-                    channel=channel,
-                    thread_ts=attach_thread_ts,
-                    file=str(resolved),
-                    filename=resolved.name,
-                )
-                uploaded_files.append(resolved.name)
-                logger.info(f"파일 업로드 성공: {resolved.name}")
-            except Exception as e:
-                error_msg = f"{resolved.name}: {e}"
+        # URL 발급/전송은 파일별로 병렬, 완료 호출은 한 번
+        results = await slack_client.upload_files(
+            client, files_to_upload, channel, attach_thread_ts
+        )
+        for r in results:
+            file_timings[r.path.name] = round(r.elapsed_ms, 1)
+            if r.ok:
+                uploaded_files.append(r.path.name)
+                logger.info(f"파일 업로드 성공: {r.path.name} ({r.elapsed_ms:.0f}ms)")
+            else:
+                error_msg = f"{r.path.name}: {r.error}"
                 file_errors.append(error_msg)
                 logger.error(f"파일 업로드 실패: {error_msg}")
 
-        # 결과 조립
-        result: dict = {"success": True, "message": f"메시지 전송 완료 (ts: {msg_ts})"}
-        if uploaded_files:
-            result["uploaded_files"] = uploaded_files
-        if file_errors:
-            result["file_errors"] = file_errors
-            result["message"] += f" / 파일 업로드 실패: {', '.join(file_errors)}"
-
+        result = _build_result(msg_ts, uploaded_files, file_errors)
+        if file_timings:
+            result["file_timings_ms"] = file_timings
         return result
 
     except Exception as e:
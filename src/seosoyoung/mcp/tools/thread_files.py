@@ -1,27 +1,53 @@
 """스레드 내 파일 다운로드 MCP 도구"""
 
+import asyncio
 import logging
 from typing import Any
 
-from slack_sdk import WebClient
+import httpx
+from slack_sdk.web.async_client import AsyncWebClient
 
-from seosoyoung.mcp.config import SLACK_BOT_TOKEN
-from seosoyoung.slackbot.slack.file_handler import download_file
+from seosoyoung.mcp import slack_client
+from seosoyoung.mcp.config import DOWNLOAD_CONCURRENCY, MAX_DOWNLOAD_SIZE
+from seosoyoung.slackbot.slack.file_handler import FileFetchError, fetch_file
 
 logger = logging.getLogger(__name__)
 
+# conversations.replies 페이지 크기 (Slack 권장 최대 200)
+REPLIES_PAGE_SIZE = 200
 
-def _get_slack_client() -> WebClient:
-    """Slack WebClient 인스턴스 반환"""
-    return WebClient(token=SLACK_BOT_TOKEN)
+
+def _get_async_slack_client() -> AsyncWebClient:
+    """프로세스 공유 Slack AsyncWebClient 반환"""
+    return slack_client.get_async_client()
+
+
+async def _fetch_thread_messages(
+    client: AsyncWebClient, channel: str, thread_ts: str
+) -> list[dict]:
+    """conversations.replies를 커서 끝까지 따라가며 스레드 메시지 전체 조회"""
+    messages: list[dict] = []
+    cursor = ""
+    while True:
+        kwargs: dict[str, Any] = {"channel": channel, "ts": thread_ts, "limit": REPLIES_PAGE_SIZE}
+        if cursor:
+            kwargs["cursor"] = cursor
+        async with slack_client.limit("conversations.replies"):
+            response = await client.conversations_replies(**kwargs)
+        messages.extend(response.get("messages", []))
+        cursor = (response.get("response_metadata") or {}).get("next_cursor", "")
+        if not cursor:
+            return messages
 
 
 async def download_thread_files(channel: str, thread_ts: str) -> dict[str, Any]:
     """스레드 내 모든 메시지의 첨부 파일을 다운로드
 
-    Slack conversations.replies API로 스레드 메시지를 조회하고,
-    파일이 있는 메시지에서 파일을 다운로드합니다.
-    기존 slack/file_handler.py의 download_file()을 재활용합니다.
+    Slack conversations.replies API로 스레드 메시지를 페이지 끝까지 조회하고,
+    파일이 있는 메시지에서 파일을 병렬로 다운로드합니다
+    (동시 DOWNLOAD_CONCURRENCY개, 파일당 최대 MAX_DOWNLOAD_SIZE).
+    이미 받은 파일(같은 file_id, 같은 크기)은 다시 받지 않습니다.
+    일부 파일이 실패해도 성공한 파일 목록은 그대로 반환합니다.
 
     Args:
         channel: 슬랙 채널 ID
@@ -30,26 +56,23 @@ async def download_thread_files(channel: str, thread_ts: str) -> dict[str, Any]:
     Returns:
         {
             success: bool,
-            files: [{ local_path, original_name, size, file_type, message_ts }],
+            files: [{ local_path, original_name, size, file_type, message_ts, cached }],
+            failures: [{ original_name, message_ts, error }],
             message: str
         }
     """
     try:
-        client = _get_slack_client()
-        response = client.conversations_replies(
-            channel=channel,
-            ts=thread_ts,
-        )
+        client = _get_async_slack_client()
+        messages = await _fetch_thread_messages(client, channel, thread_ts)
     except Exception as e:
         logger.error(f"스레드 메시지 조회 실패: channel={channel}, ts={thread_ts}, error={e}")
         return {
             "success": False,
             "files": [],
+            "failures": [],
             "message": f"스레드 메시지 조회 실패: {e}",
         }
 
-    messages = response.get("messages", [])
-
     # 파일이 있는 메시지에서 파일 정보 수집
     file_entries: list[tuple[str, dict]] = []  # (message_ts, file_info)
     for msg in messages:
@@ -61,24 +84,54 @@ async def download_thread_files(channel: str, thread_ts: str) -> dict[str, Any]:
         return {
             "success": True,
             "files": [],
+            "failures": [],
             "message": "스레드에 파일 없음",
         }
 
-    # 파일 다운로드
-    downloaded = []
-    for msg_ts, file_info in file_entries:
-        result = await download_file(file_info, thread_ts)
-        if result:
-            downloaded.append({
-                "local_path": result["local_path"],
-                "original_name": result["original_name"],
-                "size": result["size"],
-                "file_type": result["file_type"],
-                "message_ts": msg_ts,
-            })
+    semaphore = asyncio.Semaphore(max(1, DOWNLOAD_CONCURRENCY))
+
+    async def fetch(msg_ts: str, file_info: dict, http: httpx.AsyncClient) -> dict:
+        async with semaphore:
+            try:
+                result, cached = await fetch_file(
+                    file_info, thread_ts, http, max_size=MAX_DOWNLOAD_SIZE
+                )
+            except Exception as e:
+                # 예상 밖 오류도 이 파일의 실패로만 기록해 나머지 결과를 살린다
+                if isinstance(e, FileFetchError):
+                    logger.warning(f"파일 다운로드 실패: {file_info.get('name')} - {e}")
+                else:
+                    logger.exception(f"파일 다운로드 오류: {file_info.get('name')} - {e}")
+                return {
+                    "original_name": file_info.get("name", "unknown"),
+                    "message_ts": msg_ts,
+                    "error": str(e),
+                }
+        return {
+            "local_path": result["local_path"],
+            "original_name": result["original_name"],
+            "size": result["size"],
+            "file_type": result["file_type"],
+            "message_ts": msg_ts,
+            "cached": cached,
+        }
+
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=max(1, DOWNLOAD_CONCURRENCY)),
+    ) as http:
+        outcomes = await asyncio.gather(
+            *(fetch(msg_ts, file_info, http) for msg_ts, file_info in file_entries)
+        )
+
+    downloaded = [o for o in outcomes if "error" not in o]
+    failures = [o for o in outcomes if "error" in o]
 
+    message = f"{len(downloaded)}개 파일 다운로드 완료"
+    if failures:
+        message += f" / {len(failures)}개 실패"
     return {
         "success": True,
         "files": downloaded,
-        "message": f"{len(downloaded)}개 파일 다운로드 완료",
+        "failures": failures,
+        "message": message,
     }
@@ -1,14 +1,34 @@
-"""Slack 사용자 프로필 조회 및 아바타 다운로드 MCP 도구"""
+"""Slack 사용자 프로필 조회 및 아바타 다운로드 MCP 도구
 
+아바타는 AVATAR_DIR에 캐시합니다.
+- {user}_{size}.{ext}: 이미지
+- {user}_{size}.meta.json: 원본 URL, ETag, Last-Modified, 마지막 검증 시각
+- {user}.profile.json: 프로필 스냅샷 (AVATAR_PROFILE_TTL 동안 users.info 생략)
+
+Slack 아바타 URL에는 이미지 해시가 들어 있으므로 URL이 같으면 내용도
+같다고 보고 로컬 파일을 그대로 씁니다. AVATAR_REVALIDATE_AFTER가 지나면
+조건부 요청(If-None-Match/If-Modified-Since)으로 재검증하고, 이미지 수가
+AVATAR_CACHE_MAX_FILES를 넘으면 가장 오래 쓰지 않은 것부터 지웁니다.
+"""
+
+import json
 import logging
+import os
+import time
 from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import urlparse
 
 import httpx
-from slack_sdk import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
 
-from seosoyoung.mcp.config import SLACK_BOT_TOKEN, WORKSPACE_ROOT
+from seosoyoung.mcp import slack_client
+from seosoyoung.mcp.config import (
+    AVATAR_CACHE_MAX_FILES,
+    AVATAR_PROFILE_TTL,
+    AVATAR_REVALIDATE_AFTER,
+    WORKSPACE_ROOT,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -17,30 +37,17 @@ AVATAR_DIR = Path(WORKSPACE_ROOT) / ".local" / "tmp" / "avatars"
 VALID_SIZES = {24, 32, 48, 72, 192, 512, 1024}
 
 
-def _get_slack_client() -> WebClient:
-    """Slack WebClient 인스턴스 반환"""
-    return WebClient(token=SLACK_BOT_TOKEN)
+def _get_async_slack_client() -> AsyncWebClient:
+    """프로세스 공유 Slack AsyncWebClient 반환"""
+    return slack_client.get_async_client()
 
 
-def get_user_profile(user_id: str) -> dict[str, Any]:
-    """Slack 사용자 프로필 정보를 조회
+def _is_valid_user_id(user_id: str) -> bool:
+    return bool(user_id) and user_id.startswith("U")
 
-    Args:
-        user_id: Slack User ID (예: U08HWT0C6K1)
-
-    Returns:
-        dict: success, profile 키를 포함하는 결과 딕셔너리
-    """
-    if not user_id or not user_id.startswith("U"):
-        return {"success": False, "message": f"유효하지 않은 user_id: {user_id}"}
-
-    try:
-        client = _get_slack_client()
-        response = client.users_info(user=user_id)
-    except Exception as e:
-        logger.error(f"사용자 프로필 조회 실패: user_id={user_id}, error={e}")
-        return {"success": False, "message": f"프로필 조회 실패: {e}"}
 
+def _build_profile(user_id: str, response: Any) -> dict[str, Any]:
+    """users.info 응답에서 프로필 결과 딕셔너리 조립"""
     user = response.get("user", {})
     profile = user.get("profile", {})
 
@@ -64,6 +71,82 @@ def get_user_profile(user_id: str) -> dict[str, Any]:
     }
 
 
+async def get_user_profile(user_id: str) -> dict[str, Any]:
+    """Slack 사용자 프로필 정보를 조회
+
+    Args:
+        user_id: Slack User ID (예: U08HWT0C6K1)
+
+    Returns:
+        dict: success, profile 키를 포함하는 결과 딕셔너리
+    """
+    if not _is_valid_user_id(user_id):
+        return {"success": False, "message": f"유효하지 않은 user_id: {user_id}"}
+
+    try:
+        client = _get_async_slack_client()
+        async with slack_client.limit("users.info"):
+            response = await client.users_info(user=user_id)
+    except Exception as e:
+        logger.error(f"사용자 프로필 조회 실패: user_id={user_id}, error={e}")
+        return {"success": False, "message": f"프로필 조회 실패: {e}"}
+
+    return _build_profile(user_id, response)
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _snapshot_path(user_id: str) -> Path:
+    return AVATAR_DIR / f"{user_id}.profile.json"
+
+
+def _meta_path(user_id: str, size: int) -> Path:
+    return AVATAR_DIR / f"{user_id}_{size}.meta.json"
+
+
+def _load_fresh_snapshot(user_id: str) -> dict[str, Any] | None:
+    """유효 시간 안의 프로필 스냅샷 반환 (없거나 만료면 None)"""
+    snapshot = _read_json(_snapshot_path(user_id))
+    if not snapshot or time.time() - snapshot.get("fetched_at", 0) > AVATAR_PROFILE_TTL:
+        return None
+    return snapshot.get("profile")
+
+
+def _touch(path: Path) -> None:
+    """LRU 순서 갱신 (mtime을 마지막 사용 시각으로 씀)"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _evict_lru() -> None:
+    """이미지 수가 상한을 넘으면 가장 오래 쓰지 않은 것부터 삭제"""
+    images = [
+        p for p in AVATAR_DIR.iterdir()
+        if p.is_file() and p.suffix not in (".json", ".tmp")
+    ]
+    excess = len(images) - AVATAR_CACHE_MAX_FILES
+    if excess <= 0:
+        return
+    images.sort(key=lambda p: p.stat().st_mtime)
+    for path in images[:excess]:
+        path.unlink(missing_ok=True)
+        path.with_suffix(".meta.json").unlink(missing_ok=True)
+        logger.debug(f"아바타 캐시 제거: {path.name}")
+
+
 async def download_user_avatar(
     user_id: str, size: Optional[int] = None
 ) -> dict[str, Any]:
@@ -74,7 +157,7 @@ async def download_user_avatar(
         size: 이미지 크기 (24, 32, 48, 72, 192, 512, 1024). 기본값 512.
 
     Returns:
-        dict: success, file_path 키를 포함하는 결과 딕셔너리
+        dict: success, file_path, cached(캐시 재사용 여부) 키를 포함하는 결과 딕셔너리
     """
     if size is None:
         size = 512
@@ -85,13 +168,21 @@ async def download_user_avatar(
             "message": f"유효하지 않은 size: {size}. 허용: {sorted(VALID_SIZES)}",
         }
 
-    # 프로필에서 이미지 URL 조회
-    profile_result = get_user_profile(user_id)
-    if not profile_result["success"]:
-        return profile_result
+    if not _is_valid_user_id(user_id):
+        return {"success": False, "message": f"유효하지 않은 user_id: {user_id}"}
+
+    # 프로필에서 이미지 URL 조회 (스냅샷이 유효하면 users.info 생략)
+    profile = _load_fresh_snapshot(user_id)
+    profile_fetched = False
+    if profile is None:
+        profile_result = await get_user_profile(user_id)
+        if not profile_result["success"]:
+            return profile_result
+        profile = profile_result["profile"]
+        profile_fetched = True
 
     image_key = f"image_{size}"
-    image_urls = profile_result["profile"]["image_urls"]
+    image_urls = profile["image_urls"]
     image_url = image_urls.get(image_key)
 
     if not image_url:
@@ -107,19 +198,58 @@ async def download_user_avatar(
     # 다운로드 디렉토리 생성
     AVATAR_DIR.mkdir(parents=True, exist_ok=True)
     local_path = AVATAR_DIR / f"{user_id}_{size}{path_suffix}"
+    meta_path = _meta_path(user_id, size)
+    if profile_fetched:
+        _write_json(_snapshot_path(user_id), {"fetched_at": time.time(), "profile": profile})
+
+    meta = _read_json(meta_path) if local_path.exists() else None
+    same_url = bool(meta) and meta.get("url") == image_url
+    if same_url and time.time() - meta.get("validated_at", 0) < AVATAR_REVALIDATE_AFTER:
+        _touch(local_path)
+        logger.info(f"아바타 캐시 사용: {local_path}")
+        return _avatar_result(local_path, cached=True)
+
+    # URL이 같으면 조건부 요청으로 재검증
+    headers: dict[str, str] = {}
+    if same_url:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
 
     try:
         async with httpx.AsyncClient() as http:
-            resp = await http.get(image_url)
+            resp = await http.get(image_url, headers=headers)
+            if same_url and resp.status_code == 304:
+                meta["validated_at"] = time.time()
+                _write_json(meta_path, meta)
+                _touch(local_path)
+                logger.info(f"아바타 재검증 완료 (변경 없음): {local_path}")
+                return _avatar_result(local_path, cached=True)
             resp.raise_for_status()
-            local_path.write_bytes(resp.content)
+            tmp_path = local_path.with_name(local_path.name + ".tmp")
+            tmp_path.write_bytes(resp.content)
+            os.replace(tmp_path, local_path)
     except Exception as e:
         logger.error(f"아바타 다운로드 실패: user_id={user_id}, url={image_url}, error={e}")
         return {"success": False, "message": f"이미지 다운로드 실패: {e}"}
 
+    _write_json(meta_path, {
+        "url": image_url,
+        "etag": resp.headers.get("etag", ""),
+        "last_modified": resp.headers.get("last-modified", ""),
+        "validated_at": time.time(),
+    })
+    _evict_lru()
+
     logger.info(f"아바타 다운로드 완료: {local_path}")
+    return _avatar_result(local_path, cached=False)
+
+
+def _avatar_result(local_path: Path, cached: bool) -> dict[str, Any]:
     return {
         "success": True,
         "file_path": str(local_path.resolve()),
-        "message": f"아바타 다운로드 완료: {local_path.name}",
+        "cached": cached,
+        "message": f"아바타 {'캐시 사용' if cached else '다운로드 완료'}: {local_path.name}",
     }
@@ -17,16 +17,23 @@ Usage:
 
     # Use Soulstream API
     await soulstream.run(prompt, channel, thread_ts)
+    async for event in soulstream.stream(prompt, channel, thread_ts):
+        ...
 
     # Use Mention API
     if mention.is_handled(thread_ts):
         pass  # skip intervention
 """
 
+from seosoyoung.plugin_sdk.filters import EventFilter
 from seosoyoung.plugin_sdk.hooks import (
     HookContext,
+    HookMode,
     HookPriority,
     HookResult,
+    get_hook_mode,
+    interceptor,
+    observer,
 )
 from seosoyoung.plugin_sdk.plugin import (
     HookHandler,
@@ -50,11 +57,15 @@ from seosoyoung.plugin_sdk.slack import (
     UserInfo,
 )
 from seosoyoung.plugin_sdk.soulstream import (
+    BatchRun,
+    BatchStats,
     CompactResult,
     RunRequest,
     RunResult,
     RunStatus,
     SoulstreamBackend,
+    StreamEvent,
+    StreamEventType,
 )
 from seosoyoung.plugin_sdk.mention import (
     MentionTrackingBackend,
@@ -67,10 +78,15 @@ from seosoyoung.plugin_sdk.caller_info import (
 
 __all__ = [
     # Core plugin types
+    "EventFilter",
     "HookContext",
+    "HookMode",
     "HookPriority",
     "HookResult",
     "HookHandler",
+    "get_hook_mode",
+    "interceptor",
+    "observer",
     "Plugin",
     "PluginMeta",
     # Submodules
@@ -86,11 +102,15 @@ __all__ = [
     "SlackBackend",
     "UserInfo",
     # Soulstream types
+    "BatchRun",
+    "BatchStats",
     "CompactResult",
     "RunRequest",
     "RunResult",
     "RunStatus",
     "SoulstreamBackend",
+    "StreamEvent",
+    "StreamEventType",
     # Mention types
     "MentionTrackingBackend",
     # Caller info helpers (R-4 atom G-12, G-14; R-5 atom G-15)
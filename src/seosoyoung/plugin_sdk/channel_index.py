@@ -0,0 +1,187 @@
+"""ts 인덱스 채널 메시지 저장소.
+
+채널 관찰자처럼 채널 메시지를 judged/pending으로 쌓아두는 플러그인이
+세션 컨텍스트 조회("마지막 N개", "ts 이후 최근 N개")를 전체 로드 없이
+인덱스로 처리할 수 있게 한다.
+
+- ``IndexedChannelStore``: 호스트(session_context)가 인식하는 조회 인터페이스.
+  기존 ``load_judged`` / ``load_pending`` 프로토콜도 함께 제공해야 한다.
+- ``ChannelMessageIndex``: SQLite(표준 라이브러리) 기반 구현.
+  ``(channel, ts_num)`` 인덱스로 조회하며 같은 ts는 judged가 pending보다 우선한다.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterable
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    channel TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    ts_num REAL NOT NULL,
+    judged INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (channel, ts)
+);
+CREATE INDEX IF NOT EXISTS messages_channel_ts ON messages (channel, ts_num);
+"""
+
+
+class IndexedChannelStore(ABC):
+    """ts 범위 조회를 지원하는 채널 메시지 저장소.
+
+    모든 조회 결과는 ts 오름차순이다.
+    """
+
+    @abstractmethod
+    def last_messages(self, channel_id: str, limit: int) -> list[dict]:
+        """가장 최근 메시지 최대 limit개."""
+
+    @abstractmethod
+    def messages_after(self, channel_id: str, after_ts: str, limit: int) -> list[dict]:
+        """ts가 after_ts보다 큰 메시지 중 가장 최근 최대 limit개."""
+
+    @abstractmethod
+    def get_messages(self, channel_id: str, ts_list: Iterable[str]) -> list[dict]:
+        """지정한 ts의 메시지 (없는 ts는 건너뜀)."""
+
+    @abstractmethod
+    def load_judged(self, channel_id: str) -> list[dict]:
+        """기존 ChannelStoreProtocol 호환: judged 메시지 전체."""
+
+    @abstractmethod
+    def load_pending(self, channel_id: str) -> list[dict]:
+        """기존 ChannelStoreProtocol 호환: pending 메시지 전체."""
+
+
+def _ts_num(ts: str) -> float | None:
+    try:
+        return float(ts)
+    except (TypeError, ValueError):
+        return None
+
+
+class ChannelMessageIndex(IndexedChannelStore):
+    """SQLite 기반 채널 메시지 인덱스.
+
+    Args:
+        path: DB 파일 경로. ``None``이면 메모리 DB (프로세스 종료 시 사라짐).
+
+    여러 스레드에서 호출해도 되도록 연결 하나를 락으로 보호한다.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        if path is None:
+            target = ":memory:"
+        else:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            target = str(path)
+        self._conn = sqlite3.connect(target, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            if target != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    # -- 쓰기 -----------------------------------------------------------
+
+    def add(self, channel_id: str, messages: Iterable[dict], *, judged: bool = False) -> int:
+        """메시지 추가/갱신. 추가된(또는 갱신된) 행 수를 반환.
+
+        이미 judged로 저장된 ts에 pending을 다시 넣어도 덮어쓰지 않는다.
+        ts가 없거나 숫자가 아닌 메시지는 건너뛴다.
+        """
+        rows = []
+        for msg in messages:
+            ts = msg.get("ts", "")
+            ts_num = _ts_num(ts) if ts else None
+            if ts_num is None:
+                continue
+            rows.append((channel_id, ts, ts_num, int(judged), json.dumps(msg, ensure_ascii=False)))
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT INTO messages (channel, ts, ts_num, judged, body) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (channel, ts) DO UPDATE SET judged = excluded.judged, body = excluded.body "
+                "WHERE excluded.judged >= messages.judged",
+                rows,
+            )
+            return self._conn.total_changes - before
+
+    def remove(self, channel_id: str, ts_list: Iterable[str]) -> None:
+        """지정한 ts의 메시지 삭제."""
+        rows = [(channel_id, ts) for ts in ts_list]
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM messages WHERE channel = ? AND ts = ?", rows)
+
+    def import_store(self, store, channel_id: str) -> int:
+        """load_judged/load_pending만 제공하는 기존 저장소에서 한 채널을 가져온다."""
+        count = self.add(channel_id, store.load_pending(channel_id))
+        return count + self.add(channel_id, store.load_judged(channel_id), judged=True)
+
+    # -- 조회 -----------------------------------------------------------
+
+    def _select(self, sql: str, params: tuple) -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(body) for (body,) in rows]
+
+    def last_messages(self, channel_id: str, limit: int) -> list[dict]:
+        rows = self._select(
+            "SELECT body FROM messages WHERE channel = ? ORDER BY ts_num DESC LIMIT ?",
+            (channel_id, limit),
+        )
+        rows.reverse()
+        return rows
+
+    def messages_after(self, channel_id: str, after_ts: str, limit: int) -> list[dict]:
+        cutoff = _ts_num(after_ts)
+        if cutoff is None:
+            return self.last_messages(channel_id, limit)
+        rows = self._select(
+            "SELECT body FROM messages WHERE channel = ? AND ts_num > ? ORDER BY ts_num DESC LIMIT ?",
+            (channel_id, cutoff, limit),
+        )
+        rows.reverse()
+        return rows
+
+    def get_messages(self, channel_id: str, ts_list: Iterable[str]) -> list[dict]:
+        wanted = list(dict.fromkeys(ts_list))
+        if not wanted:
+            return []
+        placeholders = ",".join("?" * len(wanted))
+        return self._select(
+            f"SELECT body FROM messages WHERE channel = ? AND ts IN ({placeholders}) ORDER BY ts_num",
+            (channel_id, *wanted),
+        )
+
+    def load_judged(self, channel_id: str) -> list[dict]:
+        return self._select(
+            "SELECT body FROM messages WHERE channel = ? AND judged = 1 ORDER BY ts_num",
+            (channel_id,),
+        )
+
+    def load_pending(self, channel_id: str) -> list[dict]:
+        return self._select(
+            "SELECT body FROM messages WHERE channel = ? AND judged = 0 ORDER BY ts_num",
+            (channel_id,),
+        )
+
+    def count(self, channel_id: str) -> int:
+        with self._lock:
+            (n,) = self._conn.execute(
+                "SELECT COUNT(*) FROM messages WHERE channel = ?", (channel_id,)
+            ).fetchone()
+        return n
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,75 @@
+"""Event subscription filters for hook handlers.
+
+A plugin declares which Slack events each hook handler cares about by
+returning ``EventFilter`` objects from ``Plugin.register_filters()``.
+The plugin manager indexes these filters so that events no plugin
+subscribes to are dropped before any hook dispatch is scheduled.
+
+Hooks without a declared filter receive every event (the default).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def event_channel(event: dict[str, Any]) -> str:
+    """Return the channel of a message or reaction event ("" if none)."""
+    channel = event.get("channel")
+    if channel:
+        return channel
+    item = event.get("item")
+    if isinstance(item, dict):
+        return item.get("channel", "")
+    return ""
+
+
+@dataclass(frozen=True)
+class EventFilter:
+    """Declarative match conditions on a Slack event.
+
+    Every condition left as ``None`` matches anything. All set conditions
+    must match.
+
+    Attributes:
+        channels: Channel IDs to accept.
+        subtypes: Message subtypes to accept. Use ``""`` for plain
+            messages without a subtype.
+        bots: True = only bot messages, False = only human messages.
+        has_files: True = only events with files, False = only without.
+        text_pattern: Regular expression searched in the event text.
+    """
+
+    channels: frozenset[str] | None = None
+    subtypes: frozenset[str] | None = None
+    bots: bool | None = None
+    has_files: bool | None = None
+    text_pattern: str | None = None
+    _regex: re.Pattern[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Accept any iterable for convenience, store as frozenset.
+        if self.channels is not None and not isinstance(self.channels, frozenset):
+            object.__setattr__(self, "channels", frozenset(self.channels))
+        if self.subtypes is not None and not isinstance(self.subtypes, frozenset):
+            object.__setattr__(self, "subtypes", frozenset(self.subtypes))
+        if self.text_pattern is not None:
+            object.__setattr__(self, "_regex", re.compile(self.text_pattern))
+
+    def matches(self, event: dict[str, Any]) -> bool:
+        """Return True if ``event`` satisfies every set condition."""
+        if self.channels is not None and event_channel(event) not in self.channels:
+            return False
+        if self.subtypes is not None and event.get("subtype", "") not in self.subtypes:
+            return False
+        if self.bots is not None and bool(event.get("bot_id")) != self.bots:
+            return False
+        if self.has_files is not None and bool(event.get("files")) != self.has_files:
+            return False
+        if self._regex is not None and not self._regex.search(event.get("text") or ""):
+            return False
+        return True
@@ -1,14 +1,17 @@
 """Hook system primitives for the plugin architecture.
 
-Defines priority levels, result types, and the context object
-that flows through a hook handler chain.
+Defines priority levels, result types, handler modes, and the context
+object that flows through a hook handler chain.
 """
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
-from typing import Any
+from typing import Any, Callable, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
 
 
 class HookPriority(IntEnum):
@@ -48,3 +51,55 @@ class HookContext:
     args: dict[str, Any] = field(default_factory=dict)
     results: list[Any] = field(default_factory=list)
     stopped: bool = False
+
+
+class HookMode(Enum):
+    """How a hook handler participates in dispatch.
+
+    INTERCEPTOR: runs in priority order inside the chain and may
+                 STOP it or contribute results (the default).
+    OBSERVER:    runs concurrently, outside the chain. Dispatch does not
+                 wait for it; its return value is discarded and it sees a
+                 copy of the context, so it cannot alter the outcome.
+    """
+
+    INTERCEPTOR = "interceptor"
+    OBSERVER = "observer"
+
+
+def _mark(handler: _F, mode: HookMode) -> _F:
+    try:
+        handler.__hook_mode__ = mode  # type: ignore[attr-defined]
+        return handler
+    except AttributeError:
+        # Bound methods reject attribute assignment; wrap instead.
+        @functools.wraps(handler)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await handler(*args, **kwargs)
+
+        wrapper.__hook_mode__ = mode  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+
+def observer(handler: _F) -> _F:
+    """Declare a hook handler as observer-only.
+
+    Usable as a decorator on handler methods or applied to a bound
+    method inside ``register_hooks()``::
+
+        @observer
+        async def on_message(self, ctx):
+            self.log(ctx.args["event"])
+            return HookResult.CONTINUE, None
+    """
+    return _mark(handler, HookMode.OBSERVER)
+
+
+def interceptor(handler: _F) -> _F:
+    """Declare a hook handler as an interceptor (the default mode)."""
+    return _mark(handler, HookMode.INTERCEPTOR)
+
+
+def get_hook_mode(handler: Callable[..., Any]) -> HookMode:
+    """Return the declared mode of a handler (INTERCEPTOR if undeclared)."""
+    return getattr(handler, "__hook_mode__", HookMode.INTERCEPTOR)
@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
 if TYPE_CHECKING:
+    from seosoyoung.plugin_sdk.filters import EventFilter
     from seosoyoung.plugin_sdk.hooks import HookContext, HookResult
 
 
@@ -41,6 +42,8 @@ class Plugin(ABC):
       - Set ``meta`` as a class attribute or in ``__init__``.
       - Implement ``on_load()`` and ``on_unload()``.
       - Optionally override ``register_hooks()`` to participate in hook chains.
+      - Optionally override ``register_filters()`` to narrow which events
+        reach event-driven hooks (``on_message``, ``on_reaction``).
     """
 
     meta: PluginMeta
@@ -64,3 +67,13 @@ class Plugin(ABC):
         Default implementation returns an empty dict (no hooks).
         """
         return {}
+
+    def register_filters(self) -> dict[str, "EventFilter"]:
+        """Return a mapping of hook_name -> EventFilter.
+
+        Events that match no plugin's filter are dropped before dispatch.
+        Hooks without a filter receive every event.
+
+        Default implementation returns an empty dict (no filtering).
+        """
+        return {}
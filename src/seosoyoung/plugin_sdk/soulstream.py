@@ -12,14 +12,28 @@ Usage:
         channel="C12345",
         thread_ts="1234567890.123456",
     )
+
+    # Consume events as they arrive, stopping early when done
+    async for event in soulstream.stream(prompt="...", channel="C1", thread_ts="1.2"):
+        if event.type is soulstream.StreamEventType.TEXT_DELTA:
+            ...
+
+    # Run many text-only prompts with bounded parallelism
+    batch = soulstream.run_batch(requests, concurrency=4)
+    async for index, result in batch:
+        ...
+    print(batch.stats.throughput)
 """
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Protocol
+from typing import Any, AsyncIterator, Callable, Iterable, Protocol
 
 
 # ============================================================================
@@ -84,6 +98,37 @@ class RunResult:
     """
 
 
+class StreamEventType(Enum):
+    """Kind of event yielded by :func:`stream`."""
+
+    SESSION = "session"
+    THINKING = "thinking"
+    TEXT_START = "text_start"
+    TEXT_DELTA = "text_delta"
+    TEXT_END = "text_end"
+    TOOL_START = "tool_start"
+    TOOL_RESULT = "tool_result"
+    COMPACT = "compact"
+    COMPLETE = "complete"
+    ERROR = "error"
+
+
+@dataclass
+class StreamEvent:
+    """A single event from a streaming run.
+
+    ``text`` carries the primary payload for the event type: the session id
+    for SESSION, the thinking/text chunk for THINKING/TEXT_DELTA, the tool
+    name for TOOL_START, the tool output for TOOL_RESULT, the final output
+    for COMPLETE and the message for ERROR. ``data`` is the raw event body.
+    """
+
+    type: StreamEventType
+    text: str = ""
+    data: dict[str, Any] = field(default_factory=dict)
+    event_id: int | None = None
+
+
 @dataclass
 class CompactResult:
     """Result of a session compact operation."""
@@ -175,6 +220,26 @@ class SoulstreamBackend(Protocol):
         """
         ...
 
+    def stream(
+        self,
+        prompt: str,
+        channel: str,
+        thread_ts: str,
+        role: str = "admin",
+        session_id: str | None = None,
+        context: list[dict] | None = None,
+        folder_id: str | None = None,
+        system_prompt: str | None = None,
+        agent_id: str | None = None,
+        caller_info: dict | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamEvent]:
+        """Execute Claude Code and yield events on the caller's event loop.
+
+        Nothing is posted to Slack. See :func:`stream` for semantics.
+        """
+        ...
+
     async def compact(self, session_id: str) -> CompactResult:
         """Compact a Claude Code session to reduce context size.
 
@@ -339,6 +404,62 @@ async def run(
     )
 
 
+def stream(
+    prompt: str,
+    channel: str,
+    thread_ts: str,
+    role: str = "admin",
+    session_id: str | None = None,
+    context: list[dict] | None = None,
+    folder_id: str | None = None,
+    system_prompt: str | None = None,
+    agent_id: str | None = None,
+    caller_info: dict | None = None,
+    **kwargs: Any,
+) -> AsyncIterator[StreamEvent]:
+    """Execute Claude Code and yield its events as they arrive.
+
+    Unlike :func:`run`, this runs directly on the caller's event loop over a
+    pooled soul client: no executor thread, no extra event loop, and nothing
+    is posted to Slack. The stream is read only as fast as the caller
+    consumes it. Leaving the loop early closes the underlying connection,
+    so a plugin can stop as soon as it has what it needs. Use
+    ``contextlib.aclosing`` when the connection must be released
+    deterministically rather than at garbage collection.
+
+    Takes the same arguments as :func:`run` (``model`` may be passed as a
+    keyword). The final event is COMPLETE or ERROR unless the caller stops
+    first.
+
+    Unlike :func:`run`, the thread's Slack session is not resumed implicitly
+    and the thread lock is not taken: without ``session_id`` the stream
+    starts a new session, so it cannot collide with a turn in progress on
+    ``thread_ts``. Pass ``session_id`` (e.g. from :func:`get_session_id`)
+    to resume a session explicitly. The resulting session id is reported
+    in the SESSION event and is not recorded on the thread.
+
+    Example:
+        async with aclosing(soulstream.stream(prompt=p, channel=c, thread_ts=t)) as events:
+            async for event in events:
+                if event.type is StreamEventType.TEXT_DELTA and "DONE" in event.text:
+                    break
+    """
+    backend = _require_backend()
+    return backend.stream(
+        prompt=prompt,
+        channel=channel,
+        thread_ts=thread_ts,
+        role=role,
+        session_id=session_id,
+        context=context,
+        folder_id=folder_id,
+        system_prompt=system_prompt,
+        agent_id=agent_id,
+        caller_info=caller_info,
+        **kwargs,
+    )
+
+
 async def compact(session_id: str) -> CompactResult:
     """Compact a Claude Code session to reduce context size.
 
@@ -411,3 +532,207 @@ def get_data_dir() -> Path:
     """
     backend = _require_backend()
     return backend.get_data_dir()
+
+
+# ============================================================================
+# Batch API
+# ============================================================================
+
+DEFAULT_BATCH_CONCURRENCY = 4
+
+_batch_ids = itertools.count(1)
+
+
+@dataclass
+class BatchStats:
+    """Throughput report for a :class:`BatchRun`."""
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    """Wall-clock seconds from the first request to the last result."""
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        done = self.succeeded + self.failed
+        return done / self.elapsed if self.elapsed > 0 else 0.0
+
+
+async def _collect_text_only(events: AsyncIterator[StreamEvent]) -> RunResult:
+    """Fold a text-only stream into a RunResult.
+
+    Utterances are matched per block (thinking event, text_start..text_end
+    run, final output), the same way ``run(text_only=True)`` does.
+    """
+    from seosoyoung.plugin_sdk.utterance import extract_utterance_matches
+
+    session_id: str | None = None
+    output = ""
+    utterances: list[str] = []
+    buffer: list[str] = []
+
+    def flush() -> None:
+        if buffer:
+            utterances.extend(extract_utterance_matches("".join(buffer)))
+            buffer.clear()
+
+    async for event in events:
+        if event.type is StreamEventType.SESSION:
+            session_id = event.text or session_id
+        elif event.type is StreamEventType.THINKING:
+            utterances.extend(extract_utterance_matches(event.text))
+        elif event.type in (StreamEventType.TEXT_START, StreamEventType.TEXT_END):
+            flush()
+        elif event.type is StreamEventType.TEXT_DELTA:
+            buffer.append(event.text)
+        elif event.type is StreamEventType.ERROR:
+            return RunResult(
+                ok=False, status=RunStatus.FAILED, session_id=session_id, error=event.text,
+            )
+        elif event.type is StreamEventType.COMPLETE:
+            flush()
+            output = event.text
+            utterances.extend(extract_utterance_matches(output))
+            return RunResult(
+                ok=True,
+                status=RunStatus.COMPLETED,
+                session_id=session_id,
+                output=output,
+                utterances=utterances,
+            )
+    flush()
+    return RunResult(
+        ok=False,
+        status=RunStatus.FAILED,
+        session_id=session_id,
+        error="stream ended without a complete event",
+        utterances=utterances,
+    )
+
+
+class BatchRun:
+    """Results of :func:`run_batch`, yielded as ``(index, RunResult)`` in completion order.
+
+    Iterating starts the batch; ``index`` is the position of the request in the
+    input. Closing the batch cancels the requests still in flight; wrap it in
+    ``contextlib.aclosing`` to do that as soon as the loop is left early.
+    ``stats`` is updated as results arrive.
+    """
+
+    def __init__(
+        self,
+        requests: Iterable[RunRequest],
+        concurrency: int,
+        options: dict[str, Any],
+    ):
+        self.requests = list(requests)
+        self.concurrency = max(1, concurrency)
+        self.stats = BatchStats(total=len(self.requests))
+        self._options = options
+        self._batch_id = next(_batch_ids)
+        self._iterator: AsyncIterator[tuple[int, RunResult]] | None = None
+
+    def __aiter__(self) -> AsyncIterator[tuple[int, RunResult]]:
+        if self._iterator is None:
+            self._iterator = self._results()
+        return self._iterator
+
+    async def aclose(self) -> None:
+        """Cancel requests still in flight."""
+        if self._iterator is not None:
+            await self._iterator.aclose()
+
+    async def collect(self) -> list[RunResult]:
+        """Run the whole batch and return results in input order."""
+        results: list[RunResult | None] = [None] * len(self.requests)
+        async for index, result in self:
+            results[index] = result
+        return results  # type: ignore[return-value]
+
+    async def _run_one(self, index: int, request: RunRequest, gate: asyncio.Semaphore) -> tuple[int, RunResult]:
+        backend = _require_backend()
+        async with gate:
+            # A synthetic thread key keeps batch items apart from the Slack
+            # thread they came from.
+            events = backend.stream(
+                prompt=request.prompt,
+                channel=request.channel,
+                thread_ts=f"batch:{self._batch_id}:{index}",
+                role=request.role,
+                session_id=request.session_id,
+                **self._options,
+            )
+            try:
+                result = await _collect_text_only(events)
+            except Exception as e:
+                result = RunResult(ok=False, status=RunStatus.FAILED, error=str(e))
+            finally:
+                aclose = getattr(events, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+        return index, result
+
+    async def _results(self) -> AsyncIterator[tuple[int, RunResult]]:
+        gate = asyncio.Semaphore(self.concurrency)
+        started = time.monotonic()
+        tasks = [
+            asyncio.ensure_future(self._run_one(i, request, gate))
+            for i, request in enumerate(self.requests)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
+                if result.ok:
+                    self.stats.succeeded += 1
+                else:
+                    self.stats.failed += 1
+                self.stats.elapsed = time.monotonic() - started
+                yield index, result
+        finally:
+            pending = [t for t in tasks if not t.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+def run_batch(
+    requests: Iterable[RunRequest],
+    *,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    **kwargs: Any,
+) -> BatchRun:
+    """Run many text-only prompts with bounded parallelism.
+
+    Intended for classification-style workloads (judging or summarizing many
+    items) that would otherwise issue one serialized ``run(text_only=True)``
+    turn per item. Each request runs as its own :func:`stream` under a
+    synthetic thread key, so items do not wait on each other's thread lock,
+    and all of them share the backend's pooled connections. Nothing is
+    posted to Slack.
+
+    Args:
+        requests: Requests to run. ``prompt``, ``channel``, ``role`` and
+            ``session_id`` are used per item.
+        concurrency: Maximum number of requests in flight at once.
+        **kwargs: Options applied to every item, as accepted by
+            :func:`stream` (``system_prompt``, ``model``, ``folder_id``,
+            ``agent_id``, ``caller_info``, ``context``).
+
+    Returns:
+        A :class:`BatchRun`; iterate it for ``(index, RunResult)`` pairs as
+        they finish, or ``await batch.collect()`` for results in input order.
+
+    Example:
+        batch = soulstream.run_batch(
+            [RunRequest(prompt=p, channel=channel, thread_ts=ts) for p in prompts],
+            concurrency=4,
+            system_prompt=JUDGE_PROMPT,
+        )
+        async for index, result in batch:
+            handle(index, result.output)
+        logger.info(f"{batch.stats.throughput:.1f} req/s")
+    """
+    return BatchRun(requests, concurrency, kwargs)
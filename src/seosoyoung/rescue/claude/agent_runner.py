@@ -7,7 +7,7 @@ import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import IO, Any, Optional, Callable, Awaitable
+from typing import Any, Optional, Callable, Awaitable
 
 import psutil
 
@@ -59,14 +59,17 @@ except ImportError:
 
 from seosoyoung.rescue.claude.diagnostics import (
     DebugSendFn,
+    StderrSink,
     build_session_dump,
     classify_process_error,
     format_rate_limit_warning,
 )
 from seosoyoung.rescue.claude.engine_types import EngineResult, InterventionCallback, EngineEvent, EngineEventType, EventCallback
 from seosoyoung.rescue.claude.instrumented_client import InstrumentedClaudeClient
+from seosoyoung.rescue.claude.runner_pool import Lease, PoolKey, RunnerPool, key_for, shutdown_pools_sync
 from seosoyoung.rescue.claude.sdk_compat import ParseAction, classify_parse_error
 from seosoyoung.rescue.claude.session_validator import validate_session
+from seosoyoung.rescue.claude.transcript import PREVIEW_LIMIT, MessageLog, serialize_tool_input
 from seosoyoung.utils.async_bridge import run_in_new_loop
 
 logger = logging.getLogger(__name__)
@@ -183,17 +186,23 @@ def shutdown_all_sync() -> int:
 
     시그널 핸들러 등 동기 컨텍스트에서 사용합니다.
 
+    등록된 러너 풀의 유휴 클라이언트도 함께 종료합니다.
+
     Returns:
         종료된 클라이언트 수
     """
+    count = 0
     try:
         loop = asyncio.new_event_loop()
         count = loop.run_until_complete(shutdown_all())
         loop.close()
-        return count
     except Exception as e:
         logger.warning(f"클라이언트 동기 종료 중 오류: {e}")
-        return 0
+    try:
+        count += shutdown_pools_sync()
+    except Exception as e:
+        logger.warning(f"러너 풀 종료 중 오류: {e}")
+    return count
 
 
 # Compact retry 상수
@@ -231,7 +240,7 @@ class MessageState:
     result_text: str = ""
     is_error: bool = False
     usage: Optional[dict] = None
-    collected_messages: list[dict] = field(default_factory=list)
+    collected_messages: MessageLog = field(default_factory=MessageLog)
     msg_count: int = 0
     last_tool: str = ""
     tool_use_id_to_name: dict = field(default_factory=dict)  # tool_use_id → tool_name 매핑
@@ -248,14 +257,6 @@ class MessageState:
         self.is_error = False
 
 
-def _extract_last_assistant_text(collected_messages: list[dict]) -> str:
-    """collected_messages에서 마지막 assistant 텍스트를 추출 (tool_use 제외)"""
-    for msg in reversed(collected_messages):
-        if msg.get("role") == "assistant" and not msg.get("content", "").startswith("[tool_use:"):
-            return msg["content"]
-    return ""
-
-
 class ClaudeRunner:
     """Claude Code SDK 기반 실행기
 
@@ -271,7 +272,9 @@ class ClaudeRunner:
         disallowed_tools: Optional[list[str]] = None,
         mcp_config_path: Optional[Path] = None,
         debug_send_fn: Optional[DebugSendFn] = None,
+        transcript_dir: Optional[Path] = None,
         pooled: bool = False,
+        pool: Optional[RunnerPool] = None,
     ):
         self.thread_ts = thread_ts
         self.working_dir = working_dir or Path.cwd()
@@ -279,17 +282,63 @@ class ClaudeRunner:
         self.disallowed_tools = disallowed_tools or DEFAULT_DISALLOWED_TOOLS
         self.mcp_config_path = mcp_config_path
         self.debug_send_fn = debug_send_fn
-        self._pooled = pooled
+        self.transcript_dir = transcript_dir
+        self._pooled = pooled or pool is not None
+        self._pool = pool
 
         # Instance-level client state
         self.client: Optional[ClaudeSDKClient] = None
         self.pid: Optional[int] = None
         self.execution_loop: Optional[asyncio.AbstractEventLoop] = None
 
+    @classmethod
+    def for_key(cls, key: PoolKey, thread_ts: str = "") -> "ClaudeRunner":
+        """PoolKey의 옵션으로 러너 생성 (풀의 connect 함수용)"""
+        return cls(
+            thread_ts,
+            working_dir=Path(key.working_dir),
+            allowed_tools=list(key.allowed_tools) if key.allowed_tools is not None else None,
+            disallowed_tools=list(key.disallowed_tools),
+            mcp_config_path=Path(key.mcp_config_path) if key.mcp_config_path else None,
+        )
+
+    @property
+    def pool_key(self) -> PoolKey:
+        """이 러너와 클라이언트를 공유할 수 있는 풀 키"""
+        return key_for(
+            self.working_dir, self.allowed_tools, self.disallowed_tools, self.mcp_config_path,
+        )
+
     def run_sync(self, coro):
-        """동기 컨텍스트에서 코루틴을 실행하는 브릿지"""
+        """동기 컨텍스트에서 코루틴을 실행하는 브릿지
+
+        풀을 쓰는 러너는 풀 루프에서 실행합니다 (클라이언트가 그 루프에 묶여 있음).
+        """
+        if self._pool is not None:
+            return self._pool.run_sync(coro)
         return run_in_new_loop(coro)
 
+    async def open_lease(self, session_id: Optional[str] = None) -> Lease:
+        """새 클라이언트를 연결하여 풀에 넣을 수 있는 Lease로 반환
+
+        러너 상태(self.client)는 건드리지 않습니다.
+        """
+        compact_events: list = []
+        options, stderr_file = self._build_options(session_id, compact_events=compact_events)
+        try:
+            client, pid = await self._connect(options)
+        except BaseException:
+            if stderr_file is not None:
+                stderr_file.close()
+            raise
+        return Lease(
+            client=client,
+            pid=pid,
+            compact_events=compact_events,
+            stderr_file=stderr_file,
+            session_id=session_id,
+        )
+
     async def _get_or_create_client(
         self,
         options: Optional[ClaudeAgentOptions] = None,
@@ -299,6 +348,17 @@ class ClaudeRunner:
             logger.info(f"[DEBUG-CLIENT] 기존 클라이언트 재사용: thread={self.thread_ts}")
             return self.client
 
+        client, pid = await self._connect(options)
+        self.client = client
+        self.pid = pid
+        logger.info(f"ClaudeSDKClient 생성: thread={self.thread_ts}, pid={pid}")
+        return client
+
+    async def _connect(
+        self,
+        options: Optional[ClaudeAgentOptions] = None,
+    ) -> tuple[ClaudeSDKClient, Optional[int]]:
+        """새 ClaudeSDKClient를 연결하고 (client, subprocess pid) 반환"""
         import time as _time
         logger.info(f"[DEBUG-CLIENT] 새 InstrumentedClaudeClient 생성 시작: thread={self.thread_ts}")
         client = InstrumentedClaudeClient(
@@ -334,10 +394,7 @@ class ClaudeRunner:
         except Exception as e:
             logger.warning(f"[DEBUG-CLIENT] PID 추출 실패 (무시): {e}")
 
-        self.client = client
-        self.pid = pid
-        logger.info(f"ClaudeSDKClient 생성: thread={self.thread_ts}, pid={pid}")
-        return client
+        return client, pid
 
     async def _remove_client(self) -> None:
         """이 러너의 ClaudeSDKClient를 정리"""
@@ -454,12 +511,12 @@ class ClaudeRunner:
 
         content = ""
         if isinstance(block.content, str):
-            content = block.content[:2000]
+            content = block.content[:PREVIEW_LIMIT]
         elif block.content:
             try:
-                content = json.dumps(block.content, ensure_ascii=False)[:2000]
+                content = json.dumps(block.content, ensure_ascii=False)[:PREVIEW_LIMIT]
             except (TypeError, ValueError):
-                content = str(block.content)[:2000]
+                content = str(block.content)[:PREVIEW_LIMIT]
 
         tool_name = (
             msg_state.tool_use_id_to_name.get(tool_use_id, "")
@@ -469,11 +526,7 @@ class ClaudeRunner:
         is_error = bool(getattr(block, "is_error", False))
 
         logger.info(f"[TOOL_RESULT:{source}] {tool_name}: {content[:500]}")
-        msg_state.collected_messages.append({
-            "role": "tool",
-            "content": content,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        })
+        msg_state.collected_messages.append("tool", content)
 
         if on_event:
             try:
@@ -558,7 +611,7 @@ class ClaudeRunner:
         self,
         session_id: Optional[str] = None,
         compact_events: Optional[list] = None,
-    ) -> tuple[ClaudeAgentOptions, Optional[IO[str]]]:
+    ) -> tuple[ClaudeAgentOptions, Optional[StderrSink]]:
         """ClaudeAgentOptions와 stderr 파일을 반환합니다.
 
         Returns:
@@ -570,22 +623,14 @@ class ClaudeRunner:
 
         # CLI stderr를 세션별 파일에 캡처
         import sys as _sys
-        _runtime_dir = Path(__file__).resolve().parents[4]
-        _stderr_suffix = thread_ts.replace(".", "_") if thread_ts else "default"
-        _stderr_log_path = _runtime_dir / "logs" / f"cli_stderr_{_stderr_suffix}.log"
-        logger.info(f"[DEBUG] CLI stderr 로그 경로: {_stderr_log_path}")
-        _stderr_file = None
+        _stderr_file: Optional[StderrSink] = None
         _stderr_target = _sys.stderr
         try:
-            _stderr_file = open(_stderr_log_path, "a", encoding="utf-8")
-            _stderr_file.write(f"\n--- CLI stderr capture start: {datetime.now(timezone.utc).isoformat()} ---\n")
-            _stderr_file.flush()
+            _stderr_file = StderrSink(thread_ts)
             _stderr_target = _stderr_file
+            logger.info(f"[DEBUG] CLI stderr 로그 경로: {_stderr_file.path}")
         except Exception as _e:
             logger.warning(f"[DEBUG] stderr 캡처 파일 열기 실패: {_e}")
-            if _stderr_file:
-                _stderr_file.close()
-            _stderr_file = None
 
         options = ClaudeAgentOptions(
             allowed_tools=self.allowed_tools,
@@ -603,6 +648,14 @@ class ClaudeRunner:
 
         return options, _stderr_file
 
+    def _new_message_log(self) -> MessageLog:
+        """실행 1회분 메시지 로그 (transcript_dir가 있으면 전체를 파일에 기록)"""
+        if self.transcript_dir is None:
+            return MessageLog()
+        suffix = self.thread_ts.replace(".", "_") if self.thread_ts else "default"
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        return MessageLog(spill_path=self.transcript_dir / f"{suffix}_{stamp}.jsonl")
+
     async def _notify_compact_events(
         self,
         compact_state: CompactRetryState,
@@ -690,12 +743,7 @@ class ClaudeRunner:
                     for block in message.content:
                         if isinstance(block, TextBlock):
                             msg_state.current_text = block.text
-
-                            msg_state.collected_messages.append({
-                                "role": "assistant",
-                                "content": block.text,
-                                "timestamp": datetime.now(timezone.utc).isoformat(),
-                            })
+                            msg_state.collected_messages.append("assistant", block.text)
 
                             if on_event:
                                 try:
@@ -707,33 +755,21 @@ class ClaudeRunner:
                                     logger.warning(f"이벤트 콜백 오류 (TEXT_DELTA): {e}")
 
                         elif isinstance(block, ToolUseBlock):
-                            tool_input = ""
-                            if block.input:
-                                tool_input = json.dumps(block.input, ensure_ascii=False)
-                                if len(tool_input) > 2000:
-                                    tool_input = tool_input[:2000] + "..."
+                            # 한 번만 직렬화하여 로그/수집/이벤트가 같은 문자열을 공유
+                            # (대형 파일 내용 등은 미리보기로 잘림)
+                            tool_input, event_tool_input = serialize_tool_input(block.input)
                             msg_state.last_tool = block.name
                             # tool_use_id → tool_name 매핑 기록
                             tool_use_id = getattr(block, "id", None)
                             if tool_use_id:
                                 msg_state.tool_use_id_to_name[tool_use_id] = block.name
                             logger.info(f"[TOOL_USE] {block.name}: {tool_input[:500]}")
-                            msg_state.collected_messages.append({
-                                "role": "assistant",
-                                "content": f"[tool_use: {block.name}] {tool_input}",
-                                "timestamp": datetime.now(timezone.utc).isoformat(),
-                            })
+                            msg_state.collected_messages.append(
+                                "assistant", f"[tool_use: {block.name}] {tool_input}",
+                            )
 
                             if on_event:
                                 try:
-                                    # tool_input 크기 제한: 대형 파일 내용 등 방지
-                                    event_tool_input = block.input or {}
-                                    try:
-                                        _input_str = json.dumps(event_tool_input, ensure_ascii=False)
-                                        if len(_input_str) > 2000:
-                                            event_tool_input = {"_truncated": _input_str[:2000] + "..."}
-                                    except (TypeError, ValueError):
-                                        event_tool_input = {"_error": "serialize_failed"}
                                     await on_event(EngineEvent(
                                         type=EngineEventType.TOOL_START,
                                         data={
@@ -846,7 +882,7 @@ class ClaudeRunner:
                 f"Compact retry 생략: CLI 프로세스 이미 종료 "
                 f"(pid={self.pid}, thread={self.thread_ts})"
             )
-            fallback_text = _extract_last_assistant_text(msg_state.collected_messages)
+            fallback_text = msg_state.collected_messages.last_assistant_text
             if fallback_text:
                 msg_state.current_text = fallback_text
                 logger.info(
@@ -918,16 +954,37 @@ class ClaudeRunner:
     ) -> EngineResult:
         """실제 실행 로직 (ClaudeSDKClient 기반)"""
         thread_ts = self.thread_ts
-        compact_state = CompactRetryState()
-        options, stderr_file = self._build_options(session_id, compact_events=compact_state.events)
-        logger.info(f"Claude Code SDK 실행 시작 (cwd={self.working_dir})")
-        logger.info(f"[DEBUG-OPTIONS] permission_mode={options.permission_mode}")
-        logger.info(f"[DEBUG-OPTIONS] cwd={options.cwd}")
-        logger.info(f"[DEBUG-OPTIONS] mcp_servers={options.mcp_servers}")
-        logger.info(f"[DEBUG-OPTIONS] resume={options.resume}")
-        logger.info(f"[DEBUG-OPTIONS] allowed_tools count={len(options.allowed_tools) if options.allowed_tools else 0}")
-        logger.info(f"[DEBUG-OPTIONS] disallowed_tools count={len(options.disallowed_tools) if options.disallowed_tools else 0}")
-        logger.info(f"[DEBUG-OPTIONS] hooks={'yes' if options.hooks else 'no'}")
+
+        # 풀 사용 시: 같은 세션에 묶인 클라이언트(없으면 fresh)를 빌리고,
+        # 없으면 새로 연결한 클라이언트를 실행 후 풀에 반납한다.
+        lease: Optional[Lease] = None
+        if self._pool is not None and self.client is None:
+            lease = await self._pool.checkout(self.pool_key, session_id)
+            if lease is None:
+                lease = await self.open_lease(session_id)
+            else:
+                logger.info(f"풀 클라이언트 사용: thread={thread_ts}, pid={lease.pid}, session={session_id}")
+                # 웜 클라이언트는 default 로그에 연결돼 있으므로 이 스레드 로그로 옮긴다
+                if lease.stderr_file is not None:
+                    try:
+                        lease.stderr_file.bind(thread_ts)
+                    except Exception as e:
+                        logger.warning(f"stderr 로그 전환 실패: thread={thread_ts}, {e}")
+            self.client, self.pid = lease.client, lease.pid
+            compact_state = CompactRetryState(events=lease.compact_events)
+            options, stderr_file = None, None
+            logger.info(f"Claude Code SDK 실행 시작 (cwd={self.working_dir}, pooled)")
+        else:
+            compact_state = CompactRetryState()
+            options, stderr_file = self._build_options(session_id, compact_events=compact_state.events)
+            logger.info(f"Claude Code SDK 실행 시작 (cwd={self.working_dir})")
+            logger.info(f"[DEBUG-OPTIONS] permission_mode={options.permission_mode}")
+            logger.info(f"[DEBUG-OPTIONS] cwd={options.cwd}")
+            logger.info(f"[DEBUG-OPTIONS] mcp_servers={options.mcp_servers}")
+            logger.info(f"[DEBUG-OPTIONS] resume={options.resume}")
+            logger.info(f"[DEBUG-OPTIONS] allowed_tools count={len(options.allowed_tools) if options.allowed_tools else 0}")
+            logger.info(f"[DEBUG-OPTIONS] disallowed_tools count={len(options.disallowed_tools) if options.disallowed_tools else 0}")
+            logger.info(f"[DEBUG-OPTIONS] hooks={'yes' if options.hooks else 'no'}")
 
         # 현재 실행 루프를 인스턴스에 등록 (interrupt에서 사용)
         self.execution_loop = asyncio.get_running_loop()
@@ -936,8 +993,9 @@ class ClaudeRunner:
         if thread_ts:
             register_runner(self)
 
-        msg_state = MessageState()
+        msg_state = MessageState(collected_messages=self._new_message_log())
         _session_start = datetime.now(timezone.utc)
+        healthy = False
 
         try:
             client = await self._get_or_create_client(options=options)
@@ -980,13 +1038,14 @@ class ClaudeRunner:
                 break
 
             # 정상 완료
+            healthy = True
             output = msg_state.result_text or msg_state.current_text
 
             return EngineResult(
                 success=not msg_state.is_error,
                 output=output,
                 session_id=msg_state.session_id,
-                collected_messages=msg_state.collected_messages,
+                collected_messages=msg_state.collected_messages.to_list(),
                 is_error=msg_state.is_error,
                 usage=msg_state.usage,
             )
@@ -1061,10 +1120,16 @@ class ClaudeRunner:
                 error=str(e)
             )
         finally:
-            if not self._pooled:
+            if lease is not None:
+                # 풀에 반납: 세션이 확보된 정상 클라이언트만 재사용, 나머지는 풀이 종료
+                self.detach_client()
+                lease.session_id = msg_state.session_id or session_id
+                await self._pool.checkin(self.pool_key, lease, healthy=healthy)
+            elif not self._pooled:
                 await self._remove_client()
             # pooled 모드: client 유지, registry와 execution_loop만 정리
             self.execution_loop = None
+            msg_state.collected_messages.close()
             if thread_ts:
                 remove_runner(thread_ts)
             if stderr_file is not None:
@@ -6,9 +6,11 @@ ProcessError 분류, 세션 덤프 생성, stderr 캡처 등을 담당합니다.
 
 import logging
 import os
+import threading
 from collections import deque
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Optional
+from typing import IO, Callable, Optional
 
 try:
     from claude_agent_sdk._errors import ProcessError
@@ -21,19 +23,71 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _logs_dir() -> Path:
+    runtime_dir = Path(os.environ.get("SEOSOYOUNG_RUNTIME", Path(__file__).resolve().parents[4]))
+    return runtime_dir / "logs"
+
+
+def stderr_log_path(thread_ts: Optional[str] = None) -> Path:
+    """스레드별 cli_stderr 로그 경로 (thread_ts가 없으면 default)"""
+    suffix = thread_ts.replace(".", "_") if thread_ts else "default"
+    return _logs_dir() / f"cli_stderr_{suffix}.log"
+
+
+class StderrSink:
+    """CLI stderr를 받는 대상 파일을 바꿀 수 있는 싱크
+
+    풀 클라이언트는 연결 시점의 debug_stderr에 묶이므로, 스레드에 빌려줄
+    때마다 bind()로 그 스레드의 cli_stderr 로그로 대상을 옮깁니다.
+    SDK는 stderr 리더에서 write/flush만 호출합니다.
+    """
+
+    def __init__(self, thread_ts: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._file: Optional[IO[str]] = None
+        self.path: Optional[Path] = None
+        self.bind(thread_ts)
+
+    def bind(self, thread_ts: Optional[str] = None) -> None:
+        """이후 출력을 thread_ts의 로그 파일로 보냄 (열기 실패 시 예외)"""
+        path = stderr_log_path(thread_ts)
+        with self._lock:
+            if path == self.path and self._file is not None:
+                return
+            new_file = open(path, "a", encoding="utf-8")
+            new_file.write(f"\n--- CLI stderr capture start: {datetime.now(timezone.utc).isoformat()} ---\n")
+            new_file.flush()
+            old_file, self._file, self.path = self._file, new_file, path
+        if old_file is not None:
+            old_file.close()
+
+    def write(self, data: str) -> int:
+        with self._lock:
+            if self._file is None:
+                return 0
+            return self._file.write(data)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            old_file, self._file = self._file, None
+        if old_file is not None:
+            old_file.close()
+
+
 def read_stderr_tail(n_lines: int = 30, *, thread_ts: Optional[str] = None) -> str:
     """세션별 cli_stderr 로그의 마지막 N줄 읽기"""
     try:
-        runtime_dir = Path(os.environ.get("SEOSOYOUNG_RUNTIME", Path(__file__).resolve().parents[4]))
-        logs_dir = runtime_dir / "logs"
-
-        suffix = thread_ts.replace(".", "_") if thread_ts else "default"
-        session_path = logs_dir / f"cli_stderr_{suffix}.log"
+        session_path = stderr_log_path(thread_ts)
 
         if session_path.exists():
             stderr_path = session_path
         else:
-            stderr_path = logs_dir / "cli_stderr.log"
+            stderr_path = _logs_dir() / "cli_stderr.log"
             if not stderr_path.exists():
                 return "(cli_stderr.log not found)"
 
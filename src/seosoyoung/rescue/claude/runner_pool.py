@@ -0,0 +1,377 @@
+"""ClaudeSDKClient 웜 풀
+
+요청마다 CLI 서브프로세스를 띄우고 SDK 핸드셰이크를 기다리는 비용을 없애기
+위해, 연결된 클라이언트를 미리 만들어 두고 빌려 줍니다.
+
+클라이언트는 연결 시점의 옵션(cwd, 도구 제한, resume 등)에 묶이므로 풀은
+PoolKey(작업 디렉토리 + 옵션)별로 두 종류의 유휴 클라이언트를 보관합니다.
+
+- fresh: 아직 대화가 없는 클라이언트. 새 세션(session_id 없음) 요청에 사용하며
+  꺼낼 때마다 warm_size개가 되도록 백그라운드에서 다시 채웁니다.
+- session-bound: 실행을 마치고 반납된 클라이언트. 같은 session_id로 이어지는
+  요청에서 resume 없이 그대로 대화를 이어 갑니다.
+
+클라이언트(anyio 스트림)는 연결된 이벤트 루프에 묶이므로, 풀은 전용
+BackgroundLoop 하나에서 연결/실행/종료를 모두 수행합니다. 풀을 쓰는
+ClaudeRunner는 run_sync()가 이 루프로 코루틴을 보냅니다. 이 루프는 모든 풀
+러너가 함께 쓰므로, 실행 중 호출되는 콜백(on_compact 등)은 Slack API 같은
+블로킹 호출을 asyncio.to_thread로 넘겨야 다른 스레드의 실행을 멈추지 않습니다.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+
+import psutil
+
+from seosoyoung.utils.async_bridge import BackgroundLoop
+
+if TYPE_CHECKING:
+    from seosoyoung.rescue.claude.diagnostics import StderrSink
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolKey:
+    """클라이언트를 공유할 수 있는 실행 옵션 묶음"""
+
+    working_dir: str
+    allowed_tools: Optional[tuple[str, ...]]
+    disallowed_tools: tuple[str, ...]
+    mcp_config_path: str = ""
+
+
+@dataclass
+class Lease:
+    """풀이 빌려 주는 연결된 클라이언트
+
+    compact_events는 연결 시 PreCompact 훅이 붙잡은 리스트이므로 클라이언트와
+    수명을 같이 합니다. stderr_file(StderrSink)도 클라이언트가 끊길 때 닫으며,
+    빌려 가는 러너가 자기 스레드의 로그로 bind()합니다.
+    """
+
+    client: Any
+    pid: Optional[int]
+    compact_events: list = field(default_factory=list)
+    stderr_file: Optional["StderrSink"] = None
+    session_id: Optional[str] = None
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+ConnectFn = Callable[[PoolKey], Awaitable[Lease]]
+ProbeFn = Callable[[Lease], bool]
+
+
+def pid_alive(lease: Lease) -> bool:
+    """기본 헬스 프로브: CLI 서브프로세스가 살아 있는지 (pid를 모르면 True)"""
+    if lease.pid is None:
+        return True
+    try:
+        proc = psutil.Process(lease.pid)
+        return proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return False
+
+
+class RunnerPool:
+    """PoolKey별 웜 클라이언트 풀
+
+    Args:
+        connect: 새 클라이언트를 연결해 Lease로 돌려주는 코루틴 함수
+        warm_size: 키마다 유지할 fresh 클라이언트 수
+        max_idle: 유휴 클라이언트 총 상한. 넘으면 가장 오래 쉰 것부터 종료
+        idle_timeout: 이 시간(초) 넘게 쉰 클라이언트는 종료
+        probe: 꺼내기/반납 시 헬스 체크 함수
+    """
+
+    def __init__(
+        self,
+        connect: ConnectFn,
+        *,
+        warm_size: int = 1,
+        max_idle: int = 4,
+        idle_timeout: float = 600.0,
+        probe: ProbeFn = pid_alive,
+    ):
+        self._connect = connect
+        self.warm_size = warm_size
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self._probe = probe
+        self._loop = BackgroundLoop(name="rescue-runner-pool")
+
+        # 모든 상태는 풀 루프에서만 만지므로 asyncio 단일 스레드 규칙으로 보호된다.
+        self._fresh: dict[PoolKey, list[Lease]] = {}
+        self._bound: "OrderedDict[tuple[PoolKey, str], Lease]" = OrderedDict()
+        self._warming: dict[PoolKey, int] = {}
+        self._warm_tasks: set[asyncio.Task] = set()
+        self._keys: set[PoolKey] = set()
+        self._reaper: Optional[asyncio.Task] = None
+        self._closed = False
+        self._shutdown_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # === 동기 진입점 ===
+
+    def run_sync(self, coro):
+        """풀 루프에서 코루틴을 실행하고 결과를 기다림 (블로킹)"""
+        return self._loop.submit(coro).result()
+
+    def start(self, *keys: PoolKey) -> None:
+        """키별 프리워밍과 유휴 정리 작업을 시작 (블로킹하지 않음)"""
+        self._loop.submit(self._start(keys))
+
+    def drop_sync(self, key: PoolKey, session_id: str) -> bool:
+        """세션에 묶인 유휴 클라이언트를 종료 (없으면 False)"""
+        if self._closed:
+            return False
+        return self._loop.submit(self._drop(key, session_id)).result()
+
+    def shutdown_sync(self, timeout: float = 10.0) -> int:
+        """모든 유휴 클라이언트를 종료하고 풀 루프를 멈춤
+
+        시그널 핸들러 등 동기 컨텍스트에서 여러 번 불러도 안전합니다.
+
+        Returns:
+            종료한 클라이언트 수
+        """
+        with self._shutdown_lock:
+            if self._closed:
+                return 0
+            self._closed = True
+        leases = []
+        try:
+            count = self._loop.submit(self._close_all()).result(timeout=timeout)
+        except Exception as e:
+            logger.warning(f"풀 종료 중 오류, 남은 프로세스 강제 종료: {e}")
+            leases = self._all_idle()
+            for lease in leases:
+                self._kill(lease)
+            count = len(leases)
+        self._loop.stop()
+        return count
+
+    # === 풀 루프 코루틴 ===
+
+    async def _start(self, keys: tuple[PoolKey, ...]) -> None:
+        for key in keys:
+            self._keys.add(key)
+            self._replenish(key)
+        if self._reaper is None and self.idle_timeout > 0:
+            self._reaper = asyncio.create_task(self._reap_loop())
+
+    async def checkout(self, key: PoolKey, session_id: Optional[str] = None) -> Optional[Lease]:
+        """조건에 맞는 유휴 클라이언트를 꺼냄 (없으면 None)
+
+        session_id가 있으면 그 세션에 묶인 클라이언트만, 없으면 fresh
+        클라이언트만 돌려줍니다. 헬스 프로브를 통과하지 못한 것은 버립니다.
+        """
+        if self._closed:
+            return None
+        self._keys.add(key)
+
+        lease: Optional[Lease] = None
+        if session_id:
+            lease = self._bound.pop((key, session_id), None)
+            if lease is not None and not self._probe(lease):
+                await self._discard(lease, "헬스 체크 실패")
+                lease = None
+        else:
+            fresh = self._fresh.get(key, [])
+            while fresh and lease is None:
+                candidate = fresh.pop(0)
+                if self._probe(candidate):
+                    lease = candidate
+                else:
+                    await self._discard(candidate, "헬스 체크 실패")
+            self._replenish(key)
+
+        if lease is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        lease.compact_events.clear()
+        lease.last_used = time.monotonic()
+        return lease
+
+    async def checkin(self, key: PoolKey, lease: Lease, *, healthy: bool = True) -> None:
+        """실행을 마친 클라이언트를 반납
+
+        세션 ID가 있고 건강하면 session-bound로 보관하고, 아니면 종료합니다.
+        """
+        if self._closed or not healthy or not lease.session_id or not self._probe(lease):
+            await self._discard(lease, "반납 불가")
+            return
+
+        slot = (key, lease.session_id)
+        previous = self._bound.pop(slot, None)
+        if previous is not None and previous is not lease:
+            await self._discard(previous, "같은 세션의 새 클라이언트로 대체")
+        lease.last_used = time.monotonic()
+        self._bound[slot] = lease
+        await self._enforce_max_idle()
+
+    async def _drop(self, key: PoolKey, session_id: str) -> bool:
+        lease = self._bound.pop((key, session_id), None)
+        if lease is None:
+            return False
+        await self._discard(lease, "세션 무효화")
+        return True
+
+    async def evict_idle(self) -> int:
+        """idle_timeout을 넘긴 유휴 클라이언트 종료. 종료 수 반환"""
+        deadline = time.monotonic() - self.idle_timeout
+        expired_bound = [slot for slot, lease in self._bound.items() if lease.last_used < deadline]
+        count = 0
+        for slot in expired_bound:
+            await self._discard(self._bound.pop(slot), "유휴 시간 초과")
+            count += 1
+        for key, fresh in self._fresh.items():
+            keep = []
+            for lease in fresh:
+                if lease.last_used < deadline:
+                    await self._discard(lease, "유휴 시간 초과")
+                    count += 1
+                else:
+                    keep.append(lease)
+            fresh[:] = keep
+        for key in list(self._keys):
+            self._replenish(key)
+        return count
+
+    def stats(self) -> dict:
+        """풀 상태 요약"""
+        return {
+            "fresh": sum(len(v) for v in self._fresh.values()),
+            "bound": len(self._bound),
+            "warming": sum(self._warming.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    # === 내부 ===
+
+    def _all_idle(self) -> list[Lease]:
+        leases = list(self._bound.values())
+        for fresh in self._fresh.values():
+            leases.extend(fresh)
+        return leases
+
+    def _idle_count(self) -> int:
+        return len(self._bound) + sum(len(v) for v in self._fresh.values())
+
+    def _replenish(self, key: PoolKey) -> None:
+        """fresh 클라이언트가 warm_size보다 적으면 부족분을 백그라운드 연결"""
+        if self._closed:
+            return
+        have = len(self._fresh.get(key, [])) + self._warming.get(key, 0)
+        for _ in range(max(0, self.warm_size - have)):
+            self._warming[key] = self._warming.get(key, 0) + 1
+            task = asyncio.create_task(self._warm_one(key))
+            self._warm_tasks.add(task)
+            task.add_done_callback(self._warm_tasks.discard)
+
+    async def _warm_one(self, key: PoolKey) -> None:
+        try:
+            t0 = time.monotonic()
+            lease = await self._connect(key)
+            logger.info(f"웜 클라이언트 준비: pid={lease.pid}, {time.monotonic() - t0:.2f}s")
+        except Exception as e:
+            logger.warning(f"웜 클라이언트 연결 실패: {e}")
+            return
+        finally:
+            self._warming[key] -= 1
+        if self._closed:
+            await self._discard(lease, "풀 종료됨")
+            return
+        self._fresh.setdefault(key, []).append(lease)
+        await self._enforce_max_idle()
+
+    async def _enforce_max_idle(self) -> None:
+        # session-bound부터 가장 오래 쉰 순서로 줄인다 (fresh는 다음 요청용)
+        while self._idle_count() > self.max_idle and self._bound:
+            _, lease = self._bound.popitem(last=False)
+            await self._discard(lease, "풀 상한 초과")
+
+    async def _reap_loop(self) -> None:
+        interval = max(1.0, self.idle_timeout / 2)
+        while not self._closed:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.warning(f"유휴 클라이언트 정리 실패: {e}")
+
+    async def _close_all(self) -> int:
+        if self._reaper is not None:
+            self._reaper.cancel()
+        # 연결 중인 클라이언트는 끝까지 기다려 _warm_one이 스스로 종료하게 한다
+        if self._warm_tasks:
+            await asyncio.gather(*self._warm_tasks, return_exceptions=True)
+        leases = self._all_idle()
+        self._bound.clear()
+        self._fresh.clear()
+        for lease in leases:
+            await self._discard(lease, "풀 종료")
+        logger.info(f"러너 풀 종료: {len(leases)}개 클라이언트")
+        return len(leases)
+
+    async def _discard(self, lease: Lease, reason: str) -> None:
+        logger.info(f"풀 클라이언트 종료 ({reason}): pid={lease.pid}")
+        try:
+            await asyncio.wait_for(lease.client.disconnect(), timeout=5)
+        except Exception as e:
+            logger.warning(f"풀 클라이언트 disconnect 실패: pid={lease.pid}, {e}")
+            self._kill(lease)
+        if lease.stderr_file is not None:
+            try:
+                lease.stderr_file.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _kill(lease: Lease) -> None:
+        if lease.pid:
+            from seosoyoung.rescue.claude.agent_runner import ClaudeRunner
+            ClaudeRunner._force_kill_process(lease.pid, "pool")
+
+
+# 프로세스 종료 시 함께 정리할 풀 목록
+_pools: list[RunnerPool] = []
+_pools_lock = threading.Lock()
+
+
+def register_pool(pool: RunnerPool) -> None:
+    with _pools_lock:
+        _pools.append(pool)
+
+
+def shutdown_pools_sync() -> int:
+    """등록된 모든 풀 종료. 종료한 클라이언트 수 반환"""
+    with _pools_lock:
+        pools = list(_pools)
+        _pools.clear()
+    return sum(pool.shutdown_sync() for pool in pools)
+
+
+def key_for(
+    working_dir: Path,
+    allowed_tools: Optional[list[str]],
+    disallowed_tools: list[str],
+    mcp_config_path: Optional[Path] = None,
+) -> PoolKey:
+    """러너 설정으로 PoolKey 생성"""
+    return PoolKey(
+        working_dir=str(Path(working_dir).resolve()),
+        allowed_tools=tuple(allowed_tools) if allowed_tools is not None else None,
+        disallowed_tools=tuple(disallowed_tools),
+        mcp_config_path=str(mcp_config_path or ""),
+    )
@@ -2,27 +2,193 @@
 세션 검증 모듈
 
 Claude Code 세션의 유효성을 검증하고 세션 파일을 찾습니다.
+
+세션 파일은 ~/.claude/projects/<project>/<session_id>.jsonl 에 있습니다.
+매 resume마다 모든 프로젝트 디렉토리를 뒤지지 않도록 session_id → 경로
+인덱스를 유지합니다. 인덱스는 디렉토리 mtime이 바뀐 프로젝트만 다시 읽어
+갱신하고, 재시작 후에도 쓰도록 파일에 저장합니다. 인덱스에서 못 찾으면
+기존 방식의 전체 탐색으로 확인합니다.
 """
 
+import json
+import logging
+import os
 import re
+import threading
 from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+_INDEX_VERSION = 1
+
+
+def _default_index_path() -> Path:
+    runtime_dir = Path(os.environ.get("SEOSOYOUNG_RUNTIME", Path(__file__).resolve().parents[4]))
+    return runtime_dir / "data" / "session_index.json"
+
+
+class SessionIndex:
+    """session_id → 세션 파일 경로 인덱스
+
+    Args:
+        projects_dir: Claude 프로젝트 루트 (~/.claude/projects)
+        index_path: 인덱스 저장 파일 (None이면 저장하지 않음)
+    """
+
+    def __init__(self, projects_dir: Path, index_path: Optional[Path] = None):
+        self.projects_dir = projects_dir
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._loaded = False
+        # 프로젝트 디렉토리 이름 → 마지막으로 읽었을 때의 mtime_ns
+        self._dir_mtimes: dict[str, int] = {}
+        # session_id → 프로젝트 디렉토리 이름
+        self._sessions: dict[str, str] = {}
+
+    def lookup(self, session_id: str) -> Optional[Path]:
+        """세션 파일 경로 조회 (없으면 None)"""
+        file_name = f"{session_id}.jsonl"
+        with self._lock:
+            self._load()
+
+            path = self._indexed_path(session_id, file_name)
+            if path is not None:
+                return path
+
+            # 미스: 바뀐 디렉토리만 다시 읽고 재조회
+            if self._refresh():
+                self._save()
+            path = self._indexed_path(session_id, file_name)
+            if path is not None:
+                return path
+
+            # 폴백: 전체 탐색 (mtime 해상도가 낮은 파일시스템 등)
+            path = self._walk(file_name)
+            if path is not None:
+                self._sessions[session_id] = path.parent.name
+                self._save()
+            return path
+
+    def _indexed_path(self, session_id: str, file_name: str) -> Optional[Path]:
+        dir_name = self._sessions.get(session_id)
+        if dir_name is None:
+            return None
+        path = self.projects_dir / dir_name / file_name
+        if path.exists():
+            return path
+        del self._sessions[session_id]
+        return None
+
+    def _refresh(self) -> bool:
+        """mtime이 바뀐 프로젝트 디렉토리만 다시 읽음. 변경이 있었으면 True"""
+        if not self.projects_dir.exists():
+            return False
+
+        seen: set[str] = set()
+        changed = False
+        with os.scandir(self.projects_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                seen.add(entry.name)
+                try:
+                    mtime = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                if self._dir_mtimes.get(entry.name) == mtime:
+                    continue
+                self._scan_dir(entry.name)
+                self._dir_mtimes[entry.name] = mtime
+                changed = True
+
+        removed = set(self._dir_mtimes) - seen
+        if removed:
+            for name in removed:
+                del self._dir_mtimes[name]
+            self._sessions = {
+                sid: name for sid, name in self._sessions.items() if name not in removed
+            }
+            changed = True
+        return changed
+
+    def _scan_dir(self, dir_name: str) -> None:
+        stale = [sid for sid, name in self._sessions.items() if name == dir_name]
+        for sid in stale:
+            del self._sessions[sid]
+        try:
+            with os.scandir(self.projects_dir / dir_name) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".jsonl") and entry.is_file():
+                        self._sessions[entry.name[:-len(".jsonl")]] = dir_name
+        except OSError as e:
+            logger.debug(f"프로젝트 디렉토리 읽기 실패: {dir_name}, {e}")
+
+    def _walk(self, file_name: str) -> Optional[Path]:
+        if not self.projects_dir.exists():
+            return None
+        for project_dir in self.projects_dir.iterdir():
+            if project_dir.is_dir():
+                session_file = project_dir / file_name
+                if session_file.exists():
+                    return session_file
+        return None
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.index_path is None or not self.index_path.exists():
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if data.get("version") != _INDEX_VERSION or data.get("root") != str(self.projects_dir):
+                return
+            self._dir_mtimes = {k: int(v) for k, v in data.get("dirs", {}).items()}
+            self._sessions = dict(data.get("sessions", {}))
+        except Exception as e:
+            logger.warning(f"세션 인덱스 로드 실패 (재구축): {e}")
+            self._dir_mtimes, self._sessions = {}, {}
+
+    def _save(self) -> None:
+        if self.index_path is None:
+            return
+        data = {
+            "version": _INDEX_VERSION,
+            "root": str(self.projects_dir),
+            "dirs": self._dir_mtimes,
+            "sessions": self._sessions,
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            logger.warning(f"세션 인덱스 저장 실패: {e}")
+
+
+_indexes: dict[Path, SessionIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_session_index() -> SessionIndex:
+    """현재 홈 디렉토리 기준 세션 인덱스 (프로세스 공유)"""
+    claude_dir = Path.home() / ".claude" / "projects"
+    with _indexes_lock:
+        index = _indexes.get(claude_dir)
+        if index is None:
+            index = SessionIndex(claude_dir, _default_index_path())
+            _indexes[claude_dir] = index
+        return index
+
 
 def find_session_file(session_id: str) -> Optional[Path]:
     """세션 파일을 찾습니다."""
     claude_dir = Path.home() / ".claude" / "projects"
     if not claude_dir.exists():
         return None
-
-    session_file_name = f"{session_id}.jsonl"
-    for project_dir in claude_dir.iterdir():
-        if project_dir.is_dir():
-            session_file = project_dir / session_file_name
-            if session_file.exists():
-                return session_file
-
-    return None
+    return get_session_index().lookup(session_id)
 
 
 def validate_session(session_id: str) -> Optional[str]:
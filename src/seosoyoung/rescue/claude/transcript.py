@@ -0,0 +1,100 @@
+"""실행 중 수집 메시지 로그
+
+긴 세션에서 모든 메시지를 메모리에 쌓지 않도록, 진단용으로 최근 N개만
+링 버퍼에 보관하고 전체 기록은 선택적으로 JSONL 파일에 흘려 씁니다.
+"""
+
+import json
+import logging
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# 메모리에 유지할 최근 메시지 수
+DEFAULT_MESSAGE_LIMIT = 200
+
+# 도구 입력/결과 미리보기 최대 길이
+PREVIEW_LIMIT = 2000
+
+TOOL_USE_PREFIX = "[tool_use:"
+
+
+def serialize_tool_input(tool_input: Optional[dict]) -> tuple[str, dict]:
+    """도구 입력을 한 번만 직렬화하여 (미리보기 문자열, 이벤트용 입력) 반환
+
+    미리보기는 PREVIEW_LIMIT에서 자르고, 이벤트용 입력은 원본이 작으면
+    원본 dict를, 크면 잘린 미리보기를 담은 dict를 돌려줍니다. 두 값은 같은
+    문자열 객체를 공유합니다.
+    """
+    if not tool_input:
+        return "", tool_input or {}
+    try:
+        text = json.dumps(tool_input, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return "", {"_error": "serialize_failed"}
+    if len(text) <= PREVIEW_LIMIT:
+        return text, tool_input
+    preview = text[:PREVIEW_LIMIT] + "..."
+    return preview, {"_truncated": preview}
+
+
+class MessageLog:
+    """최근 메시지 링 버퍼 + 선택적 디스크 기록
+
+    Args:
+        limit: 메모리에 유지할 최근 메시지 수 (None이면 제한 없음)
+        spill_path: 전체 메시지를 JSONL로 기록할 파일 (None이면 기록 안 함)
+    """
+
+    def __init__(self, limit: Optional[int] = DEFAULT_MESSAGE_LIMIT, spill_path: Optional[Path] = None):
+        self._recent: deque[dict] = deque(maxlen=limit)
+        self._spill: Optional[IO[str]] = None
+        self.spill_path = spill_path
+        self.total = 0
+        # 링 버퍼에서 밀려나도 폴백 복원에 쓸 수 있도록 따로 보관
+        self.last_assistant_text = ""
+        if spill_path is not None:
+            try:
+                spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._spill = open(spill_path, "a", encoding="utf-8")
+            except OSError as e:
+                logger.warning(f"transcript 파일 열기 실패 (메모리만 사용): {e}")
+                self.spill_path = None
+
+    def append(self, role: str, content: str) -> None:
+        entry = {
+            "role": role,
+            "content": content,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        self._recent.append(entry)
+        self.total += 1
+        if role == "assistant" and not content.startswith(TOOL_USE_PREFIX):
+            self.last_assistant_text = content
+        if self._spill is not None:
+            try:
+                self._spill.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            except (OSError, ValueError) as e:
+                logger.warning(f"transcript 기록 실패, 이후 기록 중단: {e}")
+                self.close()
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._recent)
+
+    def to_list(self) -> list[dict]:
+        """보관 중인 최근 메시지 목록"""
+        return list(self._recent)
+
+    def close(self) -> None:
+        if self._spill is not None:
+            try:
+                self._spill.close()
+            except OSError:
+                pass
+            self._spill = None
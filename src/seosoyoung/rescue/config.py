@@ -37,6 +37,15 @@ class RescueConfig:
     # 봇 사용자 ID (런타임에 auth.test()로 설정)
     BOT_USER_ID: str | None = None
 
+    # 웜 러너 풀: 미리 연결해 둘 클라이언트 수 (0이면 풀 미사용)
+    POOL_WARM_SIZE: int = int(os.environ.get("RESCUE_POOL_SIZE", "1"))
+    # 유휴 클라이언트 총 상한 / 유휴 종료 시간(초)
+    POOL_MAX_IDLE: int = int(os.environ.get("RESCUE_POOL_MAX_IDLE", "4"))
+    POOL_IDLE_TIMEOUT: float = float(os.environ.get("RESCUE_POOL_IDLE_TIMEOUT", "600"))
+
+    # 스레드와 무관한 전역 동시 실행 턴 수 (초과분은 도착 순서대로 대기)
+    MAX_CONCURRENT_RUNS: int = int(os.environ.get("RESCUE_MAX_CONCURRENT_RUNS", "4"))
+
     @classmethod
     def validate(cls) -> None:
         """필수 환경변수 검증"""
@@ -50,6 +59,12 @@ class RescueConfig:
                 f"필수 환경변수가 설정되지 않았습니다: {', '.join(missing)}"
             )
 
+    @staticmethod
+    def get_transcript_dir() -> Path | None:
+        """실행별 전체 메시지 기록(JSONL) 디렉토리 (RESCUE_TRANSCRIPT_DIR, 없으면 기록 안 함)"""
+        transcript_dir = os.environ.get("RESCUE_TRANSCRIPT_DIR")
+        return Path(transcript_dir) if transcript_dir else None
+
     @staticmethod
     def get_working_dir() -> Path:
         """Claude Code SDK 작업 디렉토리 (env의 WORKSPACE_DIR 우선, 없으면 cwd)"""
@@ -9,6 +9,7 @@ Claude에 전달되며, env 주입은 사용하지 않습니다.
 """
 
 import logging
+import threading
 from typing import Optional
 
 from seosoyoung.rescue.config import RescueConfig
@@ -16,6 +17,7 @@ from seosoyoung.rescue.claude.agent_runner import (
     ClaudeRunner,
     get_runner as _get_runner,
 )
+from seosoyoung.rescue.claude.runner_pool import PoolKey, RunnerPool, register_pool
 from seosoyoung.rescue.claude.engine_types import EngineResult
 from seosoyoung.utils.async_bridge import run_in_new_loop
 
@@ -23,18 +25,50 @@ logger = logging.getLogger(__name__)
 
 DISALLOWED_TOOLS = ["WebFetch", "WebSearch", "Task"]
 
+_pool: Optional[RunnerPool] = None
+_pool_lock = threading.Lock()
 
-def create_runner(thread_ts: str = "") -> ClaudeRunner:
+
+async def _connect_for_pool(key: PoolKey):
+    return await ClaudeRunner.for_key(key).open_lease()
+
+
+def start_pool() -> Optional[RunnerPool]:
+    """웜 러너 풀을 만들고 프리워밍을 시작 (RESCUE_POOL_SIZE=0이면 None)
+
+    여러 번 호출해도 풀은 하나만 만듭니다. shutdown_all_sync()가 함께 종료합니다.
+    """
+    global _pool
+    if RescueConfig.POOL_WARM_SIZE <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = RunnerPool(
+                _connect_for_pool,
+                warm_size=RescueConfig.POOL_WARM_SIZE,
+                max_idle=RescueConfig.POOL_MAX_IDLE,
+                idle_timeout=RescueConfig.POOL_IDLE_TIMEOUT,
+            )
+            register_pool(_pool)
+            _pool.start(create_runner(use_pool=False).pool_key)
+            logger.info(f"웜 러너 풀 시작: warm_size={RescueConfig.POOL_WARM_SIZE}")
+        return _pool
+
+
+def create_runner(thread_ts: str = "", use_pool: bool = True) -> ClaudeRunner:
     """rescue-bot용 ClaudeRunner를 생성합니다.
 
     Args:
         thread_ts: 스레드 타임스탬프 (세션 키)
+        use_pool: start_pool()로 풀이 시작되어 있으면 풀 클라이언트를 사용
     """
     return ClaudeRunner(
         thread_ts=thread_ts,
         working_dir=RescueConfig.get_working_dir(),
         allowed_tools=None,
         disallowed_tools=DISALLOWED_TOOLS,
+        transcript_dir=RescueConfig.get_transcript_dir(),
+        pool=_pool if use_pool else None,
     )
 
 
@@ -47,6 +81,12 @@ def interrupt(thread_ts: str) -> bool:
 
 
 def compact_session_sync(session_id: str) -> EngineResult:
-    """세션 컴팩트 (동기)"""
-    runner = create_runner()
+    """세션 컴팩트 (동기)
+
+    컴팩트는 별도 클라이언트로 resume하여 수행하므로, 같은 세션에 묶인 풀
+    클라이언트(컴팩트 전 대화를 들고 있음)는 먼저 버립니다.
+    """
+    runner = create_runner(use_pool=False)
+    if _pool is not None:
+        _pool.drop_sync(runner.pool_key, session_id)
     return run_in_new_loop(runner.compact_session(session_id))
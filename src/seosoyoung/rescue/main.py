@@ -5,7 +5,8 @@ soul 서버를 경유하지 않는 독립 경량 봇입니다.
 
 메인 봇에서 복제한 기능:
 - SessionManager 기반 세션 관리
-- 인터벤션 (interrupt → pending prompt → while loop)
+- 인터벤션 (interrupt → 스레드 메일박스 → 합쳐진 후속 턴 1회)
+- 전역 동시 실행 상한 + 슬랙 대기 순번 표시
 - on_compact 컴팩션 알림
 - help/status/compact 명령어
 - 슬랙 컨텍스트 블록 (채널/스레드/파일 정보)
@@ -41,11 +42,12 @@ def _ensure_sdk_installed():
 
 _ensure_sdk_installed()
 
+import asyncio
 import logging
 import re
 import sys
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
@@ -53,11 +55,12 @@ from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 
 from seosoyoung.rescue.config import RescueConfig
-from seosoyoung.rescue.engine_adapter import create_runner, interrupt, compact_session_sync
+from seosoyoung.rescue.engine_adapter import create_runner, interrupt, compact_session_sync, start_pool
 from seosoyoung.rescue.claude.engine_types import EngineResult
 from seosoyoung.rescue.reflect import reflect
+from seosoyoung.rescue.run_slots import RunSlots
 from seosoyoung.rescue.session import Session, SessionManager
-from seosoyoung.rescue.slack_utils import update_message
+from seosoyoung.rescue.slack_utils import build_section_blocks, update_message
 
 # 로깅 설정
 logging.basicConfig(
@@ -76,6 +79,32 @@ class PendingPrompt:
     channel: str
     say: object
     client: object
+    status_ts: str = ""  # 슬랙 대기 안내 메시지 ts (후속 턴의 진행 메시지로 재사용)
+
+
+@dataclass
+class ThreadMailbox:
+    """실행 중인 스레드에 도착한 메시지 모음"""
+    prompts: list[PendingPrompt] = field(default_factory=list)
+    status_ts: str = ""
+
+    def merge(self) -> PendingPrompt:
+        """쌓인 메시지를 후속 턴 하나로 합침 (응답 대상은 마지막 메시지)"""
+        last = self.prompts[-1]
+        if len(self.prompts) == 1:
+            prompt = last.prompt
+        else:
+            lines = [f"실행 중에 도착한 메시지 {len(self.prompts)}건입니다. 모두 반영해 한 번에 답변해주세요."]
+            lines += [f"{i}. {p.prompt}" for i, p in enumerate(self.prompts, 1)]
+            prompt = "\n".join(lines)
+        return PendingPrompt(
+            prompt=prompt,
+            msg_ts=last.msg_ts,
+            channel=last.channel,
+            say=last.say,
+            client=last.client,
+            status_ts=self.status_ts,
+        )
 
 
 class RescueBotApp:
@@ -92,10 +121,13 @@ class RescueBotApp:
         self._thread_locks: dict[str, threading.Lock] = {}
         self._locks_lock = threading.Lock()
 
-        # 인터벤션: 대기 중인 프롬프트
-        self._pending_prompts: dict[str, PendingPrompt] = {}
+        # 인터벤션: 스레드별 메일박스 (실행 중 도착한 메시지)
+        self._pending_prompts: dict[str, ThreadMailbox] = {}
         self._pending_lock = threading.Lock()
 
+        # 전역 동시 실행 상한
+        self._run_slots = RunSlots(RescueConfig.MAX_CONCURRENT_RUNS)
+
         # 인터벤션: 실행 중인 runner 추적
         self._active_runners: dict[str, object] = {}
         self._runners_lock = threading.Lock()
@@ -181,9 +213,16 @@ class RescueBotApp:
     # === 인터벤션 ===
 
     def _pop_pending(self, thread_ts: str) -> Optional[PendingPrompt]:
-        """pending 프롬프트를 꺼내고 제거"""
+        """메일박스를 비우고 쌓인 메시지를 하나로 합쳐 반환"""
+        with self._pending_lock:
+            mailbox = self._pending_prompts.pop(thread_ts, None)
+        if mailbox is None or not mailbox.prompts:
+            return None
+        return mailbox.merge()
+
+    def _has_pending(self, thread_ts: str) -> bool:
         with self._pending_lock:
-            return self._pending_prompts.pop(thread_ts, None)
+            return thread_ts in self._pending_prompts
 
     def _handle_intervention(
         self,
@@ -197,7 +236,7 @@ class RescueBotApp:
         """인터벤션 처리: 실행 중인 스레드에 새 메시지가 도착한 경우"""
         logger.info(f"인터벤션 발생: thread={thread_ts}")
 
-        # pending에 저장 (최신 것으로 덮어씀)
+        # 메일박스에 추가: 실행이 끝나면 쌓인 메시지를 한 턴으로 합쳐 처리
         pending = PendingPrompt(
             prompt=prompt,
             msg_ts=msg_ts,
@@ -206,9 +245,16 @@ class RescueBotApp:
             client=client,
         )
         with self._pending_lock:
-            self._pending_prompts[thread_ts] = pending
+            mailbox = self._pending_prompts.setdefault(thread_ts, ThreadMailbox())
+            mailbox.prompts.append(pending)
+            queued = len(mailbox.prompts)
+            status_ts = mailbox.status_ts
 
-        # interrupt fire-and-forget (동기)
+        self._show_mailbox_status(thread_ts, channel, client, mailbox, queued, status_ts)
+
+        # interrupt fire-and-forget (동기): 첫 메시지에서만 보냄
+        if queued > 1:
+            return
         with self._runners_lock:
             active_runner = self._active_runners.get(thread_ts)
         if active_runner:
@@ -218,6 +264,45 @@ class RescueBotApp:
             except Exception as e:
                 logger.warning(f"인터럽트 전송 실패 (무시): thread={thread_ts}, {e}")
 
+    def _show_mailbox_status(
+        self, thread_ts: str, channel: str, client, mailbox: ThreadMailbox,
+        queued: int, status_ts: str,
+    ):
+        """메일박스 대기 안내 메시지를 게시하거나 갱신
+
+        첫 메시지가 안내를 게시하고 status_ts를 기록합니다. 게시 중 도착한
+        메시지는 건수를 갱신하지 않으므로, status_ts를 기록하는 쪽이 그때의
+        건수로 한 번 더 갱신합니다. 게시 중 메일박스가 후속 턴으로 넘어갔다면
+        안내 메시지를 삭제합니다.
+        """
+        try:
+            if status_ts:
+                update_message(client, channel, status_ts, self._mailbox_status_text(queued))
+                return
+            if queued > 1:
+                # 첫 메시지 쪽에서 게시 후 건수 갱신
+                return
+            text = self._mailbox_status_text(queued)
+            posted = client.chat_postMessage(
+                channel=channel, thread_ts=thread_ts, text=text,
+                blocks=build_section_blocks(text),
+            )
+            with self._pending_lock:
+                taken = self._pending_prompts.get(thread_ts) is not mailbox
+                if not taken:
+                    mailbox.status_ts = posted["ts"]
+                    latest = len(mailbox.prompts)
+            if taken:
+                client.chat_delete(channel=channel, ts=posted["ts"])
+            elif latest != queued:
+                update_message(client, channel, posted["ts"], self._mailbox_status_text(latest))
+        except Exception as e:
+            logger.warning(f"대기 안내 메시지 전송 실패: {e}")
+
+    @staticmethod
+    def _mailbox_status_text(queued: int) -> str:
+        return f"> 📥 현재 작업이 끝나면 이어서 답변합니다 (대기 메시지 {queued}건)"
+
     # === 메시지 처리 핵심 로직 ===
 
     @reflect.capability(
@@ -239,24 +324,33 @@ class RescueBotApp:
     ):
         """공통 메시지 처리 로직 (인터벤션 지원)"""
         lock = self._get_thread_lock(thread_ts)
+        first_prompt: Optional[str] = prompt
         if not lock.acquire(blocking=False):
-            # 인터벤션: pending에 저장 후 interrupt
+            # 인터벤션: 메일박스에 넣고 interrupt
             self._handle_intervention(
                 thread_ts, prompt, "", channel, say, client,
             )
-            return
+            # 실행 중이던 쪽이 그 사이 끝났다면 직접 메일박스를 비운다
+            if not lock.acquire(blocking=False):
+                return
+            first_prompt = None
 
-        try:
-            self._run_with_lock(
-                prompt, thread_ts, channel, user_id, say, client,
-                is_thread_reply=is_thread_reply,
-            )
-        finally:
-            lock.release()
+        while True:
+            try:
+                self._run_with_lock(
+                    first_prompt, thread_ts, channel, user_id, say, client,
+                    is_thread_reply=is_thread_reply,
+                )
+            finally:
+                lock.release()
+            first_prompt = None
+            # 락 해제 직전에 도착한 메시지가 남았으면 다시 잡고 처리
+            if not self._has_pending(thread_ts) or not lock.acquire(blocking=False):
+                return
 
     def _run_with_lock(
         self,
-        prompt: str,
+        prompt: Optional[str],
         thread_ts: str,
         channel: str,
         user_id: str,
@@ -264,24 +358,61 @@ class RescueBotApp:
         client,
         is_thread_reply: bool = False,
     ):
-        """락을 보유한 상태에서 실행 (while 루프로 pending 처리)"""
+        """락을 보유한 상태에서 실행 (while 루프로 메일박스 처리)"""
         # 첫 번째 실행
-        self._execute_once(
-            prompt, thread_ts, channel, user_id, say, client,
-            is_thread_reply=is_thread_reply,
-        )
+        if prompt is not None:
+            self._run_turn(
+                prompt, thread_ts, channel, user_id, say, client,
+                is_thread_reply=is_thread_reply,
+            )
 
-        # pending 확인 → while 루프
+        # 메일박스 확인 → 쌓인 메시지는 합쳐서 한 턴으로
         while True:
             pending = self._pop_pending(thread_ts)
             if not pending:
                 break
 
             logger.info(f"인터벤션 이어가기: thread={thread_ts}")
-            self._execute_once(
+            self._run_turn(
                 pending.prompt, thread_ts, channel, user_id,
                 pending.say, pending.client,
                 is_thread_reply=True,
+                status_ts=pending.status_ts,
+            )
+
+    def _run_turn(
+        self,
+        prompt: str,
+        thread_ts: str,
+        channel: str,
+        user_id: str,
+        say,
+        client,
+        is_thread_reply: bool = False,
+        status_ts: str = "",
+    ):
+        """전역 실행 슬롯을 얻어 한 턴 실행 (대기 중이면 순번을 슬랙에 표시)"""
+        status = {"ts": status_ts}
+
+        def on_position(position: int):
+            text = f"> ⏳ 다른 작업이 진행 중이라 대기 중입니다 ({position}번째)"
+            try:
+                if status["ts"]:
+                    update_message(client, channel, status["ts"], text)
+                else:
+                    posted = client.chat_postMessage(
+                        channel=channel, thread_ts=thread_ts, text=text,
+                        blocks=build_section_blocks(text),
+                    )
+                    status["ts"] = posted["ts"]
+            except Exception as e:
+                logger.warning(f"대기 순번 표시 실패: {e}")
+
+        with self._run_slots.slot(on_position):
+            self._execute_once(
+                prompt, thread_ts, channel, user_id, say, client,
+                is_thread_reply=is_thread_reply,
+                status_ts=status["ts"],
             )
 
     def _execute_once(
@@ -293,31 +424,41 @@ class RescueBotApp:
         say,
         client,
         is_thread_reply: bool = False,
+        status_ts: str = "",
     ):
-        """단일 Claude 실행"""
+        """단일 Claude 실행
+
+        status_ts가 있으면 (대기 안내 메시지) 새로 게시하지 않고 그 메시지를
+        진행 메시지로 바꿔 씁니다.
+        """
         session = self._get_or_create_session(thread_ts, channel)
 
         # 초기 메시지: blockquote 형태로 생각 과정 표시
         initial_text = "> 소영이 생각합니다..."
-        initial_msg = client.chat_postMessage(
-            channel=channel,
-            thread_ts=thread_ts,
-            text=initial_text,
-            blocks=[{
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": initial_text}
-            }]
-        )
-        last_msg_ts = initial_msg["ts"]
+        if status_ts:
+            update_message(client, channel, status_ts, initial_text)
+            last_msg_ts = status_ts
+        else:
+            initial_msg = client.chat_postMessage(
+                channel=channel,
+                thread_ts=thread_ts,
+                text=initial_text,
+                blocks=[{
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": initial_text}
+                }]
+            )
+            last_msg_ts = initial_msg["ts"]
 
-        # on_compact 콜백
+        # on_compact 콜백 (모든 풀 러너가 공유하는 풀 루프에서 호출되므로
+        # 블로킹 Slack 호출은 워커 스레드로 넘긴다)
         async def on_compact(trigger: str, message: str):
             try:
                 if trigger == "auto":
                     text = "🔄 컨텍스트가 자동 압축됩니다..."
                 else:
                     text = "📦 컨텍스트를 압축하는 중입니다..."
-                say(text=text, thread_ts=thread_ts)
+                await asyncio.to_thread(say, text=text, thread_ts=thread_ts)
             except Exception as e:
                 logger.warning(f"컴팩션 알림 전송 실패: {e}")
 
@@ -483,7 +624,9 @@ class RescueBotApp:
             text=(
                 f"📊 *상태 (rescue-bot)*\n"
                 f"• 작업 폴더: `{Path.cwd()}`\n"
-                f"• 활성 세션: {self.sessions.count()}개"
+                f"• 활성 세션: {self.sessions.count()}개\n"
+                f"• 실행 중: {self._run_slots.active}/{self._run_slots.capacity}, "
+                f"대기: {self._run_slots.waiting}"
             ),
             thread_ts=thread_ts,
         )
@@ -634,11 +777,16 @@ def main():
 
     def _on_shutdown():
         logger.info("rescue-bot: graceful shutdown")
+        from seosoyoung.rescue.claude.agent_runner import shutdown_all_sync
+        shutdown_all_sync()
         os._exit(0)
 
     _app = create_management_app(reflect, _on_shutdown)
     start_management_server(_app, _SHUTDOWN_PORT)
 
+    # 웜 러너 풀: 첫 요청 전에 CLI 클라이언트를 미리 연결
+    start_pool()
+
     # Slack 앱 초기화
     slack_app = App(token=RescueConfig.SLACK_BOT_TOKEN, logger=logger)
 
@@ -0,0 +1,86 @@
+"""rescue-bot 전역 동시 실행 슬롯
+
+스레드 수와 무관하게 동시에 실행되는 Claude 턴 수를 제한합니다.
+슬롯을 기다리는 요청은 도착 순서(FIFO)로 처리하며, 대기 순번이 바뀔
+때마다 콜백으로 알려 슬랙에 표시할 수 있게 합니다.
+"""
+
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+PositionCallback = Callable[[int], None]
+
+
+class RunSlots:
+    """FIFO 대기열이 있는 카운팅 세마포어
+
+    Args:
+        capacity: 동시에 실행할 수 있는 턴 수 (1 이상)
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._active = 0
+        self._waiting: deque[object] = deque()
+        self._cond = threading.Condition()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiting)
+
+    def acquire(self, on_position: Optional[PositionCallback] = None) -> None:
+        """슬롯을 얻을 때까지 대기
+
+        on_position은 대기열 순번(1부터)이 바뀔 때마다 락 밖에서 호출됩니다.
+        바로 실행할 수 있으면 호출되지 않습니다.
+        """
+        ticket = object()
+        last_position = 0
+        with self._cond:
+            if self._active < self.capacity and not self._waiting:
+                self._active += 1
+                return
+            self._waiting.append(ticket)
+
+        try:
+            while True:
+                with self._cond:
+                    while True:
+                        position = self._waiting.index(ticket) + 1
+                        if position == 1 and self._active < self.capacity:
+                            self._waiting.popleft()
+                            self._active += 1
+                            self._cond.notify_all()
+                            return
+                        if position != last_position:
+                            break
+                        self._cond.wait()
+                last_position = position
+                if on_position is not None:
+                    on_position(position)
+        except BaseException:
+            with self._cond:
+                if ticket in self._waiting:
+                    self._waiting.remove(ticket)
+                    self._cond.notify_all()
+            raise
+
+    def release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, on_position: Optional[PositionCallback] = None) -> Iterator[None]:
+        """with 블록 동안 슬롯을 점유"""
+        self.acquire(on_position)
+        try:
+            yield
+        finally:
+            self.release()
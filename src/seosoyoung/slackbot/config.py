@@ -77,6 +77,37 @@ def parse_slack_user_folder_map(raw: str | None) -> dict[str, str]:
             )
             return {}
         result[user_id.strip()] = folder_id.strip()
+
+    return result
+
+
+def parse_hook_timeouts(raw: str | None) -> dict[str, float]:
+    """PLUGIN_HOOK_TIMEOUTS JSON 문자열을 hook_name → 초(float) dict로 파싱"""
+    if raw is None or not raw.strip():
+        return {}
+
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError as e:
+        logger.error(f"PLUGIN_HOOK_TIMEOUTS 파싱 실패: {e}")
+        return {}
+
+    if not isinstance(parsed, dict):
+        logger.error("PLUGIN_HOOK_TIMEOUTS 파싱 실패: JSON object가 아닙니다")
+        return {}
+
+    result: dict[str, float] = {}
+    for hook_name, seconds in parsed.items():
+        if (
+            not isinstance(seconds, (int, float))
+            or isinstance(seconds, bool)
+            or seconds <= 0
+        ):
+            logger.error(
+                f"PLUGIN_HOOK_TIMEOUTS 파싱 실패: {hook_name}의 값은 양수여야 합니다"
+            )
+            return {}
+        result[hook_name] = float(seconds)
 
     return result
 
@@ -199,6 +230,82 @@ class BotIdentityConfig:
     )
 
 
+@dataclass
+class PluginRuntimeConfig:
+    """플러그인 훅 디스패치 설정"""
+
+    # 훅별 핸들러 데드라인 (예: {"on_message": 5}), 미지정 훅은 무제한
+    hook_timeouts: dict[str, float] = field(
+        default_factory=lambda: parse_hook_timeouts(os.getenv("PLUGIN_HOOK_TIMEOUTS"))
+    )
+    # 연속 실패(예외/타임아웃) N회 시 해당 핸들러를 건너뜀 (0이면 비활성)
+    breaker_threshold: int = int(os.getenv("PLUGIN_BREAKER_THRESHOLD", "5"))
+    # 차단 후 재시도까지 대기 시간(초)
+    breaker_cooldown: float = float(os.getenv("PLUGIN_BREAKER_COOLDOWN", "60"))
+    # 종료 시 진행 중인 observer 훅을 기다리는 최대 시간 (초)
+    observer_drain_timeout: float = float(os.getenv("PLUGIN_OBSERVER_DRAIN_TIMEOUT", "5"))
+
+
+@dataclass
+class LoggingConfig:
+    """로깅 파이프라인 설정
+
+    핫 패스는 큐 적재만 하고, 파일/콘솔 출력은 리스너 스레드가 담당합니다.
+    """
+
+    # 큐 최대 길이 (초과 시 레코드 유실 + 유실 카운트 증가)
+    queue_size: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    # JSON lines 형식으로 파일 기록 여부
+    json: bool = _parse_bool(os.getenv("LOG_JSON"), False)
+    # 파일 크기 기반 회전 (0이면 회전하지 않음), 회전된 파일은 gzip 압축
+    max_bytes: int = int(os.getenv("LOG_MAX_BYTES", str(50 * 1024 * 1024)))
+    backup_count: int = int(os.getenv("LOG_BACKUP_COUNT", "10"))
+    # 모듈(로거)별 초당 DEBUG 로그 허용량 (0이면 제한 없음)
+    debug_rate_limit: float = float(os.getenv("LOG_DEBUG_RATE_LIMIT", "50"))
+
+
+@dataclass
+class SchedulerConfig:
+    """에이전트 턴 실행 스케줄러 설정
+
+    Bolt 리스너 스레드와 분리된 워커 풀에서 턴을 실행합니다.
+    """
+
+    # 동시에 실행할 에이전트 턴 수
+    turn_workers: int = int(os.getenv("AGENT_TURN_WORKERS", "16"))
+    # 턴 대기열 최대 길이 (초과 시 거절 안내)
+    turn_queue_size: int = int(os.getenv("AGENT_TURN_QUEUE_SIZE", "200"))
+    # 인터벤션 등 제어 이벤트 전용 워커 수
+    control_workers: int = int(os.getenv("AGENT_CONTROL_WORKERS", "2"))
+    # 종료 시 실행 중인 턴을 기다리는 최대 시간(초)
+    shutdown_timeout: float = float(os.getenv("AGENT_SCHEDULER_SHUTDOWN_TIMEOUT", "5"))
+
+
+@dataclass
+class EventDedupConfig:
+    """Slack 이벤트 재전송 중복 제거 설정"""
+
+    # event_id 보존 시간(초). Slack 재전송(최대 수 분 후)보다 길게 유지
+    window: float = float(os.getenv("EVENT_DEDUP_WINDOW", "600"))
+    # 보관할 최대 키 수 (고정 메모리)
+    max_keys: int = int(os.getenv("EVENT_DEDUP_MAX_KEYS", "50000"))
+
+
+@dataclass
+class TracingConfig:
+    """턴 지연 추적 설정 (기본 비활성)
+
+    요약은 관리 서버 /reflect/stats/tracing 에서 볼 수 있습니다.
+    """
+
+    # 턴 단계별 span 기록 여부
+    enabled: bool = _parse_bool(os.getenv("TRACING_ENABLED"), False)
+    # 완료된 trace를 추가 기록할 파일 (비우면 메모리 요약만 유지)
+    export_path: str = os.getenv("TRACING_EXPORT_PATH", "")
+    # 파일 형식: jsonl(trace당 한 줄) 또는 otlp(OTLP/JSON, 줄당 ExportTraceServiceRequest)
+    export_format: str = os.getenv("TRACING_EXPORT_FORMAT", "jsonl")
+
+
 class Config:
     """애플리케이션 설정
 
@@ -216,6 +323,11 @@ class Config:
     orchestrator = OrchestratorConfig()
     emoji = EmojiConfig()
     bot = BotIdentityConfig()
+    log = LoggingConfig()
+    plugins = PluginRuntimeConfig()
+    scheduler = SchedulerConfig()
+    event_dedup = EventDedupConfig()
+    tracing = TracingConfig()
 
     # ========================================
     # 경로 설정 (런타임에 cwd 기준 계산)
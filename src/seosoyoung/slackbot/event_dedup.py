@@ -0,0 +1,175 @@
+"""Slack 이벤트 재전송 중복 제거
+
+Socket Mode는 ack가 늦으면 같은 이벤트를 다시 보냅니다(retry_attempt /
+X-Slack-Retry-Num). 워커가 긴 턴에 묶일수록 재전송이 잦아지고, 핸들러에는
+event_id 기준 가드가 없어 파일 다운로드/컨텍스트 조회/턴 실행까지 중복될 수
+있습니다.
+
+EventDeduplicator는 모든 핸들러 앞단의 Bolt 전역 미들웨어로 동작하며,
+이미 본 event_id(및 같은 메시지의 client_msg_id)를 작업 시작 전에 버립니다.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from slack_bolt import BoltResponse
+
+logger = logging.getLogger(__name__)
+
+
+class TimeBucketedSet:
+    """고정 메모리 시간 버킷 집합
+
+    window를 buckets개 구간으로 나눠 구간마다 집합 하나를 둡니다. 구간이
+    돌아오면 그 집합을 비우므로 키는 대략 window 동안 유지됩니다. 삽입/조회는
+    버킷 수(상수)에 비례하는 O(1)입니다.
+
+    Args:
+        window: 키 보존 시간(초)
+        buckets: 구간 수
+        max_keys: 전체 보관 키 상한. 한 구간에 max_keys/buckets개를 넘으면
+            더 이상 기록하지 않고 overflow로 셉니다.
+    """
+
+    def __init__(
+        self,
+        window: float,
+        buckets: int = 10,
+        max_keys: int = 50_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._n = max(1, buckets)
+        self._width = window / self._n
+        self._per_bucket = max(1, max_keys // self._n)
+        self._sets: list[set[str]] = [set() for _ in range(self._n)]
+        self._epochs = [-1] * self._n
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.overflow = 0
+
+    def _rotate(self) -> tuple[int, int]:
+        epoch = int(self._clock() // self._width)
+        idx = epoch % self._n
+        if self._epochs[idx] != epoch:
+            self._sets[idx].clear()
+            self._epochs[idx] = epoch
+        return idx, epoch
+
+    def _contains(self, key: str, epoch: int) -> bool:
+        oldest = epoch - self._n
+        return any(
+            self._epochs[i] > oldest and key in self._sets[i] for i in range(self._n)
+        )
+
+    def add_all_if_absent(self, keys: Iterable[str]) -> bool:
+        """keys 중 하나도 없으면 모두 기록하고 True, 하나라도 있으면 False"""
+        keys = list(keys)
+        with self._lock:
+            idx, epoch = self._rotate()
+            if any(self._contains(k, epoch) for k in keys):
+                return False
+            current = self._sets[idx]
+            if len(current) + len(keys) > self._per_bucket:
+                self.overflow += 1
+                return True
+            current.update(keys)
+            return True
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            _, epoch = self._rotate()
+            return self._contains(key, epoch)
+
+    def __len__(self) -> int:
+        with self._lock:
+            _, epoch = self._rotate()
+            oldest = epoch - self._n
+            return sum(len(s) for i, s in enumerate(self._sets) if self._epochs[i] > oldest)
+
+
+def event_keys(body: dict) -> list[str]:
+    """Events API 요청의 중복 판별 키 (이벤트가 아니면 빈 목록)"""
+    if body.get("type") != "event_callback":
+        return []
+    keys = []
+    event_id = body.get("event_id")
+    if event_id:
+        keys.append(f"event:{event_id}")
+    event = body.get("event") or {}
+    client_msg_id = event.get("client_msg_id")
+    if client_msg_id:
+        # 같은 사용자 메시지가 message/app_mention 양쪽으로 오는 것은 정상이므로 타입별로 구분
+        keys.append(f"msg:{event.get('type', '')}:{event.get('channel', '')}:{client_msg_id}")
+    return keys
+
+
+def _retry_num(request, body: dict) -> Optional[int]:
+    """재전송 횟수 (X-Slack-Retry-Num 헤더, 없으면 envelope의 retry_attempt)"""
+    headers = getattr(request, "headers", None) or {}
+    values = headers.get("x-slack-retry-num") or []
+    if isinstance(values, str):
+        values = [values]
+    raw = values[0] if values else body.get("retry_attempt")
+    try:
+        return int(raw) if raw is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class EventDeduplicator:
+    """event_id 기반 멱등성 레이어 (Bolt 전역 미들웨어)
+
+    Args:
+        window: 중복 판별 보존 시간(초). Slack 재전송 주기(최대 수 분)보다 길게.
+        max_keys: 보관 키 상한 (고정 메모리)
+    """
+
+    def __init__(self, window: float = 600.0, max_keys: int = 50_000, clock: Callable[[], float] = time.monotonic):
+        self._seen = TimeBucketedSet(window, max_keys=max_keys, clock=clock)
+        self._stats_lock = threading.Lock()
+        self.checked = 0
+        self.dropped = 0
+        self.dropped_retries = 0
+        self.retries_processed = 0
+
+    def is_duplicate(self, body: dict, retry_num: Optional[int] = None) -> bool:
+        """처음 본 이벤트면 기록 후 False, 이미 본 이벤트면 True"""
+        keys = event_keys(body)
+        if not keys:
+            return False
+        fresh = self._seen.add_all_if_absent(keys)
+        with self._stats_lock:
+            self.checked += 1
+            if fresh:
+                if retry_num:
+                    # 첫 전달을 놓친 재전송 (재시작 직후 등) → 처리
+                    self.retries_processed += 1
+            else:
+                self.dropped += 1
+                if retry_num:
+                    self.dropped_retries += 1
+        if not fresh:
+            logger.info(f"중복 이벤트 무시: {keys[0]} (retry={retry_num})")
+        return not fresh
+
+    def middleware(self, body, request, next):
+        """Bolt 전역 미들웨어: 중복이면 리스너를 호출하지 않고 바로 ack
+
+        next()를 부르지 않고 200 응답을 돌려주면 리스너 없이 ack만 됩니다.
+        """
+        if self.is_duplicate(body, _retry_num(request, body)):
+            return BoltResponse(status=200, body="")
+        return next()
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "checked": self.checked,
+                "dropped": self.dropped,
+                "dropped_retries": self.dropped_retries,
+                "retries_processed": self.retries_processed,
+                "tracked_keys": len(self._seen),
+                "overflow": self._seen.overflow,
+            }
@@ -604,21 +604,35 @@ def handle_plugins(*, command, say, ts, user_id, client, check_permission, plugi
 
     if subcmd == "list":
         plugins = plugin_manager.plugins
-        if not plugins:
+        lazy_plugins = plugin_manager.lazy_plugins
+        if not plugins and not lazy_plugins:
             say(text="로드된 플러그인이 없습니다.", thread_ts=ts)
             return
 
+        reports = plugin_manager.load_reports
         lines = ["🔌 *로드된 플러그인*"]
         for name, plugin in plugins.items():
             meta = plugin.meta
             priority = plugin_manager._priorities.get(name, 0)
+            report = reports.get(name)
+            load_time = f", load: {report.total_ms:.0f}ms" if report else ""
             lines.append(
-                f"• `{meta.name}` v{meta.version} (priority: {priority})"
+                f"• `{meta.name}` v{meta.version} (priority: {priority}{load_time})"
             )
             if meta.description:
                 lines.append(f"  _{meta.description}_")
+        for name, spec in lazy_plugins.items():
+            lines.append(
+                f"• `{name}` (lazy, 대기 중: {', '.join(spec.hooks)})"
+            )
         say(text="\n".join(lines), thread_ts=ts)
 
+    elif subcmd == "stats":
+        text = _format_plugin_stats(plugin_manager.hook_stats(), target)
+        if not target:
+            text += _format_dispatch_counts(plugin_manager.dispatch_counts())
+        say(text=text, thread_ts=ts)
+
     elif subcmd == "reload" and target:
         from seosoyoung.utils.async_bridge import run_in_new_loop
 
@@ -651,6 +665,7 @@ def handle_plugins(*, command, say, ts, user_id, client, check_permission, plugi
             text=(
                 "🔌 *plugins 명령어 사용법*\n"
                 "• `plugins list` - 로드된 플러그인 목록\n"
+                "• `plugins stats [이름]` - 훅 디스패치 지연/실패 통계\n"
                 "• `plugins reload <이름>` - 플러그인 리로드\n"
                 "• `plugins unload <이름>` - 플러그인 언로드"
             ),
@@ -658,6 +673,36 @@ def handle_plugins(*, command, say, ts, user_id, client, check_permission, plugi
         )
 
 
+def _format_plugin_stats(stats: dict, target: str | None = None) -> str:
+    """플러그인 훅 디스패치 통계를 슬랙 메시지로 포맷"""
+    if target:
+        stats = {target: stats[target]} if target in stats else {}
+    if not stats:
+        return "수집된 훅 디스패치 통계가 없습니다."
+
+    lines = ["📊 *플러그인 훅 통계*"]
+    for plugin_name, hooks in sorted(stats.items()):
+        lines.append(f"• `{plugin_name}`")
+        for hook_name, s in sorted(hooks.items()):
+            breaker = "" if s["breaker"] == "closed" else f" ⚠️ {s['breaker']}"
+            lines.append(
+                f"  `{hook_name}` {s['calls']}회 "
+                f"p50 {s['p50_ms']:.0f}ms / p99 {s['p99_ms']:.0f}ms / max {s['max_ms']:.0f}ms, "
+                f"오류 {s['errors']} · 타임아웃 {s['timeouts']} · 스킵 {s['skipped']}{breaker}"
+            )
+    return "\n".join(lines)
+
+
+def _format_dispatch_counts(counts: dict) -> str:
+    """이벤트 필터링 결과(디스패치 실행/스킵 수)를 슬랙 메시지로 포맷"""
+    if not counts:
+        return ""
+    lines = ["", "🚦 *이벤트 디스패치*"]
+    for hook_name, c in sorted(counts.items()):
+        lines.append(f"• `{hook_name}` 실행 {c['executed']} · 스킵 {c['skipped']}")
+    return "\n".join(lines)
+
+
 def handle_resume_list_run(*, say, ts, list_runner_ref=None, **_):
     """정주행 재개 명령어 핸들러"""
     list_runner = list_runner_ref() if list_runner_ref else None
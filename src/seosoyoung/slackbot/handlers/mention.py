@@ -11,10 +11,15 @@ from seosoyoung.slackbot.config import (
     DEFAULT_SOULSTREAM_FOLDER_ID,
     resolve_folder_id,
 )
+from seosoyoung.slackbot import tracing
 from seosoyoung.slackbot.reflect import reflect
 from seosoyoung.slackbot.slack import download_files_sync, build_file_context
 from seosoyoung.slackbot.slack.message_formatter import format_slack_message
-from seosoyoung.slackbot.handlers.message import process_thread_message, build_slack_context
+from seosoyoung.slackbot.handlers.message import (
+    process_thread_message,
+    build_slack_context,
+    schedule_turn,
+)
 from seosoyoung.slackbot.handlers.commands import (
     handle_help,
     handle_status,
@@ -173,7 +178,7 @@ def try_handle_command(
     """
     # Plugin hook dispatch: on_command (최우선)
     pm = deps.get("plugin_manager")
-    if pm and pm.plugins:
+    if pm and pm.has_subscribers("on_command"):
         try:
             from seosoyoung.utils.async_bridge import run_in_new_loop
             from seosoyoung.core.context import create_hook_context
@@ -278,7 +283,8 @@ def create_session_and_run_claude(
     update_message_fn = deps.get("update_message_fn")
     pm = deps.get("plugin_manager")
 
-    user_info = get_user_role(user_id, client)
+    with tracing.span("auth.lookup"):
+        user_info = get_user_role(user_id, client)
     if not user_info:
         say(text="사용자 정보를 확인할 수 없습니다.", thread_ts=thread_ts or ts)
         return
@@ -293,13 +299,14 @@ def create_session_and_run_claude(
     channel_store = co_plugin.store if co_plugin else None
     channel_observer_channels = co_plugin.channels if co_plugin else []
 
-    slack_messages = _get_channel_messages(client, channel, limit=20)
-    initial_ctx = build_initial_context(
-        channel_id=channel,
-        slack_messages=slack_messages,
-        monitored_channels=channel_observer_channels,
-        channel_store=channel_store,
-    )
+    with tracing.span("context.build"):
+        slack_messages = _get_channel_messages(client, channel, limit=20)
+        initial_ctx = build_initial_context(
+            channel_id=channel,
+            slack_messages=slack_messages,
+            monitored_channels=channel_observer_channels,
+            channel_store=channel_store,
+        )
 
     # 세션 생성
     session = session_manager.create(
@@ -323,7 +330,8 @@ def create_session_and_run_claude(
     file_download_failed = False
     if had_file_attachments:
         try:
-            downloaded_files = download_files_sync(event, session_thread_ts)
+            with tracing.span("files.download", count=len(event["files"])):
+                downloaded_files = download_files_sync(event, session_thread_ts)
             if downloaded_files:
                 file_context = build_file_context(downloaded_files)
                 logger.info(f"파일 {len(downloaded_files)}개 다운로드 완료")
@@ -404,7 +412,8 @@ def create_session_and_run_claude(
                 context_items=context_items,
                 channel_observer_channels=channel_observer_channels,
             )
-            ctx = run_in_new_loop(pm.dispatch("before_execute", ctx))
+            with tracing.span("plugin.before_execute"):
+                ctx = run_in_new_loop(pm.dispatch("before_execute", ctx))
             for result in ctx.results:
                 if isinstance(result, dict):
                     if "prompt" in result:
@@ -500,6 +509,11 @@ def register_mention_handlers(app, dependencies: dict):
 
     @app.event("app_mention")
     def handle_mention(event, say, client):
+        """@seosoyoung 멘션 처리 (턴 trace의 시작점)"""
+        with tracing.trace("slack.mention", channel=event.get("channel", ""), ts=event.get("ts", "")):
+            _handle_mention(event, say, client)
+
+    def _handle_mention(event, say, client):
         """@seosoyoung 멘션 처리
 
         - 채널에서 멘션: 세션 생성 + Claude 실행
@@ -554,7 +568,8 @@ def register_mention_handlers(app, dependencies: dict):
                     )
                     return
 
-                process_thread_message(
+                schedule_turn(
+                    dependencies, thread_ts, say, process_thread_message,
                     event, text, thread_ts, ts, channel, session, say, client,
                     get_user_role, run_claude_in_session, log_prefix="스레드 멘션",
                     session_manager=session_manager,
@@ -576,7 +591,8 @@ def register_mention_handlers(app, dependencies: dict):
 
         # 일반 질문: 세션 생성 + Claude 실행 (공유 함수 사용)
         clean_text = re.sub(r"<@[A-Z0-9]+>", "", text).strip()
-        create_session_and_run_claude(
+        schedule_turn(
+            dependencies, thread_ts or ts, say, create_session_and_run_claude,
             event, clean_text, channel, ts, thread_ts, user_id,
             say, client, dependencies,
         )
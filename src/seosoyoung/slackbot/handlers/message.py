@@ -3,6 +3,7 @@
 import re
 import logging
 
+from seosoyoung.slackbot import tracing
 from seosoyoung.slackbot.config import Config
 from seosoyoung.utils.async_bridge import run_in_new_loop
 from seosoyoung.core.context import create_hook_context
@@ -10,6 +11,7 @@ from seosoyoung.slackbot.slack import download_files_sync, build_file_context
 from seosoyoung.slackbot.slack.message_formatter import format_slack_message
 from seosoyoung.slackbot.soulstream.session_context import build_followup_context
 from seosoyoung.slackbot.handlers.auth import check_auth_session
+from seosoyoung.slackbot.scheduler import BUSY_MESSAGE, dispatch_turn
 
 logger = logging.getLogger(__name__)
 
@@ -79,7 +81,8 @@ def process_thread_message(
     file_context = ""
     if event.get("files"):
         try:
-            downloaded_files = download_files_sync(event, thread_ts)
+            with tracing.span("files.download", count=len(event["files"])):
+                downloaded_files = download_files_sync(event, thread_ts)
             if downloaded_files:
                 file_context = build_file_context(downloaded_files)
                 logger.info(f"파일 {len(downloaded_files)}개 다운로드 완료")
@@ -89,7 +92,8 @@ def process_thread_message(
     if not clean_text and not file_context:
         return False
 
-    user_info = get_user_role(user_id, client)
+    with tracing.span("auth.lookup"):
+        user_info = get_user_role(user_id, client)
     if not user_info:
         say(text="사용자 정보를 확인할 수 없습니다.", thread_ts=thread_ts)
         return True
@@ -112,12 +116,13 @@ def process_thread_message(
         and channel_store
         and session.last_seen_ts
     ):
-        followup = build_followup_context(
-            channel_id=channel,
-            last_seen_ts=session.last_seen_ts,
-            channel_store=channel_store,
-            monitored_channels=channel_observer_channels,
-        )
+        with tracing.span("context.build"):
+            followup = build_followup_context(
+                channel_id=channel,
+                last_seen_ts=session.last_seen_ts,
+                channel_store=channel_store,
+                monitored_channels=channel_observer_channels,
+            )
         if followup["messages"]:
             lines = [
                 format_slack_message(msg, channel=channel)
@@ -179,7 +184,8 @@ def process_thread_message(
                 context_items=context_items,
                 channel_observer_channels=channel_observer_channels,
             )
-            ctx = run_in_new_loop(pm.dispatch("before_execute", ctx))
+            with tracing.span("plugin.before_execute"):
+                ctx = run_in_new_loop(pm.dispatch("before_execute", ctx))
             for result in ctx.results:
                 if isinstance(result, dict):
                     if "prompt" in result:
@@ -258,6 +264,19 @@ def process_thread_message(
     return True
 
 
+def schedule_turn(dependencies: dict, key: str, say, fn, *args, **kwargs) -> None:
+    """에이전트 턴을 실행 스케줄러에 넘기고 리스너는 바로 반환
+
+    dependencies에 scheduler가 없으면 호출 스레드에서 바로 실행합니다.
+    대기열이 가득 차 거절되면 스레드에 안내 메시지를 남깁니다.
+    """
+    dispatch_turn(
+        dependencies.get("scheduler"), fn, *args, key=key,
+        on_rejected=lambda: say(text=BUSY_MESSAGE, thread_ts=key),
+        **kwargs,
+    )
+
+
 def _contains_bot_mention(text: str) -> bool:
     """텍스트에 봇 멘션이 포함되어 있는지 확인"""
     if not Config.slack.bot_user_id:
@@ -318,7 +337,8 @@ def _handle_dm_message(event, say, client, dependencies):
             )
             return
 
-        process_thread_message(
+        schedule_turn(
+            dependencies, thread_ts, say, process_thread_message,
             event, text, thread_ts, ts, channel, session, say, client,
             get_user_role, run_claude_in_session, log_prefix="DM 메시지",
             session_manager=session_manager,
@@ -345,7 +365,8 @@ def _handle_dm_message(event, say, client, dependencies):
         return
 
     # 일반 질문: 세션 생성 + Claude 실행 (공유 함수)
-    create_session_and_run_claude(
+    schedule_turn(
+        dependencies, ts, say, create_session_and_run_claude,
         event, clean_text, channel, ts, None, user_id,
         say, client, dependencies,
     )
@@ -375,7 +396,8 @@ def register_message_handlers(app, dependencies: dict):
         # 봇 메시지 포함 모든 메시지를 플러그인에 전달합니다.
         # ChannelObserverPlugin이 수집+소화 트리거를 처리합니다.
         # TranslatePlugin은 자체 bot_id 가드를 가집니다.
-        if pm and pm.plugins:
+        # 구독 필터에 걸리는 플러그인이 없으면 async 브릿지를 거치지 않습니다.
+        if pm and pm.should_dispatch("on_message", event):
             try:
                 ctx = create_hook_context(
                     "on_message", event=event,
@@ -396,7 +418,8 @@ def register_message_handlers(app, dependencies: dict):
         # DM 채널 메시지 → 전용 핸들러로 라우팅
         channel_type = event.get("channel_type", "")
         if channel_type == "im":
-            _handle_dm_message(event, say, client, dependencies)
+            with tracing.trace("slack.dm", channel=channel or "", ts=event.get("ts", "")):
+                _handle_dm_message(event, say, client, dependencies)
             return
 
         # DM 채널인데 channel_type이 없는 경우 감지 (Slack API 불일치 디버깅)
@@ -434,14 +457,16 @@ def register_message_handlers(app, dependencies: dict):
             )
             return
 
-        process_thread_message(
-            event, text, thread_ts, ts, channel, session, say, client,
-            get_user_role, run_claude_in_session, log_prefix="메시지",
-            session_manager=session_manager,
-            update_message_fn=dependencies.get("update_message_fn"),
-            plugin_manager=pm,
-            persistent_listener_manager=dependencies.get("persistent_listener_manager"),
-        )
+        with tracing.trace("slack.message", channel=channel, ts=ts):
+            schedule_turn(
+                dependencies, thread_ts, say, process_thread_message,
+                event, text, thread_ts, ts, channel, session, say, client,
+                get_user_role, run_claude_in_session, log_prefix="메시지",
+                session_manager=session_manager,
+                update_message_fn=dependencies.get("update_message_fn"),
+                plugin_manager=pm,
+                persistent_listener_manager=dependencies.get("persistent_listener_manager"),
+            )
 
     @app.event("reaction_added")
     def handle_reaction(event, client):
@@ -459,7 +484,7 @@ def register_message_handlers(app, dependencies: dict):
                 logger.error(f"채널 리액션 수집 실패 (added): {e}")
 
         # Plugin hook dispatch: on_reaction
-        if pm and pm.plugins:
+        if pm and pm.should_dispatch("on_reaction", event):
             try:
                 ctx = create_hook_context("on_reaction", event=event)
                 ctx = run_in_new_loop(pm.dispatch("on_reaction", ctx))
@@ -32,32 +32,245 @@ logger.debug()
     - 상세한 디버깅 정보
     - 개발/문제 해결 시에만 필요한 정보
     - 예: 폴링 상태, 락 획득/해제
+
+로깅 파이프라인
+==============
+
+루트 로거에는 QueueHandler 하나만 붙습니다. 로그를 남기는 스레드(SSE 이벤트
+디스패치, 플러그인 디스패치 등)는 큐 적재 비용만 지불하고, 파일/콘솔 출력은
+QueueListener 스레드가 담당합니다.
+
+- 큐는 크기가 제한되며, 가득 차면 레코드를 버리고 유실 카운트를 올립니다.
+  유실이 발생하면 큐에 여유가 생긴 뒤 경고 레코드 한 건으로 보고합니다.
+- 파일은 크기 기반으로 회전하고, 회전된 파일은 gzip으로 압축합니다.
+- LOG_JSON=true이면 파일을 JSON lines 형식으로 기록합니다.
+- DEBUG 로그는 모듈(로거)별로 초당 허용량을 넘으면 버립니다.
 """
 
+import atexit
+import copy
+import gzip
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
 from seosoyoung.slackbot.config import Config
 
+_TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+_listener: logging.handlers.QueueListener | None = None
+_queue_handler: "BoundedQueueHandler | None" = None
+_rate_filter: "ModuleRateLimitFilter | None" = None
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """크기 제한 큐에 레코드를 적재하는 핸들러
+
+    큐가 가득 차면 블로킹하지 않고 레코드를 버린 뒤 유실 카운트를 올립니다.
+    포맷팅은 리스너 스레드에서 수행하므로, 여기서는 메시지 인자 병합과
+    예외 정보 직렬화(드묾)만 합니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._unreported_drops = 0
+        self._exc_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self._unreported_drops += 1
+            return
+
+        if self._unreported_drops:
+            self._report_drops()
+
+    def _report_drops(self) -> None:
+        """누적된 유실 건수를 경고 레코드로 보고"""
+        count = self._unreported_drops
+        notice = logging.LogRecord(
+            name=__name__,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg=f"로그 큐 포화로 {count}건의 로그가 유실되었습니다",
+            args=None,
+            exc_info=None,
+        )
+        try:
+            self.queue.put_nowait(notice)
+        except queue.Full:
+            return
+        self._unreported_drops -= count
+
+
+class ModuleRateLimitFilter(logging.Filter):
+    """모듈(로거)별 DEBUG 로그 속도 제한 필터
+
+    토큰 버킷 방식으로, 로거 이름마다 초당 ``rate``건(버스트 ``burst``건)까지
+    통과시킵니다. ``max_level``을 초과하는 레벨의 레코드는 항상 통과합니다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        max_level: int = logging.DEBUG,
+    ) -> None:
+        super().__init__()
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.max_level = max_level
+        self.suppressed = 0
+        self._buckets: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or self.rate <= 0:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(record.name)
+            if bucket is None:
+                bucket = [self.burst, now]
+                self._buckets[record.name] = bucket
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens < 1.0:
+                bucket[0] = tokens
+                self.suppressed += 1
+                return False
+            bucket[0] = tokens - 1.0
+        return True
+
+
+class JsonLineFormatter(logging.Formatter):
+    """한 레코드를 한 줄의 JSON 객체로 직렬화하는 포매터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """회전된 로그 파일을 gzip으로 압축"""
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def _build_file_handler(log_file: Path) -> logging.Handler:
+    """크기 기반 회전 + gzip 압축 파일 핸들러 생성"""
+    handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=max(Config.log.max_bytes, 0),
+        backupCount=Config.log.backup_count,
+        encoding="utf-8",
+    )
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    if Config.log.json:
+        handler.setFormatter(JsonLineFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(_TEXT_FORMAT))
+    return handler
+
 
 def setup_logging() -> logging.Logger:
     """로깅 설정 및 로거 반환"""
+    global _listener, _queue_handler, _rate_filter
+
     log_dir = Path(Config.get_log_path())
     log_dir.mkdir(parents=True, exist_ok=True)
 
     log_file = log_dir / f"bot_{datetime.now().strftime('%Y%m%d')}.log"
 
+    shutdown_logging()
+
+    file_handler = _build_file_handler(log_file)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(_TEXT_FORMAT))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=max(Config.log.queue_size, 1))
+    _queue_handler = BoundedQueueHandler(log_queue)
+    _rate_filter = ModuleRateLimitFilter(rate=Config.log.debug_rate_limit)
+    _queue_handler.addFilter(_rate_filter)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+
     logging.basicConfig(
         level=logging.DEBUG if Config.debug else logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[
-            logging.FileHandler(log_file, encoding="utf-8"),
-            logging.StreamHandler()
-        ]
+        handlers=[_queue_handler],
+        force=True,
     )
 
     # urllib3 HTTP 요청 로그 억제 (폴링 등에서 과도한 DEBUG 로그 방지)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
     return logging.getLogger(__name__)
+
+
+def shutdown_logging() -> None:
+    """리스너를 멈추고 큐에 남은 레코드를 모두 기록
+
+    os._exit()는 atexit을 건너뛰므로, 프로세스 종료 직전에 직접 호출해야 합니다.
+    """
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def get_logging_stats() -> dict[str, int]:
+    """로깅 파이프라인 통계 (큐 적재량, 유실/속도제한 건수)"""
+    if _queue_handler is None:
+        return {"queued": 0, "dropped": 0, "rate_limited": 0}
+    return {
+        "queued": _queue_handler.queue.qsize(),
+        "dropped": _queue_handler.dropped,
+        "rate_limited": _rate_filter.suppressed if _rate_filter else 0,
+    }
+
+
+atexit.register(shutdown_logging)
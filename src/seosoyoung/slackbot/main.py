@@ -9,7 +9,7 @@ from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 
 from seosoyoung.slackbot.config import Config
-from seosoyoung.slackbot.logging_config import setup_logging
+from seosoyoung.slackbot.logging_config import get_logging_stats, setup_logging, shutdown_logging
 from seosoyoung.slackbot.auth import check_permission, get_user_role
 from pathlib import Path
 from seosoyoung.slackbot.soulstream.session import SessionManager, SessionRuntime
@@ -18,18 +18,28 @@ from seosoyoung.slackbot.presentation.session_listener import PersistentSessionL
 from seosoyoung.slackbot.slack.helpers import send_long_message, resolve_operator_dm
 from seosoyoung.slackbot.slack.formatting import update_message
 from seosoyoung.slackbot.handlers import register_all_handlers
+from seosoyoung.slackbot.scheduler import ExecutionScheduler
+from seosoyoung.slackbot.event_dedup import EventDeduplicator
 from seosoyoung.slackbot.handlers.actions import send_restart_confirmation
-from seosoyoung.core.plugin_manager import PluginManager
+from seosoyoung.core.plugin_manager import PluginManager, PluginSpec
 from seosoyoung.core.plugin_config import load_plugin_registry, load_plugin_config
 from seosoyoung.slackbot.restart import RestartManager, RestartType
 from seosoyoung.slackbot.marker_parser import parse_markers
 from seosoyoung.slackbot.handlers.mention_tracker import MentionTracker
 from seosoyoung.slackbot.plugin_backends import init_plugin_backends
 from seosoyoung.slackbot.reflect import reflect
+from seosoyoung.slackbot import tracing
 
 # 로깅 설정
 logger = setup_logging()
 
+# 턴 지연 추적 (비활성이면 no-op)
+tracer = tracing.configure(
+    enabled=Config.tracing.enabled,
+    export_path=Config.tracing.export_path or None,
+    export_format=Config.tracing.export_format,
+)
+
 # Slack 앱 초기화
 app = App(token=Config.slack.bot_token, logger=logger)
 
@@ -52,12 +62,27 @@ _channel_refs: dict = {
 def _perform_restart(restart_type: RestartType) -> None:
     """재시작 수행"""
     notify_shutdown()
+    # 대기 중인 턴은 버리고 실행 중인 턴만 잠시 기다린다
+    scheduler.shutdown(timeout=Config.scheduler.shutdown_timeout, cancel_pending=True)
+    _shutdown_plugin_observers()
+    # os._exit는 atexit을 건너뛰므로 로그·trace 큐를 직접 비운다
+    tracing.shutdown()
+    shutdown_logging()
     os._exit(restart_type.value)
 
 
+def _get_running_count() -> int:
+    """재시작 대기 기준: 실행 중인 세션 + 스케줄러에 남은 턴
+
+    스케줄러의 턴은 세션이 만들어지기 전(대기열, 인증·파일 준비 중)에도
+    끝나기 전까지 실행 중으로 센다.
+    """
+    return max(session_runtime.get_running_session_count(), scheduler.pending_turns())
+
+
 # 재시작 관리자
 restart_manager = RestartManager(
-    get_running_count=session_runtime.get_running_session_count,
+    get_running_count=_get_running_count,
     on_restart=_perform_restart
 )
 
@@ -112,7 +137,7 @@ def _shutdown_with_session_wait(restart_type: RestartType, source: str) -> None:
     """
     logger.info(f"[{source}] graceful shutdown 시작")
 
-    running_count = session_runtime.get_running_session_count()
+    running_count = _get_running_count()
     if running_count == 0:
         logger.info(f"[{source}] 활성 세션 없음 — 즉시 종료")
         _perform_restart(restart_type)
@@ -179,6 +204,15 @@ executor = ClaudeExecutor(
     persistent_listener_manager=persistent_listener_manager,
 )
 
+# 에이전트 턴 실행 스케줄러 (Bolt 리스너 스레드와 분리)
+scheduler = ExecutionScheduler(
+    turn_workers=Config.scheduler.turn_workers,
+    max_queue=Config.scheduler.turn_queue_size,
+    control_workers=Config.scheduler.control_workers,
+    # 세션 종료 시점엔 턴이 아직 워커에 남아 있으므로 턴이 끝날 때 다시 확인
+    on_turn_finished=_check_restart_on_session_stop,
+)
+
 # 멘션 트래커 (채널 관찰자-멘션 핸들러 통합용)
 _mention_tracker = MentionTracker()
 
@@ -194,7 +228,17 @@ async def _slack_notifier(message: str) -> None:
         logger.warning(f"플러그인 알림 전송 실패: {e}")
 
 
-plugin_manager = PluginManager(notifier=_slack_notifier)
+plugin_manager = PluginManager(
+    notifier=_slack_notifier,
+    hook_timeouts=Config.plugins.hook_timeouts,
+    breaker_threshold=Config.plugins.breaker_threshold,
+    breaker_cooldown=Config.plugins.breaker_cooldown,
+)
+
+
+# 호스트 코드가 plugin_manager.plugins에서 이름으로 직접 참조하는 플러그인
+# (handlers/message.py, handlers/commands.py, presentation/execution.py)
+_HOST_LOOKUP_PLUGINS = frozenset({"memory", "channel_observer", "translate"})
 
 
 @reflect.capability(
@@ -205,7 +249,15 @@ plugin_manager = PluginManager(notifier=_slack_notifier)
     ),
 )
 def _load_plugins() -> None:
-    """plugins.yaml 레지스트리에서 플러그인을 로드합니다."""
+    """plugins.yaml 레지스트리에서 플러그인을 로드합니다.
+
+    모듈 import와 on_load는 플러그인별로 동시에 진행됩니다.
+    레지스트리 항목에 ``lazy: true``와 ``hooks`` 목록을 지정하면
+    해당 훅이 처음 디스패치될 때 로드되고, ``load_timeout``(초)으로
+    on_load 타임아웃을 개별 지정할 수 있습니다.
+    호스트가 이름으로 조회하는 플러그인(_HOST_LOOKUP_PLUGINS)은 훅 디스패치를
+    거치지 않고 참조되므로 ``lazy``를 무시하고 즉시 로드합니다.
+    """
     from seosoyoung.utils.async_bridge import run_in_new_loop
 
     base_dir = Path.cwd()  # bot CWD = services/bot (haniel services.bot.cwd) → config/plugins.yaml ✓
@@ -218,32 +270,45 @@ def _load_plugins() -> None:
 
     _ENTRY_REQUIRED = ("config", "priority")
 
-    async def _load_all():
-        for entry in registry:
-            name = entry["name"]
-            missing = [f for f in _ENTRY_REQUIRED if f not in entry]
-            if missing:
-                logger.error(
-                    "플러그인 로드 스킵 (%s): plugins.yaml에 필수 필드 누락 %s",
-                    name, missing,
-                )
-                continue
-
-            try:
-                config_path = base_dir / entry["config"]
-                config = load_plugin_config(config_path)
-
-                await plugin_manager.load(
-                    module=entry["module"],
-                    config=config,
-                    priority=entry["priority"],
-                    depends_on=entry.get("depends_on", []),
-                )
-            except Exception as e:
-                logger.error(f"플러그인 로드 실패 ({name}): {e}")
-
-
-    run_in_new_loop(_load_all())
+    specs: list[PluginSpec] = []
+    for entry in registry:
+        name = entry["name"]
+        missing = [f for f in _ENTRY_REQUIRED if f not in entry]
+        if missing:
+            logger.error(
+                "플러그인 로드 스킵 (%s): plugins.yaml에 필수 필드 누락 %s",
+                name, missing,
+            )
+            continue
+
+        try:
+            config = load_plugin_config(base_dir / entry["config"])
+        except Exception as e:
+            logger.error(f"플러그인 로드 실패 ({name}): {e}")
+            continue
+
+        lazy = bool(entry.get("lazy", False))
+        if lazy and name in _HOST_LOOKUP_PLUGINS:
+            logger.warning(
+                "플러그인 %s는 호스트가 이름으로 조회하므로 lazy를 무시하고 즉시 로드합니다", name,
+            )
+            lazy = False
+
+        specs.append(PluginSpec(
+            name=name,
+            module=entry["module"],
+            config=config,
+            priority=entry["priority"],
+            depends_on=entry.get("depends_on", []),
+            lazy=lazy,
+            hooks=entry.get("hooks", []),
+            timeout=entry.get("load_timeout"),
+        ))
+
+    reports = run_in_new_loop(plugin_manager.load_all(specs))
+    for report in reports:
+        if report.status in ("failed", "timeout"):
+            logger.error(f"플러그인 로드 실패 ({report.name}): {report.error}")
 
 
 def _build_dependencies():
@@ -254,6 +319,7 @@ def _build_dependencies():
         "get_session_lock": session_runtime.get_session_lock,
         "get_running_session_count": session_runtime.get_running_session_count,
         "run_claude_in_session": executor.run,
+        "scheduler": scheduler,
         "check_permission": check_permission,
         "get_user_role": get_user_role,
         "send_restart_confirmation": send_restart_confirmation,
@@ -276,6 +342,13 @@ def _build_dependencies():
     }
 
 
+# 재전송 중복 제거: 모든 핸들러보다 먼저 실행되는 전역 미들웨어
+event_deduplicator = EventDeduplicator(
+    window=Config.event_dedup.window,
+    max_keys=Config.event_dedup.max_keys,
+)
+app.use(event_deduplicator.middleware)
+
 # 핸들러 등록
 register_all_handlers(app, _build_dependencies())
 
@@ -302,6 +375,18 @@ def notify_shutdown():
         logger.error(f"종료 알림 실패: {e}")
 
 
+def _shutdown_plugin_observers():
+    """백그라운드 루프의 observer 훅을 마저 처리하고 루프를 멈춤"""
+    from seosoyoung.utils.async_bridge import run_in_new_loop
+
+    try:
+        run_in_new_loop(
+            plugin_manager.shutdown_observers(timeout=Config.plugins.observer_drain_timeout)
+        )
+    except Exception as e:
+        logger.error(f"observer 훅 정리 실패: {e}")
+
+
 def _dispatch_plugin_startup():
     """Dispatch on_startup hook to all loaded plugins.
 
@@ -364,7 +449,18 @@ def main():
         """
         _shutdown_with_session_wait(RestartType.RESTART, "HTTP /shutdown")
 
-    _app = create_management_app(reflect, _on_shutdown_request)
+    _app = create_management_app(
+        reflect,
+        _on_shutdown_request,
+        stats_providers={
+            "plugins": plugin_manager.hook_stats,
+            "plugin_dispatch": plugin_manager.dispatch_counts,
+            "scheduler": scheduler.stats,
+            "event_dedup": event_deduplicator.stats,
+            "tracing": tracer.summary,
+            "logging": get_logging_stats,
+        },
+    )
     start_management_server(_app, _SHUTDOWN_PORT)
     init_bot_user_id()
 
@@ -377,6 +473,7 @@ def main():
         data_dir=Path(Config.get_session_path()).parent / "data",
         update_message_fn=update_message,
         mention_tracker=_mention_tracker,
+        role_tools=Config.auth.role_tools,
     )
 
     _load_plugins()
@@ -11,8 +11,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import weakref
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import Any, AsyncIterator, Callable, TYPE_CHECKING
 
 from seosoyoung.plugin_sdk import slack, soulstream, mention
 from seosoyoung.plugin_sdk.slack import (
@@ -31,10 +32,13 @@ from seosoyoung.plugin_sdk.soulstream import (
     RunResult,
     RunStatus,
     SoulstreamBackend,
+    StreamEvent,
+    StreamEventType,
 )
 
 if TYPE_CHECKING:
     from seosoyoung.slackbot.handlers.mention_tracker import MentionTracker
+    from seosoyoung.slackbot.soulstream.service_client import SSEEvent, SoulServiceClient
     from seosoyoung.slackbot.soulstream.session import SessionManager
 
 logger = logging.getLogger(__name__)
@@ -301,6 +305,40 @@ class SlackBackendImpl(SlackBackend):
 # ============================================================================
 
 
+def _to_stream_event(raw: "SSEEvent") -> StreamEvent | None:
+    """SSE 이벤트를 plugin_sdk StreamEvent로 변환 (플러그인에 불필요한 이벤트는 None)"""
+    from seosoyoung.slackbot.soulstream.service_client import SoulServiceClient
+
+    data = raw.data
+    eid = SoulServiceClient._event_id_as_int(raw.id)
+    name = raw.event
+    if name == "init":
+        session_id = data.get("agent_session_id") or data.get("agentSessionId") or ""
+        return StreamEvent(StreamEventType.SESSION, session_id, data, eid)
+    if name == "thinking":
+        return StreamEvent(
+            StreamEventType.THINKING, data.get("thinking") or data.get("text", ""), data, eid,
+        )
+    if name in ("text_start", "text_end"):
+        return StreamEvent(StreamEventType(name), "", data, eid)
+    if name == "text_delta":
+        return StreamEvent(StreamEventType.TEXT_DELTA, data.get("text", ""), data, eid)
+    if name == "tool_start":
+        return StreamEvent(StreamEventType.TOOL_START, data.get("tool_name", ""), data, eid)
+    if name == "tool_result":
+        result = data.get("result", "")
+        return StreamEvent(
+            StreamEventType.TOOL_RESULT, result if isinstance(result, str) else str(result), data, eid,
+        )
+    if name == "compact":
+        return StreamEvent(StreamEventType.COMPACT, data.get("message", ""), data, eid)
+    if name == "complete":
+        return StreamEvent(StreamEventType.COMPLETE, data.get("result", "") or "", data, eid)
+    if name == "error":
+        return StreamEvent(StreamEventType.ERROR, data.get("message", "알 수 없는 오류"), data, eid)
+    return None
+
+
 class SoulstreamBackendImpl(SoulstreamBackend):
     """Soulstream backend implementation using ClaudeExecutor."""
 
@@ -312,6 +350,8 @@ class SoulstreamBackendImpl(SoulstreamBackend):
         data_dir: Path,
         slack_client=None,
         update_message_fn=None,
+        role_tools: dict | None = None,
+        client_factory: Callable[[], "SoulServiceClient"] | None = None,
     ):
         """Initialize with Claude executor and session manager.
 
@@ -323,6 +363,9 @@ class SoulstreamBackendImpl(SoulstreamBackend):
             slack_client: Slack WebClient instance (for auto-constructing PresentationContext)
             update_message_fn: (client, channel, ts, text, *, blocks=None) -> None
                                전달하면 on_compact가 None일 때 자동 생성됨
+            role_tools: stream()에서 쓸 역할별 허용 도구 (None이면 Config.auth.role_tools)
+            client_factory: stream()용 SoulServiceClient 생성 함수
+                            (None이면 executor와 같은 설정으로 생성)
         """
         self._executor = executor
         self._session_manager = session_manager
@@ -330,6 +373,16 @@ class SoulstreamBackendImpl(SoulstreamBackend):
         self._data_dir = data_dir
         self._slack_client = slack_client
         self._update_message_fn = update_message_fn
+        self._role_tools = role_tools
+        self._client_factory = client_factory
+        # 이벤트 루프별 SoulServiceClient (aiohttp 세션이 루프에 묶이므로 루프 단위로 공유)
+        self._stream_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SoulServiceClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # 루프가 끝날 때 해당 클라이언트를 닫는 태스크
+        self._stream_guards: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = (
+            weakref.WeakKeyDictionary()
+        )
 
     def _build_presentation(
         self,
@@ -627,6 +680,96 @@ class SoulstreamBackendImpl(SoulstreamBackend):
                 error=str(e),
             )
 
+    def _stream_client(self) -> "SoulServiceClient":
+        """호출자 이벤트 루프에 묶인 SoulServiceClient (루프마다 하나, keep-alive 연결 재사용)"""
+        loop = asyncio.get_running_loop()
+        client = self._stream_clients.get(loop)
+        if client is None:
+            if self._client_factory is not None:
+                client = self._client_factory()
+            else:
+                from seosoyoung.slackbot.soulstream.executor import build_soul_client
+
+                client = build_soul_client()
+            self._stream_clients[loop] = client
+            # run_in_new_loop처럼 호출마다 새로 만드는 루프는 asyncio.run이 끝나며
+            # 남은 태스크를 취소하므로, 그때 aiohttp 세션도 함께 닫힌다.
+            self._stream_guards[loop] = loop.create_task(self._close_on_loop_exit(loop, client))
+        return client
+
+    async def _close_on_loop_exit(
+        self, loop: asyncio.AbstractEventLoop, client: "SoulServiceClient",
+    ) -> None:
+        """취소될 때(루프 종료 또는 close_stream_client)까지 기다렸다가 클라이언트를 닫는다"""
+        try:
+            await loop.create_future()
+        finally:
+            if self._stream_clients.get(loop) is client:
+                del self._stream_clients[loop]
+            await client.close()
+
+    async def close_stream_client(self) -> None:
+        """현재 루프의 stream용 클라이언트를 닫는다 (상시 실행 루프를 멈추기 전 호출)."""
+        guard = self._stream_guards.pop(asyncio.get_running_loop(), None)
+        if guard is not None:
+            guard.cancel()
+            await asyncio.gather(guard, return_exceptions=True)
+
+    async def stream(
+        self,
+        prompt: str,
+        channel: str,
+        thread_ts: str,
+        role: str = "admin",
+        session_id: str | None = None,
+        context: list[dict] | None = None,
+        folder_id: str | None = None,
+        system_prompt: str | None = None,
+        agent_id: str | None = None,
+        caller_info: dict | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamEvent]:
+        """Execute Claude Code and yield events on the caller's loop.
+
+        executor/스레드/새 이벤트 루프를 거치지 않고 호출자 루프에서 SSE를 직접
+        읽는다. 실패는 예외 대신 마지막 ERROR 이벤트로 전달한다.
+
+        executor의 스레드 락을 잡지 않으므로 스레드의 Slack 세션을 암묵적으로
+        이어받지 않는다 (진행 중인 턴과 같은 세션을 동시에 resume하면 충돌).
+        session_id를 명시한 경우에만 resume하고, 결과 세션 id도 스레드 세션에
+        기록하지 않는다.
+        """
+        from seosoyoung.slackbot.soulstream.executor import _get_role_config
+
+        role_tools = self._role_tools
+        if role_tools is None:
+            from seosoyoung.slackbot.config import Config
+
+            role_tools = Config.auth.role_tools
+        role_config = _get_role_config(role or "admin", role_tools)
+
+        try:
+            events = self._stream_client().stream(
+                prompt,
+                agent_session_id=session_id,
+                allowed_tools=role_config["allowed_tools"],
+                disallowed_tools=role_config["disallowed_tools"],
+                use_mcp=role_config["mcp_config_path"] is not None,
+                context=context,
+                model=kwargs.get("model"),
+                folder_id=folder_id,
+                system_prompt=system_prompt,
+                profile=agent_id,
+                caller_info=caller_info,
+            )
+            async for raw in events:
+                event = _to_stream_event(raw)
+                if event is not None:
+                    yield event
+        except Exception as e:
+            logger.error(f"soulstream.stream failed: {e}")
+            yield StreamEvent(type=StreamEventType.ERROR, text=str(e))
+
     async def compact(self, session_id: str) -> CompactResult:
         """Compact a Claude Code session."""
         try:
@@ -697,6 +840,7 @@ def init_plugin_backends(
     data_dir: Path,
     update_message_fn=None,
     mention_tracker: "MentionTracker | None" = None,
+    role_tools: dict | None = None,
 ) -> None:
     """Initialize plugin SDK backends.
 
@@ -711,6 +855,7 @@ def init_plugin_backends(
         update_message_fn: (client, channel, ts, text, *, blocks=None) -> None
                            전달하면 워처 등에서 on_compact가 자동 생성됨
         mention_tracker: MentionTracker instance for mention tracking backend
+        role_tools: soulstream.stream()에서 쓸 역할별 허용 도구
     """
     # Initialize Slack backend
     slack_backend = SlackBackendImpl(slack_client)
@@ -722,6 +867,7 @@ def init_plugin_backends(
         executor, session_manager, restart_manager, data_dir,
         slack_client=slack_client,
         update_message_fn=update_message_fn,
+        role_tools=role_tools,
     )
     soulstream.set_backend(soulstream_backend)
     logger.info("plugin_sdk.soulstream backend initialized")
@@ -7,6 +7,7 @@ on_compact 래핑 보일러플레이트를 캡슐화합니다.
 import logging
 from typing import Callable, TYPE_CHECKING
 
+from seosoyoung.slackbot import tracing
 from seosoyoung.slackbot.presentation.activity_board import ActivityBoard, BOARD_EMPTY_TEXT
 from seosoyoung.slackbot.presentation.node_map import SlackNodeMap
 from seosoyoung.slackbot.presentation.progress import (
@@ -43,22 +44,23 @@ def run_with_event_callbacks(
             override와 함께 사용 시, override된 콜백에 wrapper가 적용됩니다.
 
     """
-    placeholder_ts = post_initial_placeholder(
-        pctx.client, pctx.channel, pctx.thread_ts,
-    )
-
-    # clean 모드: B placeholder 생성
-    board = None
-    if mode == "clean":
-        try:
-            reply = pctx.client.chat_postMessage(
-                channel=pctx.channel,
-                thread_ts=pctx.thread_ts,
-                text=BOARD_EMPTY_TEXT,
-            )
-            board = ActivityBoard(pctx.client, pctx.channel, reply["ts"])
-        except Exception as e:
-            logger.warning(f"placeholder B 게시 실패: {e}")
+    with tracing.span("slack.placeholder", mode=mode):
+        placeholder_ts = post_initial_placeholder(
+            pctx.client, pctx.channel, pctx.thread_ts,
+        )
+
+        # clean 모드: B placeholder 생성
+        board = None
+        if mode == "clean":
+            try:
+                reply = pctx.client.chat_postMessage(
+                    channel=pctx.channel,
+                    thread_ts=pctx.thread_ts,
+                    text=BOARD_EMPTY_TEXT,
+                )
+                board = ActivityBoard(pctx.client, pctx.channel, reply["ts"])
+            except Exception as e:
+                logger.warning(f"placeholder B 게시 실패: {e}")
 
     node_map = SlackNodeMap()
     event_cbs = build_event_callbacks(
@@ -7,6 +7,7 @@ PresentationContext를 캡처하는 클로저 집합을 반환합니다.
 import asyncio
 import logging
 import os
+from seosoyoung.slackbot import tracing
 from seosoyoung.slackbot.formatting import (
     format_initial_placeholder,
     format_thinking_initial,
@@ -53,6 +54,28 @@ def _thinking_delete_delay() -> float:
     return float(os.environ["SOULSTREAM_THINKING_DELETE_DELAY"])
 
 
+def _once_per_event(pctx: PresentationContext, callback):
+    """이벤트 id 기준 멱등 래퍼
+
+    소울스트림 이벤트 id는 세션 내에서 단조 증가하므로, 이미 렌더링한 id
+    (pctx.last_event_id) 이하의 이벤트는 재연결로 재생된 것으로 보고 건너뜁니다.
+    마지막 인자가 event_id인 세분화 콜백에만 적용합니다.
+    처음 렌더링한 이벤트 시점을 턴 trace에 slack.first_update로 남깁니다.
+    """
+
+    async def wrapped(*args):
+        event_id = args[-1] if args else None
+        if isinstance(event_id, int):
+            if pctx.last_event_id is not None and event_id <= pctx.last_event_id:
+                logger.debug(f"이미 처리한 이벤트 재생 무시: event_id={event_id}")
+                return
+            pctx.last_event_id = event_id
+        await callback(*args)
+        tracing.mark("slack.first_update")
+
+    return wrapped
+
+
 def build_event_callbacks(
     pctx: PresentationContext,
     node_map: SlackNodeMap,
@@ -414,12 +437,12 @@ def build_event_callbacks(
             logger.warning(f"컴팩션 알림 전송 실패: {e}")
 
     return {
-        "on_thinking": on_thinking,
-        "on_text_start": on_text_start,
-        "on_text_delta": on_text_delta,
-        "on_text_end": on_text_end,
-        "on_tool_start": on_tool_start,
-        "on_tool_result": on_tool_result,
+        "on_thinking": _once_per_event(pctx, on_thinking),
+        "on_text_start": _once_per_event(pctx, on_text_start),
+        "on_text_delta": _once_per_event(pctx, on_text_delta),
+        "on_text_end": _once_per_event(pctx, on_text_end),
+        "on_tool_start": _once_per_event(pctx, on_tool_start),
+        "on_tool_result": _once_per_event(pctx, on_tool_result),
         "on_input_request": on_input_request,
         "on_input_request_responded": on_input_request_responded,
         "on_input_request_expired": on_input_request_expired,
@@ -100,13 +100,23 @@ class PersistentSessionListenerManager:
         channel: str,
         thread_ts: str,
         slack_client,
+        last_event_id: int | None = None,
     ) -> _ListenerState:
+        """listener 시작 또는 갱신
+
+        last_event_id: 호출자가 이미 렌더링한 마지막 이벤트 id.
+            listener는 그 이후부터 구독하여 같은 턴을 다시 그리지 않는다.
+        """
         with self._lock:
             existing = self._states.get(session_id)
             if existing:
                 existing.channel = channel
                 existing.thread_ts = thread_ts
                 existing.slack_client = slack_client
+                if last_event_id is not None and (
+                    existing.last_event_id is None or last_event_id > existing.last_event_id
+                ):
+                    existing.last_event_id = last_event_id
                 existing.note_input_activity()
                 return existing
 
@@ -116,6 +126,7 @@ class PersistentSessionListenerManager:
                 thread_ts=thread_ts,
                 slack_client=slack_client,
             )
+            state.last_event_id = last_event_id
             self._states[session_id] = state
 
         thread = self._thread_factory(
@@ -41,3 +41,5 @@ class PresentationContext:
     dm_last_reply_ts: Optional[str] = None
     # 컴팩트 알림 메시지 ts (on_compact가 전송한 메시지, 완료 후 갱신용)
     compact_msg_ts: Optional[str] = None
+    # 마지막으로 렌더링한 스트림 이벤트 id (재연결 재생 중복 방지 + 후속 구독 커서)
+    last_event_id: Optional[int] = None
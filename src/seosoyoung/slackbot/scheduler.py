@@ -0,0 +1,307 @@
+"""에이전트 턴 실행 스케줄러
+
+Slack Bolt 리스너 스레드에서 에이전트 턴(수 분 걸릴 수 있음)을 직접
+실행하면 Socket Mode 워커가 모두 긴 턴에 묶여, 리액션/명령어/실행 중
+세션에 대한 인터벤션까지 그 뒤에 줄을 서게 됩니다.
+
+ExecutionScheduler는 리스너가 작업을 넘기고 즉시 반환하도록 별도의
+워커 풀을 둡니다. 두 개의 레인으로 나뉩니다.
+
+- turn: 에이전트 턴. 워커 수(capacity)와 대기열 길이를 명시적으로 제한하며,
+  대기열이 가득 차면 제출이 거절됩니다.
+- control: 인터럽트/인터벤션, status 등 짧은 제어 이벤트. 전용 워커를 가지므로
+  turn 레인이 가득 차도 지연되지 않습니다.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from seosoyoung.slackbot import tracing
+
+logger = logging.getLogger(__name__)
+
+TURN = "turn"
+CONTROL = "control"
+
+
+@dataclass
+class _Job:
+    fn: Callable
+    args: tuple
+    kwargs: dict
+    key: str
+    lane: str
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+class _Lane:
+    """고정 크기 워커 풀 + 제한된 FIFO 대기열"""
+
+    def __init__(self, name: str, workers: int, max_queue: int, scheduler: "ExecutionScheduler"):
+        self.name = name
+        self.capacity = max(1, workers)
+        self.max_queue = max_queue
+        self._queue: "queue.Queue[Optional[_Job]]" = queue.Queue(maxsize=max_queue)
+        self._scheduler = scheduler
+        self._lock = threading.Lock()
+        self.running = 0
+        # 제출되어 아직 끝나지 않은 작업 수 (대기열→실행 전환 사이에도 0이 되지 않음)
+        self.outstanding = 0
+        self.peak_queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        # 최근 대기 시간(ms) 표본
+        self.waits: deque[float] = deque(maxlen=500)
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"sched-{name}-{i}", daemon=True)
+            for i in range(self.capacity)
+        ]
+        for t in self._threads:
+            t.start()
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    def put(self, job: _Job) -> bool:
+        with self._lock:
+            self.outstanding += 1
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                self.outstanding -= 1
+                self.rejected += 1
+            return False
+        with self._lock:
+            self.peak_queued = max(self.peak_queued, self._queue.qsize())
+        return True
+
+    def _worker(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            with self._lock:
+                self.running += 1
+                self.waits.append((time.monotonic() - job.submitted_at) * 1000)
+            # 실행 중 여부(is_active)는 turn 레인 작업만 기준으로 한다
+            tracked = job.key if job.lane == TURN else ""
+            self._scheduler._enter(tracked)
+            try:
+                job.fn(*job.args, **job.kwargs)
+                with self._lock:
+                    self.completed += 1
+            except Exception:
+                with self._lock:
+                    self.failed += 1
+                logger.exception(f"스케줄러 작업 실패: lane={self.name}, key={job.key}")
+            finally:
+                self._scheduler._leave(tracked)
+                with self._lock:
+                    self.running -= 1
+                    self.outstanding -= 1
+            if job.lane == TURN:
+                self._scheduler._turn_finished()
+
+    def drop_pending(self) -> int:
+        """대기열의 작업을 실행하지 않고 버림"""
+        dropped = 0
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return dropped
+            if job is not None:
+                tracing.cancel(job.fn, "shutdown")
+                with self._lock:
+                    self.outstanding -= 1
+                dropped += 1
+
+    def stop(self, timeout: float) -> None:
+        for _ in self._threads:
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                break
+        deadline = time.monotonic() + timeout
+        for t in self._threads:
+            # 워커 안에서 종료를 요청한 경우 (턴 종료 콜백의 재시작 등)
+            if t is not threading.current_thread():
+                t.join(max(0.0, deadline - time.monotonic()))
+
+    def stats(self) -> dict:
+        with self._lock:
+            waits = sorted(self.waits)
+            p95 = waits[int(len(waits) * 0.95) - 1] if waits else 0.0
+            return {
+                "capacity": self.capacity,
+                "running": self.running,
+                "queued": self._queue.qsize(),
+                "max_queue": self.max_queue,
+                "peak_queued": self.peak_queued,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "wait_p95_ms": round(p95, 1),
+            }
+
+
+class ExecutionScheduler:
+    """에이전트 턴/제어 이벤트 실행 스케줄러
+
+    Args:
+        turn_workers: 동시에 실행할 에이전트 턴 수
+        max_queue: turn 레인 대기열 최대 길이 (초과 시 submit_turn이 False)
+        control_workers: 제어 이벤트 전용 워커 수
+        on_turn_finished: turn 레인 작업이 끝날 때마다 호출 (재시작 대기 확인 등)
+    """
+
+    def __init__(
+        self,
+        turn_workers: int = 16,
+        max_queue: int = 200,
+        control_workers: int = 2,
+        on_turn_finished: Optional[Callable[[], None]] = None,
+    ):
+        self._active_keys: dict[str, int] = {}
+        self._keys_lock = threading.Lock()
+        self._on_turn_finished = on_turn_finished
+        self._lanes = {
+            TURN: _Lane(TURN, turn_workers, max_queue, self),
+            CONTROL: _Lane(CONTROL, control_workers, 0, self),
+        }
+
+    def submit_turn(self, fn: Callable, *args: Any, key: str = "", **kwargs: Any) -> bool:
+        """에이전트 턴 제출. 대기열이 가득 차면 False"""
+        accepted = self._lanes[TURN].put(_Job(fn, args, kwargs, key, TURN))
+        if not accepted:
+            logger.warning(f"턴 대기열 가득 참, 거절: key={key}")
+        return accepted
+
+    def submit_control(self, fn: Callable, *args: Any, key: str = "", **kwargs: Any) -> bool:
+        """제어 이벤트 제출 (대기열 제한 없음, 항상 True)"""
+        return self._lanes[CONTROL].put(_Job(fn, args, kwargs, key, CONTROL))
+
+    def is_active(self, key: str) -> bool:
+        """key의 턴이 현재 turn 레인에서 실행 중인지"""
+        with self._keys_lock:
+            return self._active_keys.get(key, 0) > 0
+
+    def stats(self) -> dict:
+        """레인별 용량/실행/대기열 지표"""
+        return {name: lane.stats() for name, lane in self._lanes.items()}
+
+    def pending_turns(self) -> int:
+        """실행 중이거나 대기 중인 에이전트 턴 수"""
+        return self._lanes[TURN].outstanding
+
+    def shutdown(self, timeout: float = 5.0, cancel_pending: bool = False) -> None:
+        """워커 종료
+
+        기본적으로 대기 중인 작업은 순서대로 처리된 뒤 종료합니다.
+        cancel_pending이면 대기 중인 작업은 버리고 실행 중인 작업만 기다립니다.
+        """
+        if cancel_pending:
+            for lane in self._lanes.values():
+                dropped = lane.drop_pending()
+                if dropped:
+                    logger.warning(f"종료로 대기 작업 {dropped}건 취소: lane={lane.name}")
+        for lane in self._lanes.values():
+            lane.stop(timeout)
+
+    def _turn_finished(self) -> None:
+        if self._on_turn_finished is None:
+            return
+        try:
+            self._on_turn_finished()
+        except Exception:
+            logger.exception("턴 종료 콜백 실패")
+
+    def _enter(self, key: str) -> None:
+        if key:
+            with self._keys_lock:
+                self._active_keys[key] = self._active_keys.get(key, 0) + 1
+
+    def _leave(self, key: str) -> None:
+        if key:
+            with self._keys_lock:
+                remaining = self._active_keys.get(key, 0) - 1
+                if remaining > 0:
+                    self._active_keys[key] = remaining
+                else:
+                    self._active_keys.pop(key, None)
+
+
+BUSY_MESSAGE = "요청이 많아 잠시 후 다시 시도해주세요."
+
+
+def dispatch_turn(
+    scheduler: Optional[ExecutionScheduler],
+    fn: Callable,
+    *args: Any,
+    key: str = "",
+    on_rejected: Optional[Callable[[], None]] = None,
+    **kwargs: Any,
+) -> None:
+    """핸들러에서 턴을 실행하는 공통 진입점
+
+    스케줄러가 없으면(테스트, 단독 사용) 호출 스레드에서 바로 실행합니다.
+    같은 key(스레드)의 턴이 이미 실행 중이면 이 호출은 인터벤션이므로
+    제어 레인으로 보내 turn 레인 대기열에 막히지 않게 합니다.
+    """
+    if scheduler is None:
+        fn(*args, **kwargs)
+        return
+    # 워커 스레드에서도 핸들러의 trace를 이어 쓰도록 컨텍스트를 붙인다
+    if key and scheduler.is_active(key):
+        scheduler.submit_control(
+            tracing.bind(_intervene, "turn.control"),
+            scheduler, fn, args, kwargs, key, on_rejected, key=key,
+        )
+        return
+    _submit_turn(scheduler, fn, args, kwargs, key, on_rejected)
+
+
+def _intervene(
+    scheduler: ExecutionScheduler,
+    fn: Callable,
+    args: tuple,
+    kwargs: dict,
+    key: str,
+    on_rejected: Optional[Callable[[], None]],
+) -> None:
+    """제어 레인에서 인터벤션 실행
+
+    제출 시점과 실행 시점 사이에 턴이 끝났을 수 있으므로 다시 확인하고,
+    더 이상 실행 중이 아니면 일반 턴으로 turn 레인에 돌려보냅니다.
+    (제어 워커가 수 분짜리 턴에 묶이지 않도록)
+    """
+    if scheduler.is_active(key):
+        fn(*args, **kwargs)
+        return
+    _submit_turn(scheduler, fn, args, kwargs, key, on_rejected)
+
+
+def _submit_turn(
+    scheduler: ExecutionScheduler,
+    fn: Callable,
+    args: tuple,
+    kwargs: dict,
+    key: str,
+    on_rejected: Optional[Callable[[], None]],
+) -> None:
+    job = tracing.bind(fn, "turn")
+    if not scheduler.submit_turn(job, *args, key=key, **kwargs):
+        tracing.cancel(job, "rejected")
+        if on_rejected is not None:
+            try:
+                on_rejected()
+            except Exception as e:
+                logger.warning(f"거절 안내 실패: {e}")
@@ -1,24 +1,54 @@
-"""Management 서버 (cogito /reflect + /shutdown)
+"""Management 서버 (cogito /reflect + /reflect/stats + /shutdown)
 
 cogito 리플렉션 엔드포인트와 graceful shutdown 엔드포인트를
 FastAPI 앱으로 통합하여 제공한다.
+
+Reflector는 정적 메타데이터(identity, capability, config)만 다루므로,
+런타임 통계는 stats provider로 주입받아 /reflect/stats 아래에 노출한다.
 """
 
 import logging
 import threading
-from typing import Callable
+from typing import Any, Callable
 
 import uvicorn
 from cogito import Reflector
 from cogito.endpoint import mount_cogito
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 
 logger = logging.getLogger(__name__)
 
 
-def create_management_app(reflector: Reflector, shutdown_callback: Callable[[], None]) -> FastAPI:
-    """cogito /reflect + /shutdown 을 제공하는 FastAPI 앱을 생성한다."""
+StatsProvider = Callable[[], Any]
+
+
+def create_management_app(
+    reflector: Reflector,
+    shutdown_callback: Callable[[], None],
+    stats_providers: dict[str, StatsProvider] | None = None,
+) -> FastAPI:
+    """cogito /reflect + /shutdown 을 제공하는 FastAPI 앱을 생성한다.
+
+    Args:
+        reflector: cogito Reflector
+        shutdown_callback: /shutdown 요청 시 호출할 콜백
+        stats_providers: 이름 → 통계 스냅샷 함수. /reflect/stats/{name}으로 노출
+    """
     app = FastAPI()
+    providers = dict(stats_providers or {})
+
+    # mount_cogito보다 먼저 등록해야 /reflect/{...} 라우트에 가려지지 않는다
+    @app.get("/reflect/stats")
+    async def stats_index():
+        return {"providers": sorted(providers)}
+
+    @app.get("/reflect/stats/{name}")
+    async def stats(name: str):
+        provider = providers.get(name)
+        if provider is None:
+            raise HTTPException(status_code=404, detail=f"unknown stats provider: {name}")
+        return provider()
+
     mount_cogito(app, reflector)
 
     @app.post("/shutdown")
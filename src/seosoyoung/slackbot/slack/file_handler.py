@@ -3,9 +3,11 @@
 슬랙에 첨부된 파일을 다운로드하여 Claude Code에 전달할 수 있도록 처리합니다.
 """
 
+import asyncio
 import logging
 import os
 import shutil
+import tempfile
 from pathlib import Path
 from typing import TypedDict
 
@@ -93,6 +95,73 @@ def cleanup_all_files() -> None:
             logger.warning(f"전체 임시 파일 정리 실패: {TMP_DIR} - {e}")
 
 
+def _local_path_for(file_info: SlackFile, thread_ts: str) -> Path:
+    """슬랙 파일의 로컬 저장 경로
+
+    파일명에 슬랙 file_id를 포함하여 중복 방지
+    예: image.png -> image_F0AAVCNQ4K0.png
+    """
+    file_id = file_info.get("id", "unknown")
+    file_name = file_info.get("name", "unknown")
+    tmp_dir = ensure_tmp_dir(thread_ts)
+    stem = Path(file_name).stem
+    suffix = Path(file_name).suffix
+    return tmp_dir / f"{stem}_{file_id}{suffix}"
+
+
+def _bot_token() -> str:
+    # MCP 호환성을 위해 slackbot.config 대신 os.environ에서 토큰을 읽는다.
+    return os.environ.get("SLACK_BOT_TOKEN", "")
+
+
+def _part_file(local_path: Path) -> tuple[int, Path]:
+    """local_path와 같은 폴더에 호출마다 고유한 임시 파일 생성 (fd, 경로)"""
+    fd, name = tempfile.mkstemp(dir=local_path.parent, prefix=local_path.name + ".", suffix=".part")
+    return fd, Path(name)
+
+
+def _save_atomically(local_path: Path, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 교체하여 동시 다운로드끼리 서로의 파일을 덮지 않게 함"""
+    fd, part_path = _part_file(local_path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(part_path, local_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_content(local_path: Path, file_name: str) -> tuple[str, str | None]:
+    """저장된 파일의 (file_type, 텍스트 내용) 반환"""
+    file_type = get_file_type(file_name)
+    content = None
+
+    # 텍스트 파일이면 내용 읽기
+    if file_type == "text":
+        try:
+            with open(local_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except UnicodeDecodeError:
+            # UTF-8 실패 시 다른 인코딩 시도
+            try:
+                with open(local_path, "r", encoding="cp949") as f:
+                    content = f.read()
+            except Exception:
+                logger.warning(f"텍스트 파일 읽기 실패: {file_name}")
+                file_type = "binary"
+    elif file_type == "unknown":
+        # 알 수 없는 타입은 텍스트로 시도
+        try:
+            with open(local_path, "r", encoding="utf-8") as f:
+                content = f.read()
+            file_type = "text"
+        except Exception:
+            file_type = "binary"
+
+    return file_type, content
+
+
 async def download_file(
     file_info: SlackFile,
     thread_ts: str,
@@ -106,7 +175,6 @@ async def download_file(
     Returns:
         DownloadedFile 또는 None (실패 시)
     """
-    file_id = file_info.get("id", "unknown")
     file_name = file_info.get("name", "unknown")
     file_size = file_info.get("size", 0)
     url = file_info.get("url_private", "")
@@ -117,18 +185,11 @@ async def download_file(
 
     try:
         # 임시 폴더 확보
-        tmp_dir = ensure_tmp_dir(thread_ts)
-
-        # 파일명에 슬랙 file_id를 포함하여 중복 방지
-        # 예: image.png -> image_F0AAVCNQ4K0.png
-        stem = Path(file_name).stem
-        suffix = Path(file_name).suffix
-        local_path = tmp_dir / f"{stem}_{file_id}{suffix}"
+        local_path = _local_path_for(file_info, thread_ts)
 
         # 파일 다운로드 (Bot Token 인증)
-        # MCP 호환성을 위해 slackbot.config 대신 os.environ에서 토큰을 읽는다.
         # 토큰이 없으면 빈 Bearer로 401이 발생하므로, 침묵 실패 대신 즉시 명시적 에러를 남긴다.
-        bot_token = os.environ.get("SLACK_BOT_TOKEN", "")
+        bot_token = _bot_token()
         if not bot_token:
             logger.error(
                 f"SLACK_BOT_TOKEN 환경변수가 설정되지 않아 파일 다운로드를 건너뜁니다: {file_name}"
@@ -140,34 +201,10 @@ async def download_file(
             response = await client.get(url, headers=headers, follow_redirects=True)
             response.raise_for_status()
 
-            # 파일 저장
-            with open(local_path, "wb") as f:
-                f.write(response.content)
+            # 파일 저장 (같은 파일을 받는 fetch_file과 겹치지 않도록 고유 임시 파일 경유)
+            await asyncio.to_thread(_save_atomically, local_path, response.content)
 
-        file_type = get_file_type(file_name)
-        content = None
-
-        # 텍스트 파일이면 내용 읽기
-        if file_type == "text":
-            try:
-                with open(local_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except UnicodeDecodeError:
-                # UTF-8 실패 시 다른 인코딩 시도
-                try:
-                    with open(local_path, "r", encoding="cp949") as f:
-                        content = f.read()
-                except Exception:
-                    logger.warning(f"텍스트 파일 읽기 실패: {file_name}")
-                    file_type = "binary"
-        elif file_type == "unknown":
-            # 알 수 없는 타입은 텍스트로 시도
-            try:
-                with open(local_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                file_type = "text"
-            except Exception:
-                file_type = "binary"
+        file_type, content = _read_content(local_path, file_name)
 
         logger.info(f"파일 다운로드 완료: {file_name} -> {local_path} (type={file_type})")
 
@@ -187,6 +224,97 @@ async def download_file(
         return None
 
 
+class FileFetchError(Exception):
+    """fetch_file 실패 (사유를 메시지로 전달)"""
+
+
+async def fetch_file(
+    file_info: SlackFile,
+    thread_ts: str,
+    http: httpx.AsyncClient,
+    max_size: int | None = None,
+) -> tuple[DownloadedFile, bool]:
+    """슬랙 파일을 스트리밍으로 내려받아 저장
+
+    download_file과 달리 호출자가 HTTP 클라이언트를 공유하고, 실패 시
+    None 대신 FileFetchError로 사유를 알립니다. 응답 본문은 청크 단위로
+    임시 파일에 쓴 뒤 교체하므로 파일 전체를 메모리에 올리지 않습니다.
+
+    같은 file_id의 로컬 파일이 이미 있고 크기가 슬랙 메타데이터와 같으면
+    다시 받지 않습니다.
+
+    Args:
+        file_info: 슬랙 파일 정보
+        thread_ts: 스레드 타임스탬프
+        http: 재사용할 httpx.AsyncClient
+        max_size: 허용 최대 바이트 (None이면 제한 없음)
+
+    Returns:
+        (DownloadedFile, 캐시 재사용 여부)
+
+    Raises:
+        FileFetchError: URL/토큰 없음, 크기 초과, HTTP 오류 등
+    """
+    file_name = file_info.get("name", "unknown")
+    file_size = file_info.get("size", 0)
+    url = file_info.get("url_private", "")
+
+    if not url:
+        raise FileFetchError("파일 URL 없음")
+    if max_size is not None and file_size > max_size:
+        raise FileFetchError(f"파일 크기 초과: {file_size} bytes (최대 {max_size})")
+
+    local_path = _local_path_for(file_info, thread_ts)
+    cached = bool(file_size) and local_path.is_file() and local_path.stat().st_size == file_size
+
+    if not cached:
+        bot_token = _bot_token()
+        if not bot_token:
+            raise FileFetchError("SLACK_BOT_TOKEN 환경변수가 설정되지 않음")
+
+        # 같은 파일을 동시에 받는 호출(핸들러와 MCP 도구 등)끼리 임시 파일이 겹치지 않도록
+        # 호출마다 고유한 이름을 쓰고, 다 받은 쪽이 원자적으로 교체한다
+        try:
+            fd, part_path = _part_file(local_path)
+        except OSError as e:
+            raise FileFetchError(f"저장 실패: {e}") from e
+        written = 0
+        try:
+            headers = {"Authorization": f"Bearer {bot_token}"}
+            with os.fdopen(fd, "wb") as f:
+                async with http.stream("GET", url, headers=headers, follow_redirects=True) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes():
+                        written += len(chunk)
+                        # 메타데이터와 실제 크기가 다를 수 있으므로 수신 중에도 확인
+                        if max_size is not None and written > max_size:
+                            raise FileFetchError(f"파일 크기 초과: {written}+ bytes (최대 {max_size})")
+                        # 디스크 쓰기로 이벤트 루프를 막지 않도록 워커 스레드에서
+                        await asyncio.to_thread(f.write, chunk)
+            os.replace(part_path, local_path)
+        except FileFetchError:
+            part_path.unlink(missing_ok=True)
+            raise
+        except httpx.HTTPError as e:
+            part_path.unlink(missing_ok=True)
+            raise FileFetchError(f"HTTP 오류: {e}") from e
+        except OSError as e:
+            part_path.unlink(missing_ok=True)
+            raise FileFetchError(f"저장 실패: {e}") from e
+
+    file_type, content = _read_content(local_path, file_name)
+    logger.info(
+        f"파일 {'캐시 사용' if cached else '다운로드 완료'}: {file_name} -> {local_path} (type={file_type})"
+    )
+    return {
+        "local_path": str(local_path.resolve()),
+        "original_name": file_name,
+        "size": file_size,
+        "file_type": file_type,
+        "content": content,
+    }, cached
+
+
 async def download_files_from_event(
     event: dict,
     thread_ts: str,
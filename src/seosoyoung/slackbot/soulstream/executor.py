@@ -12,6 +12,7 @@ import threading
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+from seosoyoung.slackbot import tracing
 from seosoyoung.slackbot.reflect import reflect
 from seosoyoung.slackbot.soulstream.debug_policy import is_user_facing_debug_message
 from seosoyoung.slackbot.soulstream.engine_types import ClaudeResult, CompactCallback
@@ -30,6 +31,28 @@ def _get_mcp_config_path() -> Optional[Path]:
     return config_path if config_path.exists() else None
 
 
+def build_soul_client():
+    """설정에 맞는 SoulServiceClient 생성
+
+    오케스트레이터 URL이 설정되어 있으면 orch-server의 execute-proxy를,
+    없으면 soul-server를 직접 사용합니다.
+    """
+    from seosoyoung.slackbot.config import Config
+    from seosoyoung.slackbot.soulstream.service_client import SoulServiceClient
+
+    if Config.orchestrator.url:
+        return SoulServiceClient(
+            base_url=f"{Config.orchestrator.url}/api",
+            token=Config.orchestrator.token,
+            preferred_node_id=Config.orchestrator.preferred_node or None,
+            event_stream_path="/sessions/{session_id}/events",
+        )
+    return SoulServiceClient(
+        base_url=Config.claude.soul_url,
+        token=Config.claude.soul_token,
+    )
+
+
 def _get_role_config(role: str, role_tools: dict) -> dict:
     """역할에 맞는 runner 설정을 반환 (모듈 레벨 함수)
 
@@ -435,24 +458,10 @@ class ClaudeExecutor:
         orch-server의 execute-proxy는 soul-server와 동일한 /execute 인터페이스를 제공하되,
         reconnect 경로만 다릅니다: /sessions/{id}/events (orch) vs /events/{id}/stream (soul).
         """
-        from seosoyoung.slackbot.config import Config
-        from seosoyoung.slackbot.soulstream.service_client import SoulServiceClient
         from seosoyoung.slackbot.soulstream.service_adapter import ClaudeServiceAdapter
 
-        if Config.orchestrator.url:
-            client = SoulServiceClient(
-                base_url=f"{Config.orchestrator.url}/api",
-                token=Config.orchestrator.token,
-                preferred_node_id=Config.orchestrator.preferred_node or None,
-                event_stream_path="/sessions/{session_id}/events",
-            )
-        else:
-            client = SoulServiceClient(
-                base_url=Config.claude.soul_url,
-                token=Config.claude.soul_token,
-            )
         return ClaudeServiceAdapter(
-            client=client,
+            client=build_soul_client(),
             parse_markers_fn=self._parse_markers_fn,
         )
 
@@ -570,6 +579,12 @@ class ClaudeExecutor:
         async def on_session_callback(new_session_id: str) -> None:
             self._register_session_id(thread_ts, new_session_id)
 
+        # 마지막으로 수신한 이벤트 id (렌더링하지 않은 이벤트 포함) — 후속 리스너의 커서
+        received: dict = {"last_event_id": None}
+
+        async def on_event_id(event_id: int) -> None:
+            received["last_event_id"] = event_id
+
         try:
             execute_kwargs: dict = dict(
                 prompt=prompt,
@@ -587,6 +602,7 @@ class ClaudeExecutor:
                 on_input_request=on_input_request,
                 on_input_request_responded=on_input_request_responded,
                 on_input_request_expired=on_input_request_expired,
+                on_event_id=on_event_id,
                 allowed_tools=allowed_tools,
                 disallowed_tools=disallowed_tools,
                 use_mcp=use_mcp,
@@ -601,7 +617,17 @@ class ClaudeExecutor:
             if inactivity_timeout is not None:
                 execute_kwargs["inactivity_timeout"] = inactivity_timeout
 
-            result = run_in_new_loop(adapter.execute(**execute_kwargs))
+            execution = adapter.execute(**execute_kwargs)
+
+            async def _execute_and_close():
+                # 턴마다 만든 ClientSession은 같은 루프 안에서 닫는다
+                try:
+                    return await execution
+                finally:
+                    await adapter.close()
+
+            with tracing.span("soul.execute", resume=bool(session_id)):
+                result = run_in_new_loop(_execute_and_close())
 
             # 결과 콜백 호출 (OM 등)
             if on_result:
@@ -610,7 +636,9 @@ class ClaudeExecutor:
                 except Exception as cb_err:
                     logger.warning(f"[Remote] on_result 콜백 오류 (무시): {cb_err}")
 
-            self._process_result(presentation, result, thread_ts)
+            self._process_result(
+                presentation, result, thread_ts, last_event_id=received["last_event_id"],
+            )
 
         except Exception as e:
             logger.exception(f"[Remote] Claude 실행 오류: {e}")
@@ -619,11 +647,14 @@ class ClaudeExecutor:
         finally:
             self._unregister_session_id(thread_ts)
 
-    def _process_result(self, presentation: Any, result, thread_ts: str):
+    def _process_result(
+        self, presentation: Any, result, thread_ts: str, last_event_id: Optional[int] = None,
+    ):
         """실행 결과 처리
 
         세션 업데이트 후 결과 타입에 따라 핸들러를 호출합니다.
         presentation이 None이면 세션만 갱신하고 슬랙 게시를 건너뜁니다 (text_only 모드).
+        last_event_id는 턴에서 마지막으로 수신한 이벤트 id로, 후속 리스너가 이어받을 커서입니다.
         """
         if result.session_id:
             self.session_manager.update_session_id(thread_ts, result.session_id)
@@ -637,18 +668,21 @@ class ClaudeExecutor:
             # text_only 모드: 출력은 on_result 콜백으로 이미 캡처됨
             return
 
-        if result.interrupted:
-            self._result_processor.handle_interrupted(presentation)
-        elif result.is_error:
-            self._result_processor.handle_error(presentation, result.output or result.error)
-        elif result.success:
-            self._result_processor.handle_success(presentation, result)
-        else:
-            self._result_processor.handle_error(presentation, result.error)
-
-        self._maybe_start_persistent_listener(presentation, result, thread_ts)
-
-    def _maybe_start_persistent_listener(self, presentation: Any, result, thread_ts: str) -> None:
+        with tracing.span("slack.final_post"):
+            if result.interrupted:
+                self._result_processor.handle_interrupted(presentation)
+            elif result.is_error:
+                self._result_processor.handle_error(presentation, result.output or result.error)
+            elif result.success:
+                self._result_processor.handle_success(presentation, result)
+            else:
+                self._result_processor.handle_error(presentation, result.error)
+
+        self._maybe_start_persistent_listener(presentation, result, thread_ts, last_event_id)
+
+    def _maybe_start_persistent_listener(
+        self, presentation: Any, result, thread_ts: str, last_event_id: Optional[int] = None,
+    ) -> None:
         if self._persistent_listener_manager is None:
             return
         if presentation is None:
@@ -664,6 +698,11 @@ class ClaudeExecutor:
                 channel=presentation.channel,
                 thread_ts=thread_ts,
                 slack_client=presentation.client,
+                # 렌더링 여부와 무관하게 받은 이벤트 이후부터 (없으면 렌더링한 id)
+                last_event_id=(
+                    last_event_id if last_event_id is not None
+                    else getattr(presentation, "last_event_id", None)
+                ),
             )
         except Exception as e:
             logger.warning(f"[SSE:listener] 시작 실패 (무시): {e}")
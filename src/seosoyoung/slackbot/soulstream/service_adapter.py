@@ -56,6 +56,7 @@ class ClaudeServiceAdapter:
         on_input_request: Optional[Callable] = None,
         on_input_request_responded: Optional[Callable] = None,
         on_input_request_expired: Optional[Callable] = None,
+        on_event_id: Optional[Callable[[int], Awaitable[None]]] = None,
         allowed_tools: Optional[list[str]] = None,
         disallowed_tools: Optional[list[str]] = None,
         use_mcp: bool = True,
@@ -77,6 +78,7 @@ class ClaudeServiceAdapter:
             on_debug: 디버그 메시지 콜백 (rate_limit 경고 등)
             on_session: 세션 ID 조기 통지 콜백 (agent_session_id: str)
             on_credential_alert: 크레덴셜 알림 콜백 (data: dict)
+            on_event_id: 이벤트 id 수신 콜백 (event_id: int)
             allowed_tools: 허용 도구 목록 (None이면 서버 기본값 사용)
             disallowed_tools: 금지 도구 목록
             use_mcp: MCP 서버 연결 여부
@@ -104,6 +106,7 @@ class ClaudeServiceAdapter:
                 on_input_request=on_input_request,
                 on_input_request_responded=on_input_request_responded,
                 on_input_request_expired=on_input_request_expired,
+                on_event_id=on_event_id,
                 allowed_tools=allowed_tools,
                 disallowed_tools=disallowed_tools,
                 use_mcp=use_mcp,
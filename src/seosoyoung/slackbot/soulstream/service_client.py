@@ -12,6 +12,8 @@ from typing import AsyncIterator, Awaitable, Callable, List, Optional
 
 import aiohttp
 
+from seosoyoung.slackbot import tracing
+
 logger = logging.getLogger(__name__)
 
 # HTTP 타임아웃 (초)
@@ -119,6 +121,22 @@ class ExponentialBackoff:
         self.attempt = 0
 
 
+class _StreamCursor:
+    """마지막으로 수신한 SSE 이벤트 id 추적 (재연결 시 after_id 커서)
+
+    on_event_id 콜백 자리에 그대로 넘길 수 있으며, 사용자 콜백이 있으면 전달합니다.
+    """
+
+    def __init__(self, on_event_id: Optional[Callable[[int], Awaitable[None]]] = None):
+        self.last_event_id: Optional[int] = None
+        self._on_event_id = on_event_id
+
+    async def __call__(self, event_id: int) -> None:
+        self.last_event_id = event_id
+        if self._on_event_id:
+            await self._on_event_id(event_id)
+
+
 # === 클라이언트 ===
 
 class SoulServiceClient:
@@ -205,6 +223,7 @@ class SoulServiceClient:
         on_input_request: Optional[Callable] = None,
         on_input_request_responded: Optional[Callable] = None,
         on_input_request_expired: Optional[Callable] = None,
+        on_event_id: Optional[Callable[[int], Awaitable[None]]] = None,
         allowed_tools: Optional[List[str]] = None,
         disallowed_tools: Optional[List[str]] = None,
         use_mcp: bool = True,
@@ -229,6 +248,9 @@ class SoulServiceClient:
             on_session: 세션 ID 조기 통지 콜백 (agent_session_id: str)
             on_credential_alert: 크레덴셜 알림 콜백 (data: dict)
             on_input_request: AskUserQuestion 이벤트 콜백 (request_id, questions, agent_session_id)
+            on_event_id: 이벤트 id 수신 콜백 (event_id: int). 재연결 시에는
+                마지막으로 받은 id 이후(after_id)부터 이어받으므로 같은 id가
+                두 번 전달되지 않습니다.
             allowed_tools: 허용 도구 목록 (None이면 서버 기본값 사용)
             disallowed_tools: 금지 도구 목록
             use_mcp: MCP 서버 연결 여부
@@ -242,80 +264,38 @@ class SoulServiceClient:
         session = await self._get_session()
         url = f"{self.base_url}/execute"
 
-        data = {
-            "prompt": prompt,
-            "use_mcp": use_mcp,
-        }
-        if agent_session_id:
-            data["agent_session_id"] = agent_session_id
-        if allowed_tools is not None:
-            data["allowed_tools"] = allowed_tools
-        if disallowed_tools is not None:
-            data["disallowed_tools"] = disallowed_tools
-        if context is not None:
-            data["context_items"] = context
-        if model is not None:
-            data["model"] = model
-        if folder_id is not None:
-            data["folder_id"] = folder_id
-        if system_prompt is not None:
-            data["system_prompt"] = system_prompt
-        if profile is not None:
-            data["profile"] = profile  # soul-server ExecuteRequest.profile: Optional[str]
-        if caller_info is not None:
-            # soul-server /execute가 body.caller_info가 있으면 HTTP Request 수집을
-            # 건너뛰고 이 값을 그대로 사용한다 (Phase 2).
-            data["caller_info"] = caller_info
-        if self.preferred_node_id:
-            data["node_id"] = self.preferred_node_id
+        data = self._build_execute_payload(
+            prompt,
+            agent_session_id=agent_session_id,
+            allowed_tools=allowed_tools,
+            disallowed_tools=disallowed_tools,
+            use_mcp=use_mcp,
+            context=context,
+            model=model,
+            folder_id=folder_id,
+            system_prompt=system_prompt,
+            profile=profile,
+            caller_info=caller_info,
+        )
 
         backoff = ExponentialBackoff()
         resolved_session_id = agent_session_id  # init 이벤트에서 갱신됨
+        cursor = _StreamCursor(on_event_id)
 
-        async with session.post(url, json=data) as response:
-            if response.status == 409:
-                error = await self._parse_error(response)
-                if self._is_session_conflict_error(error):
-                    raise SessionConflictError(error)
-                raise SoulServiceError(f"실행 실패: {error}")
-            elif response.status == 503:
-                error = await self._parse_error(response)
-                if self._is_rate_limit_error(error):
-                    raise RateLimitError(error)
-                raise SoulServiceError(f"실행 실패: {error}")
-            elif response.status != 200:
-                error = await self._parse_error(response)
-                raise SoulServiceError(f"실행 실패: {error}")
-
-            try:
-                result = await self._handle_sse_events(
-                    response=response,
-                    on_compact=on_compact,
-                    on_debug=on_debug,
-                    on_session=on_session,
-                    on_credential_alert=on_credential_alert,
-                    on_thinking=on_thinking,
-                    on_text_start=on_text_start,
-                    on_text_delta=on_text_delta,
-                    on_text_end=on_text_end,
-                    on_tool_start=on_tool_start,
-                    on_tool_result=on_tool_result,
-                    on_input_request=on_input_request,
-                    on_input_request_responded=on_input_request_responded,
-                    on_input_request_expired=on_input_request_expired,
-                )
-                # init 이벤트에서 읽은 session_id를 보존
-                if result.agent_session_id:
-                    resolved_session_id = result.agent_session_id
-
-                # persist_listening 모드: complete 후 재구독 루프 진입
-                if persist_listening and result.success and resolved_session_id:
-                    return await self._persist_listen_loop(
-                        agent_session_id=resolved_session_id,
-                        last_result=result,
-                        inactivity_timeout=inactivity_timeout,
+        # 요청 전송부터 응답 헤더(상태 확인)까지
+        connecting = tracing.start_span("soul.connect")
+        try:
+            async with session.post(url, json=data) as response:
+                await self._raise_for_execute_status(response)
+                connecting.end()
+
+                try:
+                    result = await self._handle_sse_events(
+                        response=response,
+                        on_event_id=cursor,
                         on_compact=on_compact,
                         on_debug=on_debug,
+                        on_session=on_session,
                         on_credential_alert=on_credential_alert,
                         on_thinking=on_thinking,
                         on_text_start=on_text_start,
@@ -327,12 +307,39 @@ class SoulServiceClient:
                         on_input_request_responded=on_input_request_responded,
                         on_input_request_expired=on_input_request_expired,
                     )
+                    # init 이벤트에서 읽은 session_id를 보존
+                    if result.agent_session_id:
+                        resolved_session_id = result.agent_session_id
+
+                    # persist_listening 모드: complete 후 재구독 루프 진입
+                    if persist_listening and result.success and resolved_session_id:
+                        return await self._persist_listen_loop(
+                            agent_session_id=resolved_session_id,
+                            last_result=result,
+                            inactivity_timeout=inactivity_timeout,
+                            on_compact=on_compact,
+                            on_debug=on_debug,
+                            on_credential_alert=on_credential_alert,
+                            on_thinking=on_thinking,
+                            on_text_start=on_text_start,
+                            on_text_delta=on_text_delta,
+                            on_text_end=on_text_end,
+                            on_tool_start=on_tool_start,
+                            on_tool_result=on_tool_result,
+                            on_input_request=on_input_request,
+                            on_input_request_responded=on_input_request_responded,
+                            on_input_request_expired=on_input_request_expired,
+                        )
 
-                return result
-            except ConnectionLostError as e:
-                # init 이벤트에서 이미 session_id를 받았을 수 있음
-                if e.agent_session_id:
-                    resolved_session_id = e.agent_session_id
+                    return result
+                except ConnectionLostError as e:
+                    # init 이벤트에서 이미 session_id를 받았을 수 있음
+                    if e.agent_session_id:
+                        resolved_session_id = e.agent_session_id
+        except BaseException as e:
+            # 연결 실패나 409/503 등 상태 오류도 span에 남긴다 (성공 후 예외는 이미 닫혀 무시)
+            connecting.end(e)
+            raise
 
         # 연결 끊김 → reconnect_stream()으로 새 HTTP 요청을 보내 재연결
         if not resolved_session_id:
@@ -343,18 +350,25 @@ class SoulServiceClient:
             )
 
         while backoff.should_retry():
-            delay = backoff.get_delay()
+            # 커서가 있으면 끊긴 지점부터 이어받기만 하면 되므로 첫 시도는 바로 재연결
+            if cursor.last_event_id is not None and backoff.attempt == 0:
+                delay = 0.0
+            else:
+                delay = backoff.get_delay()
             logger.warning(
                 f"[SSE] 연결 끊김, 재연결 시도 ({backoff.attempt + 1}/{backoff.max_retries}), "
-                f"{delay}초 후"
+                f"{delay}초 후, after_id={cursor.last_event_id}"
             )
             backoff.increment()
             await asyncio.sleep(delay)
 
+            progress_mark = cursor.last_event_id
             try:
-                return await self.reconnect_stream(
+                result = await self.reconnect_stream(
                     resolved_session_id, on_compact, on_debug,
                     on_credential_alert,
+                    after_id=cursor.last_event_id,
+                    on_event_id=cursor,
                     on_thinking=on_thinking,
                     on_text_start=on_text_start,
                     on_text_delta=on_text_delta,
@@ -366,6 +380,9 @@ class SoulServiceClient:
                     on_input_request_expired=on_input_request_expired,
                 )
             except ConnectionLostError:
+                if cursor.last_event_id != progress_mark:
+                    # 재연결 후 이벤트를 더 받았으면 새로운 끊김으로 보고 백오프 초기화
+                    backoff.reset()
                 continue
             except SessionNotFoundError:
                 return ExecuteResult(
@@ -374,12 +391,123 @@ class SoulServiceClient:
                     error="재연결 실패: 세션이 이미 종료됨",
                 )
 
+            # after_id 이후만 재생되므로 init 이벤트가 없을 수 있음
+            if not result.agent_session_id:
+                result.agent_session_id = resolved_session_id
+            return result
+
         return ExecuteResult(
             success=False,
             result=f"Soulstream 연결이 끊어졌습니다 ({backoff.max_retries}회 재시도 실패)",
             error=f"Soulstream 연결이 끊어졌습니다 ({backoff.max_retries}회 재시도 실패)",
         )
 
+    async def stream(
+        self,
+        prompt: str,
+        agent_session_id: Optional[str] = None,
+        *,
+        allowed_tools: Optional[List[str]] = None,
+        disallowed_tools: Optional[List[str]] = None,
+        use_mcp: bool = True,
+        context: Optional[List[dict]] = None,
+        model: Optional[str] = None,
+        folder_id: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        profile: Optional[str] = None,
+        caller_info: Optional[dict] = None,
+    ) -> AsyncIterator[SSEEvent]:
+        """Claude Code 실행 이벤트를 호출자 루프에서 그대로 yield
+
+        execute()와 같은 POST /execute 요청이지만 콜백 대신 SSEEvent를 하나씩
+        돌려줍니다. 소비자가 다음 이벤트를 요청할 때만 스트림을 읽으므로
+        소비 속도가 곧 읽기 속도입니다(backpressure). 중간에 빠져나가면
+        응답이 닫히고 연결이 반환됩니다.
+
+        execute()와 달리 자동 재연결은 하지 않습니다. 연결이 끊기면
+        ConnectionLostError가 그대로 전파됩니다.
+        """
+        session = await self._get_session()
+        url = f"{self.base_url}/execute"
+        data = self._build_execute_payload(
+            prompt,
+            agent_session_id=agent_session_id,
+            allowed_tools=allowed_tools,
+            disallowed_tools=disallowed_tools,
+            use_mcp=use_mcp,
+            context=context,
+            model=model,
+            folder_id=folder_id,
+            system_prompt=system_prompt,
+            profile=profile,
+            caller_info=caller_info,
+        )
+
+        async with session.post(url, json=data) as response:
+            await self._raise_for_execute_status(response)
+            async for event in self._parse_sse_stream(response):
+                yield event
+
+    def _build_execute_payload(
+        self,
+        prompt: str,
+        *,
+        agent_session_id: Optional[str],
+        allowed_tools: Optional[List[str]],
+        disallowed_tools: Optional[List[str]],
+        use_mcp: bool,
+        context: Optional[List[dict]],
+        model: Optional[str],
+        folder_id: Optional[str],
+        system_prompt: Optional[str],
+        profile: Optional[str],
+        caller_info: Optional[dict],
+    ) -> dict:
+        """POST /execute 요청 본문 구성"""
+        data = {
+            "prompt": prompt,
+            "use_mcp": use_mcp,
+        }
+        if agent_session_id:
+            data["agent_session_id"] = agent_session_id
+        if allowed_tools is not None:
+            data["allowed_tools"] = allowed_tools
+        if disallowed_tools is not None:
+            data["disallowed_tools"] = disallowed_tools
+        if context is not None:
+            data["context_items"] = context
+        if model is not None:
+            data["model"] = model
+        if folder_id is not None:
+            data["folder_id"] = folder_id
+        if system_prompt is not None:
+            data["system_prompt"] = system_prompt
+        if profile is not None:
+            data["profile"] = profile  # soul-server ExecuteRequest.profile: Optional[str]
+        if caller_info is not None:
+            # soul-server /execute가 body.caller_info가 있으면 HTTP Request 수집을
+            # 건너뛰고 이 값을 그대로 사용한다 (Phase 2).
+            data["caller_info"] = caller_info
+        if self.preferred_node_id:
+            data["node_id"] = self.preferred_node_id
+        return data
+
+    async def _raise_for_execute_status(self, response: aiohttp.ClientResponse) -> None:
+        """POST /execute 응답 상태 코드를 예외로 변환"""
+        if response.status == 409:
+            error = await self._parse_error(response)
+            if self._is_session_conflict_error(error):
+                raise SessionConflictError(error)
+            raise SoulServiceError(f"실행 실패: {error}")
+        elif response.status == 503:
+            error = await self._parse_error(response)
+            if self._is_rate_limit_error(error):
+                raise RateLimitError(error)
+            raise SoulServiceError(f"실행 실패: {error}")
+        elif response.status != 200:
+            error = await self._parse_error(response)
+            raise SoulServiceError(f"실행 실패: {error}")
+
     async def _persist_listen_loop(
         self,
         agent_session_id: str,
@@ -585,12 +713,18 @@ class SoulServiceClient:
         on_input_request: Optional[Callable] = None,
         on_input_request_responded: Optional[Callable] = None,
         on_input_request_expired: Optional[Callable] = None,
+        after_id: Optional[int] = None,
+        on_event_id: Optional[Callable[[int], Awaitable[None]]] = None,
     ) -> ExecuteResult:
-        """세션 SSE 스트림에 재연결"""
+        """세션 SSE 스트림에 재연결
+
+        after_id를 주면 그 이후 이벤트부터 이어받습니다 (이미 처리한 이벤트 재생 없음).
+        """
         session = await self._get_session()
         url = f"{self.base_url}{self._event_stream_path.format(session_id=agent_session_id)}"
+        params = {"after_id": after_id} if after_id is not None else None
 
-        async with session.get(url) as response:
+        async with session.get(url, params=params) as response:
             if response.status == 404:
                 raise SessionNotFoundError(
                     f"세션을 찾을 수 없습니다: {agent_session_id}"
@@ -601,6 +735,7 @@ class SoulServiceClient:
 
             return await self._handle_sse_events(
                 response=response,
+                on_event_id=on_event_id,
                 on_compact=on_compact,
                 on_debug=on_debug,
                 on_credential_alert=on_credential_alert,
@@ -845,8 +980,12 @@ class SoulServiceClient:
             else self._parse_sse_stream(response, read_timeout=read_timeout)
         )
 
+        first_event = True
         try:
             async for event in stream:
+                if first_event:
+                    tracing.mark("soul.first_event")
+                    first_event = False
                 eid = self._event_id_as_int(event.id)
                 if on_event_id and eid is not None:
                     await on_event_id(eid)
@@ -2,11 +2,17 @@
 
 세션 생성 시 채널 대화 맥락을 구성합니다.
 모니터링 채널이면 judged/pending 데이터를 병합하여 더 풍부한 컨텍스트를 제공합니다.
+
+채널 저장소가 IndexedChannelStore(plugin_sdk.channel_index)이면 필요한 메시지만
+인덱스로 조회하고, load_judged/load_pending만 제공하는 기존 저장소는 전체를
+불러와 병합하는 기존 경로를 그대로 사용합니다. 두 경로의 결과는 같습니다.
 """
 
 import logging
 from typing import Callable, Optional, Protocol, runtime_checkable
 
+from seosoyoung.plugin_sdk.channel_index import IndexedChannelStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,10 +51,15 @@ def build_initial_context(
 
     if is_monitored:
         source_type = "hybrid"
-        # judged + pending + slack 메시지 병합
-        judged = channel_store.load_judged(channel_id)
-        pending = channel_store.load_pending(channel_id)
-        all_messages = _merge_messages(judged, pending, slack_messages)
+        if isinstance(channel_store, IndexedChannelStore):
+            # 최종 7개에 들 수 있는 저장 메시지는 저장소의 최근 7개뿐
+            stored = channel_store.last_messages(channel_id, MAX_INITIAL_MESSAGES)
+            all_messages = _merge_messages(stored, slack_messages)
+        else:
+            # judged + pending + slack 메시지 병합
+            judged = channel_store.load_judged(channel_id)
+            pending = channel_store.load_pending(channel_id)
+            all_messages = _merge_messages(judged, pending, slack_messages)
     else:
         source_type = "thread"
         all_messages = list(slack_messages)
@@ -100,6 +111,9 @@ def build_followup_context(
     if not is_monitored or not last_seen_ts:
         return {"messages": [], "last_seen_ts": last_seen_ts}
 
+    if isinstance(channel_store, IndexedChannelStore):
+        return _build_followup_indexed(channel_id, last_seen_ts, channel_store)
+
     # judged + pending에서 last_seen_ts 이후 메시지 수집
     judged = channel_store.load_judged(channel_id)
     pending = channel_store.load_pending(channel_id)
@@ -139,6 +153,40 @@ def build_followup_context(
     }
 
 
+def _build_followup_indexed(
+    channel_id: str,
+    last_seen_ts: str,
+    channel_store: IndexedChannelStore,
+) -> dict:
+    """build_followup_context의 인덱스 조회 경로
+
+    linked 메시지는 모두 cutoff 이전이라 정렬 시 unseen보다 앞에 오므로,
+    unseen이 MAX_FOLLOWUP_MESSAGES개 이상이면 잘려 나갑니다. 따라서 최근
+    unseen MAX_FOLLOWUP_MESSAGES개만 조회하고, 그보다 적을 때만 linked를 찾습니다.
+    """
+    unseen = channel_store.messages_after(channel_id, last_seen_ts, MAX_FOLLOWUP_MESSAGES)
+    cutoff = float(last_seen_ts)
+
+    linked_messages: list[dict] = []
+    if len(unseen) < MAX_FOLLOWUP_MESSAGES:
+        linked_ts = [
+            m["linked_message_ts"] for m in unseen
+            if m.get("linked_message_ts") and float(m["linked_message_ts"]) <= cutoff
+        ]
+        if linked_ts:
+            linked_messages = channel_store.get_messages(channel_id, linked_ts)
+
+    combined = _merge_messages(linked_messages, unseen)
+    combined.sort(key=lambda m: float(m.get("ts", "0")))
+    if len(combined) > MAX_FOLLOWUP_MESSAGES:
+        combined = combined[-MAX_FOLLOWUP_MESSAGES:]
+
+    return {
+        "messages": combined,
+        "last_seen_ts": combined[-1]["ts"] if combined else last_seen_ts,
+    }
+
+
 def format_hybrid_context(
     messages: list[dict],
     source_type: str,
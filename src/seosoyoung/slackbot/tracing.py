@@ -0,0 +1,548 @@
+"""턴 지연 추적 (경량 span tracing)
+
+한 턴이 Slack 이벤트 수신 → 권한 조회 → 파일 다운로드 → 컨텍스트 구성 →
+before_execute 훅 → soul 연결 → 첫 SSE 이벤트 → 첫 Slack 갱신 → 최종 게시 중
+어디서 시간을 쓰는지 기록합니다.
+
+- 턴마다 trace id를 하나 만들고, 단계는 span으로, 단발성 시점(첫 SSE 이벤트,
+  첫 Slack 갱신)은 trace 시작 기준 오프셋인 mark로 남깁니다.
+- 현재 span은 ContextVar로 전달됩니다. 스케줄러 워커로 넘어갈 때는 bind()가,
+  run_in_new_loop 스레드로 넘어갈 때는 브릿지가 컨텍스트를 복사합니다.
+- trace는 핸들러 범위와 bind()된 작업이 모두 끝나면 완료됩니다. 완료 후 끝난
+  span은 버리고, 끝나지 않은 span은 완료 시각까지로 잘라 unfinished로 표시합니다.
+- 비활성 상태에서는 trace를 만들지 않으므로 span()/mark()는 ContextVar 조회
+  한 번 뒤 공용 no-op을 돌려줍니다.
+- 완료된 trace는 메모리 요약(단계별 p50/p95/p99)에 반영되고, 경로가 설정되면
+  백그라운드 스레드가 JSONL 또는 OTLP/JSON 파일로 기록합니다 (수집기 불필요).
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+JSONL = "jsonl"
+OTLP = "otlp"
+
+SERVICE_NAME = "seosoyoung"
+
+# perf_counter_ns(단조)를 epoch ns로 환산해 span 시각과 지속 시간을 함께 얻는다
+_EPOCH_OFFSET_NS = time.time_ns() - time.perf_counter_ns()
+
+
+def _now_ns() -> int:
+    return time.perf_counter_ns() + _EPOCH_OFFSET_NS
+
+
+def _ms(ns: int) -> float:
+    return round(ns / 1e6, 3)
+
+
+class Span:
+    """trace 안의 한 단계 (시작/종료 시각, 속성, 오류)"""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "attrs", "start_ns", "end_ns", "error")
+
+    def __init__(self, trace: "Trace", name: str, parent_id: Optional[str], attrs: dict):
+        self.trace = trace
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.attrs = attrs
+        self.error: Optional[str] = None
+        self.end_ns: Optional[int] = None
+        self.start_ns = _now_ns()
+        trace.spans.append(self)
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """종료 시각 기록 (여러 번 호출해도 처음 한 번만 반영)"""
+        if self.end_ns is not None:
+            return
+        self.end_ns = _now_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+
+
+class _NoopSpan:
+    """비활성/trace 밖에서 돌려주는 공용 span"""
+
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "seosoyoung_trace_span", default=None
+)
+
+
+class _SpanScope:
+    """with 블록 동안 span을 현재 span으로 둔다
+
+    release가 주어지면(trace의 root) 블록이 끝나도 span을 닫지 않고 hold만
+    놓습니다. root는 마지막 hold가 풀릴 때 닫힙니다.
+    """
+
+    __slots__ = ("span", "_token", "_release")
+
+    def __init__(self, span: Span, release: Optional[Callable[[], None]] = None):
+        self.span = span
+        self._release = release
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._token = _current.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _current.reset(self._token)
+        if self._release is None:
+            self.span.end(exc)
+            return False
+        if exc is not None:
+            self.span.error = f"{type(exc).__name__}: {exc}"
+        self._release()
+        return False
+
+
+class Trace:
+    """한 턴의 span 모음
+
+    root span은 trace 시작(이벤트 수신)부터 마지막 hold가 풀릴 때까지입니다.
+    """
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: dict):
+        self.tracer = tracer
+        self.trace_id = os.urandom(16).hex()
+        self.spans: list[Span] = []
+        self.marks: dict[str, int] = {}
+        self.finished = False
+        self._holds = 1
+        self._lock = threading.Lock()
+        self.root = Span(self, name, None, attrs)
+
+    def mark(self, name: str) -> None:
+        """trace 안에서 처음 도달한 시각만 기록"""
+        if name not in self.marks:
+            self.marks[name] = _now_ns()
+
+    def hold(self) -> None:
+        with self._lock:
+            self._holds += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._holds -= 1
+            done = self._holds == 0 and not self.finished
+            if done:
+                self.finished = True
+        if done:
+            self.root.end()
+            self.tracer._finish(self)
+
+    def finished_spans(self) -> list[Span]:
+        """완료 시점까지의 span (끝나지 않은 span은 root 종료 시각으로 자름)"""
+        root_end = self.root.end_ns
+        return [s for s in self.spans if s.end_ns is None or s.end_ns <= root_end]
+
+
+class _BoundCall:
+    """다른 스레드에서 실행될 작업: trace를 붙잡고 컨텍스트를 옮긴다
+
+    제출부터 실행 시작까지를 scheduler.wait span으로, 실행을 name span으로 남깁니다.
+    """
+
+    def __init__(self, fn: Callable, name: str, parent: Span):
+        self._fn = fn
+        self._name = name
+        self._parent = parent
+        self._context = contextvars.copy_context()
+        parent.trace.hold()
+        self._wait = Span(parent.trace, "scheduler.wait", parent.span_id, {})
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._context.run(self._run, args, kwargs)
+
+    def _run(self, args: tuple, kwargs: dict) -> Any:
+        self._wait.end()
+        trace = self._parent.trace
+        try:
+            with _SpanScope(Span(trace, self._name, self._parent.span_id, {})):
+                return self._fn(*args, **kwargs)
+        finally:
+            trace.release()
+
+    def cancel(self, reason: str) -> None:
+        """실행되지 않을 작업 (대기열 거절 등)"""
+        self._wait.set(cancelled=reason)
+        self._wait.end()
+        self._parent.trace.release()
+
+
+def _percentiles(values) -> dict:
+    ordered = sorted(values)
+    n = len(ordered)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(n - 1, int(n * p))], 1)
+
+    return {
+        "count": n,
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+        "max_ms": round(ordered[-1], 1),
+    }
+
+
+# -- 내보내기 형식 ----------------------------------------------------------------
+
+
+def trace_to_dict(trace: Trace) -> dict:
+    """JSONL 한 줄 (trace 하나). 시각은 root 시작 기준 ms 오프셋"""
+    root = trace.root
+    origin = root.start_ns
+    spans = []
+    for s in trace.finished_spans():
+        if s is root:
+            continue
+        entry = {
+            "span_id": s.span_id,
+            "parent_id": s.parent_id,
+            "name": s.name,
+            "start_ms": _ms(s.start_ns - origin),
+            "duration_ms": _ms((s.end_ns or root.end_ns) - s.start_ns),
+        }
+        if s.end_ns is None:
+            entry["unfinished"] = True
+        if s.attrs:
+            entry["attrs"] = s.attrs
+        if s.error:
+            entry["error"] = s.error
+        spans.append(entry)
+    record = {
+        "trace_id": trace.trace_id,
+        "span_id": root.span_id,
+        "name": root.name,
+        "start_unix_ns": origin,
+        "duration_ms": _ms(root.end_ns - origin),
+        "attrs": root.attrs,
+        "spans": spans,
+        "marks": {name: _ms(at - origin) for name, at in trace.marks.items()},
+    }
+    if root.error:
+        record["error"] = root.error
+    return record
+
+
+def _otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attrs: dict) -> list[dict]:
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attrs.items()]
+
+
+def trace_to_otlp(trace: Trace) -> dict:
+    """OTLP/JSON ExportTraceServiceRequest (OpenTelemetry Collector file exporter 형식)
+
+    mark는 root span의 event로 싣습니다.
+    """
+    root = trace.root
+    spans = []
+    for s in trace.finished_spans():
+        attrs = dict(s.attrs)
+        if s.end_ns is None:
+            attrs["unfinished"] = True
+        span = {
+            "traceId": trace.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns or root.end_ns),
+            "attributes": _otlp_attributes(attrs),
+            "status": {"code": 2, "message": s.error} if s.error else {},
+        }
+        if s.parent_id:
+            span["parentSpanId"] = s.parent_id
+        if s is root and trace.marks:
+            span["events"] = [
+                {"timeUnixNano": str(at), "name": name} for name, at in trace.marks.items()
+            ]
+        spans.append(span)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": SERVICE_NAME})},
+            "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+        }]
+    }
+
+
+_FORMATTERS = {JSONL: trace_to_dict, OTLP: trace_to_otlp}
+
+
+class FileExporter:
+    """완료된 trace를 백그라운드 스레드에서 파일에 한 줄씩 추가
+
+    핫 패스는 큐 적재만 합니다. 큐가 가득 차면 trace를 버리고 dropped로 셉니다.
+    """
+
+    def __init__(self, path: str | Path, export_format: str = JSONL, max_queue: int = 1000):
+        if export_format not in _FORMATTERS:
+            raise ValueError(f"알 수 없는 trace 내보내기 형식: {export_format} (jsonl 또는 otlp)")
+        self.path = Path(path)
+        self.export_format = export_format
+        self.written = 0
+        self.dropped = 0
+        self._format = _FORMATTERS[export_format]
+        self._queue: queue.Queue = queue.Queue(maxsize=max(max_queue, 1))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._worker, name="trace-exporter", daemon=True)
+        self._thread.start()
+
+    def submit(self, trace: Trace) -> None:
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def _worker(self) -> None:
+        with self.path.open("a", encoding="utf-8") as f:
+            while True:
+                trace = self._queue.get()
+                if trace is None:
+                    f.flush()
+                    return
+                try:
+                    f.write(json.dumps(self._format(trace), ensure_ascii=False, default=str) + "\n")
+                    self.written += 1
+                except Exception as e:
+                    logger.warning(f"trace 기록 실패: {e}")
+                if self._queue.empty():
+                    f.flush()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """큐에 남은 trace를 모두 기록하고 스레드 종료"""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+
+class Tracer:
+    """trace 생성과 완료 trace 집계
+
+    Args:
+        enabled: False면 trace()가 no-op을 돌려주고 아무것도 기록하지 않음
+        exporter: 완료된 trace를 받을 FileExporter (없으면 메모리 요약만)
+        window: 단계별 백분위 계산에 쓰는 최근 표본 수
+        recent: 요약에 보여 줄 최근 trace 수
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        exporter: Optional[FileExporter] = None,
+        window: int = 1000,
+        recent: int = 20,
+    ):
+        self.enabled = enabled
+        self.exporter = exporter
+        self.started = 0
+        self.finished = 0
+        self._window = window
+        self._spans: dict[str, deque] = {}
+        self._marks: dict[str, deque] = {}
+        self._recent: deque = deque(maxlen=recent)
+        self._lock = threading.Lock()
+
+    def trace(self, name: str, **attrs: Any):
+        """새 trace를 시작하는 with 블록 (이미 trace 안이면 하위 span)"""
+        if not self.enabled:
+            return NOOP_SPAN
+        parent = _current.get()
+        if parent is not None:
+            return _SpanScope(Span(parent.trace, name, parent.span_id, attrs))
+        with self._lock:
+            self.started += 1
+        trace = Trace(self, name, attrs)
+        return _SpanScope(trace.root, release=trace.release)
+
+    def _finish(self, trace: Trace) -> None:
+        root = trace.root
+        origin = root.start_ns
+        with self._lock:
+            self.finished += 1
+            for s in trace.finished_spans():
+                if s is not root and s.end_ns is not None:
+                    self._sample(self._spans, s.name, (s.end_ns - s.start_ns) / 1e6)
+            self._sample(self._spans, root.name, (root.end_ns - origin) / 1e6)
+            for name, at in trace.marks.items():
+                self._sample(self._marks, name, (at - origin) / 1e6)
+            self._recent.append(trace)
+        if self.exporter is not None:
+            self.exporter.submit(trace)
+
+    def _sample(self, table: dict[str, deque], name: str, value: float) -> None:
+        samples = table.get(name)
+        if samples is None:
+            samples = table[name] = deque(maxlen=self._window)
+        samples.append(value)
+
+    def summary(self) -> dict:
+        """관리 서버 /reflect/stats/tracing 응답
+
+        spans: 단계별 지속 시간, marks: trace 시작부터 해당 시점까지의 시간
+        """
+        with self._lock:
+            spans = {name: _percentiles(v) for name, v in sorted(self._spans.items())}
+            marks = {name: _percentiles(v) for name, v in sorted(self._marks.items())}
+            recent = list(self._recent)
+        result = {
+            "enabled": self.enabled,
+            "traces_started": self.started,
+            "traces_finished": self.finished,
+            "spans": spans,
+            "marks": marks,
+            "recent": [_recent_entry(t) for t in reversed(recent)],
+        }
+        if self.exporter is not None:
+            result["export"] = {
+                "path": str(self.exporter.path),
+                "format": self.exporter.export_format,
+                "written": self.exporter.written,
+                "dropped": self.exporter.dropped,
+            }
+        return result
+
+    def close(self) -> None:
+        if self.exporter is not None:
+            self.exporter.close()
+
+
+def _recent_entry(trace: Trace) -> dict:
+    """최근 trace 한 건: 전체 시간과 가장 오래 걸린 단계 3개"""
+    root = trace.root
+    stages = sorted(
+        ((s.name, (s.end_ns - s.start_ns) / 1e6) for s in trace.finished_spans()
+         if s is not root and s.end_ns is not None),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    return {
+        "trace_id": trace.trace_id,
+        "name": root.name,
+        "duration_ms": round((root.end_ns - root.start_ns) / 1e6, 1),
+        "slowest": [{"name": name, "ms": round(ms, 1)} for name, ms in stages[:3]],
+        "marks": {name: round((at - root.start_ns) / 1e6, 1) for name, at in trace.marks.items()},
+    }
+
+
+# -- 모듈 수준 API ----------------------------------------------------------------
+
+_tracer = Tracer()
+
+
+def configure(
+    enabled: bool,
+    export_path: str | Path | None = None,
+    export_format: str = JSONL,
+) -> Tracer:
+    """전역 tracer 교체 (이전 tracer의 내보내기 큐는 비운 뒤 닫음)"""
+    global _tracer
+    exporter = FileExporter(export_path, export_format) if enabled and export_path else None
+    previous, _tracer = _tracer, Tracer(enabled=enabled, exporter=exporter)
+    previous.close()
+    return _tracer
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def shutdown() -> None:
+    """내보내기 큐를 비움. os._exit() 직전에 직접 호출해야 합니다."""
+    _tracer.close()
+
+
+def trace(name: str, **attrs: Any):
+    """턴 trace 시작: ``with tracing.trace("slack.mention", channel=...):``"""
+    return _tracer.trace(name, **attrs)
+
+
+def span(name: str, **attrs: Any):
+    """현재 trace의 하위 단계: ``with tracing.span("auth.lookup"):``"""
+    parent = _current.get()
+    if parent is None or parent.trace.finished:
+        return NOOP_SPAN
+    return _SpanScope(Span(parent.trace, name, parent.span_id, attrs))
+
+
+def start_span(name: str, **attrs: Any):
+    """with 블록으로 감싸기 어려운 구간용. 현재 span은 바꾸지 않으며 end()로 닫음"""
+    parent = _current.get()
+    if parent is None or parent.trace.finished:
+        return NOOP_SPAN
+    return Span(parent.trace, name, parent.span_id, attrs)
+
+
+def mark(name: str) -> None:
+    """현재 trace에서 처음 도달한 시점 기록 (예: soul.first_event)"""
+    current = _current.get()
+    if current is not None:
+        current.trace.mark(name)
+
+
+def current_trace_id() -> Optional[str]:
+    current = _current.get()
+    return current.trace.trace_id if current is not None else None
+
+
+def bind(fn: Callable, name: str = "turn") -> Callable:
+    """다른 스레드에서 실행할 함수에 현재 trace를 붙임 (trace 밖이면 fn 그대로)"""
+    parent = _current.get()
+    if parent is None or parent.trace.finished:
+        return fn
+    return _BoundCall(fn, name, parent)
+
+
+def cancel(fn: Callable, reason: str) -> None:
+    """bind()한 작업이 실행되지 않게 되었을 때 trace를 놓아 줌"""
+    if isinstance(fn, _BoundCall):
+        fn.cancel(reason)
+
+
+atexit.register(shutdown)
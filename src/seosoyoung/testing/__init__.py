@@ -0,0 +1,29 @@
+"""테스트·벤치마크용 로컬 fake 서비스
+
+실제 soul-server나 Slack 워크스페이스 없이 봇의 네트워크 경로(SSE 파싱, 재연결,
+콜백 fan-out, Slack API 호출)를 부하 상태로 돌려보기 위한 in-process 서버들입니다.
+"""
+
+from seosoyoung.testing.fake_slack import (
+    FakeSlackServer,
+    LatencyModel,
+    RateLimits,
+)
+from seosoyoung.testing.fake_soul import (
+    FailurePlan,
+    FakeSoulServer,
+    StreamProfile,
+    load_recording,
+    synthetic_events,
+)
+
+__all__ = [
+    "FailurePlan",
+    "FakeSlackServer",
+    "FakeSoulServer",
+    "LatencyModel",
+    "RateLimits",
+    "StreamProfile",
+    "load_recording",
+    "synthetic_events",
+]
@@ -0,0 +1,705 @@
+"""Fake Slack Web API / Socket Mode 서버
+
+봇(slackbot), plugin_sdk 백엔드, MCP 도구가 쓰는 Slack Web API 메서드를
+aiohttp로 흉내냅니다. slack_sdk의 WebClient/AsyncWebClient를 base_url만 바꿔
+그대로 붙일 수 있습니다.
+
+- POST|GET /api/{method}         → Web API (아래 메서드)
+- POST     /upload/{file_id}     → files.getUploadURLExternal이 발급한 업로드 URL
+- GET      /link/                → Socket Mode 웹소켓 (apps.connections.open이 발급)
+
+지원 메서드: auth.test, apps.connections.open, chat.postMessage, chat.update,
+chat.delete, reactions.add, reactions.remove, users.info, conversations.history,
+conversations.replies, conversations.open, conversations.info,
+files.getUploadURLExternal, files.completeUploadExternal(files_upload_v2 흐름),
+views.publish
+
+메서드별 호출 수를 세고, Slack 티어별 rate limit(429 + Retry-After)과 응답
+지연 분포를 흉내냅니다. Socket Mode 연결로 이벤트를 밀어 넣고 ack를 기다릴 수
+있어, 워크스페이스 없이 이벤트 수신부터 API 호출까지를 끝까지 돌려볼 수 있습니다.
+
+실행:
+    python -m seosoyoung.testing.fake_slack --port 3000 --median-ms 40 --p99-ms 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from aiohttp import WSMsgType, web
+
+# Slack Web API 티어별 분당 허용 호출 수 (공식 문서의 하한)
+TIER_PER_MINUTE: dict[int, int] = {1: 1, 2: 20, 3: 50, 4: 100}
+
+# 메서드별 티어. chat.postMessage는 "special" 티어(채널당 초당 1건)라 따로 처리한다.
+METHOD_TIERS: dict[str, int] = {
+    "apps.connections.open": 1,
+    "auth.test": 4,
+    "chat.update": 3,
+    "chat.delete": 3,
+    "reactions.add": 3,
+    "reactions.remove": 2,
+    "users.info": 4,
+    "conversations.history": 3,
+    "conversations.replies": 3,
+    "conversations.open": 3,
+    "conversations.info": 3,
+    "files.getUploadURLExternal": 4,
+    "files.completeUploadExternal": 4,
+    "views.publish": 4,
+}
+DEFAULT_TIER = 3
+
+# 폼으로 올 때 JSON 문자열로 인코딩되는 인자
+_JSON_FIELDS = ("blocks", "attachments", "files", "view", "metadata")
+
+
+class SlackApiFailure(Exception):
+    """Web API 오류 응답 ({"ok": false, "error": code})"""
+
+    def __init__(self, code: str):
+        super().__init__(code)
+        self.code = code
+
+
+@dataclass
+class LatencyModel:
+    """응답 지연 분포 (로그정규, 밀리초)
+
+    median_ms가 0이면 지연 없이 응답합니다.
+    """
+
+    median_ms: float = 0.0
+    p99_ms: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        """지연 한 건을 초 단위로 뽑는다"""
+        if self.median_ms <= 0:
+            return 0.0
+        p99 = max(self.p99_ms, self.median_ms)
+        sigma = math.log(p99 / self.median_ms) / 2.3263  # z(0.99)
+        return self.median_ms * math.exp(rng.gauss(0.0, sigma)) / 1000.0
+
+
+@dataclass
+class RateLimits:
+    """티어별 rate limit 설정
+
+    각 메서드(chat.postMessage는 채널별)에 분당 한도만큼 채워지는 토큰 버킷을
+    둡니다. Slack처럼 짧은 버스트는 허용하고 지속 속도만 제한합니다.
+
+    Attributes:
+        enabled: False면 제한 없이 응답
+        tier_per_minute: 티어별 분당 호출 수
+        post_per_second: chat.postMessage 채널당 초당 호출 수
+        post_burst: chat.postMessage 채널당 버스트 허용량
+        speedup: 버킷 충전 속도 배율 (10이면 한도가 10배, 테스트 단축용)
+    """
+
+    enabled: bool = True
+    tier_per_minute: dict[int, int] = field(default_factory=lambda: dict(TIER_PER_MINUTE))
+    post_per_second: float = 1.0
+    post_burst: int = 3
+    speedup: float = 1.0
+
+
+class _TokenBuckets:
+    def __init__(self, limits: RateLimits, clock: Callable[[], float]):
+        self.limits = limits
+        self.clock = clock
+        self._buckets: dict[tuple, list[float]] = {}
+
+    def _shape(self, method: str) -> tuple[float, float]:
+        """(버킷 크기, 초당 충전량)"""
+        if method == "chat.postMessage":
+            return float(self.limits.post_burst), self.limits.post_per_second * self.limits.speedup
+        per_minute = self.limits.tier_per_minute[METHOD_TIERS.get(method, DEFAULT_TIER)]
+        return float(per_minute), per_minute / 60.0 * self.limits.speedup
+
+    def acquire(self, method: str, params: dict) -> float:
+        """토큰 하나를 쓰고 0을, 부족하면 다시 시도할 때까지의 초를 반환"""
+        key = (method, params.get("channel")) if method == "chat.postMessage" else (method,)
+        capacity, rate = self._shape(method)
+        now = self.clock()
+        tokens, last = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - last) * rate)
+        if tokens >= 1.0:
+            self._buckets[key] = [tokens - 1.0, now]
+            return 0.0
+        self._buckets[key] = [tokens, now]
+        return (1.0 - tokens) / rate
+
+
+def _read_json_fields(params: dict) -> dict:
+    for name in _JSON_FIELDS:
+        value = params.get(name)
+        if isinstance(value, str) and value[:1] in ("[", "{"):
+            try:
+                params[name] = json.loads(value)
+            except ValueError:
+                pass
+    return params
+
+
+async def _read_params(request: web.Request) -> dict:
+    """쿼리스트링·폼·JSON 본문을 하나의 인자 dict로 합친다 (slack_sdk는 메서드마다 다르게 보냄)"""
+    params: dict = dict(request.query)
+    if request.method == "POST" and request.can_read_body:
+        if request.content_type == "application/json":
+            params.update(await request.json())
+        else:
+            form = await request.post()
+            params.update({k: v for k, v in form.items() if isinstance(v, str)})
+    return _read_json_fields(params)
+
+
+def _bool(value) -> bool:
+    return value in (True, "true", "1", 1)
+
+
+class FakeSlackServer:
+    """in-process fake Slack
+
+    Args:
+        latency: 기본 응답 지연 분포
+        method_latency: 메서드별 지연 분포 (latency보다 우선)
+        rate_limits: rate limit 설정 (None이면 기본 티어 한도 적용)
+        bot_user_id: auth.test가 돌려줄 봇 사용자 ID
+        team_id: 워크스페이스 ID (이벤트 봉투에 실림)
+        seed: 지연 샘플링 난수 시드
+        clock: rate limit 시계 (테스트에서 교체)
+    """
+
+    def __init__(
+        self,
+        latency: Optional[LatencyModel] = None,
+        method_latency: Optional[dict[str, LatencyModel]] = None,
+        rate_limits: Optional[RateLimits] = None,
+        bot_user_id: str = "UFAKEBOT",
+        team_id: str = "TFAKE",
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.latency = latency or LatencyModel()
+        self.method_latency = method_latency or {}
+        self.rate_limits = rate_limits or RateLimits()
+        self.bot_user_id = bot_user_id
+        self.team_id = team_id
+
+        self.calls: Counter = Counter()
+        self.rate_limited: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.stats = {
+            "socket_connections": 0,
+            "events_sent": 0,
+            "events_acked": 0,
+            "uploads": 0,
+            "upload_bytes": 0,
+        }
+        self.ack_latencies: list[float] = []
+
+        # 워크스페이스 상태
+        self.channels: dict[str, dict[str, dict]] = {}
+        self.users: dict[str, dict] = {}
+        self.files: dict[str, dict] = {}
+        self.views: dict[str, dict] = {}
+
+        self._rng = random.Random(seed)
+        self._buckets = _TokenBuckets(self.rate_limits, clock)
+        self._ids = itertools.count(1)
+        self._last_ts = 0.0
+        self._sockets: list[web.WebSocketResponse] = []
+        self._socket_rr = itertools.count()
+        self._acks: dict[str, tuple[float, asyncio.Future]] = {}
+        self._connected = asyncio.Event()
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ""
+        self._methods: dict[str, Callable[[dict], dict]] = {
+            "api.test": lambda p: {"args": p},
+            "auth.test": self._auth_test,
+            "apps.connections.open": self._connections_open,
+            "chat.postMessage": self._post_message,
+            "chat.update": self._update_message,
+            "chat.delete": self._delete_message,
+            "reactions.add": self._add_reaction,
+            "reactions.remove": self._remove_reaction,
+            "users.info": self._users_info,
+            "conversations.history": self._history,
+            "conversations.replies": self._replies,
+            "conversations.open": self._open,
+            "conversations.info": self._conversation_info,
+            "files.getUploadURLExternal": self._upload_url,
+            "files.completeUploadExternal": self._complete_upload,
+            "views.publish": self._publish_view,
+        }
+        self.app = self._build_app()
+
+    def _build_app(self) -> web.Application:
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_route("*", "/api/{method}", self._api)
+        app.router.add_post("/upload/{file_id}", self._upload)
+        app.router.add_get("/link/", self._socket)
+        app.on_shutdown.append(self._close_sockets)
+        return app
+
+    # -- 수명 주기 ---------------------------------------------------------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버를 띄우고 Web API base URL(…/api/)을 반환 (port=0이면 빈 포트 자동 선택)"""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{bound}"
+        return f"{self.base_url}/api/"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _close_sockets(self, _app) -> None:
+        for ws in list(self._sockets):
+            await ws.close()
+
+    def reset_counters(self) -> None:
+        """호출 수·rate limit·오류 카운터 초기화 (워크스페이스 상태는 유지)"""
+        self.calls.clear()
+        self.rate_limited.clear()
+        self.errors.clear()
+
+    # -- 워크스페이스 상태 ---------------------------------------------------
+
+    def _next_ts(self) -> str:
+        ts = max(time.time(), self._last_ts + 0.000001)
+        self._last_ts = ts
+        return f"{ts:.6f}"
+
+    def _channel(self, channel_id: Optional[str]) -> dict[str, dict]:
+        if not channel_id:
+            raise SlackApiFailure("channel_not_found")
+        return self.channels.setdefault(channel_id, {})
+
+    def _message(self, params: dict) -> dict:
+        message = self._channel(params.get("channel")).get(params.get("ts", ""))
+        if message is None:
+            raise SlackApiFailure("message_not_found")
+        return message
+
+    def add_message(
+        self,
+        channel: str,
+        text: str,
+        *,
+        user: str = "UFAKEUSER",
+        thread_ts: Optional[str] = None,
+        **fields,
+    ) -> dict:
+        """채널(또는 스레드)에 메시지를 직접 추가하고 저장된 메시지를 반환"""
+        ts = self._next_ts()
+        message = {"type": "message", "user": user, "text": text, "ts": ts, **fields}
+        if thread_ts:
+            parent = self._channel(channel).get(thread_ts)
+            if parent is not None:
+                parent.setdefault("thread_ts", thread_ts)
+                parent["reply_count"] = parent.get("reply_count", 0) + 1
+                parent["latest_reply"] = ts
+            message["thread_ts"] = thread_ts
+        self._channel(channel)[ts] = message
+        return message
+
+    def messages(self, channel: str, thread_ts: Optional[str] = None) -> list[dict]:
+        """채널 최상위 메시지(또는 스레드 전체)를 시간순으로 반환"""
+        stored = sorted(self.channels.get(channel, {}).values(), key=lambda m: float(m["ts"]))
+        if thread_ts is None:
+            return [m for m in stored if m.get("thread_ts", m["ts"]) == m["ts"]]
+        return [m for m in stored if m["ts"] == thread_ts or m.get("thread_ts") == thread_ts]
+
+    def add_user(self, user_id: str, **fields) -> dict:
+        """users.info가 돌려줄 사용자 정보를 등록 (기본 프로필에 fields를 덮어씀)"""
+        user = self._default_user(user_id)
+        profile = {**user["profile"], **fields.pop("profile", {})}
+        user.update(fields, profile=profile)
+        self.users[user_id] = user
+        return user
+
+    @staticmethod
+    def _default_user(user_id: str) -> dict:
+        name = f"user-{user_id.lower()}"
+        return {
+            "id": user_id,
+            "name": name,
+            "real_name": name,
+            "is_bot": False,
+            "tz": "Asia/Seoul",
+            "profile": {
+                "display_name": name,
+                "real_name": name,
+                "image_72": f"https://example.invalid/{user_id}.png",
+            },
+        }
+
+    # -- Web API -----------------------------------------------------------
+
+    async def _api(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        self.calls[method] += 1
+        params = await _read_params(request)
+
+        delay = self.method_latency.get(method, self.latency).sample(self._rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.rate_limits.enabled:
+            wait = self._buckets.acquire(method, params)
+            if wait:
+                self.rate_limited[method] += 1
+                return web.json_response(
+                    {"ok": False, "error": "ratelimited"},
+                    status=429,
+                    headers={"Retry-After": str(max(1, math.ceil(wait)))},
+                )
+
+        handler = self._methods.get(method)
+        try:
+            if handler is None:
+                raise SlackApiFailure("unknown_method")
+            if not request.headers.get("Authorization") and "token" not in params:
+                raise SlackApiFailure("not_authed")
+            result = handler(params)
+        except SlackApiFailure as e:
+            self.errors[method] += 1
+            return web.json_response({"ok": False, "error": e.code})
+        return web.json_response({"ok": True, **result})
+
+    def _auth_test(self, params: dict) -> dict:
+        return {
+            "url": "https://fake.slack.invalid/",
+            "team": "fake",
+            "user": "fake-bot",
+            "team_id": self.team_id,
+            "user_id": self.bot_user_id,
+            "bot_id": "BFAKEBOT",
+        }
+
+    def _connections_open(self, params: dict) -> dict:
+        ws_base = self.base_url.replace("http://", "ws://", 1)
+        return {"url": f"{ws_base}/link/?ticket={uuid.uuid4().hex}"}
+
+    def _post_message(self, params: dict) -> dict:
+        channel = params.get("channel")
+        if not params.get("text") and not params.get("blocks") and not params.get("attachments"):
+            raise SlackApiFailure("no_text")
+        fields = {k: params[k] for k in ("blocks", "attachments", "metadata") if params.get(k)}
+        message = self.add_message(
+            channel,
+            params.get("text", ""),
+            user=self.bot_user_id,
+            thread_ts=params.get("thread_ts") or None,
+            bot_id="BFAKEBOT",
+            **fields,
+        )
+        return {"channel": channel, "ts": message["ts"], "message": message}
+
+    def _update_message(self, params: dict) -> dict:
+        message = self._message(params)
+        for key in ("text", "blocks", "attachments"):
+            if key in params:
+                message[key] = params[key]
+        message["edited"] = {"user": self.bot_user_id, "ts": self._next_ts()}
+        return {"channel": params["channel"], "ts": message["ts"], "text": message.get("text", "")}
+
+    def _delete_message(self, params: dict) -> dict:
+        self._message(params)
+        del self.channels[params["channel"]][params["ts"]]
+        return {"channel": params["channel"], "ts": params["ts"]}
+
+    def _add_reaction(self, params: dict) -> dict:
+        message = self._message({"channel": params.get("channel"), "ts": params.get("timestamp")})
+        reactions = message.setdefault("reactions", [])
+        entry = next((r for r in reactions if r["name"] == params.get("name")), None)
+        if entry is None:
+            entry = {"name": params.get("name"), "users": [], "count": 0}
+            reactions.append(entry)
+        if self.bot_user_id in entry["users"]:
+            raise SlackApiFailure("already_reacted")
+        entry["users"].append(self.bot_user_id)
+        entry["count"] += 1
+        return {}
+
+    def _remove_reaction(self, params: dict) -> dict:
+        message = self._message({"channel": params.get("channel"), "ts": params.get("timestamp")})
+        reactions = message.get("reactions", [])
+        entry = next((r for r in reactions if r["name"] == params.get("name")), None)
+        if entry is None or self.bot_user_id not in entry["users"]:
+            raise SlackApiFailure("no_reaction")
+        entry["users"].remove(self.bot_user_id)
+        entry["count"] -= 1
+        if not entry["count"]:
+            reactions.remove(entry)
+        return {}
+
+    def _users_info(self, params: dict) -> dict:
+        user_id = params.get("user")
+        if not user_id:
+            raise SlackApiFailure("user_not_found")
+        return {"user": self.users.get(user_id) or self._default_user(user_id)}
+
+    @staticmethod
+    def _page(messages: list[dict], params: dict) -> dict:
+        offset = int(params.get("cursor") or 0)
+        limit = int(params.get("limit") or 100)
+        page = messages[offset:offset + limit]
+        has_more = offset + limit < len(messages)
+        return {
+            "messages": page,
+            "has_more": has_more,
+            "response_metadata": {"next_cursor": str(offset + limit) if has_more else ""},
+        }
+
+    @staticmethod
+    def _in_range(messages: list[dict], params: dict) -> list[dict]:
+        oldest = float(params.get("oldest") or 0)
+        latest = float(params.get("latest") or math.inf)
+        inclusive = _bool(params.get("inclusive"))
+        if inclusive:
+            return [m for m in messages if oldest <= float(m["ts"]) <= latest]
+        return [m for m in messages if oldest < float(m["ts"]) < latest]
+
+    def _history(self, params: dict) -> dict:
+        self._channel(params.get("channel"))
+        messages = self._in_range(self.messages(params["channel"]), params)
+        return self._page(list(reversed(messages)), params)
+
+    def _replies(self, params: dict) -> dict:
+        channel = self._channel(params.get("channel"))
+        if params.get("ts") not in channel:
+            raise SlackApiFailure("thread_not_found")
+        thread = self.messages(params["channel"], params["ts"])
+        return self._page(self._in_range(thread, params), params)
+
+    def _open(self, params: dict) -> dict:
+        users = params.get("users") or ""
+        if isinstance(users, list):
+            users = ",".join(users)
+        if not users:
+            raise SlackApiFailure("users_list_not_supplied")
+        channel_id = "D" + uuid.uuid5(uuid.NAMESPACE_OID, users).hex[:10].upper()
+        self._channel(channel_id)
+        return {"channel": {"id": channel_id, "is_im": "," not in users}}
+
+    def _conversation_info(self, params: dict) -> dict:
+        channel_id = params.get("channel") or ""
+        self._channel(channel_id)
+        return {
+            "channel": {
+                "id": channel_id,
+                "name": channel_id.lower(),
+                "is_channel": channel_id.startswith("C"),
+                "is_private": channel_id.startswith("G"),
+                "is_im": channel_id.startswith("D"),
+            }
+        }
+
+    def _upload_url(self, params: dict) -> dict:
+        if not params.get("filename") or not params.get("length"):
+            raise SlackApiFailure("invalid_arguments")
+        file_id = f"F{next(self._ids):08d}"
+        self.files[file_id] = {
+            "id": file_id,
+            "name": params["filename"],
+            "title": params["filename"],
+            "size": int(params["length"]),
+            "uploaded": False,
+        }
+        return {"upload_url": f"{self.base_url}/upload/{file_id}", "file_id": file_id}
+
+    def _complete_upload(self, params: dict) -> dict:
+        entries = params.get("files") or []
+        completed = []
+        for entry in entries:
+            stored = self.files.get(entry.get("id"))
+            if stored is None or not stored["uploaded"]:
+                raise SlackApiFailure("file_not_found")
+            stored["title"] = entry.get("title") or stored["title"]
+            completed.append({k: v for k, v in stored.items() if k != "uploaded"})
+        channel = params.get("channel_id")
+        if channel:
+            self.add_message(
+                channel,
+                params.get("initial_comment", ""),
+                user=self.bot_user_id,
+                thread_ts=params.get("thread_ts") or None,
+                files=completed,
+            )
+        return {"files": completed}
+
+    def _publish_view(self, params: dict) -> dict:
+        view = params.get("view")
+        if not params.get("user_id") or not isinstance(view, dict):
+            raise SlackApiFailure("invalid_arguments")
+        published = {**view, "id": f"V{next(self._ids):08d}", "team_id": self.team_id}
+        self.views[params["user_id"]] = published
+        return {"view": published}
+
+    async def _upload(self, request: web.Request) -> web.Response:
+        stored = self.files.get(request.match_info["file_id"])
+        if stored is None:
+            return web.Response(status=404, text="file not found")
+        data = await request.read()
+        stored["uploaded"] = True
+        stored["size"] = len(data)
+        self.stats["uploads"] += 1
+        self.stats["upload_bytes"] += len(data)
+        return web.Response(text=f"OK - {len(data)}")
+
+    # -- Socket Mode -------------------------------------------------------
+
+    async def _socket(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(autoping=True)
+        await ws.prepare(request)
+        self._sockets.append(ws)
+        self.stats["socket_connections"] += 1
+        await ws.send_json({
+            "type": "hello",
+            "num_connections": len(self._sockets),
+            "connection_info": {"app_id": "AFAKEAPP"},
+            "debug_info": {"host": "fake-slack", "approximate_connection_time": 18060},
+        })
+        self._connected.set()
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    ack = json.loads(msg.data)
+                except ValueError:
+                    continue
+                sent_at, future = self._acks.get(ack.get("envelope_id"), (0.0, None))
+                if future is not None and not future.done():
+                    self.stats["events_acked"] += 1
+                    self.ack_latencies.append(time.perf_counter() - sent_at)
+                    future.set_result(ack)
+        finally:
+            self._sockets.remove(ws)
+            if not self._sockets:
+                self._connected.clear()
+        return ws
+
+    async def wait_for_connection(self, timeout: float = 5.0) -> None:
+        """Socket Mode 클라이언트가 붙을 때까지 대기"""
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    def event_payload(self, event: dict) -> dict:
+        """event를 Events API event_callback 본문으로 감싼다"""
+        return {
+            "token": "fake-verification-token",
+            "team_id": self.team_id,
+            "api_app_id": "AFAKEAPP",
+            "event": event,
+            "type": "event_callback",
+            "event_id": f"Ev{next(self._ids):010d}",
+            "event_time": int(time.time()),
+        }
+
+    async def send_event(self, event: dict, *, retry_attempt: int = 0, payload: Optional[dict] = None) -> str:
+        """연결된 소켓 하나(라운드 로빈)로 events_api 봉투를 보내고 envelope_id를 반환
+
+        같은 이벤트의 재전송을 흉내내려면 처음 받은 payload와 retry_attempt를 넘깁니다.
+        """
+        if not self._sockets:
+            raise RuntimeError("Socket Mode 연결이 없습니다")
+        envelope_id = str(uuid.uuid4())
+        envelope = {
+            "envelope_id": envelope_id,
+            "payload": payload or self.event_payload(event),
+            "type": "events_api",
+            "accepts_response_payload": False,
+            "retry_attempt": retry_attempt,
+            "retry_reason": "timeout" if retry_attempt else "",
+        }
+        ws = self._sockets[next(self._socket_rr) % len(self._sockets)]
+        self._acks[envelope_id] = (time.perf_counter(), asyncio.get_running_loop().create_future())
+        await ws.send_json(envelope)
+        self.stats["events_sent"] += 1
+        return envelope_id
+
+    async def wait_for_ack(self, envelope_id: str, timeout: float = 3.0) -> Optional[dict]:
+        """ack 메시지를 기다려 반환 (timeout이면 None; Slack이라면 재전송할 상황)"""
+        if envelope_id not in self._acks:
+            return None
+        _, future = self._acks[envelope_id]
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            if future.done():
+                del self._acks[envelope_id]
+
+    async def dispatch(self, event: dict, timeout: float = 3.0) -> Optional[dict]:
+        """이벤트를 보내고 ack까지 기다린다"""
+        return await self.wait_for_ack(await self.send_event(event), timeout)
+
+    async def post_user_message(
+        self,
+        channel: str,
+        text: str,
+        *,
+        user: str = "UFAKEUSER",
+        thread_ts: Optional[str] = None,
+        mention: bool = False,
+    ) -> tuple[dict, str]:
+        """사용자 메시지를 채널에 남기고 message(멘션이면 app_mention) 이벤트를 전송
+
+        Returns:
+            (전송한 이벤트, envelope_id)
+        """
+        if mention and f"<@{self.bot_user_id}>" not in text:
+            text = f"<@{self.bot_user_id}> {text}"
+        message = self.add_message(
+            channel, text, user=user, thread_ts=thread_ts, client_msg_id=str(uuid.uuid4()),
+        )
+        event = {**message, "type": "app_mention" if mention else "message", "channel": channel}
+        event["event_ts"] = message["ts"]
+        return event, await self.send_event(event)
+
+    async def request_reconnect(self, reason: str = "refresh_requested") -> None:
+        """모든 소켓에 disconnect를 보내 재연결을 유도 (Slack의 주기적 갱신 흉내)"""
+        for ws in list(self._sockets):
+            await ws.send_json({"type": "disconnect", "reason": reason})
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="fake Slack Web API / Socket Mode")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--median-ms", type=float, default=0.0, help="응답 지연 중앙값")
+    parser.add_argument("--p99-ms", type=float, default=0.0, help="응답 지연 p99")
+    parser.add_argument("--no-rate-limit", action="store_true")
+    parser.add_argument("--speedup", type=float, default=1.0, help="rate limit 충전 속도 배율")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    server = FakeSlackServer(
+        latency=LatencyModel(median_ms=args.median_ms, p99_ms=args.p99_ms),
+        rate_limits=RateLimits(enabled=not args.no_rate_limit, speedup=args.speedup),
+        seed=args.seed,
+    )
+    server.base_url = f"http://{args.host}:{args.port}"
+    web.run_app(server.app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,417 @@
+"""Fake soul-server
+
+봇이 사용하는 soul-server / orch-server HTTP 인터페이스를 aiohttp로 흉내냅니다.
+
+- POST /execute                          → SSE (init ... complete)
+- GET  /events/{id}/stream               → SSE 재연결 (soul-server 경로, after_id 지원)
+- GET  /sessions/{id}/events             → SSE 구독 (orch 경로, after_id 지원)
+- POST /sessions/{id}/intervene          → 202, 실행 중이면 턴 뒤에 이어서 실행
+- POST /sessions/{id}/respond            → 200 (AskUserQuestion 응답)
+- GET  /sessions?status=&limit=          → 홈 탭 세션 목록
+- GET  /health
+
+모든 경로는 orch-server처럼 /api 접두사로도 열려 있습니다.
+
+이벤트 스트림은 StreamProfile로 합성하거나 녹화 파일(JSONL)을 재생하며,
+전송 속도·크기·장애(중간 끊김, error 종료, 503 거절)를 설정할 수 있습니다.
+
+실행:
+    python -m seosoyoung.testing.fake_soul --port 4105 --rate 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from aiohttp import web
+
+Event = tuple[str, dict]
+
+
+@dataclass
+class StreamProfile:
+    """합성 이벤트 스트림 구성
+
+    Attributes:
+        thinking_blocks: thinking 이벤트 수
+        text_deltas: text_delta 이벤트 수
+        delta_size: text_delta 한 건의 문자 수
+        tool_calls: tool_start/tool_result 쌍 수
+        tool_result_size: tool_result 본문 문자 수
+        events_per_second: 이벤트 전송 속도 (0이면 지연 없이 전송)
+        first_event_delay: init 이후 첫 이벤트까지의 지연(초), 모델 첫 토큰 지연 모사
+    """
+
+    thinking_blocks: int = 1
+    text_deltas: int = 20
+    delta_size: int = 32
+    tool_calls: int = 2
+    tool_result_size: int = 256
+    events_per_second: float = 0.0
+    first_event_delay: float = 0.0
+
+
+@dataclass
+class FailurePlan:
+    """장애 주입 설정 (확률은 0~1)
+
+    Attributes:
+        drop_probability: SSE 연결마다 중간에 끊길 확률
+        error_probability: 턴이 complete 대신 error 이벤트로 끝날 확률
+        reject_probability: /execute가 503으로 거절할 확률
+        seed: 난수 시드 (재현용)
+    """
+
+    drop_probability: float = 0.0
+    error_probability: float = 0.0
+    reject_probability: float = 0.0
+    seed: Optional[int] = None
+
+
+def synthetic_events(profile: StreamProfile, prompt: str = "") -> list[Event]:
+    """profile에 맞는 한 턴 분량의 이벤트 (init 제외)"""
+    events: list[Event] = []
+    for i in range(profile.thinking_blocks):
+        events.append(("thinking", {"thinking": f"생각 {i}: {prompt[:40]}"}))
+    for i in range(profile.tool_calls):
+        tool_use_id = f"toolu_{i}"
+        events.append((
+            "tool_start",
+            {"tool_name": "Read", "tool_input": {"file_path": f"/tmp/{i}.txt"}, "tool_use_id": tool_use_id},
+        ))
+        events.append((
+            "tool_result",
+            {"result": "x" * profile.tool_result_size, "tool_use_id": tool_use_id, "is_error": False},
+        ))
+    chunk = ("가나다라마바사아자차카타파하 " * (profile.delta_size // 15 + 1))[: profile.delta_size]
+    events.append(("text_start", {}))
+    events.extend(("text_delta", {"text": chunk}) for _ in range(profile.text_deltas))
+    events.append(("text_end", {}))
+    result = chunk * profile.text_deltas
+    events.append(("assistant_message", {"content": result}))
+    events.append(("complete", {"result": result}))
+    return events
+
+
+def load_recording(path: str | Path) -> list[Event]:
+    """녹화된 이벤트 스트림 로드
+
+    한 줄에 {"event": ..., "data": {...}} 하나씩인 JSONL. init 이벤트는 서버가
+    세션마다 새로 만들므로 건너뜁니다. complete/error가 없으면 빈 complete를 붙입니다.
+    """
+    events: list[Event] = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        name = record.get("event") or record.get("type", "message")
+        if name == "init":
+            continue
+        events.append((name, record.get("data", {})))
+    if not events or events[-1][0] not in ("complete", "error"):
+        events.append(("complete", {"result": ""}))
+    return events
+
+
+def _encode(event_id: int, name: str, data: dict) -> bytes:
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"id: {event_id}\nevent: {name}\ndata: {payload}\n\n".encode("utf-8")
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class _FakeSession:
+    agent_session_id: str
+    prompt: str
+    status: str = "running"
+    log: list[bytes] = field(default_factory=list)
+    pending_prompts: list[str] = field(default_factory=list)
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
+    changed: asyncio.Condition = field(default_factory=asyncio.Condition)
+    producer: Optional[asyncio.Task] = None
+
+    async def append(self, name: str, data: dict) -> None:
+        async with self.changed:
+            self.log.append(_encode(len(self.log) + 1, name, data))
+            self.updated_at = _now_iso()
+            self.changed.notify_all()
+
+    async def finish(self, status: str) -> None:
+        async with self.changed:
+            self.status = status
+            self.updated_at = _now_iso()
+            self.changed.notify_all()
+
+    def summary(self) -> dict:
+        return {
+            "agent_session_id": self.agent_session_id,
+            "status": self.status,
+            "display_name": self.prompt[:30],
+            "last_message": {"preview": self.prompt[:80]},
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "node_id": "fake-node",
+        }
+
+
+class FakeSoulServer:
+    """in-process fake soul-server
+
+    Args:
+        profile: 합성 스트림 구성 (recording이 있으면 무시)
+        failures: 장애 주입 설정
+        recording: 재생할 녹화 이벤트 (load_recording 결과)
+    """
+
+    def __init__(
+        self,
+        profile: Optional[StreamProfile] = None,
+        failures: Optional[FailurePlan] = None,
+        recording: Optional[list[Event]] = None,
+    ):
+        self.profile = profile or StreamProfile()
+        self.failures = failures or FailurePlan()
+        self.recording = recording
+        self.sessions: dict[str, _FakeSession] = {}
+        self.stats = {
+            "executes": 0,
+            "rejected": 0,
+            "streams": 0,
+            "reconnects": 0,
+            "dropped": 0,
+            "events_sent": 0,
+            "interventions": 0,
+            "responses": 0,
+        }
+        self._rng = random.Random(self.failures.seed)
+        self._ids = itertools.count(1)
+        self._runner: Optional[web.AppRunner] = None
+        self.app = self._build_app()
+
+    def _build_app(self) -> web.Application:
+        app = web.Application()
+        for prefix in ("", "/api"):
+            app.router.add_post(f"{prefix}/execute", self._execute)
+            app.router.add_get(f"{prefix}/events/{{session_id}}/stream", self._reconnect)
+            app.router.add_get(f"{prefix}/sessions/{{session_id}}/events", self._reconnect)
+            app.router.add_post(f"{prefix}/sessions/{{session_id}}/intervene", self._intervene)
+            app.router.add_post(f"{prefix}/sessions/{{session_id}}/respond", self._respond)
+            app.router.add_get(f"{prefix}/sessions", self._list_sessions)
+            app.router.add_get(f"{prefix}/health", self._health)
+        app.on_shutdown.append(self._cancel_producers)
+        return app
+
+    # -- 수명 주기 ---------------------------------------------------------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버를 띄우고 base URL을 반환 (port=0이면 빈 포트 자동 선택)"""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound = site._server.sockets[0].getsockname()[1]
+        return f"http://{host}:{bound}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _cancel_producers(self, _app) -> None:
+        for session in self.sessions.values():
+            if session.producer and not session.producer.done():
+                session.producer.cancel()
+
+    # -- 턴 생산 -----------------------------------------------------------
+
+    def _turn_events(self, prompt: str) -> list[Event]:
+        events = list(self.recording) if self.recording is not None else synthetic_events(self.profile, prompt)
+        if self.failures.error_probability and self._rng.random() < self.failures.error_probability:
+            events[-1] = ("error", {"message": "fake soul-server: 주입된 실행 오류"})
+        return events
+
+    async def _produce(self, session: _FakeSession, prompt: str) -> None:
+        """세션 로그에 턴 이벤트를 설정된 속도로 쌓는다 (개입 메시지는 이어서 실행)"""
+        interval = 1.0 / self.profile.events_per_second if self.profile.events_per_second > 0 else 0.0
+        status = "completed"
+        while True:
+            if self.profile.first_event_delay:
+                await asyncio.sleep(self.profile.first_event_delay)
+            for name, data in self._turn_events(prompt):
+                if interval:
+                    await asyncio.sleep(interval)
+                await session.append(name, data)
+                if name == "error":
+                    status = "error"
+            if not session.pending_prompts:
+                break
+            prompt = session.pending_prompts.pop(0)
+        await session.finish(status)
+
+    def _start_turn(self, session: _FakeSession, prompt: str) -> None:
+        session.status = "running"
+        session.producer = asyncio.get_running_loop().create_task(self._produce(session, prompt))
+
+    # -- SSE ---------------------------------------------------------------
+
+    async def _stream(self, request: web.Request, session: _FakeSession, after_id: int) -> web.StreamResponse:
+        """세션 로그를 after_id 이후부터 전송하고, 실행 중이면 새 이벤트를 따라간다"""
+        self.stats["streams"] += 1
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+        await resp.prepare(request)
+
+        drop_at = None
+        if self.failures.drop_probability and self._rng.random() < self.failures.drop_probability:
+            # 최소 한 이벤트(/execute면 init)는 보낸 뒤 끊어야 클라이언트가 재연결할 수 있다
+            drop_at = self._rng.randint(1, 8)
+
+        cursor = after_id
+        sent = 0
+        while True:
+            async with session.changed:
+                while cursor >= len(session.log) and session.status == "running":
+                    await session.changed.wait()
+                chunk = session.log[cursor:]
+                finished = session.status != "running"
+            for data in chunk:
+                if drop_at is not None and sent >= drop_at:
+                    # 이벤트 중간에서 연결을 끊는다
+                    await resp.write(data[: len(data) // 2])
+                    self.stats["dropped"] += 1
+                    request.transport.close()
+                    return resp
+                await resp.write(data)
+                sent += 1
+                self.stats["events_sent"] += 1
+            cursor += len(chunk)
+            if finished and cursor >= len(session.log):
+                break
+        await resp.write_eof()
+        return resp
+
+    # -- 핸들러 -------------------------------------------------------------
+
+    async def _execute(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        self.stats["executes"] += 1
+        if self.failures.reject_probability and self._rng.random() < self.failures.reject_probability:
+            self.stats["rejected"] += 1
+            return web.json_response(
+                {"error": {"code": "RATE_LIMIT_EXCEEDED", "message": "fake soul-server: 주입된 거절"}},
+                status=503,
+            )
+
+        prompt = body.get("prompt", "")
+        session_id = body.get("agent_session_id")
+        session = self.sessions.get(session_id) if session_id else None
+        if session is None:
+            session = _FakeSession(agent_session_id=session_id or f"fake-sess-{next(self._ids)}", prompt=prompt)
+            self.sessions[session.agent_session_id] = session
+        elif session.status == "running":
+            return web.json_response(
+                {"error": {"code": "SESSION_CONFLICT", "message": "이미 실행 중인 세션입니다"}},
+                status=409,
+            )
+        start = len(session.log)
+        await session.append("init", {"agent_session_id": session.agent_session_id})
+        self._start_turn(session, prompt)
+        return await self._stream(request, session, start)
+
+    async def _reconnect(self, request: web.Request) -> web.StreamResponse:
+        session = self.sessions.get(request.match_info["session_id"])
+        if session is None:
+            return web.json_response({"error": "session not found"}, status=404)
+        self.stats["reconnects"] += 1
+        try:
+            after_id = int(request.query.get("after_id", 0))
+        except ValueError:
+            after_id = 0
+        return await self._stream(request, session, max(0, after_id))
+
+    async def _intervene(self, request: web.Request) -> web.Response:
+        session = self.sessions.get(request.match_info["session_id"])
+        if session is None:
+            return web.json_response({"error": "session not found"}, status=404)
+        body = await request.json()
+        self.stats["interventions"] += 1
+        text = body.get("text", "")
+        await session.append("intervention_sent", {"text": text, "user": body.get("user", "")})
+        if session.status == "running":
+            session.pending_prompts.append(text)
+        else:
+            self._start_turn(session, text)
+        return web.json_response({"queued": True}, status=202)
+
+    async def _respond(self, request: web.Request) -> web.Response:
+        if request.match_info["session_id"] not in self.sessions:
+            return web.json_response({"error": "session not found"}, status=404)
+        self.stats["responses"] += 1
+        return web.json_response({"ok": True})
+
+    async def _list_sessions(self, request: web.Request) -> web.Response:
+        wanted = set(filter(None, request.query.get("status", "").split(",")))
+        limit = int(request.query.get("limit", 0) or 0)
+        sessions = [
+            s.summary() for s in self.sessions.values() if not wanted or s.status in wanted
+        ]
+        sessions.sort(key=lambda s: s["updated_at"], reverse=True)
+        total = len(sessions)
+        if limit:
+            sessions = sessions[:limit]
+        return web.json_response({"sessions": sessions, "total": total})
+
+    async def _health(self, request: web.Request) -> web.Response:
+        running = sum(1 for s in self.sessions.values() if s.status == "running")
+        return web.json_response({"status": "ok", "fake": True, "running_sessions": running, "time": time.time()})
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="fake soul-server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4105)
+    parser.add_argument("--rate", type=float, default=0.0, help="초당 이벤트 수 (0=무제한)")
+    parser.add_argument("--deltas", type=int, default=20)
+    parser.add_argument("--delta-size", type=int, default=32)
+    parser.add_argument("--tools", type=int, default=2)
+    parser.add_argument("--first-event-delay", type=float, default=0.0)
+    parser.add_argument("--drop", type=float, default=0.0, help="연결 끊김 확률")
+    parser.add_argument("--error", type=float, default=0.0, help="error 종료 확률")
+    parser.add_argument("--reject", type=float, default=0.0, help="503 거절 확률")
+    parser.add_argument("--recording", help="재생할 이벤트 JSONL")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    server = FakeSoulServer(
+        profile=StreamProfile(
+            text_deltas=args.deltas,
+            delta_size=args.delta_size,
+            tool_calls=args.tools,
+            events_per_second=args.rate,
+            first_event_delay=args.first_event_delay,
+        ),
+        failures=FailurePlan(
+            drop_probability=args.drop,
+            error_probability=args.error,
+            reject_probability=args.reject,
+            seed=args.seed,
+        ),
+        recording=load_recording(args.recording) if args.recording else None,
+    )
+    web.run_app(server.app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@
 """
 
 import asyncio
+import concurrent.futures
+import contextvars
 import logging
 import threading
 
@@ -15,6 +17,7 @@ def run_in_new_loop(coro):
 
     각 호출마다 격리된 이벤트 루프를 생성하여
     이전 실행의 anyio 잔여물이 영향을 미치지 않도록 합니다.
+    호출자의 contextvars(현재 trace span 등)는 복사해서 넘깁니다.
 
     Args:
         coro: 실행할 코루틴
@@ -34,10 +37,60 @@ def run_in_new_loop(coro):
         except BaseException as e:
             error_box[0] = e
 
-    thread = threading.Thread(target=_run, name="async-bridge-sync")
+    context = contextvars.copy_context()
+    thread = threading.Thread(target=context.run, args=(_run,), name="async-bridge-sync")
     thread.start()
     thread.join()
 
     if error_box[0] is not None:
         raise error_box[0]
     return result_box[0]
+
+
+class BackgroundLoop:
+    """데몬 스레드에서 상시 동작하는 이벤트 루프
+
+    run_in_new_loop은 호출이 끝나면 루프를 닫으므로, 호출자가 기다리지 않는
+    (fire-and-forget) 코루틴은 이 루프에 제출해야 끝까지 실행됩니다.
+    루프는 첫 제출 시점에 시작됩니다.
+    """
+
+    def __init__(self, name: str = "async-bridge-background") -> None:
+        self._name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run, args=(loop,), name=self._name, daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """코루틴을 백그라운드 루프에 제출하고 concurrent Future를 반환"""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+
+    def stop(self) -> None:
+        """루프를 멈추고 스레드 종료를 기다림 (진행 중인 코루틴은 버려짐)"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
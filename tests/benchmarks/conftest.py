@@ -0,0 +1,189 @@
+"""성능 회귀 벤치마크 하네스
+
+``@pytest.mark.benchmark`` 테스트는 ``bench`` fixture로 핫 함수를 반복 측정하고,
+``baselines.json``에 기록된 기준값과 비교해 예산(budget)을 넘으면 실패합니다.
+
+- 측정: timeit식 autorange로 라운드당 약 20ms가 되도록 반복 횟수를 정하고,
+  여러 라운드 중 호출당 최솟값을 씁니다 (스케줄링 잡음에 가장 둔감).
+- 기계 보정: 세션마다 고정된 순수 파이썬 작업량(calibration)을 재고, 기준값을
+  기록했을 때의 보정값과의 비율로 기준값을 환산합니다. 느린 CI 머신에서도
+  같은 예산을 쓸 수 있습니다.
+- 예산: 항목별 ``budget`` (없으면 ``_meta.default_budget``). 허용치는
+  ``기준값 × 머신 보정비 × budget``.
+
+실행:
+    pytest -m benchmark -n0                  # 기준값과 비교
+    pytest -m benchmark -n0 --bench-update   # 현재 머신으로 기준값 갱신
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+BASELINE_PATH = Path(__file__).parent / "baselines.json"
+DEFAULT_BUDGET = 1.5
+
+_ROUND_TARGET = 0.02  # 라운드당 목표 시간(초)
+_ROUNDS = 7
+_CALIBRATION_ROUNDS = 15
+
+
+@dataclass
+class BenchResult:
+    name: str
+    per_call_us: float
+    rounds: int
+    iterations: int
+    limit_us: float | None = None
+    baseline_us: float | None = None
+
+
+def _time_block(fn: Callable[[], Any], number: int) -> float:
+    started = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return time.perf_counter() - started
+
+
+def measure(fn: Callable[[], Any], rounds: int = _ROUNDS) -> tuple[float, int]:
+    """(호출당 최소 시간(초), 라운드당 반복 수)"""
+    number = 1
+    while True:
+        elapsed = _time_block(fn, number)
+        if elapsed >= _ROUND_TARGET:
+            break
+        number = number * 10 if elapsed == 0 else max(number + 1, int(number * _ROUND_TARGET / elapsed * 1.1))
+    best = min(_time_block(fn, number) for _ in range(rounds))
+    return best / number, number
+
+
+_CALIBRATION_TEXT = " ".join(f"word{i} <@U{i:05d}> **bold{i}**" for i in range(40))
+_CALIBRATION_RE = re.compile(r"\*\*(.+?)\*\*")
+
+
+def _calibration_workload() -> None:
+    """기계 속도 측정용 고정 작업량 (정규식·dict·JSON·문자열 연산 혼합)"""
+    data = {f"k{i}": i for i in range(100)}
+    json.loads(json.dumps(data))
+    _CALIBRATION_RE.sub(r"*\1*", _CALIBRATION_TEXT)
+    sum(len(k) * v for k, v in data.items())
+    "|".join(sorted(data, reverse=True))
+
+
+def _load_baselines() -> dict:
+    if not BASELINE_PATH.exists():
+        return {"_meta": {}}
+    return json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+
+
+class BenchSession:
+    """세션 단위 상태: 기준값, 머신 보정비, 측정 결과"""
+
+    def __init__(self, update: bool):
+        self.update = update
+        self.baselines = _load_baselines()
+        self.calibration_us = measure(_calibration_workload, _CALIBRATION_ROUNDS)[0] * 1e6
+        recorded = self.baselines.get("_meta", {}).get("calibration_us")
+        self.scale = self.calibration_us / recorded if recorded else 1.0
+        self.results: list[BenchResult] = []
+
+    def check(self, result: BenchResult) -> None:
+        self.results.append(result)
+        if self.update:
+            return
+        entry = self.baselines.get(result.name)
+        if entry is None:
+            pytest.fail(
+                f"{result.name}: 기준값이 없습니다 — pytest -m benchmark -n0 --bench-update 로 기록하세요",
+                pytrace=False,
+            )
+        budget = entry.get("budget", self.baselines["_meta"].get("default_budget", DEFAULT_BUDGET))
+        result.baseline_us = entry["per_call_us"]
+        result.limit_us = entry["per_call_us"] * self.scale * budget
+        if result.per_call_us > result.limit_us:
+            pytest.fail(
+                f"{result.name}: {result.per_call_us:.2f}µs > 허용 {result.limit_us:.2f}µs "
+                f"(기준 {entry['per_call_us']:.2f}µs × 머신 보정 {self.scale:.2f} × 예산 {budget})",
+                pytrace=False,
+            )
+
+    def write(self) -> None:
+        meta = self.baselines.setdefault("_meta", {})
+        meta.update(
+            calibration_us=round(self.calibration_us, 3),
+            default_budget=meta.get("default_budget", DEFAULT_BUDGET),
+            python=platform.python_version(),
+            machine=platform.machine(),
+            updated_at=datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+        )
+        for result in self.results:
+            entry = self.baselines.setdefault(result.name, {})
+            entry["per_call_us"] = round(result.per_call_us, 3)
+        ordered = {"_meta": meta, **{k: self.baselines[k] for k in sorted(self.baselines) if k != "_meta"}}
+        BASELINE_PATH.write_text(json.dumps(ordered, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def bench_session(pytestconfig) -> BenchSession:
+    update = pytestconfig.getoption("--bench-update")
+    if update and getattr(pytestconfig, "workerinput", None) is not None:
+        raise pytest.UsageError("--bench-update는 -n0(단일 프로세스)으로 실행하세요")
+    session = BenchSession(update=update)
+    pytestconfig._bench_session = session
+    return session
+
+
+@pytest.fixture
+def bench(request, bench_session) -> Callable:
+    """pytest-benchmark식 측정 fixture
+
+    ``bench(fn, *args, ops=1, **kwargs)``: fn(*args, **kwargs)를 반복 측정하고
+    첫 호출 결과를 반환합니다. fn 한 번이 ops개의 연산을 묶어 실행하면 ops로 나눈
+    값을 연산당 시간으로 기록합니다. 기준값 키는 테스트 함수 이름입니다.
+    """
+
+    def run(fn: Callable, *args, ops: int = 1, **kwargs):
+        result = fn(*args, **kwargs)
+        per_call, iterations = measure(lambda: fn(*args, **kwargs))
+        bench_session.check(BenchResult(
+            name=request.node.name,
+            per_call_us=per_call / ops * 1e6,
+            rounds=_ROUNDS,
+            iterations=iterations,
+        ))
+        return result
+
+    return run
+
+
+def pytest_sessionfinish(session, exitstatus):
+    bench_session = getattr(session.config, "_bench_session", None)
+    if bench_session is not None and bench_session.update and bench_session.results:
+        bench_session.write()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    bench_session = getattr(config, "_bench_session", None)
+    if bench_session is None or not bench_session.results:
+        return
+    tr = terminalreporter
+    tr.section("benchmarks")
+    tr.write_line(
+        f"machine calibration {bench_session.calibration_us:.2f}µs (scale {bench_session.scale:.2f})"
+        + (" — baselines updated" if bench_session.update else "")
+    )
+    width = max(len(r.name) for r in bench_session.results)
+    for r in bench_session.results:
+        line = f"{r.name:<{width}}  {r.per_call_us:>10.2f}µs"
+        if r.limit_us:
+            line += f"  limit {r.limit_us:>10.2f}µs  ({r.per_call_us / r.limit_us:.0%} of budget)"
+        tr.write_line(line)
@@ -0,0 +1,229 @@
+"""런타임 핫 경로 벤치마크
+
+SSE 파싱, 세션 저장소, 플러그인 훅 디스패치, 턴 trace처럼 턴/이벤트마다 거치는
+경로입니다.
+"""
+
+import asyncio
+import io
+import json
+import os
+import sys
+import tempfile
+import types
+from pathlib import Path
+
+import pytest
+
+from seosoyoung.core.context import create_hook_context
+from seosoyoung.core.hooks import HookResult
+from seosoyoung.core.plugin import Plugin, PluginMeta
+from seosoyoung.core.plugin_manager import PluginManager
+from seosoyoung.slackbot import tracing
+from seosoyoung.slackbot.soulstream.service_client import SoulServiceClient
+from seosoyoung.slackbot.soulstream.session import SessionManager
+from seosoyoung.testing import StreamProfile, synthetic_events
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def _run(loop, factory):
+    # bench는 같은 인자로 반복 호출하므로 코루틴 대신 팩토리를 받는다
+    return loop.run_until_complete(factory())
+
+
+# -- SSE ----------------------------------------------------------------------
+
+
+def _sse_payload() -> bytes:
+    """도구 4회, 텍스트 델타 150개짜리 한 턴 (약 160 이벤트)"""
+    events = [("init", {"agent_session_id": "sess-bench"})]
+    events += synthetic_events(StreamProfile(text_deltas=150, tool_calls=4))
+    return b"".join(
+        f"id: {i}\nevent: {name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode()
+        for i, (name, data) in enumerate(events, start=1)
+    )
+
+
+class _Content:
+    def __init__(self, payload: bytes):
+        self._buf = io.BytesIO(payload)
+
+    async def readline(self) -> bytes:
+        return self._buf.readline()
+
+
+class _Response:
+    def __init__(self, payload: bytes):
+        self.content = _Content(payload)
+
+
+def test_parse_sse_stream(bench, loop):
+    client = SoulServiceClient(base_url="http://localhost:4105")
+    payload = _sse_payload()
+
+    async def parse_all() -> int:
+        count = 0
+        async for _ in client._parse_sse_stream(_Response(payload)):
+            count += 1
+        return count
+
+    event_count = _run(loop, parse_all)
+    # 이벤트당 시간으로 기록
+    assert bench(_run, loop, parse_all, ops=event_count) == event_count
+
+
+# -- SessionManager -----------------------------------------------------------
+
+
+@pytest.fixture
+def session_dir(tmp_path):
+    """가능하면 tmpfs(/dev/shm)를 써서 디스크 특성 대신 코드 비용을 잰다"""
+    shm = Path("/dev/shm")
+    if not (shm.is_dir() and os.access(shm, os.W_OK)):
+        yield tmp_path / "sessions"
+        return
+    with tempfile.TemporaryDirectory(dir=shm, prefix="ssy-bench-") as path:
+        yield Path(path)
+
+
+@pytest.fixture
+def sessions(session_dir):
+    manager = SessionManager(session_dir=session_dir)
+    for i in range(200):
+        ts = f"1718000000.{i:06d}"
+        manager.create(thread_ts=ts, channel_id="C1", user_id="U1", username="bench", role="admin")
+        if i % 2:
+            manager.update_session_id(ts, f"sess-{i}")
+    return manager
+
+
+def test_session_get_cached(bench, sessions):
+    assert bench(sessions.get, "1718000000.000100").channel_id == "C1"
+
+
+def test_session_update_cycle(bench, sessions):
+    """메시지 수신마다 일어나는 카운트 증가 + last_seen 갱신 (파일 저장 2회)"""
+    ts = "1718000000.000050"
+
+    def cycle():
+        sessions.increment_message_count(ts)
+        sessions.update_last_seen_ts(ts, "1718000001.000000")
+
+    bench(cycle)
+    assert sessions.get(ts).message_count > 0
+
+
+def test_session_cold_load(bench, sessions):
+    """재시작 직후처럼 캐시가 빈 상태에서 세션 파일을 읽는 경로"""
+    session_dir = sessions.session_dir
+
+    def cold_get():
+        return SessionManager(session_dir=session_dir).get("1718000000.000150")
+
+    assert bench(cold_get).thread_ts == "1718000000.000150"
+
+
+def test_session_find_all_by_session_id(bench, sessions):
+    assert len(bench(sessions.find_all_by_session_id)) == 100
+
+
+# -- PluginManager.dispatch ---------------------------------------------------
+
+
+def _plugin_module(index: int) -> str:
+    class BenchPlugin(Plugin):
+        meta = PluginMeta(name=f"bench_{index}", version="1.0.0")
+
+        async def on_load(self, config):
+            pass
+
+        async def on_unload(self):
+            pass
+
+        def register_hooks(self):
+            async def on_message(ctx):
+                return HookResult.CONTINUE, ctx.args["text"][:8]
+
+            return {"on_message": on_message}
+
+    name = f"bench_plugin_{index}"
+    module = types.ModuleType(name)
+    module.BenchPlugin = BenchPlugin
+    module.Plugin = Plugin
+    sys.modules[name] = module
+    return name
+
+
+@pytest.fixture
+def plugin_manager(loop):
+    manager = PluginManager()
+    names = [_plugin_module(i) for i in range(5)]
+    for i, name in enumerate(names):
+        loop.run_until_complete(manager.load(name, priority=i))
+    yield manager
+    for name in names:
+        sys.modules.pop(name, None)
+
+
+def test_plugin_manager_dispatch(bench, loop, plugin_manager):
+    """핸들러 5개 체인을 100회 디스패치 (디스패치당 시간으로 기록)"""
+    event = {"type": "message", "channel": "C1", "user": "U1", "text": "안녕하세요 벤치마크", "ts": "1.0"}
+
+    async def dispatch_many():
+        for _ in range(100):
+            ctx = await plugin_manager.dispatch(
+                "on_message", create_hook_context("on_message", event=event, text=event["text"]),
+            )
+        return ctx
+
+    ctx = bench(_run, loop, dispatch_many, ops=100)
+    assert len(ctx.results) == 5
+
+
+# -- tracing ------------------------------------------------------------------
+
+_TURN_STAGES = (
+    "auth.lookup", "context.build", "files.download", "plugin.before_execute",
+    "slack.placeholder", "soul.execute", "slack.final_post",
+)
+
+
+@pytest.fixture
+def tracer():
+    yield tracing.configure(enabled=True)
+    tracing.configure(enabled=False)
+
+
+def test_trace_turn(bench, tracer):
+    """턴 하나의 추적 비용: span 8개 + mark 2개 + 완료 집계 (턴은 보통 수 초)"""
+
+    def turn():
+        with tracing.trace("slack.mention", channel="C1", ts="1.0"):
+            for name in _TURN_STAGES:
+                with tracing.span(name):
+                    pass
+            tracing.start_span("soul.connect").end()
+            tracing.mark("soul.first_event")
+            tracing.mark("slack.first_update")
+
+    bench(turn)
+    assert tracer.summary()["spans"]["soul.connect"]["count"] > 0
+
+
+def test_span_disabled(bench):
+    """비활성(또는 trace 밖) span + mark 100회 (연산당 시간으로 기록)"""
+
+    def calls():
+        for _ in range(100):
+            with tracing.span("auth.lookup"):
+                tracing.mark("soul.first_event")
+
+    bench(calls, ops=100)
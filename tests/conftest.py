@@ -53,11 +53,29 @@ sys.modules["slack_bolt.adapter.socket_mode"] = MagicMock()
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 
+# -m으로 직접 고를 때만 실행하는 마커와 스킵 사유
+_OPT_IN_MARKERS = {
+    "integration": "통합 테스트: pytest -m integration 으로 실행",
+    "benchmark": "성능 회귀 테스트: pytest -m benchmark -n0 으로 실행",
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-update",
+        action="store_true",
+        default=False,
+        help="benchmark 마커 테스트의 측정값으로 tests/benchmarks/baselines.json 갱신",
+    )
+
+
 def pytest_collection_modifyitems(config, items):
-    """integration 마커가 붙은 테스트는 -m integration 옵션 없이 실행 시 자동 스킵"""
-    if config.getoption("-m", default="") == "integration":
-        return
-    skip_integration = pytest.mark.skip(reason="통합 테스트: pytest -m integration 으로 실행")
-    for item in items:
-        if "integration" in item.keywords:
-            item.add_marker(skip_integration)
+    """integration/benchmark 마커가 붙은 테스트는 -m 으로 고르지 않으면 자동 스킵"""
+    selected = config.getoption("-m", default="")
+    for marker, reason in _OPT_IN_MARKERS.items():
+        if selected == marker:
+            continue
+        skip = pytest.mark.skip(reason=reason)
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip)
@@ -0,0 +1,136 @@
+"""Tests for plugin_sdk/filters.py and PluginManager subscription index."""
+
+from __future__ import annotations
+
+import sys
+import types
+from typing import Any
+
+import pytest
+
+from seosoyoung.core.context import create_hook_context
+from seosoyoung.core.hooks import HookContext, HookResult
+from seosoyoung.core.plugin import Plugin, PluginMeta
+from seosoyoung.core.plugin_manager import PluginManager
+from seosoyoung.plugin_sdk import EventFilter
+
+
+def _event(**kwargs) -> dict:
+    return {"type": "message", "channel": "C1", "text": "hello", "user": "U1", **kwargs}
+
+
+class TestEventFilter:
+    def test_empty_filter_matches_everything(self):
+        assert EventFilter().matches(_event())
+
+    def test_channels(self):
+        f = EventFilter(channels=["C1", "C2"])
+        assert f.matches(_event())
+        assert not f.matches(_event(channel="C9"))
+
+    def test_reaction_channel_from_item(self):
+        f = EventFilter(channels=["C1"])
+        assert f.matches({"type": "reaction_added", "item": {"channel": "C1"}})
+
+    def test_subtypes_empty_string_is_plain_message(self):
+        f = EventFilter(subtypes=[""])
+        assert f.matches(_event())
+        assert not f.matches(_event(subtype="message_changed"))
+
+    def test_bots(self):
+        assert EventFilter(bots=False).matches(_event())
+        assert not EventFilter(bots=False).matches(_event(bot_id="B1"))
+        assert EventFilter(bots=True).matches(_event(bot_id="B1"))
+
+    def test_has_files(self):
+        assert EventFilter(has_files=True).matches(_event(files=[{"id": "F1"}]))
+        assert not EventFilter(has_files=True).matches(_event())
+
+    def test_text_pattern(self):
+        f = EventFilter(text_pattern=r"^번역\s")
+        assert f.matches(_event(text="번역 안녕"))
+        assert not f.matches(_event(text="안녕"))
+        assert not f.matches(_event(text=None))
+
+
+def _plugin(name: str, filters: dict | None, seen: list) -> type[Plugin]:
+    class FilteredPlugin(Plugin):
+        meta = PluginMeta(name=name, version="0.1.0")
+
+        async def on_load(self, config: dict[str, Any]) -> None:
+            pass
+
+        async def on_unload(self) -> None:
+            pass
+
+        def register_hooks(self) -> dict:
+            async def on_message(ctx: HookContext) -> tuple[HookResult, Any]:
+                seen.append(name)
+                return HookResult.CONTINUE, name
+
+            return {"on_message": on_message}
+
+        def register_filters(self) -> dict:
+            return filters or {}
+
+    return FilteredPlugin
+
+
+@pytest.fixture()
+def load_plugin():
+    loaded = []
+
+    async def _load(manager: PluginManager, name: str, filters, seen):
+        module = f"fake_filter_plugins_{name}"
+        mod = types.ModuleType(module)
+        cls = _plugin(name, filters, seen)
+        mod.__dict__[cls.__name__] = cls
+        sys.modules[module] = mod
+        loaded.append(module)
+        await manager.load(module)
+
+    yield _load
+    for module in loaded:
+        sys.modules.pop(module, None)
+
+
+class TestSubscriptionIndex:
+    async def test_no_handlers_is_skipped(self):
+        manager = PluginManager()
+        assert not manager.should_dispatch("on_message", _event())
+        assert manager.dispatch_counts() == {"on_message": {"executed": 0, "skipped": 1}}
+
+    async def test_unfiltered_plugin_matches_all(self, load_plugin):
+        manager = PluginManager()
+        await load_plugin(manager, "all", None, [])
+        assert manager.should_dispatch("on_message", _event(channel="C9", bot_id="B1"))
+
+    async def test_channel_filter_skips_other_channels(self, load_plugin):
+        manager = PluginManager()
+        await load_plugin(manager, "scoped", {"on_message": EventFilter(channels=["C1"])}, [])
+
+        assert manager.should_dispatch("on_message", _event())
+        assert not manager.should_dispatch("on_message", _event(channel="C2"))
+        assert manager.dispatch_counts()["on_message"] == {"executed": 1, "skipped": 1}
+
+    async def test_unload_rebuilds_index(self, load_plugin):
+        manager = PluginManager()
+        await load_plugin(manager, "all", None, [])
+        await load_plugin(manager, "scoped", {"on_message": EventFilter(channels=["C1"])}, [])
+        assert manager.should_dispatch("on_message", _event(channel="C2"))
+
+        await manager.unload("all")
+
+        assert not manager.should_dispatch("on_message", _event(channel="C2"))
+
+    async def test_dispatch_only_calls_matching_handlers(self, load_plugin):
+        manager = PluginManager()
+        seen: list = []
+        await load_plugin(manager, "humans", {"on_message": EventFilter(bots=False)}, seen)
+        await load_plugin(manager, "everyone", None, seen)
+
+        ctx = create_hook_context("on_message", event=_event(bot_id="B1"))
+        result = await manager.dispatch("on_message", ctx)
+
+        assert seen == ["everyone"]
+        assert result.results == ["everyone"]
@@ -0,0 +1,172 @@
+"""logging_config 테스트 (큐 기반 로깅 파이프라인)"""
+
+import gzip
+import json
+import logging
+import queue
+import sys
+from unittest.mock import patch
+
+from seosoyoung.slackbot import logging_config
+from seosoyoung.slackbot.logging_config import (
+    BoundedQueueHandler,
+    JsonLineFormatter,
+    ModuleRateLimitFilter,
+    _build_file_handler,
+)
+
+
+def _record(name="test", level=logging.DEBUG, msg="hello %s", args=("world",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+class TestBoundedQueueHandler:
+    """크기 제한 큐 핸들러 테스트"""
+
+    def test_enqueue_merges_args(self):
+        q = queue.Queue(maxsize=10)
+        handler = BoundedQueueHandler(q)
+
+        handler.handle(_record())
+
+        record = q.get_nowait()
+        assert record.msg == "hello world"
+        assert record.args is None
+
+    def test_drops_when_full(self):
+        q = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(q)
+
+        for _ in range(5):
+            handler.handle(_record())
+
+        assert q.qsize() == 2
+        assert handler.dropped == 3
+
+    def test_reports_drops_once_queue_has_room(self):
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1))
+        handler.handle(_record())
+        handler.handle(_record())  # 유실
+
+        roomy = queue.Queue(maxsize=10)
+        handler.queue = roomy
+        handler.handle(_record())
+
+        messages = [roomy.get_nowait().getMessage() for _ in range(roomy.qsize())]
+        assert messages[0] == "hello world"
+        assert "1건의 로그가 유실" in messages[1]
+        assert handler.dropped == 1
+
+    def test_exception_serialized_on_enqueue(self):
+        q = queue.Queue(maxsize=10)
+        handler = BoundedQueueHandler(q)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info()
+            )
+        handler.handle(record)
+
+        queued = q.get_nowait()
+        assert queued.exc_info is None
+        assert "ValueError: boom" in queued.exc_text
+
+
+class TestModuleRateLimitFilter:
+    """모듈별 DEBUG 속도 제한 테스트"""
+
+    def test_limits_debug_per_module(self):
+        f = ModuleRateLimitFilter(rate=1, burst=3)
+        with patch("seosoyoung.slackbot.logging_config.time.monotonic", return_value=100.0):
+            passed = [f.filter(_record(name="chatty")) for _ in range(10)]
+
+        assert passed.count(True) == 3
+        assert f.suppressed == 7
+
+    def test_modules_have_independent_buckets(self):
+        f = ModuleRateLimitFilter(rate=1, burst=1)
+        with patch("seosoyoung.slackbot.logging_config.time.monotonic", return_value=100.0):
+            assert f.filter(_record(name="a"))
+            assert not f.filter(_record(name="a"))
+            assert f.filter(_record(name="b"))
+
+    def test_refills_over_time(self):
+        f = ModuleRateLimitFilter(rate=2, burst=1)
+        with patch("seosoyoung.slackbot.logging_config.time.monotonic", return_value=100.0):
+            assert f.filter(_record())
+            assert not f.filter(_record())
+        with patch("seosoyoung.slackbot.logging_config.time.monotonic", return_value=100.5):
+            assert f.filter(_record())
+
+    def test_info_always_passes(self):
+        f = ModuleRateLimitFilter(rate=1, burst=1)
+        with patch("seosoyoung.slackbot.logging_config.time.monotonic", return_value=100.0):
+            results = [f.filter(_record(level=logging.INFO)) for _ in range(10)]
+
+        assert all(results)
+        assert f.suppressed == 0
+
+    def test_zero_rate_disables_limit(self):
+        f = ModuleRateLimitFilter(rate=0)
+        assert all(f.filter(_record()) for _ in range(100))
+
+
+class TestJsonLineFormatter:
+    """JSON lines 포매터 테스트"""
+
+    def test_format_single_line_json(self):
+        line = JsonLineFormatter().format(_record(level=logging.INFO, msg="한글 %s", args=("로그",)))
+
+        assert "\n" not in line
+        entry = json.loads(line)
+        assert entry["message"] == "한글 로그"
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "test"
+
+
+class TestFileRotation:
+    """크기 기반 회전 + 압축 테스트"""
+
+    def test_rotated_files_are_gzipped(self, tmp_path):
+        log_file = tmp_path / "bot.log"
+        with patch.object(logging_config.Config.log, "max_bytes", 200), \
+                patch.object(logging_config.Config.log, "backup_count", 3), \
+                patch.object(logging_config.Config.log, "json", False):
+            handler = _build_file_handler(log_file)
+        try:
+            for i in range(20):
+                handler.emit(_record(level=logging.INFO, msg="line %d " + "x" * 40, args=(i,)))
+        finally:
+            handler.close()
+
+        rotated = tmp_path / "bot.log.1.gz"
+        assert rotated.exists()
+        with gzip.open(rotated, "rt", encoding="utf-8") as f:
+            assert "line" in f.read()
+        assert not (tmp_path / "bot.log.4.gz").exists()
+
+
+class TestSetupLogging:
+    """setup_logging 통합 테스트"""
+
+    def test_writes_through_listener(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LOG_PATH", str(tmp_path))
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        try:
+            logging_config.setup_logging()
+            assert len(root.handlers) == 1
+            assert isinstance(root.handlers[0], BoundedQueueHandler)
+
+            logging.getLogger("pipeline-test").warning("queued %s", "message")
+            logging_config.shutdown_logging()
+
+            contents = "".join(p.read_text(encoding="utf-8") for p in tmp_path.glob("bot_*.log"))
+            assert "queued message" in contents
+            stats = logging_config.get_logging_stats()
+            assert stats["dropped"] == 0
+        finally:
+            logging_config.shutdown_logging()
+            root.handlers[:] = saved_handlers
+            root.setLevel(saved_level)
@@ -0,0 +1,235 @@
+"""턴 지연 추적(tracing) 테스트
+
+비활성 시 no-op, span 중첩과 trace id, 스케줄러 워커/run_in_new_loop 스레드로의
+컨텍스트 전달, JSONL/OTLP 파일 내보내기, 관리 서버 요약을 검증합니다.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from seosoyoung.slackbot import tracing
+from seosoyoung.slackbot.scheduler import ExecutionScheduler, dispatch_turn
+from seosoyoung.slackbot.soulstream.service_client import SoulServiceClient
+from seosoyoung.testing import FakeSoulServer, StreamProfile
+from seosoyoung.utils.async_bridge import run_in_new_loop
+
+
+@pytest.fixture
+def configure():
+    def _configure(**kwargs):
+        kwargs.setdefault("enabled", True)
+        return tracing.configure(**kwargs)
+
+    yield _configure
+    tracing.configure(enabled=False)
+
+
+def _read_lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestDisabled:
+    def test_everything_is_noop(self, configure):
+        tracer = configure(enabled=False)
+        fn = lambda: None  # noqa: E731
+
+        with tracing.trace("slack.mention") as root:
+            assert root is tracing.NOOP_SPAN
+            assert tracing.span("auth.lookup") is tracing.NOOP_SPAN
+            assert tracing.start_span("soul.connect") is tracing.NOOP_SPAN
+            tracing.mark("soul.first_event")
+            assert tracing.bind(fn) is fn
+            assert tracing.current_trace_id() is None
+
+        assert tracer.summary()["traces_started"] == 0
+
+    def test_spans_outside_trace_are_noop(self, configure):
+        configure()
+        assert tracing.span("auth.lookup") is tracing.NOOP_SPAN
+        tracing.mark("slack.first_update")
+        assert tracing.get_tracer().summary()["traces_started"] == 0
+
+
+class TestTraceExport:
+    def test_jsonl_nesting_marks_and_errors(self, configure, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        tracer = configure(export_path=path)
+
+        with tracing.trace("slack.mention", channel="C1", ts="1.0"):
+            trace_id = tracing.current_trace_id()
+            with tracing.span("auth.lookup"):
+                pass
+            with tracing.span("soul.execute"):
+                tracing.mark("soul.first_event")
+                tracing.mark("soul.first_event")  # 처음 시점만 유지
+            with pytest.raises(ValueError):
+                with tracing.span("slack.final_post"):
+                    raise ValueError("boom")
+        tracer.close()
+
+        [record] = _read_lines(path)
+        assert record["trace_id"] == trace_id and len(trace_id) == 32
+        assert record["name"] == "slack.mention"
+        assert record["attrs"] == {"channel": "C1", "ts": "1.0"}
+        spans = {s["name"]: s for s in record["spans"]}
+        assert list(spans) == ["auth.lookup", "soul.execute", "slack.final_post"]
+        assert all(s["parent_id"] == record["span_id"] for s in spans.values())
+        assert spans["slack.final_post"]["error"] == "ValueError: boom"
+        first_event = record["marks"]["soul.first_event"]
+        assert spans["soul.execute"]["start_ms"] <= first_event <= record["duration_ms"]
+
+    def test_otlp_file_format(self, configure, tmp_path):
+        path = tmp_path / "traces.otlp.jsonl"
+        tracer = configure(export_path=path, export_format=tracing.OTLP)
+
+        with tracing.trace("slack.mention", resumed=False, files=2):
+            with tracing.span("files.download"):
+                tracing.mark("slack.first_update")
+        tracer.close()
+
+        [request] = _read_lines(path)
+        resource_spans = request["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0] == {
+            "key": "service.name", "value": {"stringValue": "seosoyoung"},
+        }
+        root, child = resource_spans["scopeSpans"][0]["spans"]
+        assert root["traceId"] == child["traceId"]
+        assert len(child["spanId"]) == 16 and child["parentSpanId"] == root["spanId"]
+        assert "parentSpanId" not in root
+        assert int(root["endTimeUnixNano"]) >= int(child["endTimeUnixNano"]) >= int(child["startTimeUnixNano"])
+        assert {"key": "files", "value": {"intValue": "2"}} in root["attributes"]
+        assert {"key": "resumed", "value": {"boolValue": False}} in root["attributes"]
+        assert root["events"][0]["name"] == "slack.first_update"
+
+    def test_unknown_format_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            tracing.FileExporter(tmp_path / "t.jsonl", "zipkin")
+
+    def test_unfinished_span_is_clipped(self, configure, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        tracer = configure(export_path=path)
+
+        with tracing.trace("slack.mention"):
+            tracing.start_span("soul.connect")  # 예외 등으로 end() 없이 끝난 구간
+        tracer.close()
+
+        [record] = _read_lines(path)
+        [connect] = record["spans"]
+        assert connect["unfinished"] is True
+        assert connect["start_ms"] + connect["duration_ms"] == pytest.approx(record["duration_ms"], abs=0.01)
+
+
+class TestPropagation:
+    def test_trace_spans_scheduler_worker_and_async_bridge(self, configure):
+        tracer = configure()
+        scheduler = ExecutionScheduler(turn_workers=1, max_queue=1, control_workers=1)
+        seen = {}
+
+        async def soul_call():
+            with tracing.span("soul.execute"):
+                seen["loop_trace"] = tracing.current_trace_id()
+
+        def turn():
+            seen["worker_trace"] = tracing.current_trace_id()
+            with tracing.span("auth.lookup"):
+                pass
+            run_in_new_loop(soul_call())
+
+        try:
+            with tracing.trace("slack.mention"):
+                seen["handler_trace"] = tracing.current_trace_id()
+                dispatch_turn(scheduler, turn, key="1.0")
+            # 핸들러가 끝나도 워커 작업이 끝날 때까지 trace는 열려 있다
+            assert _wait_until(lambda: tracer.summary()["traces_finished"] == 1)
+        finally:
+            scheduler.shutdown(timeout=2)
+
+        assert seen["handler_trace"] == seen["worker_trace"] == seen["loop_trace"]
+        [trace] = tracer._recent
+        by_name = {s.name: s for s in trace.spans}
+        assert set(by_name) == {"slack.mention", "scheduler.wait", "turn", "auth.lookup", "soul.execute"}
+        assert by_name["turn"].parent_id == trace.root.span_id
+        assert by_name["auth.lookup"].parent_id == by_name["turn"].span_id
+        assert by_name["soul.execute"].parent_id == by_name["turn"].span_id
+        assert trace.root.end_ns >= by_name["turn"].end_ns
+
+    def test_rejected_turn_releases_trace(self, configure):
+        tracer = configure()
+        scheduler = ExecutionScheduler(turn_workers=1, max_queue=1, control_workers=1)
+        release = threading.Event()
+        try:
+            dispatch_turn(scheduler, release.wait, 5, key="a")
+            assert _wait_until(lambda: scheduler.stats()["turn"]["running"] == 1)
+            dispatch_turn(scheduler, release.wait, 5, key="b")
+            with tracing.trace("slack.mention"):
+                dispatch_turn(scheduler, release.wait, 5, key="c", on_rejected=lambda: None)
+            assert tracer.summary()["traces_finished"] == 1
+        finally:
+            release.set()
+            scheduler.shutdown(timeout=2)
+
+        [trace] = tracer._recent
+        wait = next(s for s in trace.spans if s.name == "scheduler.wait")
+        assert wait.attrs == {"cancelled": "rejected"}
+
+    async def test_soul_client_connect_and_first_event(self, configure):
+        tracer = configure()
+        server = FakeSoulServer(profile=StreamProfile(text_deltas=3, tool_calls=1))
+        url = await server.start()
+        try:
+            async with SoulServiceClient(base_url=url) as client:
+                with tracing.trace("slack.mention"):
+                    result = await client.execute(prompt="안녕")
+        finally:
+            await server.stop()
+
+        assert result.success
+        [trace] = tracer._recent
+        connect = next(s for s in trace.spans if s.name == "soul.connect")
+        assert connect.end_ns is not None
+        assert trace.marks["soul.first_event"] >= connect.end_ns
+
+
+    async def test_soul_connect_failure_ends_span_with_error(self, configure):
+        tracer = configure()
+        async with SoulServiceClient(base_url="http://127.0.0.1:9") as client:
+            with pytest.raises(Exception):
+                with tracing.trace("slack.mention"):
+                    await client.execute(prompt="안녕")
+
+        [trace] = tracer._recent
+        connect = next(s for s in trace.spans if s.name == "soul.connect")
+        assert connect.end_ns is not None and connect.end_ns <= trace.root.end_ns
+        assert connect.error
+
+class TestSummary:
+    def test_percentiles_and_recent(self, configure):
+        tracer = configure()
+        for _ in range(20):
+            with tracing.trace("slack.mention"):
+                with tracing.span("auth.lookup"):
+                    pass
+                tracing.mark("slack.first_update")
+
+        summary = tracer.summary()
+        assert summary["enabled"] is True
+        assert summary["traces_started"] == summary["traces_finished"] == 20
+        auth = summary["spans"]["auth.lookup"]
+        assert auth["count"] == 20
+        assert auth["p50_ms"] <= auth["p95_ms"] <= auth["p99_ms"] <= auth["max_ms"]
+        assert summary["spans"]["slack.mention"]["count"] == 20
+        assert summary["marks"]["slack.first_update"]["count"] == 20
+        recent = summary["recent"][0]
+        assert recent["slowest"][0]["name"] == "auth.lookup"
+        assert "export" not in summary
+        json.dumps(summary)
@@ -0,0 +1,140 @@
+"""Slack 이벤트 재전송 중복 제거 테스트"""
+
+import threading
+from types import SimpleNamespace
+
+from seosoyoung.slackbot.event_dedup import (
+    EventDeduplicator,
+    TimeBucketedSet,
+    event_keys,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _envelope(event_id="Ev1", client_msg_id="c-1", event_type="app_mention", ts="1.0"):
+    event = {"type": event_type, "channel": "C1", "user": "U1", "text": "hi", "ts": ts}
+    if client_msg_id:
+        event["client_msg_id"] = client_msg_id
+    return {"type": "event_callback", "team_id": "T1", "event_id": event_id, "event": event}
+
+
+class TestTimeBucketedSet:
+    def test_keys_expire_after_window(self):
+        clock = _Clock()
+        seen = TimeBucketedSet(window=60, buckets=6, clock=clock)
+
+        assert seen.add_all_if_absent(["a"])
+        assert not seen.add_all_if_absent(["a"])
+        clock.now += 45
+        assert "a" in seen
+        clock.now += 20
+        assert "a" not in seen
+        assert seen.add_all_if_absent(["a"])
+
+    def test_any_known_key_marks_duplicate(self):
+        seen = TimeBucketedSet(window=60, clock=_Clock())
+        assert seen.add_all_if_absent(["a", "b"])
+        assert not seen.add_all_if_absent(["c", "b"])
+        assert "c" not in seen
+
+    def test_memory_is_bounded(self):
+        clock = _Clock()
+        seen = TimeBucketedSet(window=60, buckets=6, max_keys=60, clock=clock)
+        for i in range(200):
+            seen.add_all_if_absent([f"k{i}"])
+            clock.now += 0.1
+        assert len(seen) <= 60
+        assert seen.overflow > 0
+
+
+class TestEventKeys:
+    def test_non_event_payloads_are_not_tracked(self):
+        assert event_keys({"type": "block_actions", "actions": []}) == []
+
+    def test_client_msg_id_key_is_per_event_type(self):
+        mention = event_keys(_envelope("Ev1", event_type="app_mention"))
+        message = event_keys(_envelope("Ev2", event_type="message"))
+        assert mention[1] != message[1]
+
+
+class TestEventDeduplicator:
+    def test_drops_redelivery_and_counts_it(self):
+        dedup = EventDeduplicator(clock=_Clock())
+
+        assert not dedup.is_duplicate(_envelope())
+        assert dedup.is_duplicate(_envelope(), retry_num=1)
+        assert dedup.is_duplicate(_envelope(), retry_num=2)
+        stats = dedup.stats()
+        assert stats["dropped"] == 2
+        assert stats["dropped_retries"] == 2
+
+    def test_same_message_with_new_event_id_is_duplicate(self):
+        dedup = EventDeduplicator(clock=_Clock())
+        assert not dedup.is_duplicate(_envelope("Ev1", client_msg_id="c-9"))
+        assert dedup.is_duplicate(_envelope("Ev2", client_msg_id="c-9"))
+
+    def test_first_seen_retry_is_processed(self):
+        """재시작 등으로 첫 전달을 못 본 재전송은 처리한다"""
+        dedup = EventDeduplicator(clock=_Clock())
+        assert not dedup.is_duplicate(_envelope(), retry_num=1)
+        assert dedup.stats()["retries_processed"] == 1
+
+    def test_concurrent_deliveries_pass_once(self):
+        dedup = EventDeduplicator()
+        passed = []
+        barrier = threading.Barrier(8)
+
+        def deliver():
+            barrier.wait()
+            if not dedup.is_duplicate(_envelope()):
+                passed.append(1)
+
+        threads = [threading.Thread(target=deliver) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(passed) == 1
+
+
+class TestMiddleware:
+    """Bolt 전역 미들웨어 계약: 중복이면 next()를 부르지 않고 응답을 반환"""
+
+    def _dispatch(self, dedup, body, retry_num=None):
+        headers = {"x-slack-retry-num": [str(retry_num)]} if retry_num else {}
+        request = SimpleNamespace(headers=headers)
+        calls = []
+        result = dedup.middleware(body, request, lambda: calls.append(body))
+        return result, calls
+
+    def test_retry_is_acked_without_reaching_handler(self):
+        dedup = EventDeduplicator()
+
+        _, first_calls = self._dispatch(dedup, _envelope())
+        result, retry_calls = self._dispatch(dedup, _envelope(), retry_num=1)
+
+        assert len(first_calls) == 1
+        assert retry_calls == []
+        assert result is not None
+        assert dedup.stats()["dropped_retries"] == 1
+
+    def test_non_event_requests_pass_through(self):
+        dedup = EventDeduplicator()
+        action = {"type": "block_actions", "actions": [{"action_id": "x"}]}
+        for _ in range(2):
+            _, calls = self._dispatch(dedup, action)
+            assert len(calls) == 1
+        assert dedup.stats()["checked"] == 0
+
+    def test_retry_attempt_from_envelope(self):
+        dedup = EventDeduplicator()
+        self._dispatch(dedup, _envelope())
+        self._dispatch(dedup, dict(_envelope(), retry_attempt=2))
+        assert dedup.stats()["dropped_retries"] == 1
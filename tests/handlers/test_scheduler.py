@@ -0,0 +1,232 @@
+"""에이전트 턴 실행 스케줄러 테스트
+
+리스너가 턴을 스케줄러에 넘기고 바로 반환하는지, 실행 중 세션에 대한
+인터벤션이 제어 레인으로 우선 처리되는지, 동시 턴 50개 부하에서도
+이벤트 처리 지연이 평탄하게 유지되는지 검증합니다.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from seosoyoung.slackbot.handlers.message import schedule_turn
+from seosoyoung.slackbot.scheduler import BUSY_MESSAGE, ExecutionScheduler, dispatch_turn
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+@pytest.fixture
+def scheduler():
+    sched = ExecutionScheduler(turn_workers=2, max_queue=2, control_workers=1)
+    yield sched
+    sched.shutdown(timeout=2)
+
+
+class TestExecutionScheduler:
+    """레인/용량/지표 테스트"""
+
+    def test_no_scheduler_runs_inline(self):
+        fn = MagicMock()
+        dispatch_turn(None, fn, 1, key="t", x=2)
+        fn.assert_called_once_with(1, x=2)
+
+    def test_capacity_queue_and_rejection(self, scheduler):
+        release = threading.Event()
+        rejected = MagicMock()
+
+        for i in range(2):
+            dispatch_turn(scheduler, release.wait, 5, key=f"t{i}", on_rejected=rejected)
+        assert _wait_until(lambda: scheduler.stats()["turn"]["running"] == 2)
+        for i in range(2, 4):
+            dispatch_turn(scheduler, release.wait, 5, key=f"t{i}", on_rejected=rejected)
+        assert scheduler.stats()["turn"]["queued"] == 2
+
+        # 대기열 초과분은 거절
+        dispatch_turn(scheduler, release.wait, 5, key="t4", on_rejected=rejected)
+        rejected.assert_called_once()
+
+        release.set()
+        assert _wait_until(lambda: scheduler.stats()["turn"]["completed"] == 4)
+        stats = scheduler.stats()["turn"]
+        assert stats["capacity"] == 2
+        assert stats["peak_queued"] == 2
+        assert stats["rejected"] == 1
+        assert stats["running"] == 0 and stats["queued"] == 0
+
+    def test_intervention_bypasses_full_turn_lane(self, scheduler):
+        release = threading.Event()
+        for i in range(2):
+            dispatch_turn(scheduler, release.wait, 5, key=f"t{i}")
+        assert _wait_until(lambda: scheduler.is_active("t0") and scheduler.is_active("t1"))
+        for i in range(2, 4):
+            dispatch_turn(scheduler, release.wait, 5, key=f"t{i}")
+
+        # 실행 중인 스레드에 온 메시지는 turn 대기열이 가득 차도 바로 처리
+        handled = threading.Event()
+        rejected = MagicMock()
+        dispatch_turn(scheduler, handled.set, key="t0", on_rejected=rejected)
+        assert handled.wait(1)
+        rejected.assert_not_called()
+        assert scheduler.stats()["control"]["completed"] == 1
+        release.set()
+
+    def test_intervention_after_turn_ended_goes_back_to_turn_lane(self, scheduler):
+        release = threading.Event()
+        dispatch_turn(scheduler, release.wait, 5, key="t0")
+        assert _wait_until(lambda: scheduler.is_active("t0"))
+
+        # 제출 시점엔 실행 중이었지만 제어 워커가 집을 때는 턴이 끝난 경우
+        handled = threading.Event()
+        with patch.object(scheduler, "is_active", side_effect=[True, False]):
+            dispatch_turn(scheduler, handled.set, key="t0")
+            assert handled.wait(1)
+        release.set()
+        assert _wait_until(lambda: scheduler.stats()["turn"]["completed"] == 2)
+        assert scheduler.stats()["control"]["completed"] == 1
+
+    def test_pending_turns_and_finish_callback(self):
+        finished = []
+        sched = ExecutionScheduler(
+            turn_workers=1, max_queue=2, control_workers=1,
+            on_turn_finished=lambda: finished.append(sched.pending_turns()),
+        )
+        release = threading.Event()
+        try:
+            for i in range(2):
+                dispatch_turn(sched, release.wait, 5, key=f"t{i}")
+            assert sched.pending_turns() == 2
+            release.set()
+            assert _wait_until(lambda: len(finished) == 2)
+            assert finished == [1, 0]
+        finally:
+            sched.shutdown(timeout=2)
+
+    def test_shutdown_cancels_pending_turns(self, scheduler):
+        release = threading.Event()
+        ran = []
+        for i in range(4):
+            dispatch_turn(scheduler, lambda i=i: (release.wait(5), ran.append(i)), key=f"t{i}")
+        assert _wait_until(lambda: scheduler.stats()["turn"]["running"] == 2)
+
+        threading.Timer(0.1, release.set).start()
+        scheduler.shutdown(timeout=2, cancel_pending=True)
+        assert sorted(ran) == [0, 1]
+        assert scheduler.pending_turns() == 0
+
+    def test_failed_job_is_counted(self, scheduler):
+        dispatch_turn(scheduler, MagicMock(side_effect=RuntimeError("boom")), key="t")
+        assert _wait_until(lambda: scheduler.stats()["turn"]["failed"] == 1)
+        assert not scheduler.is_active("t")
+
+
+class TestScheduleTurn:
+    """핸들러 진입점 테스트"""
+
+    def test_rejection_notifies_thread(self):
+        sched = MagicMock()
+        sched.is_active.return_value = False
+        sched.submit_turn.return_value = False
+        say = MagicMock()
+
+        schedule_turn({"scheduler": sched}, "1.0", say, MagicMock())
+
+        say.assert_called_once_with(text=BUSY_MESSAGE, thread_ts="1.0")
+
+    def test_thread_message_listener_returns_immediately(self):
+        from seosoyoung.slackbot.handlers.message import register_message_handlers
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_turn(*args, **kwargs):
+            started.set()
+            release.wait(5)
+
+        sched = ExecutionScheduler(turn_workers=1, max_queue=4)
+        deps = {
+            "session_manager": MagicMock(),
+            "restart_manager": MagicMock(is_pending=False),
+            "run_claude_in_session": MagicMock(),
+            "get_user_role": MagicMock(),
+            "scheduler": sched,
+        }
+        handlers = {}
+        app = MagicMock()
+        app.event = lambda name: (lambda fn: handlers.setdefault(name, fn))
+        register_message_handlers(app, deps)
+
+        event = {"user": "U1", "channel": "C1", "ts": "2.0", "thread_ts": "1.0", "text": "hi"}
+        try:
+            with patch("seosoyoung.slackbot.handlers.message.check_auth_session", return_value=False), \
+                    patch("seosoyoung.slackbot.handlers.message.process_thread_message",
+                          side_effect=slow_turn) as ptm:
+                t0 = time.monotonic()
+                handlers["message"](event, MagicMock(), MagicMock())
+                assert time.monotonic() - t0 < 0.5
+                assert started.wait(2)
+                assert sched.is_active("1.0")
+                release.set()
+                assert _wait_until(lambda: not sched.is_active("1.0"))
+            assert ptm.call_args.args[2] == "1.0"
+        finally:
+            release.set()
+            sched.shutdown(timeout=2)
+
+
+class TestLoad:
+    """동시 턴 50개 부하에서 이벤트 처리 지연"""
+
+    N_TURNS = 50
+    TURN_SECONDS = 0.3
+    BOLT_WORKERS = 10
+
+    def _measure(self, scheduler):
+        """Bolt 워커 풀에 긴 턴 50개를 보낸 뒤 짧은 이벤트의 처리 지연(초) 목록 반환"""
+        bolt = ThreadPoolExecutor(max_workers=self.BOLT_WORKERS)
+        deps = {"scheduler": scheduler}
+        latencies = []
+        try:
+            for i in range(self.N_TURNS):
+                bolt.submit(schedule_turn, deps, f"t{i}", MagicMock(), time.sleep, self.TURN_SECONDS)
+            time.sleep(0.05)
+
+            def quick_event(submitted):
+                latencies.append(time.monotonic() - submitted)
+
+            futures = []
+            for _ in range(20):
+                futures.append(bolt.submit(quick_event, time.monotonic()))
+                time.sleep(0.01)
+            for f in futures:
+                f.result(10)
+        finally:
+            bolt.shutdown(wait=True)
+        return sorted(latencies)
+
+    def test_event_latency_stays_flat(self):
+        sched = ExecutionScheduler(turn_workers=50, max_queue=100)
+        try:
+            scheduled = self._measure(sched)
+            assert _wait_until(lambda: sched.stats()["turn"]["completed"] == self.N_TURNS, 10)
+            stats = sched.stats()["turn"]
+        finally:
+            sched.shutdown(timeout=2)
+        inline = self._measure(None)
+
+        p95 = lambda xs: xs[int(len(xs) * 0.95) - 1]
+        print(
+            f"\nevent latency p95: scheduler={p95(scheduled) * 1000:.1f}ms "
+            f"inline={p95(inline) * 1000:.1f}ms, turn stats={stats}"
+        )
+        assert p95(scheduled) < 0.1
+        # 인라인 실행은 Bolt 워커가 모두 턴에 묶여 최소 한 턴 이상 대기
+        assert p95(inline) > self.TURN_SECONDS
+        assert stats["rejected"] == 0
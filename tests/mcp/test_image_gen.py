@@ -22,6 +22,14 @@ _FAKE_PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
 _FAKE_PNG_B64 = base64.b64encode(_FAKE_PNG).decode()
 
 
+@pytest.fixture(autouse=True)
+def _fresh_backend():
+    """모듈 공유 백엔드가 테스트 간에 새지 않도록 초기화"""
+    _image_gen_mod.set_backend(None)
+    yield
+    _image_gen_mod.set_backend(None)
+
+
 def _make_openai_response(b64_json=None):
     """OpenAI images API 응답 mock 생성"""
     mock_image = MagicMock()
@@ -332,10 +340,10 @@ class TestMcpGenerateAndUploadImage:
             path=img_path, mime_type="image/png", prompt="cute dog"
         )
 
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
 
         with patch("seosoyoung.mcp.tools.image_gen.generate_image", new_callable=AsyncMock, return_value=mock_generated):
-            with patch("seosoyoung.mcp.tools.image_gen.WebClient", return_value=mock_client):
+            with patch("seosoyoung.mcp.tools.image_gen._get_async_slack_client", return_value=mock_client):
                 result = await generate_and_upload_image(
                     "cute dog", "C123", "T123"
                 )
@@ -380,11 +388,11 @@ class TestMcpGenerateAndUploadImage:
             path=img_path, mime_type="image/png", prompt="test"
         )
 
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.files_upload_v2.side_effect = Exception("Slack API error")
 
         with patch("seosoyoung.mcp.tools.image_gen.generate_image", new_callable=AsyncMock, return_value=mock_generated):
-            with patch("seosoyoung.mcp.tools.image_gen.WebClient", return_value=mock_client):
+            with patch("seosoyoung.mcp.tools.image_gen._get_async_slack_client", return_value=mock_client):
                 result = await generate_and_upload_image(
                     "test", "C123", "T123"
                 )
@@ -405,10 +413,10 @@ class TestMcpGenerateAndUploadImage:
         )
 
         mock_gen = AsyncMock(return_value=mock_generated)
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
 
         with patch("seosoyoung.mcp.tools.image_gen.generate_image", mock_gen):
-            with patch("seosoyoung.mcp.tools.image_gen.WebClient", return_value=mock_client):
+            with patch("seosoyoung.mcp.tools.image_gen._get_async_slack_client", return_value=mock_client):
                 result = await generate_and_upload_image(
                     "blend style", "C123", "T123",
                     reference_image_paths="/path/to/ref1.png, /path/to/ref2.jpg"
@@ -431,10 +439,10 @@ class TestMcpGenerateAndUploadImage:
         )
 
         mock_gen = AsyncMock(return_value=mock_generated)
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
 
         with patch("seosoyoung.mcp.tools.image_gen.generate_image", mock_gen):
-            with patch("seosoyoung.mcp.tools.image_gen.WebClient", return_value=mock_client):
+            with patch("seosoyoung.mcp.tools.image_gen._get_async_slack_client", return_value=mock_client):
                 result = await generate_and_upload_image(
                     "high res art", "C123", "T123",
                     size="1536x1024",
@@ -459,10 +467,10 @@ class TestMcpGenerateAndUploadImage:
         )
 
         mock_gen = AsyncMock(return_value=mock_generated)
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
 
         with patch("seosoyoung.mcp.tools.image_gen.generate_image", mock_gen):
-            with patch("seosoyoung.mcp.tools.image_gen.WebClient", return_value=mock_client):
+            with patch("seosoyoung.mcp.tools.image_gen._get_async_slack_client", return_value=mock_client):
                 result = await generate_and_upload_image(
                     "default", "C123", "T123",
                     size="",
@@ -499,5 +507,90 @@ class TestMcpGenerateAndUploadImage:
         assert "지원하지 않는 품질" in result["message"]
 
 
+class TestImageBackend:
+    """백엔드 재사용, 청크 디코딩, 동시 생성 제한 테스트"""
+
+    async def test_openai_client_reused_across_calls(self, tmp_path):
+        """AsyncOpenAI 클라이언트는 한 번만 생성"""
+        from seosoyoung.mcp.tools.image_gen import generate_image
+
+        client = MagicMock()
+        client.images.generate = AsyncMock(return_value=_make_openai_response())
+
+        with patch("seosoyoung.mcp.tools.image_gen.AsyncOpenAI", return_value=client) as factory, \
+                patch(_API_KEY_PATH, "test-key"), \
+                patch("seosoyoung.mcp.tools.image_gen.IMAGE_GEN_DIR", tmp_path):
+            await generate_image("one")
+            await generate_image("two")
+
+        assert factory.call_count == 1
+        assert client.images.generate.call_count == 2
+
+    def test_decode_to_file_across_chunks(self, tmp_path):
+        """청크 경계를 넘는 base64도 원본과 동일하게 복원"""
+        payload = bytes(range(256)) * 1000  # 256KB, 여러 청크
+        out = tmp_path / "out.png"
+
+        written = _image_gen_mod._decode_to_file(base64.b64encode(payload).decode(), out)
+
+        assert written == len(payload)
+        assert out.read_bytes() == payload
+
+    async def test_stub_backend_pipeline_offline(self, tmp_path):
+        """stub 백엔드로 생성부터 업로드까지 API 키 없이 동작"""
+        from seosoyoung.mcp.tools.image_gen import StubImageBackend, generate_and_upload_image
+
+        backend = StubImageBackend()
+        _image_gen_mod.set_backend(backend)
+        slack = AsyncMock()
+
+        with patch(_API_KEY_PATH, ""), \
+                patch("seosoyoung.mcp.tools.image_gen.IMAGE_GEN_DIR", tmp_path), \
+                patch("seosoyoung.mcp.tools.image_gen._get_async_slack_client", return_value=slack):
+            result = await generate_and_upload_image("offline", "C1", "T1")
+
+        assert result["success"] is True
+        assert backend.calls == 1
+        slack.files_upload_v2.assert_awaited_once()
+
+    async def test_concurrent_generations_are_limited(self, tmp_path):
+        """동시 생성 수가 IMAGE_GEN_CONCURRENCY를 넘지 않음"""
+        from seosoyoung.mcp.tools.image_gen import StubImageBackend, generate_image
+
+        in_flight = 0
+        peak = 0
+
+        class _CountingBackend(StubImageBackend):
+            async def generate(self, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                try:
+                    return await super().generate(**kwargs)
+                finally:
+                    in_flight -= 1
+
+        _image_gen_mod.set_backend(_CountingBackend(latency=0.02))
+
+        with patch("seosoyoung.mcp.tools.image_gen._CONCURRENCY", 2), \
+                patch("seosoyoung.mcp.tools.image_gen.IMAGE_GEN_DIR", tmp_path):
+            await asyncio.gather(*(generate_image(f"p{i}") for i in range(6)))
+
+        assert peak == 2
+
+
+    async def test_same_millisecond_results_get_distinct_files(self, tmp_path):
+        """같은 밀리초에 끝난 생성 결과가 서로 덮어쓰지 않음"""
+        from seosoyoung.mcp.tools.image_gen import StubImageBackend, generate_image
+
+        _image_gen_mod.set_backend(StubImageBackend())
+
+        with patch("seosoyoung.mcp.tools.image_gen.IMAGE_GEN_DIR", tmp_path), \
+                patch("seosoyoung.mcp.tools.image_gen.time.time", return_value=1700000000.0):
+            results = await asyncio.gather(*(generate_image(f"p{i}") for i in range(3)))
+
+        assert len({r.path for r in results}) == 3
+        assert len(list(tmp_path.glob("*.png"))) == 3
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
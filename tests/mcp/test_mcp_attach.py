@@ -3,7 +3,7 @@
 import os
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -54,17 +54,17 @@ class TestAttachFile:
         tmp.close()
         return tmp.name
 
-    @patch("seosoyoung.mcp.tools.attach._get_slack_client")
-    def test_upload_success(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.attach._get_async_slack_client")
+    async def test_upload_success(self, mock_get_client):
         """정상적인 파일 업로드 성공"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_get_client.return_value = mock_client
 
         tmp_path = self._make_temp_file()
         try:
             from seosoyoung.mcp.tools.attach import attach_file
 
-            result = attach_file(
+            result = await attach_file(
                 file_path=tmp_path,
                 channel="C12345",
                 thread_ts="1234567890.123456",
@@ -74,11 +74,11 @@ class TestAttachFile:
         finally:
             os.unlink(tmp_path)
 
-    def test_file_not_found(self):
+    async def test_file_not_found(self):
         """존재하지 않는 파일"""
         from seosoyoung.mcp.tools.attach import attach_file
 
-        result = attach_file(
+        result = await attach_file(
             file_path="/nonexistent/file.txt",
             channel="C12345",
             thread_ts="1234567890.123456",
@@ -86,7 +86,7 @@ class TestAttachFile:
         assert result["success"] is False
         assert "존재하지 않" in result["message"]
 
-    def test_file_outside_workspace(self):
+    async def test_file_outside_workspace(self):
         """workspace 외부 파일은 거부"""
         with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp:
             tmp.write(b"test")
@@ -95,7 +95,7 @@ class TestAttachFile:
         try:
             from seosoyoung.mcp.tools.attach import attach_file
 
-            result = attach_file(
+            result = await attach_file(
                 file_path=tmp_path,
                 channel="C12345",
                 thread_ts="1234567890.123456",
@@ -105,13 +105,13 @@ class TestAttachFile:
         finally:
             os.unlink(tmp_path)
 
-    def test_file_too_large(self):
+    async def test_file_too_large(self):
         """20MB 초과 파일 거부"""
         tmp_path = self._make_temp_file(content=b"x" * (20 * 1024 * 1024 + 1))
         try:
             from seosoyoung.mcp.tools.attach import attach_file
 
-            result = attach_file(
+            result = await attach_file(
                 file_path=tmp_path,
                 channel="C12345",
                 thread_ts="1234567890.123456",
@@ -121,10 +121,10 @@ class TestAttachFile:
         finally:
             os.unlink(tmp_path)
 
-    @patch("seosoyoung.mcp.tools.attach._get_slack_client")
-    def test_slack_api_error(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.attach._get_async_slack_client")
+    async def test_slack_api_error(self, mock_get_client):
         """Slack API 에러 처리"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.files_upload_v2.side_effect = Exception("Slack API error")
         mock_get_client.return_value = mock_client
 
@@ -132,7 +132,7 @@ class TestAttachFile:
         try:
             from seosoyoung.mcp.tools.attach import attach_file
 
-            result = attach_file(
+            result = await attach_file(
                 file_path=tmp_path,
                 channel="C12345",
                 thread_ts="1234567890.123456",
@@ -13,7 +13,7 @@ import os
 import sys
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -43,6 +43,18 @@ class TestMCPServerStandalone:
         assert "slack_get_user_profile" in tool_names
         assert len(tool_names) == 6
 
+    async def test_lifespan_closes_shared_slack_session(self):
+        """서버 종료 시 도구들이 공유한 Slack 세션이 닫힘"""
+        from seosoyoung.mcp import slack_client
+        from seosoyoung.mcp.server import _lifespan, mcp
+
+        async with _lifespan(mcp):
+            slack_client.get_async_client()
+            session = slack_client._loop_clients[asyncio.get_running_loop()].session
+
+        assert session.closed
+        assert asyncio.get_running_loop() not in slack_client._loop_clients
+
     def test_get_context_reads_env(self):
         """slack_get_context가 환경변수에서 값을 읽음"""
         with patch.dict(os.environ, {
@@ -72,17 +84,17 @@ class TestMCPE2EMentionFlow:
         tmp.close()
         return tmp.name
 
-    @patch("seosoyoung.mcp.tools.attach._get_slack_client")
-    def test_full_attach_flow(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.attach._get_async_slack_client")
+    async def test_full_attach_flow(self, mock_get_client):
         """전체 파일 첨부 플로우: 파일 생성 → MCP 도구 호출 → 슬랙 업로드"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_get_client.return_value = mock_client
 
         tmp_path = self._make_workspace_file(suffix=".md", content=b"# Test Report")
         try:
             from seosoyoung.mcp.tools.attach import attach_file
 
-            result = attach_file(
+            result = await attach_file(
                 file_path=tmp_path,
                 channel="C_E2E_CHANNEL",
                 thread_ts="1111111111.000001",
@@ -99,10 +111,10 @@ class TestMCPE2EMentionFlow:
         finally:
             os.unlink(tmp_path)
 
-    @patch("seosoyoung.mcp.tools.attach._get_slack_client")
-    def test_attach_yaml_file(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.attach._get_async_slack_client")
+    async def test_attach_yaml_file(self, mock_get_client):
         """YAML 파일 첨부 (대사 데이터 내보내기 시나리오)"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_get_client.return_value = mock_client
 
         tmp_path = self._make_workspace_file(
@@ -112,7 +124,7 @@ class TestMCPE2EMentionFlow:
         try:
             from seosoyoung.mcp.tools.attach import attach_file
 
-            result = attach_file(
+            result = await attach_file(
                 file_path=tmp_path,
                 channel="C_E2E_CHANNEL",
                 thread_ts="1111111111.000002",
@@ -123,10 +135,10 @@ class TestMCPE2EMentionFlow:
         finally:
             os.unlink(tmp_path)
 
-    @patch("seosoyoung.mcp.tools.attach._get_slack_client")
-    def test_attach_xlsx_file(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.attach._get_async_slack_client")
+    async def test_attach_xlsx_file(self, mock_get_client):
         """Excel 파일 첨부 (대사 엑셀 내보내기 시나리오)"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_get_client.return_value = mock_client
 
         tmp_path = self._make_workspace_file(
@@ -135,7 +147,7 @@ class TestMCPE2EMentionFlow:
         try:
             from seosoyoung.mcp.tools.attach import attach_file
 
-            result = attach_file(
+            result = await attach_file(
                 file_path=tmp_path,
                 channel="C_E2E_CHANNEL",
                 thread_ts="1111111111.000003",
@@ -161,17 +173,17 @@ class TestMCPE2ETrelloFlow:
         tmp.close()
         return tmp.name
 
-    @patch("seosoyoung.mcp.tools.attach._get_slack_client")
-    def test_attach_in_trello_thread(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.attach._get_async_slack_client")
+    async def test_attach_in_trello_thread(self, mock_get_client):
         """트렐로 스레드에서 파일 첨부"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_get_client.return_value = mock_client
 
         tmp_path = self._make_workspace_file(suffix=".json", content=b'{"result": "ok"}')
         try:
             from seosoyoung.mcp.tools.attach import attach_file
 
-            result = attach_file(
+            result = await attach_file(
                 file_path=tmp_path,
                 channel="C_TRELLO_NOTIFY",
                 thread_ts="2222222222.000001",
@@ -209,11 +221,11 @@ class TestMCPE2EErrorCases:
         tmp.close()
         return tmp.name
 
-    def test_file_not_found_returns_error(self):
+    async def test_file_not_found_returns_error(self):
         """존재하지 않는 파일 → success=False"""
         from seosoyoung.mcp.tools.attach import attach_file
 
-        result = attach_file(
+        result = await attach_file(
             file_path="/absolutely/nonexistent/file.txt",
             channel="C12345",
             thread_ts="1234567890.123456",
@@ -221,7 +233,7 @@ class TestMCPE2EErrorCases:
         assert result["success"] is False
         assert "존재하지 않" in result["message"]
 
-    def test_workspace_outside_file_rejected(self):
+    async def test_workspace_outside_file_rejected(self):
         """workspace 외부 파일 → success=False"""
         with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp:
             tmp.write(b"outside workspace")
@@ -230,7 +242,7 @@ class TestMCPE2EErrorCases:
         try:
             from seosoyoung.mcp.tools.attach import attach_file
 
-            result = attach_file(
+            result = await attach_file(
                 file_path=outside_path,
                 channel="C12345",
                 thread_ts="1234567890.123456",
@@ -240,7 +252,7 @@ class TestMCPE2EErrorCases:
         finally:
             os.unlink(outside_path)
 
-    def test_file_size_exceeded_rejected(self):
+    async def test_file_size_exceeded_rejected(self):
         """20MB 초과 파일 → success=False"""
         tmp_path = self._make_workspace_file(
             content=b"x" * (20 * 1024 * 1024 + 1)
@@ -248,7 +260,7 @@ class TestMCPE2EErrorCases:
         try:
             from seosoyoung.mcp.tools.attach import attach_file
 
-            result = attach_file(
+            result = await attach_file(
                 file_path=tmp_path,
                 channel="C12345",
                 thread_ts="1234567890.123456",
@@ -258,10 +270,10 @@ class TestMCPE2EErrorCases:
         finally:
             os.unlink(tmp_path)
 
-    @patch("seosoyoung.mcp.tools.attach._get_slack_client")
-    def test_slack_api_failure_handled(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.attach._get_async_slack_client")
+    async def test_slack_api_failure_handled(self, mock_get_client):
         """Slack API 에러 → success=False, 에러 메시지 포함"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.files_upload_v2.side_effect = Exception("channel_not_found")
         mock_get_client.return_value = mock_client
 
@@ -269,7 +281,7 @@ class TestMCPE2EErrorCases:
         try:
             from seosoyoung.mcp.tools.attach import attach_file
 
-            result = attach_file(
+            result = await attach_file(
                 file_path=tmp_path,
                 channel="C_INVALID",
                 thread_ts="1234567890.123456",
@@ -279,14 +291,14 @@ class TestMCPE2EErrorCases:
         finally:
             os.unlink(tmp_path)
 
-    def test_directory_path_rejected(self):
+    async def test_directory_path_rejected(self):
         """디렉토리 경로를 지정하면 거부"""
         dir_path = Path(self.WORKSPACE_ROOT) / ".local" / "tmp"
         dir_path.mkdir(parents=True, exist_ok=True)
 
         from seosoyoung.mcp.tools.attach import attach_file
 
-        result = attach_file(
+        result = await attach_file(
             file_path=str(dir_path),
             channel="C12345",
             thread_ts="1234567890.123456",
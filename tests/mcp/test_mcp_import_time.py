@@ -0,0 +1,83 @@
+"""MCP 서버 콜드 스타트 import 예산 테스트
+
+`python -X importtime`으로 seosoyoung.mcp.server를 새 프로세스에서 import하고,
+무거운 구현 의존성이 기동 경로에 들어오지 않았는지와 전체 import 시간이
+예산 안인지 확인합니다.
+
+직접 실행하면 누적 시간 상위 모듈을 출력합니다:
+    python tests/mcp/test_mcp_import_time.py
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# 도구 첫 호출 때까지 import되면 안 되는 모듈
+LAZY_MODULES = ("openai", "slack_sdk", "aiohttp", "seosoyoung.mcp.tools")
+
+# 전체 import 예산 (ms). CI 머신 편차를 고려해 넉넉히 잡고 환경변수로 조정
+BUDGET_MS = float(os.environ.get("MCP_IMPORT_BUDGET_MS", "3000"))
+
+
+def measure_import(module: str = "seosoyoung.mcp.server") -> dict[str, int]:
+    """새 인터프리터에서 module을 import하고 {모듈명: 누적 μs}를 반환"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "import failed")
+
+    timings: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def _cogito_available() -> bool:
+    try:
+        import cogito  # noqa: F401
+        return hasattr(cogito, "Reflector")
+    except ImportError:
+        return False
+
+
+@pytest.mark.skipif(not _cogito_available(), reason="cogito Reflector 미설치")
+class TestMcpColdStart:
+    """MCP 서버 import 예산"""
+
+    @pytest.fixture(scope="class")
+    def timings(self):
+        return measure_import()
+
+    def test_heavy_modules_deferred(self, timings):
+        loaded = [
+            name for name in timings
+            if any(name == m or name.startswith(m + ".") for m in LAZY_MODULES)
+        ]
+        assert loaded == [], f"기동 시 import된 지연 대상 모듈: {loaded[:10]}"
+
+    def test_total_import_within_budget(self, timings):
+        total_ms = timings["seosoyoung.mcp.server"] / 1000
+        assert total_ms < BUDGET_MS, f"MCP 서버 import {total_ms:.0f}ms > 예산 {BUDGET_MS:.0f}ms"
+
+
+if __name__ == "__main__":
+    result = measure_import()
+    top = sorted(result.items(), key=lambda kv: kv[1], reverse=True)[:25]
+    for name, us in top:
+        print(f"{us / 1000:9.1f} ms  {name}")
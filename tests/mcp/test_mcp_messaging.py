@@ -3,7 +3,7 @@
 import os
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -11,15 +11,15 @@ import pytest
 class TestPostMessageTextOnly:
     """텍스트만 전송하는 post_message 테스트"""
 
-    @patch("seosoyoung.mcp.tools.slack_messaging._get_slack_client")
-    def test_send_text_message(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.slack_messaging._get_async_slack_client")
+    async def test_send_text_message(self, mock_get_client):
         """텍스트 메시지 전송 성공"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_get_client.return_value = mock_client
 
         from seosoyoung.mcp.tools.slack_messaging import post_message
 
-        result = post_message(
+        result = await post_message(
             channel="C12345",
             text="안녕하세요!",
         )
@@ -29,15 +29,15 @@ class TestPostMessageTextOnly:
             text="안녕하세요!",
         )
 
-    @patch("seosoyoung.mcp.tools.slack_messaging._get_slack_client")
-    def test_send_text_with_thread(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.slack_messaging._get_async_slack_client")
+    async def test_send_text_with_thread(self, mock_get_client):
         """스레드에 텍스트 메시지 전송"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_get_client.return_value = mock_client
 
         from seosoyoung.mcp.tools.slack_messaging import post_message
 
-        result = post_message(
+        result = await post_message(
             channel="C12345",
             text="스레드 답글",
             thread_ts="1234567890.123456",
@@ -49,16 +49,16 @@ class TestPostMessageTextOnly:
             thread_ts="1234567890.123456",
         )
 
-    @patch("seosoyoung.mcp.tools.slack_messaging._get_slack_client")
-    def test_slack_api_error(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.slack_messaging._get_async_slack_client")
+    async def test_slack_api_error(self, mock_get_client):
         """Slack API 에러 처리"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.chat_postMessage.side_effect = Exception("channel_not_found")
         mock_get_client.return_value = mock_client
 
         from seosoyoung.mcp.tools.slack_messaging import post_message
 
-        result = post_message(
+        result = await post_message(
             channel="C_INVALID",
             text="테스트",
         )
@@ -82,17 +82,18 @@ class TestPostMessageWithFiles:
         tmp.close()
         return tmp.name
 
-    @patch("seosoyoung.mcp.tools.slack_messaging._get_slack_client")
-    def test_text_with_single_file(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.slack_messaging._get_async_slack_client")
+    @patch("seosoyoung.mcp.slack_client._stream_upload", new_callable=AsyncMock)
+    async def test_text_with_single_file(self, mock_stream, mock_get_client):
         """텍스트 + 파일 1개 전송"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_get_client.return_value = mock_client
 
         tmp_path = self._make_temp_file()
         try:
             from seosoyoung.mcp.tools.slack_messaging import post_message
 
-            result = post_message(
+            result = await post_message(
                 channel="C12345",
                 text="파일 첨부합니다",
                 file_paths=tmp_path,
@@ -100,15 +101,18 @@ class TestPostMessageWithFiles:
             assert result["success"] is True
             # chat_postMessage 호출 확인
             mock_client.chat_postMessage.assert_called_once()
-            # files_upload_v2 호출 확인
-            mock_client.files_upload_v2.assert_called_once()
+            # 업로드 URL 발급 → 전송 → 완료 호출 확인
+            mock_client.files_getUploadURLExternal.assert_called_once()
+            mock_stream.assert_called_once()
+            mock_client.files_completeUploadExternal.assert_called_once()
         finally:
             os.unlink(tmp_path)
 
-    @patch("seosoyoung.mcp.tools.slack_messaging._get_slack_client")
-    def test_text_with_multiple_files(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.slack_messaging._get_async_slack_client")
+    @patch("seosoyoung.mcp.slack_client._stream_upload", new_callable=AsyncMock)
+    async def test_text_with_multiple_files(self, mock_stream, mock_get_client):
         """텍스트 + 파일 여러 개 전송"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_get_client.return_value = mock_client
 
         tmp1 = self._make_temp_file(suffix=".txt", content=b"file1")
@@ -116,22 +120,26 @@ class TestPostMessageWithFiles:
         try:
             from seosoyoung.mcp.tools.slack_messaging import post_message
 
-            result = post_message(
+            result = await post_message(
                 channel="C12345",
                 text="파일 2개",
                 file_paths=f"{tmp1},{tmp2}",
             )
             assert result["success"] is True
             mock_client.chat_postMessage.assert_called_once()
-            assert mock_client.files_upload_v2.call_count == 2
+            assert mock_client.files_getUploadURLExternal.call_count == 2
+            assert mock_stream.call_count == 2
+            # 완료 호출은 파일 수와 무관하게 한 번
+            mock_client.files_completeUploadExternal.assert_called_once()
         finally:
             os.unlink(tmp1)
             os.unlink(tmp2)
 
-    @patch("seosoyoung.mcp.tools.slack_messaging._get_slack_client")
-    def test_text_with_thread_and_file(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.slack_messaging._get_async_slack_client")
+    @patch("seosoyoung.mcp.slack_client._stream_upload", new_callable=AsyncMock)
+    async def test_text_with_thread_and_file(self, mock_stream, mock_get_client):
         """스레드에 텍스트 + 파일 전송"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.chat_postMessage.return_value = {"ts": "9999.0001"}
         mock_get_client.return_value = mock_client
 
@@ -139,7 +147,7 @@ class TestPostMessageWithFiles:
         try:
             from seosoyoung.mcp.tools.slack_messaging import post_message
 
-            result = post_message(
+            result = await post_message(
                 channel="C12345",
                 text="스레드에 파일",
                 thread_ts="1234567890.123456",
@@ -152,11 +160,11 @@ class TestPostMessageWithFiles:
         finally:
             os.unlink(tmp_path)
 
-    def test_file_not_found(self):
+    async def test_file_not_found(self):
         """존재하지 않는 파일 경로"""
         from seosoyoung.mcp.tools.slack_messaging import post_message
 
-        result = post_message(
+        result = await post_message(
             channel="C12345",
             text="파일 첨부",
             file_paths="/nonexistent/file.txt",
@@ -164,7 +172,7 @@ class TestPostMessageWithFiles:
         assert result["success"] is False
         assert "존재하지 않" in result["message"]
 
-    def test_file_outside_workspace(self):
+    async def test_file_outside_workspace(self):
         """workspace 외부 파일 거부"""
         with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp:
             tmp.write(b"outside")
@@ -173,7 +181,7 @@ class TestPostMessageWithFiles:
         try:
             from seosoyoung.mcp.tools.slack_messaging import post_message
 
-            result = post_message(
+            result = await post_message(
                 channel="C12345",
                 text="외부 파일",
                 file_paths=tmp_path,
@@ -183,13 +191,13 @@ class TestPostMessageWithFiles:
         finally:
             os.unlink(tmp_path)
 
-    def test_file_too_large(self):
+    async def test_file_too_large(self):
         """20MB 초과 파일 거부"""
         tmp_path = self._make_temp_file(content=b"x" * (20 * 1024 * 1024 + 1))
         try:
             from seosoyoung.mcp.tools.slack_messaging import post_message
 
-            result = post_message(
+            result = await post_message(
                 channel="C12345",
                 text="큰 파일",
                 file_paths=tmp_path,
@@ -199,18 +207,18 @@ class TestPostMessageWithFiles:
         finally:
             os.unlink(tmp_path)
 
-    @patch("seosoyoung.mcp.tools.slack_messaging._get_slack_client")
-    def test_file_upload_error_reported(self, mock_get_client):
+    @patch("seosoyoung.mcp.tools.slack_messaging._get_async_slack_client")
+    async def test_file_upload_error_reported(self, mock_get_client):
         """파일 업로드 실패 시 에러 보고"""
-        mock_client = MagicMock()
-        mock_client.files_upload_v2.side_effect = Exception("upload_failed")
+        mock_client = AsyncMock()
+        mock_client.files_getUploadURLExternal.side_effect = Exception("upload_failed")
         mock_get_client.return_value = mock_client
 
         tmp_path = self._make_temp_file()
         try:
             from seosoyoung.mcp.tools.slack_messaging import post_message
 
-            result = post_message(
+            result = await post_message(
                 channel="C12345",
                 text="파일 첨부 실패 테스트",
                 file_paths=tmp_path,
@@ -0,0 +1,169 @@
+"""MCP 공유 Slack 클라이언트 테스트"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from seosoyoung.mcp import slack_client
+from seosoyoung.mcp.tools.slack_messaging import post_message
+
+
+class _SlowAsyncClient:
+    """지연이 있는 가짜 AsyncWebClient (동시 호출 수를 기록)"""
+
+    def __init__(self, latency: float = 0.1):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def _call(self) -> dict:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        return {"ok": True, "ts": f"1234.{self.calls:06d}"}
+
+    async def chat_postMessage(self, **kwargs):
+        return await self._call()
+
+    async def users_info(self, **kwargs):
+        return await self._call()
+
+
+class _FakeUploadClient:
+    """files.getUploadURLExternal / completeUploadExternal 가짜 구현"""
+
+    def __init__(self, latency: float = 0.05, fail: set[str] = frozenset()):
+        self.latency = latency
+        self.fail = fail
+        self.completions: list[dict] = []
+
+    async def files_getUploadURLExternal(self, *, filename, length):
+        await asyncio.sleep(self.latency)
+        if filename in self.fail:
+            raise RuntimeError("invalid_file")
+        return {"upload_url": f"https://upload/{filename}", "file_id": f"F_{filename}"}
+
+    async def files_completeUploadExternal(self, **kwargs):
+        self.completions.append(kwargs)
+        return {"ok": True}
+
+
+async def _fake_stream(client, url, path):
+    await asyncio.sleep(client.latency)
+
+
+class TestSharedClients:
+    """클라이언트 재사용 테스트"""
+
+    async def test_async_client_reused_within_loop(self):
+        try:
+            first = slack_client.get_async_client()
+            assert slack_client.get_async_client() is first
+        finally:
+            await slack_client.close_async_client()
+
+    def test_unknown_method_uses_default_tier(self):
+        assert slack_client.tier_of("reactions.add") == slack_client.DEFAULT_TIER
+        assert slack_client.tier_of("users.info") == 4
+
+
+class TestConcurrency:
+    """비동기 도구의 병렬 호출 테스트"""
+
+    async def test_parallel_post_messages_overlap(self):
+        """N개의 동시 호출이 순차 합계가 아니라 단일 지연 수준에 끝남"""
+        fake = _SlowAsyncClient(latency=0.1)
+        n = 8
+
+        with patch(
+            "seosoyoung.mcp.tools.slack_messaging._get_async_slack_client",
+            return_value=fake,
+        ):
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(post_message("C123", f"msg {i}") for i in range(n))
+            )
+            elapsed = time.perf_counter() - start
+
+        assert all(r["success"] for r in results)
+        assert fake.max_in_flight == n
+        assert elapsed < 0.3
+
+    @pytest.mark.parametrize("method", ["chat.update", "users.info"])
+    async def test_tier_semaphore_caps_in_flight(self, method):
+        fake = _SlowAsyncClient(latency=0.02)
+        cap = slack_client.TIER_CONCURRENCY[slack_client.tier_of(method)]
+
+        async def call():
+            async with slack_client.limit(method):
+                await fake._call()
+
+        await asyncio.gather(*(call() for _ in range(cap * 3)))
+
+        assert fake.max_in_flight == cap
+
+
+class TestUploadFiles:
+    """병렬 업로드 + 단일 완료 호출 테스트"""
+
+    def _files(self, tmp_path, n):
+        paths = []
+        for i in range(n):
+            p = tmp_path / f"f{i}.txt"
+            p.write_bytes(b"x" * 10)
+            paths.append(p)
+        return paths
+
+    async def test_uploads_in_parallel_with_single_completion(self, tmp_path):
+        client = _FakeUploadClient(latency=0.05)
+        paths = self._files(tmp_path, 6)
+
+        with patch("seosoyoung.mcp.slack_client._stream_upload", _fake_stream):
+            start = time.perf_counter()
+            results = await slack_client.upload_files(client, paths, "C1", "111.222")
+            elapsed = time.perf_counter() - start
+
+        assert [r.path for r in results] == paths
+        assert all(r.ok and r.elapsed_ms > 0 for r in results)
+        # 순차라면 6 * (0.05 + 0.05) = 0.6초
+        assert elapsed < 0.3
+        assert len(client.completions) == 1
+        completion = client.completions[0]
+        assert [f["id"] for f in completion["files"]] == [f"F_f{i}.txt" for i in range(6)]
+        assert completion["channel_id"] == "C1"
+        assert completion["thread_ts"] == "111.222"
+
+    async def test_failed_file_excluded_from_completion(self, tmp_path):
+        client = _FakeUploadClient(latency=0.0, fail={"f1.txt"})
+        paths = self._files(tmp_path, 3)
+
+        with patch("seosoyoung.mcp.slack_client._stream_upload", _fake_stream):
+            results = await slack_client.upload_files(client, paths, "C1")
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert "invalid_file" in results[1].error
+        assert [f["id"] for f in client.completions[0]["files"]] == ["F_f0.txt", "F_f2.txt"]
+        assert "thread_ts" not in client.completions[0]
+
+    async def test_post_message_reports_file_timings(self, tmp_path):
+        client = _FakeUploadClient(latency=0.0)
+        client.chat_postMessage = _SlowAsyncClient(latency=0.0).chat_postMessage
+        paths = self._files(tmp_path, 2)
+
+        with patch("seosoyoung.mcp.tools.slack_messaging.WORKSPACE_ROOT", str(tmp_path)), \
+                patch("seosoyoung.mcp.tools.slack_messaging._get_async_slack_client", return_value=client), \
+                patch("seosoyoung.mcp.slack_client._stream_upload", _fake_stream):
+            result = await post_message(
+                "C1", "files", file_paths=",".join(str(p) for p in paths)
+            )
+
+        assert result["success"] is True
+        assert result["uploaded_files"] == ["f0.txt", "f1.txt"]
+        assert set(result["file_timings_ms"]) == {"f0.txt", "f1.txt"}
@@ -1,5 +1,6 @@
 """MCP slack_download_thread_files 도구 단위 테스트"""
 
+import asyncio
 import os
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -9,6 +10,28 @@ import pytest
 from seosoyoung.mcp.tools.thread_files import download_thread_files
 
 
+def _stream_http(content: bytes, chunk_size: int = 4):
+    """http.stream()을 흉내 내는 httpx.AsyncClient 모킹 (청크 단위로 응답)"""
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+
+    async def aiter_bytes():
+        for i in range(0, len(content), chunk_size):
+            yield content[i:i + chunk_size]
+
+    response.aiter_bytes = aiter_bytes
+
+    stream_cm = MagicMock()
+    stream_cm.__aenter__ = AsyncMock(return_value=response)
+    stream_cm.__aexit__ = AsyncMock(return_value=False)
+
+    mock_http = MagicMock()
+    mock_http.stream = MagicMock(return_value=stream_cm)
+    mock_http.__aenter__ = AsyncMock(return_value=mock_http)
+    mock_http.__aexit__ = AsyncMock(return_value=False)
+    return mock_http
+
+
 class TestDownloadThreadFiles:
     """download_thread_files 함수 테스트"""
 
@@ -20,7 +43,7 @@ class TestDownloadThreadFiles:
         file_content = b"Hello, World!"
 
         # Slack conversations.replies 모킹
-        mock_slack = MagicMock()
+        mock_slack = AsyncMock()
         mock_slack.conversations_replies.return_value = {
             "ok": True,
             "messages": [
@@ -46,17 +69,10 @@ class TestDownloadThreadFiles:
         }
 
         # httpx 다운로드 모킹
-        mock_response = MagicMock()
-        mock_response.content = file_content
-        mock_response.raise_for_status = MagicMock()
+        mock_http = _stream_http(file_content)
 
-        mock_http = AsyncMock()
-        mock_http.get = AsyncMock(return_value=mock_response)
-        mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-        mock_http.__aexit__ = AsyncMock()
-
-        with patch("seosoyoung.mcp.tools.thread_files._get_slack_client", return_value=mock_slack), \
-             patch("seosoyoung.slackbot.slack.file_handler.httpx.AsyncClient", return_value=mock_http):
+        with patch("seosoyoung.mcp.tools.thread_files._get_async_slack_client", return_value=mock_slack), \
+             patch("seosoyoung.mcp.tools.thread_files.httpx.AsyncClient", return_value=mock_http):
             result = await download_thread_files("C12345", "1234567890.000000")
 
         assert result["success"] is True
@@ -67,7 +83,7 @@ class TestDownloadThreadFiles:
     @pytest.mark.asyncio
     async def test_no_files_in_thread(self):
         """파일이 없는 스레드"""
-        mock_slack = MagicMock()
+        mock_slack = AsyncMock()
         mock_slack.conversations_replies.return_value = {
             "ok": True,
             "messages": [
@@ -76,7 +92,7 @@ class TestDownloadThreadFiles:
             ],
         }
 
-        with patch("seosoyoung.mcp.tools.thread_files._get_slack_client", return_value=mock_slack):
+        with patch("seosoyoung.mcp.tools.thread_files._get_async_slack_client", return_value=mock_slack):
             result = await download_thread_files("C12345", "1234567890.000000")
 
         assert result["success"] is True
@@ -88,7 +104,7 @@ class TestDownloadThreadFiles:
         """여러 메시지에 걸친 다수의 파일"""
         monkeypatch.setattr("seosoyoung.slackbot.slack.file_handler.TMP_DIR", tmp_path / "slack_files")
 
-        mock_slack = MagicMock()
+        mock_slack = AsyncMock()
         mock_slack.conversations_replies.return_value = {
             "ok": True,
             "messages": [
@@ -131,17 +147,10 @@ class TestDownloadThreadFiles:
             ],
         }
 
-        mock_response = MagicMock()
-        mock_response.content = b"content"
-        mock_response.raise_for_status = MagicMock()
-
-        mock_http = AsyncMock()
-        mock_http.get = AsyncMock(return_value=mock_response)
-        mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-        mock_http.__aexit__ = AsyncMock()
+        mock_http = _stream_http(b"content")
 
-        with patch("seosoyoung.mcp.tools.thread_files._get_slack_client", return_value=mock_slack), \
-             patch("seosoyoung.slackbot.slack.file_handler.httpx.AsyncClient", return_value=mock_http):
+        with patch("seosoyoung.mcp.tools.thread_files._get_async_slack_client", return_value=mock_slack), \
+             patch("seosoyoung.mcp.tools.thread_files.httpx.AsyncClient", return_value=mock_http):
             result = await download_thread_files("C12345", "1234567890.000000")
 
         assert result["success"] is True
@@ -157,10 +166,10 @@ class TestDownloadThreadFiles:
     @pytest.mark.asyncio
     async def test_slack_api_error(self):
         """Slack API 호출 실패"""
-        mock_slack = MagicMock()
+        mock_slack = AsyncMock()
         mock_slack.conversations_replies.side_effect = Exception("channel_not_found")
 
-        with patch("seosoyoung.mcp.tools.thread_files._get_slack_client", return_value=mock_slack):
+        with patch("seosoyoung.mcp.tools.thread_files._get_async_slack_client", return_value=mock_slack):
             result = await download_thread_files("C_INVALID", "1234567890.000000")
 
         assert result["success"] is False
@@ -171,7 +180,7 @@ class TestDownloadThreadFiles:
         """일부 파일 다운로드 실패 시 성공한 파일만 반환"""
         monkeypatch.setattr("seosoyoung.slackbot.slack.file_handler.TMP_DIR", tmp_path / "slack_files")
 
-        mock_slack = MagicMock()
+        mock_slack = AsyncMock()
         mock_slack.conversations_replies.return_value = {
             "ok": True,
             "messages": [
@@ -200,17 +209,10 @@ class TestDownloadThreadFiles:
             ],
         }
 
-        mock_response = MagicMock()
-        mock_response.content = b"good content"
-        mock_response.raise_for_status = MagicMock()
-
-        mock_http = AsyncMock()
-        mock_http.get = AsyncMock(return_value=mock_response)
-        mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-        mock_http.__aexit__ = AsyncMock()
+        mock_http = _stream_http(b"good content")
 
-        with patch("seosoyoung.mcp.tools.thread_files._get_slack_client", return_value=mock_slack), \
-             patch("seosoyoung.slackbot.slack.file_handler.httpx.AsyncClient", return_value=mock_http):
+        with patch("seosoyoung.mcp.tools.thread_files._get_async_slack_client", return_value=mock_slack), \
+             patch("seosoyoung.mcp.tools.thread_files.httpx.AsyncClient", return_value=mock_http):
             result = await download_thread_files("C12345", "1234567890.000000")
 
         assert result["success"] is True
@@ -218,6 +220,185 @@ class TestDownloadThreadFiles:
         assert result["files"][0]["original_name"] == "good.txt"
 
 
+def _file(file_id: str, size: int = 8) -> dict:
+    return {
+        "id": file_id,
+        "name": f"{file_id}.txt",
+        "mimetype": "text/plain",
+        "filetype": "txt",
+        "size": size,
+        "url_private": f"https://files.slack.com/{file_id}.txt",
+    }
+
+
+class TestThreadFileHarvest:
+    """페이지네이션, 캐시, 크기 제한, 동시성 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def _tmp_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("seosoyoung.slackbot.slack.file_handler.TMP_DIR", tmp_path / "slack_files")
+
+    async def test_follows_reply_cursor(self):
+        """next_cursor가 있으면 다음 페이지까지 조회"""
+        mock_slack = AsyncMock()
+        mock_slack.conversations_replies.side_effect = [
+            {
+                "messages": [{"ts": "1.1", "files": [_file("F001")]}],
+                "response_metadata": {"next_cursor": "page2"},
+            },
+            {
+                "messages": [{"ts": "1.2", "files": [_file("F002")]}],
+                "response_metadata": {"next_cursor": ""},
+            },
+        ]
+
+        with patch("seosoyoung.mcp.tools.thread_files._get_async_slack_client", return_value=mock_slack), \
+             patch("seosoyoung.mcp.tools.thread_files.httpx.AsyncClient", return_value=_stream_http(b"12345678")):
+            result = await download_thread_files("C1", "1.0")
+
+        assert [f["original_name"] for f in result["files"]] == ["F001.txt", "F002.txt"]
+        second_call = mock_slack.conversations_replies.call_args_list[1]
+        assert second_call.kwargs["cursor"] == "page2"
+
+    async def test_skips_unchanged_file(self):
+        """같은 file_id/크기의 파일이 이미 있으면 다시 받지 않음"""
+        mock_slack = AsyncMock()
+        mock_slack.conversations_replies.return_value = {
+            "messages": [{"ts": "1.1", "files": [_file("F001")]}],
+        }
+        mock_http = _stream_http(b"12345678")
+
+        with patch("seosoyoung.mcp.tools.thread_files._get_async_slack_client", return_value=mock_slack), \
+             patch("seosoyoung.mcp.tools.thread_files.httpx.AsyncClient", return_value=mock_http):
+            first = await download_thread_files("C1", "1.0")
+            second = await download_thread_files("C1", "1.0")
+
+        assert first["files"][0]["cached"] is False
+        assert second["files"][0]["cached"] is True
+        assert mock_http.stream.call_count == 1
+
+    async def test_size_guard_reports_failure(self, monkeypatch):
+        """크기 초과 파일은 failures로 보고하고 나머지는 계속 진행"""
+        monkeypatch.setattr("seosoyoung.mcp.tools.thread_files.MAX_DOWNLOAD_SIZE", 100)
+        mock_slack = AsyncMock()
+        mock_slack.conversations_replies.return_value = {
+            "messages": [{"ts": "1.1", "files": [_file("F001"), _file("BIG", size=1000)]}],
+        }
+
+        with patch("seosoyoung.mcp.tools.thread_files._get_async_slack_client", return_value=mock_slack), \
+             patch("seosoyoung.mcp.tools.thread_files.httpx.AsyncClient", return_value=_stream_http(b"12345678")):
+            result = await download_thread_files("C1", "1.0")
+
+        assert result["success"] is True
+        assert [f["original_name"] for f in result["files"]] == ["F001.txt"]
+        assert result["failures"][0]["original_name"] == "BIG.txt"
+        assert "크기 초과" in result["failures"][0]["error"]
+
+    async def test_streamed_body_over_limit_is_discarded(self, monkeypatch, tmp_path):
+        """메타데이터보다 큰 본문이 오면 수신 중 중단하고 부분 파일을 남기지 않음"""
+        monkeypatch.setattr("seosoyoung.mcp.tools.thread_files.MAX_DOWNLOAD_SIZE", 10)
+        mock_slack = AsyncMock()
+        mock_slack.conversations_replies.return_value = {
+            "messages": [{"ts": "1.1", "files": [_file("F001", size=8)]}],
+        }
+
+        with patch("seosoyoung.mcp.tools.thread_files._get_async_slack_client", return_value=mock_slack), \
+             patch("seosoyoung.mcp.tools.thread_files.httpx.AsyncClient", return_value=_stream_http(b"x" * 64)):
+            result = await download_thread_files("C1", "1.0")
+
+        assert result["files"] == []
+        assert len(result["failures"]) == 1
+        assert not list((tmp_path / "slack_files").rglob("*.part"))
+
+    async def test_concurrent_fetch_of_same_file_does_not_collide(self, monkeypatch, tmp_path):
+        """같은 파일을 동시에 받아도 임시 파일이 겹치지 않고 온전한 파일이 남음"""
+        from seosoyoung.slackbot.slack.file_handler import fetch_file
+
+        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+        content = b"0123456789abcdef"
+
+        def slow_http():
+            mock_http = _stream_http(content, chunk_size=2)
+            response = mock_http.stream.return_value.__aenter__.return_value
+
+            async def aiter_bytes():
+                for i in range(0, len(content), 2):
+                    await asyncio.sleep(0.005)
+                    yield content[i:i + 2]
+
+            response.aiter_bytes = aiter_bytes
+            return mock_http
+
+        file_info = _file("F001", size=len(content))
+        results = await asyncio.gather(
+            fetch_file(file_info, "1.0", slow_http()),
+            fetch_file(file_info, "1.0", slow_http()),
+        )
+
+        paths = {r[0]["local_path"] for r in results}
+        assert len(paths) == 1
+        assert Path(paths.pop()).read_bytes() == content
+        assert not list((tmp_path / "slack_files").rglob("*.part"))
+
+    async def test_downloads_are_bounded(self, monkeypatch):
+        """동시 다운로드 수가 DOWNLOAD_CONCURRENCY를 넘지 않음"""
+        monkeypatch.setattr("seosoyoung.mcp.tools.thread_files.DOWNLOAD_CONCURRENCY", 3)
+        mock_slack = AsyncMock()
+        mock_slack.conversations_replies.return_value = {
+            "messages": [{"ts": "1.1", "files": [_file(f"F{i:03d}") for i in range(10)]}],
+        }
+        in_flight = 0
+        peak = 0
+
+        async def slow_fetch(file_info, thread_ts, http, max_size=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {
+                "local_path": "/tmp/x",
+                "original_name": file_info["name"],
+                "size": file_info["size"],
+                "file_type": "text",
+                "content": None,
+            }, False
+
+        with patch("seosoyoung.mcp.tools.thread_files._get_async_slack_client", return_value=mock_slack), \
+             patch("seosoyoung.mcp.tools.thread_files.fetch_file", slow_fetch):
+            result = await download_thread_files("C1", "1.0")
+
+        assert len(result["files"]) == 10
+        assert peak == 3
+
+    async def test_unexpected_error_keeps_other_files(self):
+        """한 파일의 예상 밖 예외가 나머지 다운로드 결과를 버리지 않음"""
+        mock_slack = AsyncMock()
+        mock_slack.conversations_replies.return_value = {
+            "messages": [{"ts": "1.1", "files": [_file("F001"), _file("F002")]}],
+        }
+
+        async def flaky_fetch(file_info, thread_ts, http, max_size=None):
+            if file_info["id"] == "F002":
+                raise OSError("disk full")
+            return {
+                "local_path": "/tmp/x",
+                "original_name": file_info["name"],
+                "size": file_info["size"],
+                "file_type": "text",
+                "content": None,
+            }, False
+
+        with patch("seosoyoung.mcp.tools.thread_files._get_async_slack_client", return_value=mock_slack), \
+             patch("seosoyoung.mcp.tools.thread_files.fetch_file", flaky_fetch):
+            result = await download_thread_files("C1", "1.0")
+
+        assert result["success"] is True
+        assert len(result["files"]) == 1
+        assert len(result["failures"]) == 1
+        assert "disk full" in result["failures"][0]["error"]
+
+
 class TestMCPToolRegistration:
     """MCP 도구 등록 확인 테스트"""
 
@@ -1,5 +1,6 @@
 """MCP user_profile 도구 단위 테스트"""
 
+import os
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -15,9 +16,9 @@ from seosoyoung.mcp.tools.user_profile import (
 class TestGetUserProfile:
     """get_user_profile 함수 테스트"""
 
-    def test_success(self):
+    async def test_success(self):
         """정상적인 프로필 조회"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.users_info.return_value = {
             "ok": True,
             "user": {
@@ -37,10 +38,10 @@ class TestGetUserProfile:
         }
 
         with patch(
-            "seosoyoung.mcp.tools.user_profile._get_slack_client",
+            "seosoyoung.mcp.tools.user_profile._get_async_slack_client",
             return_value=mock_client,
         ):
-            result = get_user_profile("U08HWT0C6K1")
+            result = await get_user_profile("U08HWT0C6K1")
 
         assert result["success"] is True
         profile = result["profile"]
@@ -54,45 +55,45 @@ class TestGetUserProfile:
         assert "image_192" in profile["image_urls"]
         assert "image_512" in profile["image_urls"]
 
-    def test_invalid_user_id_empty(self):
+    async def test_invalid_user_id_empty(self):
         """빈 user_id"""
-        result = get_user_profile("")
+        result = await get_user_profile("")
         assert result["success"] is False
         assert "유효하지 않은" in result["message"]
 
-    def test_invalid_user_id_wrong_prefix(self):
+    async def test_invalid_user_id_wrong_prefix(self):
         """잘못된 형식의 user_id"""
-        result = get_user_profile("C12345")
+        result = await get_user_profile("C12345")
         assert result["success"] is False
         assert "유효하지 않은" in result["message"]
 
-    def test_slack_api_error(self):
+    async def test_slack_api_error(self):
         """Slack API 호출 실패"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.users_info.side_effect = Exception("user_not_found")
 
         with patch(
-            "seosoyoung.mcp.tools.user_profile._get_slack_client",
+            "seosoyoung.mcp.tools.user_profile._get_async_slack_client",
             return_value=mock_client,
         ):
-            result = get_user_profile("U08HWT0C6K1")
+            result = await get_user_profile("U08HWT0C6K1")
 
         assert result["success"] is False
         assert "user_not_found" in result["message"]
 
-    def test_empty_profile_fields(self):
+    async def test_empty_profile_fields(self):
         """프로필 필드가 비어 있는 경우"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.users_info.return_value = {
             "ok": True,
             "user": {"id": "U08HWT0C6K1", "profile": {}},
         }
 
         with patch(
-            "seosoyoung.mcp.tools.user_profile._get_slack_client",
+            "seosoyoung.mcp.tools.user_profile._get_async_slack_client",
             return_value=mock_client,
         ):
-            result = get_user_profile("U08HWT0C6K1")
+            result = await get_user_profile("U08HWT0C6K1")
 
         assert result["success"] is True
         assert result["profile"]["display_name"] == ""
@@ -109,7 +110,7 @@ class TestDownloadUserAvatar:
             "seosoyoung.mcp.tools.user_profile.AVATAR_DIR", tmp_path / "avatars"
         )
 
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.users_info.return_value = {
             "ok": True,
             "user": {
@@ -123,6 +124,8 @@ class TestDownloadUserAvatar:
         mock_response = MagicMock()
         mock_response.content = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
         mock_response.raise_for_status = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
 
         mock_http = AsyncMock()
         mock_http.get = AsyncMock(return_value=mock_response)
@@ -130,7 +133,7 @@ class TestDownloadUserAvatar:
         mock_http.__aexit__ = AsyncMock()
 
         with patch(
-            "seosoyoung.mcp.tools.user_profile._get_slack_client",
+            "seosoyoung.mcp.tools.user_profile._get_async_slack_client",
             return_value=mock_client,
         ), patch("seosoyoung.mcp.tools.user_profile.httpx.AsyncClient", return_value=mock_http):
             result = await download_user_avatar("U08HWT0C6K1")
@@ -148,7 +151,7 @@ class TestDownloadUserAvatar:
             "seosoyoung.mcp.tools.user_profile.AVATAR_DIR", tmp_path / "avatars"
         )
 
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.users_info.return_value = {
             "ok": True,
             "user": {
@@ -162,6 +165,8 @@ class TestDownloadUserAvatar:
         mock_response = MagicMock()
         mock_response.content = b"\xff\xd8\xff\xe0" + b"\x00" * 50
         mock_response.raise_for_status = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
 
         mock_http = AsyncMock()
         mock_http.get = AsyncMock(return_value=mock_response)
@@ -169,7 +174,7 @@ class TestDownloadUserAvatar:
         mock_http.__aexit__ = AsyncMock()
 
         with patch(
-            "seosoyoung.mcp.tools.user_profile._get_slack_client",
+            "seosoyoung.mcp.tools.user_profile._get_async_slack_client",
             return_value=mock_client,
         ), patch("seosoyoung.mcp.tools.user_profile.httpx.AsyncClient", return_value=mock_http):
             result = await download_user_avatar("U08HWT0C6K1", size=72)
@@ -189,7 +194,7 @@ class TestDownloadUserAvatar:
     @pytest.mark.asyncio
     async def test_image_url_not_available(self):
         """요청한 크기의 이미지 URL이 없는 경우"""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.users_info.return_value = {
             "ok": True,
             "user": {
@@ -201,7 +206,7 @@ class TestDownloadUserAvatar:
         }
 
         with patch(
-            "seosoyoung.mcp.tools.user_profile._get_slack_client",
+            "seosoyoung.mcp.tools.user_profile._get_async_slack_client",
             return_value=mock_client,
         ):
             result = await download_user_avatar("U08HWT0C6K1", size=1024)
@@ -216,7 +221,7 @@ class TestDownloadUserAvatar:
             "seosoyoung.mcp.tools.user_profile.AVATAR_DIR", tmp_path / "avatars"
         )
 
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.users_info.return_value = {
             "ok": True,
             "user": {
@@ -231,7 +236,7 @@ class TestDownloadUserAvatar:
         mock_http.get = AsyncMock(side_effect=Exception("Connection refused"))
 
         with patch(
-            "seosoyoung.mcp.tools.user_profile._get_slack_client",
+            "seosoyoung.mcp.tools.user_profile._get_async_slack_client",
             return_value=mock_client,
         ), patch("seosoyoung.mcp.tools.user_profile.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -249,6 +254,101 @@ class TestDownloadUserAvatar:
         assert "유효하지 않은" in result["message"]
 
 
+def _users_info(url_512: str) -> dict:
+    return {"ok": True, "user": {"id": "U1", "profile": {"image_512": url_512}}}
+
+
+def _http(status_code: int = 200, content: bytes = b"img", headers: dict | None = None):
+    mock_response = MagicMock()
+    mock_response.content = content
+    mock_response.status_code = status_code
+    mock_response.headers = headers or {}
+    mock_response.raise_for_status = MagicMock()
+
+    mock_http = AsyncMock()
+    mock_http.get = AsyncMock(return_value=mock_response)
+    mock_http.__aenter__ = AsyncMock(return_value=mock_http)
+    mock_http.__aexit__ = AsyncMock()
+    return mock_http
+
+
+class TestAvatarCache:
+    """아바타/프로필 캐시 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def _avatar_dir(self, tmp_path, monkeypatch):
+        self.avatar_dir = tmp_path / "avatars"
+        monkeypatch.setattr("seosoyoung.mcp.tools.user_profile.AVATAR_DIR", self.avatar_dir)
+
+    async def _download(self, slack, http, user_id="U1"):
+        with patch("seosoyoung.mcp.tools.user_profile._get_async_slack_client", return_value=slack), \
+             patch("seosoyoung.mcp.tools.user_profile.httpx.AsyncClient", return_value=http):
+            return await download_user_avatar(user_id)
+
+    async def test_repeat_request_is_local_read(self):
+        """두 번째 요청은 users.info도 HTTP도 호출하지 않음"""
+        slack = AsyncMock()
+        slack.users_info.return_value = _users_info("https://avatars.slack.com/abc_512.png")
+        http = _http()
+
+        first = await self._download(slack, http)
+        second = await self._download(slack, http)
+
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert second["file_path"] == first["file_path"]
+        assert slack.users_info.await_count == 1
+        assert http.get.await_count == 1
+        assert (self.avatar_dir / "U1.profile.json").exists()
+
+    async def test_changed_url_triggers_download(self, monkeypatch):
+        """스냅샷 만료 후 이미지 URL이 바뀌면 새로 받음"""
+        monkeypatch.setattr("seosoyoung.mcp.tools.user_profile.AVATAR_PROFILE_TTL", 0)
+        slack = AsyncMock()
+        slack.users_info.return_value = _users_info("https://avatars.slack.com/abc_512.png")
+        await self._download(slack, _http(content=b"old"))
+
+        slack.users_info.return_value = _users_info("https://avatars.slack.com/def_512.png")
+        result = await self._download(slack, _http(content=b"new"))
+
+        assert result["cached"] is False
+        assert Path(result["file_path"]).read_bytes() == b"new"
+
+    async def test_revalidates_with_etag(self, monkeypatch):
+        """재검증 주기가 지나면 ETag로 조건부 요청, 304면 로컬 파일 유지"""
+        monkeypatch.setattr("seosoyoung.mcp.tools.user_profile.AVATAR_REVALIDATE_AFTER", 0)
+        slack = AsyncMock()
+        slack.users_info.return_value = _users_info("https://avatars.slack.com/abc_512.png")
+        await self._download(slack, _http(content=b"img", headers={"etag": '"v1"'}))
+
+        not_modified = _http(status_code=304)
+        result = await self._download(slack, not_modified)
+
+        assert result["cached"] is True
+        assert Path(result["file_path"]).read_bytes() == b"img"
+        sent = not_modified.get.call_args.kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+
+    async def test_evicts_least_recently_used(self, monkeypatch):
+        """이미지 수가 상한을 넘으면 가장 오래 쓰지 않은 것부터 삭제"""
+        monkeypatch.setattr("seosoyoung.mcp.tools.user_profile.AVATAR_CACHE_MAX_FILES", 2)
+        slack = AsyncMock()
+
+        for i, user_id in enumerate(["U1", "U2", "U3"]):
+            slack.users_info.return_value = _users_info(f"https://avatars.slack.com/{i}_512.png")
+            await self._download(slack, _http(), user_id=user_id)
+            # mtime 해상도에 의존하지 않도록 사용 시각을 명시적으로 벌림
+            path = self.avatar_dir / f"{user_id}_512.png"
+            os.utime(path, (1000 + i, 1000 + i))
+
+        slack.users_info.return_value = _users_info("https://avatars.slack.com/3_512.png")
+        await self._download(slack, _http(), user_id="U4")
+
+        remaining = sorted(p.name for p in self.avatar_dir.glob("*.png"))
+        assert remaining == ["U3_512.png", "U4_512.png"]
+        assert not (self.avatar_dir / "U1_512.meta.json").exists()
+
+
 class TestMCPToolRegistration:
     """MCP 도구 등록 확인 테스트"""
 
@@ -862,3 +862,52 @@ class TestKeepModeMultiTurnIsolation:
         assert any("beta" in c[1]["text"] for c in u2)
         assert not any("beta" in c[1]["text"] for c in u1)
         assert not any("alpha" in c[1]["text"] for c in u2)
+
+
+class TestReplayedEventIdempotency:
+    """재연결로 이미 처리한 이벤트 id가 다시 와도 슬랙 메시지가 중복되지 않는다"""
+
+    @pytest.mark.asyncio
+    async def test_replayed_events_are_skipped(self):
+        client = MagicMock()
+        client.chat_postMessage.side_effect = [{"ts": "ts_text"}, {"ts": "ts_tool"}]
+        cbs, pctx, _, _ = _make_event_cbs(mode="keep", client=client)
+
+        async def play(events):
+            for name, *args in events:
+                await cbs[name](*args)
+
+        first = [
+            ("on_text_start", 1),
+            ("on_text_delta", "hel", 2),
+            ("on_text_delta", "lo", 3),
+        ]
+        rest = [
+            ("on_text_end", 4),
+            ("on_tool_start", "Read", {}, "tu1", 5),
+            ("on_tool_result", "ok", "tu1", False, 6),
+        ]
+        await play(first)
+        # 커서 없이 처음부터 재생된 경우
+        await play(first + rest)
+
+        assert pctx.last_event_id == 6
+        assert client.chat_postMessage.call_count == 2
+        text_updates = [
+            c[1]["text"] for c in client.chat_update.call_args_list if c[1]["ts"] == "ts_text"
+        ]
+        assert "hello" in text_updates[-1]
+        assert not any("hellohel" in t for t in text_updates)
+
+    @pytest.mark.asyncio
+    async def test_initial_cursor_skips_already_rendered(self):
+        """pctx.last_event_id 이하의 이벤트는 렌더링하지 않는다"""
+        cbs, pctx, _, client = _make_event_cbs(mode="keep")
+        pctx.last_event_id = 10
+
+        await cbs["on_thinking"]("old", 9)
+        client.chat_postMessage.assert_not_called()
+
+        client.chat_postMessage.return_value = {"ts": "ts_new"}
+        await cbs["on_thinking"]("new", 11)
+        client.chat_postMessage.assert_called_once()
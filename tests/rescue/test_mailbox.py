@@ -0,0 +1,200 @@
+"""rescue-bot 스레드 메일박스 / 전역 실행 슬롯 테스트"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from seosoyoung.rescue.claude.engine_types import EngineResult
+from seosoyoung.rescue.run_slots import RunSlots
+
+
+class TestRunSlots:
+    """전역 동시 실행 상한 테스트"""
+
+    def test_caps_concurrency_and_reports_positions(self):
+        slots = RunSlots(2)
+        in_flight = []
+        max_in_flight = [0]
+        positions: dict[int, list[int]] = {}
+        order = []
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def worker(i):
+            def on_position(pos):
+                positions.setdefault(i, []).append(pos)
+
+            with slots.slot(on_position):
+                with lock:
+                    order.append(i)
+                    in_flight.append(i)
+                    max_in_flight[0] = max(max_in_flight[0], len(in_flight))
+                release.wait(5)
+                time.sleep(0.01)
+                with lock:
+                    in_flight.remove(i)
+
+        threads = []
+        for i in range(5):
+            t = threading.Thread(target=worker, args=(i,))
+            t.start()
+            threads.append(t)
+            # 도착 순서 고정
+            deadline = time.monotonic() + 2
+            while slots.active + slots.waiting < i + 1 and time.monotonic() < deadline:
+                time.sleep(0.005)
+
+        assert slots.active == 2 and slots.waiting == 3
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert max_in_flight[0] == 2
+        assert order == [0, 1, 2, 3, 4]
+        assert 0 not in positions and 1 not in positions
+        assert positions[4][0] == 3 and positions[4][-1] == 1
+        assert slots.active == 0 and slots.waiting == 0
+
+
+class TestThreadMailbox:
+    """실행 중 도착한 메시지 합치기 테스트"""
+
+    @pytest.fixture
+    def app(self):
+        from seosoyoung.rescue.main import RescueBotApp
+
+        bot_app = RescueBotApp()
+        bot_app.bot_user_id = "U_RESCUE"
+        bot_app.sessions.get_or_create("thread_1", "C1")
+        bot_app.sessions.update_session_id("thread_1", "sess-1")
+        return bot_app
+
+    def _event(self, text, ts):
+        return {"channel": "C1", "user": "U1", "text": text, "ts": ts, "thread_ts": "thread_1"}
+
+    def test_queued_messages_cost_one_extra_turn(self, app):
+        started = threading.Event()
+        release = threading.Event()
+        prompts = []
+
+        def run_sync(coro):
+            coro.close()
+            prompts.append(runner.run.call_args.kwargs["prompt"])
+            if len(prompts) == 1:
+                started.set()
+                release.wait(5)
+            return EngineResult(success=True, output="답변", session_id="sess-1")
+
+        runner = MagicMock()
+        runner.run_sync.side_effect = run_sync
+        say = MagicMock()
+        client = MagicMock()
+        posted = iter(f"9000.{i}" for i in range(100))
+        client.chat_postMessage.side_effect = lambda **kw: {"ts": next(posted)}
+
+        with patch("seosoyoung.rescue.main.create_runner", return_value=runner), \
+                patch("seosoyoung.rescue.main.interrupt") as interrupt:
+            first = threading.Thread(
+                target=app.handle_message, args=(self._event("첫 질문", "1.0"), say, client)
+            )
+            first.start()
+            assert started.wait(5)
+
+            # 실행 중 도착한 메시지 3건: 리스너는 바로 반환
+            for i in range(3):
+                app.handle_message(self._event(f"추가 {i}", f"2.{i}"), say, client)
+
+            release.set()
+            first.join(5)
+
+        assert runner.run_sync.call_count == 2
+        merged = prompts[1]
+        assert "메시지 3건" in merged
+        assert all(f"추가 {i}" in merged for i in range(3))
+        interrupt.assert_called_once_with("thread_1")
+
+        # 대기 안내 메시지는 한 번 게시되고 이후 건수만 갱신, 후속 턴 진행 메시지로 재사용
+        status_posts = [
+            c for c in client.chat_postMessage.call_args_list if "대기 메시지" in c.kwargs["text"]
+        ]
+        assert len(status_posts) == 1
+        status_ts = "9000.1"
+        updates = [c.kwargs for c in client.chat_update.call_args_list if c.kwargs["ts"] == status_ts]
+        assert [u["text"] for u in updates[:2]] == [
+            "> 📥 현재 작업이 끝나면 이어서 답변합니다 (대기 메시지 2건)",
+            "> 📥 현재 작업이 끝나면 이어서 답변합니다 (대기 메시지 3건)",
+        ]
+        assert any("생각합니다" in u["text"] for u in updates)
+
+    def _post_blocking(self, client, ts, on_post):
+        """chat_postMessage 도중 on_post를 실행한 뒤 ts를 돌려주도록 설정"""
+        def post(**kw):
+            on_post()
+            return {"ts": ts}
+        client.chat_postMessage.side_effect = post
+
+    def test_messages_arriving_during_post_refresh_count(self, app):
+        client = MagicMock()
+
+        def arrive_more():
+            for i in range(2):
+                app._handle_intervention("thread_1", f"추가 {i}", f"2.{i}", "C1", None, client)
+
+        self._post_blocking(client, "9000.1", arrive_more)
+        with patch("seosoyoung.rescue.main.interrupt"):
+            app._handle_intervention("thread_1", "첫 메시지", "1.0", "C1", None, client)
+
+        assert app._pending_prompts["thread_1"].status_ts == "9000.1"
+        assert client.chat_postMessage.call_count == 1
+        assert client.chat_update.call_args.kwargs["ts"] == "9000.1"
+        assert "대기 메시지 3건" in client.chat_update.call_args.kwargs["text"]
+
+    def test_mailbox_taken_during_post_deletes_status(self, app):
+        client = MagicMock()
+        self._post_blocking(client, "9000.1", lambda: app._pop_pending("thread_1"))
+
+        with patch("seosoyoung.rescue.main.interrupt"):
+            app._handle_intervention("thread_1", "첫 메시지", "1.0", "C1", None, client)
+
+        assert "thread_1" not in app._pending_prompts
+        client.chat_delete.assert_called_once_with(channel="C1", ts="9000.1")
+
+    def test_single_queued_message_is_passed_through(self, app):
+        from seosoyoung.rescue.main import PendingPrompt, ThreadMailbox
+
+        mailbox = ThreadMailbox(status_ts="1.1")
+        mailbox.prompts.append(PendingPrompt("hello", "", "C1", None, None))
+        merged = mailbox.merge()
+        assert merged.prompt == "hello"
+        assert merged.status_ts == "1.1"
+
+    def test_global_cap_shows_queue_position(self, app):
+        from seosoyoung.rescue.run_slots import RunSlots
+
+        app._run_slots = RunSlots(1)
+        app._run_slots.acquire()
+        client = MagicMock()
+        client.chat_postMessage.return_value = {"ts": "7.7"}
+        runner = MagicMock()
+        runner.run_sync.return_value = EngineResult(success=True, output="ok", session_id="sess-1")
+
+        with patch("seosoyoung.rescue.main.create_runner", return_value=runner):
+            t = threading.Thread(
+                target=app.handle_message, args=(self._event("질문", "3.0"), MagicMock(), client)
+            )
+            t.start()
+            deadline = time.monotonic() + 2
+            while not client.chat_postMessage.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert "1번째" in client.chat_postMessage.call_args.kwargs["text"]
+            assert runner.run_sync.call_count == 0
+
+            app._run_slots.release()
+            t.join(5)
+
+        assert runner.run_sync.call_count == 1
+        # 대기 메시지를 진행 메시지로 재사용 (새 게시 없음)
+        assert client.chat_postMessage.call_count == 1
+        assert client.chat_update.call_args_list[0].kwargs["ts"] == "7.7"
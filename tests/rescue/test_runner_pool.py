@@ -0,0 +1,324 @@
+"""rescue 웜 러너 풀 테스트
+
+가짜 CLI 서브프로세스(기동 지연 후 ready를 출력하고 입력마다 이벤트 한 줄을
+돌려주는 파이썬 프로세스)로 풀의 체크아웃/반납, 헬스 체크, 유휴 정리,
+종료를 검증하고 첫 이벤트까지의 시간을 콜드/웜으로 비교합니다.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import psutil
+import pytest
+
+from seosoyoung.rescue.claude.agent_runner import ClaudeRunner, shutdown_all_sync
+from seosoyoung.rescue.claude.diagnostics import StderrSink, read_stderr_tail, stderr_log_path
+from seosoyoung.rescue.claude.runner_pool import (
+    Lease,
+    RunnerPool,
+    key_for,
+    pid_alive,
+    register_pool,
+)
+
+# CLI 기동 + SDK 핸드셰이크를 흉내 내는 지연
+SPAWN_DELAY = 0.3
+
+_FAKE_CLI = f"""
+import sys, time
+time.sleep({SPAWN_DELAY})
+print("ready", flush=True)
+for line in sys.stdin:
+    print("event:" + line.strip(), flush=True)
+"""
+
+
+class FakeCLIClient:
+    """ClaudeSDKClient 대역: 실제 서브프로세스를 띄우고 stdin/stdout으로 통신"""
+
+    def __init__(self):
+        self.proc: asyncio.subprocess.Process | None = None
+
+    @property
+    def pid(self):
+        return self.proc.pid if self.proc else None
+
+    async def connect(self):
+        self.proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", _FAKE_CLI,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        assert (await self.proc.stdout.readline()).strip() == b"ready"
+
+    async def query(self, prompt: str):
+        self.proc.stdin.write(prompt.encode() + b"\n")
+        await self.proc.stdin.drain()
+
+    async def first_event(self) -> str:
+        return (await self.proc.stdout.readline()).decode().strip()
+
+    async def disconnect(self):
+        if self.proc and self.proc.returncode is None:
+            self.proc.stdin.close()
+            await self.proc.wait()
+
+
+async def fake_connect(key) -> Lease:
+    client = FakeCLIClient()
+    await client.connect()
+    return Lease(client=client, pid=client.pid)
+
+
+KEY = key_for(Path("."), None, ["WebFetch"])
+OTHER_KEY = key_for(Path("."), ["Read"], ["WebFetch"])
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def pool():
+    p = RunnerPool(fake_connect, warm_size=1, max_idle=4, idle_timeout=600)
+    yield p
+    p.shutdown_sync()
+
+
+class TestCheckoutCheckin:
+    """체크아웃/반납 테스트"""
+
+    def test_prewarm_fills_fresh_clients(self, pool):
+        pool.start(KEY)
+        assert _wait_for(lambda: pool.stats()["fresh"] == 1)
+
+    def test_fresh_checkout_is_replenished(self, pool):
+        pool.start(KEY)
+        assert _wait_for(lambda: pool.stats()["fresh"] == 1)
+
+        lease = pool.run_sync(pool.checkout(KEY))
+        assert lease is not None and pid_alive(lease)
+        assert _wait_for(lambda: pool.stats()["fresh"] == 1)
+        assert pool.stats()["hits"] == 1
+
+        pool.run_sync(pool.checkin(KEY, lease, healthy=False))
+
+    def test_session_bound_reuse(self, pool):
+        lease = pool.run_sync(fake_connect(KEY))
+        lease.session_id = "sess-1"
+        pool.run_sync(pool.checkin(KEY, lease))
+
+        # 다른 세션이나 다른 키로는 꺼낼 수 없음
+        assert pool.run_sync(pool.checkout(OTHER_KEY, "sess-1")) is None
+        assert pool.run_sync(pool.checkout(KEY, "sess-2")) is None
+
+        again = pool.run_sync(pool.checkout(KEY, "sess-1"))
+        assert again is lease
+        assert pool.stats()["bound"] == 0
+        pool.run_sync(pool.checkin(KEY, again, healthy=False))
+
+    def test_unhealthy_or_sessionless_checkin_discards(self, pool):
+        for session_id, healthy in [(None, True), ("sess-1", False)]:
+            lease = pool.run_sync(fake_connect(KEY))
+            lease.session_id = session_id
+            pool.run_sync(pool.checkin(KEY, lease, healthy=healthy))
+            assert _wait_for(lambda: not pid_alive(lease))
+        assert pool.stats()["bound"] == 0
+
+    def test_probe_failure_evicts_on_checkout(self):
+        pool = RunnerPool(fake_connect, warm_size=0, probe=lambda lease: False)
+        try:
+            lease = pool.run_sync(fake_connect(KEY))
+            lease.session_id = "sess-1"
+            pool._bound[(KEY, "sess-1")] = lease
+            assert pool.run_sync(pool.checkout(KEY, "sess-1")) is None
+            assert _wait_for(lambda: not pid_alive(lease))
+        finally:
+            pool.shutdown_sync()
+
+    def test_dead_process_fails_default_probe(self, pool):
+        lease = pool.run_sync(fake_connect(KEY))
+        psutil.Process(lease.pid).kill()
+        assert _wait_for(lambda: not pid_alive(lease))
+        pool.run_sync(lease.client.disconnect())
+
+
+class TestEviction:
+    """유휴 정리/상한 테스트"""
+
+    def test_idle_timeout_evicts(self):
+        pool = RunnerPool(fake_connect, warm_size=0, idle_timeout=0.05)
+        try:
+            lease = pool.run_sync(fake_connect(KEY))
+            lease.session_id = "sess-1"
+            pool.run_sync(pool.checkin(KEY, lease))
+            time.sleep(0.1)
+            assert pool.run_sync(pool.evict_idle()) == 1
+            assert pool.stats()["bound"] == 0
+            assert _wait_for(lambda: not pid_alive(lease))
+        finally:
+            pool.shutdown_sync()
+
+    def test_max_idle_evicts_least_recently_used(self):
+        pool = RunnerPool(fake_connect, warm_size=0, max_idle=2)
+        try:
+            leases = []
+            for i in range(3):
+                lease = pool.run_sync(fake_connect(KEY))
+                lease.session_id = f"sess-{i}"
+                pool.run_sync(pool.checkin(KEY, lease))
+                leases.append(lease)
+            assert pool.stats()["bound"] == 2
+            assert _wait_for(lambda: not pid_alive(leases[0]))
+            assert pool.run_sync(pool.checkout(KEY, "sess-2")) is leases[2]
+            pool.run_sync(pool.checkin(KEY, leases[2], healthy=False))
+        finally:
+            pool.shutdown_sync()
+
+    def test_drop_session(self, pool):
+        lease = pool.run_sync(fake_connect(KEY))
+        lease.session_id = "sess-1"
+        pool.run_sync(pool.checkin(KEY, lease))
+        assert pool.drop_sync(KEY, "sess-1") is True
+        assert pool.drop_sync(KEY, "sess-1") is False
+
+
+class TestShutdown:
+    """종료 안전성 테스트"""
+
+    def test_shutdown_all_sync_closes_registered_pools(self):
+        pool = RunnerPool(fake_connect, warm_size=2)
+        register_pool(pool)
+        pool.start(KEY)
+        assert _wait_for(lambda: pool.stats()["fresh"] == 2)
+        pids = [lease.pid for lease in pool._fresh[KEY]]
+
+        assert shutdown_all_sync() == 2
+        assert all(not psutil.pid_exists(pid) or
+                   psutil.Process(pid).status() == psutil.STATUS_ZOMBIE for pid in pids)
+        # 두 번째 호출은 아무것도 하지 않음
+        assert pool.shutdown_sync() == 0
+
+    def test_checkout_after_shutdown_returns_none(self):
+        pool = RunnerPool(fake_connect, warm_size=0)
+        pool.shutdown_sync()
+        # 루프는 다시 시작되지만 닫힌 풀은 클라이언트를 내주지 않음
+        assert pool.run_sync(pool.checkout(KEY)) is None
+        pool._loop.stop()
+
+
+class TestClaudeRunnerWithPool:
+    """ClaudeRunner의 풀 연동 테스트"""
+
+    def test_runner_checks_out_and_binds_session(self, pool):
+        runner = ClaudeRunner("1234.5678", working_dir=Path("."), pool=pool)
+
+        async def fake_receive(client, compact_state, msg_state, *args):
+            msg_state.session_id = "sess-abc"
+            msg_state.result_text = await client.first_event()
+
+        pool.start(runner.pool_key)
+        assert _wait_for(lambda: pool.stats()["fresh"] == 1)
+
+        with patch.object(runner, "_receive_messages", side_effect=fake_receive):
+            result = runner.run_sync(runner._execute("hello"))
+            assert result.success and result.output == "event:hello"
+            assert runner.client is None
+            assert pool.stats()["bound"] == 1
+
+            # 같은 세션의 다음 실행은 묶인 클라이언트를 그대로 사용
+            bound = pool._bound[(runner.pool_key, "sess-abc")]
+            result = runner.run_sync(runner._execute("again", "sess-abc"))
+            assert result.output == "event:again"
+            assert pool._bound[(runner.pool_key, "sess-abc")] is bound
+
+    def test_checkout_moves_stderr_to_thread_log(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SEOSOYOUNG_RUNTIME", str(tmp_path))
+        (tmp_path / "logs").mkdir()
+
+        async def connect_with_sink(key) -> Lease:
+            lease = await fake_connect(key)
+            lease.stderr_file = StderrSink()  # 웜 클라이언트는 thread_ts 없이 연결
+            return lease
+
+        pool = RunnerPool(connect_with_sink, warm_size=1, max_idle=4, idle_timeout=600)
+        runner = ClaudeRunner("1234.5678", working_dir=Path("."), pool=pool)
+
+        async def fake_receive(client, compact_state, msg_state, *args):
+            msg_state.session_id = "sess-abc"
+            msg_state.result_text = await client.first_event()
+
+        try:
+            pool.start(runner.pool_key)
+            assert _wait_for(lambda: pool.stats()["fresh"] == 1)
+            sink = pool._fresh[runner.pool_key][0].stderr_file
+            assert sink.path == stderr_log_path(None)
+
+            with patch.object(runner, "_receive_messages", side_effect=fake_receive):
+                runner.run_sync(runner._execute("hello"))
+
+            assert sink.path == stderr_log_path("1234.5678")
+            sink.write("boom from cli\n")
+            sink.flush()
+            assert read_stderr_tail(5, thread_ts="1234.5678").endswith("boom from cli")
+        finally:
+            pool.shutdown_sync()
+
+
+class TestTimeToFirstEvent:
+    """첫 이벤트까지의 시간: 매번 기동(콜드) vs 풀(웜)"""
+
+    ROUNDS = 3
+
+    async def _ttfe(self, get_client) -> float:
+        start = time.perf_counter()
+        client = await get_client()
+        await client.query("ping")
+        assert await client.first_event() == "event:ping"
+        return time.perf_counter() - start
+
+    def test_warm_pool_beats_cold_spawn(self, pool):
+        async def cold():
+            return (await fake_connect(KEY)).client
+
+        cold_times = []
+        for _ in range(self.ROUNDS):
+            client_box = []
+
+            async def measure():
+                async def get():
+                    client_box.append(await cold())
+                    return client_box[-1]
+                elapsed = await self._ttfe(get)
+                await client_box[-1].disconnect()
+                return elapsed
+            cold_times.append(pool.run_sync(measure()))
+
+        pool.start(KEY)
+        warm_times = []
+        for _ in range(self.ROUNDS):
+            assert _wait_for(lambda: pool.stats()["fresh"] == 1)
+            lease_box = []
+
+            async def measure():
+                async def get():
+                    lease_box.append(await pool.checkout(KEY))
+                    return lease_box[-1].client
+                elapsed = await self._ttfe(get)
+                await pool.checkin(KEY, lease_box[-1], healthy=False)
+                return elapsed
+            warm_times.append(pool.run_sync(measure()))
+
+        cold_ms = sorted(cold_times)[self.ROUNDS // 2] * 1000
+        warm_ms = sorted(warm_times)[self.ROUNDS // 2] * 1000
+        print(f"\ntime-to-first-event median: cold={cold_ms:.0f}ms warm={warm_ms:.0f}ms")
+        assert cold_ms >= SPAWN_DELAY * 1000
+        assert warm_ms < cold_ms / 3
@@ -0,0 +1,113 @@
+"""rescue 세션 파일 인덱스 테스트"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from seosoyoung.rescue.claude import session_validator
+from seosoyoung.rescue.claude.session_validator import SessionIndex
+
+SID = "0a1b2c3d-0000-4000-8000-000000000001"
+SID2 = "0a1b2c3d-0000-4000-8000-000000000002"
+
+
+@pytest.fixture
+def projects(tmp_path):
+    root = tmp_path / "projects"
+    for i in range(20):
+        (root / f"proj{i}").mkdir(parents=True)
+    (root / "proj7" / f"{SID}.jsonl").write_text("{}\n")
+    return root
+
+
+def _bump_mtime(path, delta_ns=10_000_000):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + delta_ns))
+
+
+class TestSessionIndex:
+    """인덱스 조회/증분 갱신 테스트"""
+
+    def test_lookup_builds_index(self, projects):
+        index = SessionIndex(projects)
+        assert index.lookup(SID) == projects / "proj7" / f"{SID}.jsonl"
+        assert index.lookup(SID2) is None
+
+    def test_hit_does_not_scan(self, projects):
+        index = SessionIndex(projects)
+        index.lookup(SID)
+        with patch.object(index, "_refresh") as refresh, patch.object(index, "_walk") as walk:
+            assert index.lookup(SID) is not None
+        refresh.assert_not_called()
+        walk.assert_not_called()
+
+    def test_refresh_rescans_only_changed_dirs(self, projects):
+        index = SessionIndex(projects)
+        index.lookup(SID)
+
+        new_file = projects / "proj3" / f"{SID2}.jsonl"
+        new_file.write_text("{}\n")
+        _bump_mtime(projects / "proj3")
+
+        scanned = []
+        original = index._scan_dir
+        with patch.object(index, "_scan_dir", side_effect=lambda name: (scanned.append(name), original(name))):
+            assert index.lookup(SID2) == new_file
+        assert scanned == ["proj3"]
+
+    def test_moved_and_deleted_sessions(self, projects):
+        index = SessionIndex(projects)
+        index.lookup(SID)
+
+        moved = projects / "proj9" / f"{SID}.jsonl"
+        (projects / "proj7" / f"{SID}.jsonl").rename(moved)
+        _bump_mtime(projects / "proj7")
+        _bump_mtime(projects / "proj9")
+        assert index.lookup(SID) == moved
+
+        moved.unlink()
+        _bump_mtime(projects / "proj9")
+        assert index.lookup(SID) is None
+
+    def test_fallback_walk_when_mtime_unchanged(self, projects):
+        index = SessionIndex(projects)
+        index.lookup(SID)
+        st = (projects / "proj5").stat()
+        (projects / "proj5" / f"{SID2}.jsonl").write_text("{}\n")
+        # mtime 해상도가 낮아 변경이 안 보이는 경우
+        os.utime(projects / "proj5", ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert index.lookup(SID2) == projects / "proj5" / f"{SID2}.jsonl"
+
+    def test_persisted_between_instances(self, projects, tmp_path):
+        index_path = tmp_path / "data" / "session_index.json"
+        SessionIndex(projects, index_path).lookup(SID)
+        assert index_path.exists()
+
+        restored = SessionIndex(projects, index_path)
+        with patch.object(restored, "_scan_dir") as scan, patch.object(restored, "_walk") as walk:
+            assert restored.lookup(SID) == projects / "proj7" / f"{SID}.jsonl"
+        scan.assert_not_called()
+        walk.assert_not_called()
+
+    def test_corrupt_index_is_rebuilt(self, projects, tmp_path):
+        index_path = tmp_path / "session_index.json"
+        index_path.write_text("not json")
+        assert SessionIndex(projects, index_path).lookup(SID) is not None
+
+
+class TestValidateSession:
+    """validate_session 연동 테스트"""
+
+    def test_uses_home_projects_dir(self, tmp_path, monkeypatch):
+        projects = tmp_path / ".claude" / "projects" / "p"
+        projects.mkdir(parents=True)
+        (projects / f"{SID}.jsonl").write_text("{}\n")
+        monkeypatch.setenv("SEOSOYOUNG_RUNTIME", str(tmp_path / "runtime"))
+
+        with patch("pathlib.Path.home", return_value=tmp_path):
+            assert session_validator.validate_session(SID) is None
+            assert "찾을 수 없습니다" in session_validator.validate_session(SID2)
+            assert "형식" in session_validator.validate_session("nope")
+        assert (tmp_path / "runtime" / "data" / "session_index.json").exists()
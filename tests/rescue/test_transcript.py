@@ -0,0 +1,186 @@
+"""rescue 메시지 로그 테스트
+
+ClaudeRunner._receive_messages가 수집 메시지를 링 버퍼로 제한하고
+도구 입력을 한 번만 직렬화하는지, 2,000개 메시지 실행에서도 보관
+메모리가 일정하게 유지되는지 검증합니다.
+"""
+
+import gc
+import json
+import tracemalloc
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from seosoyoung.rescue.claude import agent_runner
+from seosoyoung.rescue.claude.agent_runner import (
+    ClaudeRunner,
+    CompactRetryState,
+    MessageState,
+)
+from seosoyoung.rescue.claude.engine_types import EngineEventType
+from seosoyoung.rescue.claude.transcript import (
+    DEFAULT_MESSAGE_LIMIT,
+    PREVIEW_LIMIT,
+    MessageLog,
+    serialize_tool_input,
+)
+
+pytest.importorskip("claude_agent_sdk")
+from claude_agent_sdk.types import (  # noqa: E402
+    AssistantMessage,
+    ResultMessage,
+    TextBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
+N_MESSAGES = 2000
+
+
+class _SyntheticClient:
+    """파일 편집 도구 호출이 반복되는 긴 세션을 흉내 내는 가짜 클라이언트"""
+
+    def __init__(self, n: int, payload_size: int = 20_000):
+        self.n = n
+        self.payload_size = payload_size
+
+    async def receive_response(self):
+        for i in range(self.n - 1):
+            if i % 2 == 0:
+                yield AssistantMessage(
+                    content=[
+                        TextBlock(text=f"step {i}"),
+                        ToolUseBlock(
+                            id=f"tu_{i}",
+                            name="Edit",
+                            input={"file_path": f"f{i}.py", "new_string": "x" * self.payload_size},
+                        ),
+                    ],
+                    model="test",
+                )
+            else:
+                yield UserMessage(content=[ToolResultBlock(tool_use_id=f"tu_{i - 1}", content="ok")])
+        yield ResultMessage(
+            subtype="success", duration_ms=1, duration_api_ms=1, is_error=False,
+            num_turns=1, session_id="sess", result="done",
+        )
+
+
+async def _run(msg_state: MessageState, on_event=None) -> None:
+    runner = ClaudeRunner()
+    await runner._receive_messages(
+        _SyntheticClient(N_MESSAGES), CompactRetryState(), msg_state, None, on_event=on_event,
+    )
+
+
+class TestSerializeToolInput:
+    """도구 입력 직렬화 테스트"""
+
+    def test_small_input_passes_original(self):
+        data = {"path": "a.py"}
+        preview, event_input = serialize_tool_input(data)
+        assert preview == json.dumps(data)
+        assert event_input is data
+
+    def test_large_input_shares_truncated_string(self):
+        preview, event_input = serialize_tool_input({"content": "x" * 10_000})
+        assert len(preview) == PREVIEW_LIMIT + 3
+        assert event_input["_truncated"] is preview
+
+    def test_unserializable_input(self):
+        preview, event_input = serialize_tool_input({"obj": object()})
+        assert preview == ""
+        assert event_input == {"_error": "serialize_failed"}
+
+
+class TestMessageLog:
+    """링 버퍼 / 디스크 기록 테스트"""
+
+    def test_ring_buffer_keeps_recent(self):
+        log = MessageLog(limit=3)
+        for i in range(10):
+            log.append("assistant", f"m{i}")
+        assert [m["content"] for m in log] == ["m7", "m8", "m9"]
+        assert log.total == 10
+
+    def test_last_assistant_text_survives_eviction(self):
+        log = MessageLog(limit=2)
+        log.append("assistant", "answer")
+        for _ in range(5):
+            log.append("assistant", "[tool_use: Read] {}")
+        assert log.last_assistant_text == "answer"
+
+    def test_spill_to_disk_keeps_everything(self, tmp_path):
+        path = tmp_path / "t" / "run.jsonl"
+        log = MessageLog(limit=2, spill_path=path)
+        for i in range(5):
+            log.append("tool", f"r{i}")
+        log.close()
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [line["content"] for line in lines] == [f"r{i}" for i in range(5)]
+        assert len(log) == 2
+
+
+class TestReceiveMessages:
+    """_receive_messages 수집 파이프라인 테스트"""
+
+    async def test_serializes_each_tool_input_once(self):
+        events = []
+
+        async def on_event(event):
+            events.append(event)
+
+        with patch.object(agent_runner, "serialize_tool_input", wraps=serialize_tool_input) as ser:
+            msg_state = MessageState()
+            await _run(msg_state, on_event)
+
+        n_tool_uses = N_MESSAGES // 2
+        assert ser.call_count == n_tool_uses
+        assert msg_state.msg_count == N_MESSAGES
+        assert msg_state.result_text == "done"
+        assert len(msg_state.collected_messages) == DEFAULT_MESSAGE_LIMIT
+        assert msg_state.collected_messages.total == n_tool_uses * 2 + (N_MESSAGES // 2 - 1)
+
+        tool_starts = [e for e in events if e.type is EngineEventType.TOOL_START]
+        assert len(tool_starts) == n_tool_uses
+        assert "_truncated" in tool_starts[0].data["tool_input"]
+
+    async def test_retained_memory_is_bounded(self):
+        """2,000개 메시지 실행 후 보관 메모리가 링 버퍼 크기에 비례"""
+
+        async def retained(msg_state: MessageState) -> int:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                before, _ = tracemalloc.get_traced_memory()
+                await _run(msg_state)
+                gc.collect()
+                after, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return after - before
+
+        bounded = await retained(MessageState())
+        unbounded = await retained(MessageState(collected_messages=MessageLog(limit=None)))
+
+        print(f"\nretained: bounded={bounded / 1024:.0f}KB unbounded={unbounded / 1024:.0f}KB")
+        assert bounded < 1024 * 1024
+        assert bounded * 4 < unbounded
+
+
+class TestTranscriptDir:
+    """러너의 transcript_dir 연동 테스트"""
+
+    def test_new_message_log_spills_under_dir(self, tmp_path):
+        runner = ClaudeRunner("1234.5678", transcript_dir=tmp_path)
+        log = runner._new_message_log()
+        log.append("assistant", "hi")
+        log.close()
+        files = list(Path(tmp_path).glob("1234_5678_*.jsonl"))
+        assert len(files) == 1
+
+    def test_no_dir_means_memory_only(self):
+        assert ClaudeRunner()._new_message_log().spill_path is None
@@ -210,17 +210,57 @@ class TestExecutorRemoteBranch:
             role="admin",
         )
         pctx = _make_pctx(thread_ts="1234.5678", channel="C123")
+        pctx.last_event_id = 57
         result = ClaudeResult(success=True, output="done", session_id="sess-1")
 
         executor._process_result(pctx, result, "1234.5678")
 
+        # 턴에서 이미 렌더링한 이벤트 이후부터 구독
         listener.start_or_refresh.assert_called_once_with(
             "sess-1",
             channel="C123",
             thread_ts="1234.5678",
             slack_client=pctx.client,
+            last_event_id=57,
         )
 
+    def test_persistent_listener_resumes_after_last_received_event(self, tmp_path):
+        """렌더링하지 않은 이벤트까지 포함해 마지막으로 수신한 id부터 이어받는다."""
+        from seosoyoung.slackbot.soulstream.engine_types import ClaudeResult
+
+        listener = MagicMock()
+        executor = _make_executor(tmp_path, persistent_listener_manager=listener)
+        executor.session_manager.create(
+            thread_ts="1234.5678",
+            channel_id="C123",
+            user_id="U123",
+            role="admin",
+        )
+        pctx = _make_pctx(thread_ts="1234.5678", channel="C123")
+
+        async def mock_execute(**kwargs):
+            # 57까지 렌더링, 이후 complete 등 렌더링하지 않는 이벤트 수신
+            pctx.last_event_id = 57
+            for event_id in (56, 57, 58, 59):
+                await kwargs["on_event_id"](event_id)
+            return ClaudeResult(success=True, output="done", session_id="sess-1")
+
+        mock_adapter = MagicMock()
+        mock_adapter.execute = mock_execute
+        mock_adapter.close = AsyncMock()
+
+        with patch.object(executor, "_get_service_adapter", return_value=mock_adapter):
+            executor._execute_remote(
+                "1234.5678", "hello",
+                on_compact=_noop_compact,
+                presentation=pctx,
+                session_id="sess-001",
+                user_message=None,
+                on_result=None,
+            )
+
+        assert listener.start_or_refresh.call_args.kwargs["last_event_id"] == 59
+
     def test_failed_result_does_not_start_persistent_listener(self, tmp_path):
         """실패한 실행 결과는 listener를 시작하지 않는다."""
         from seosoyoung.slackbot.soulstream.engine_types import ClaudeResult
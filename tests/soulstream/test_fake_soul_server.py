@@ -0,0 +1,159 @@
+"""fake soul-server 테스트
+
+실제 SoulServiceClient로 fake 서버를 호출하여 실행/재연결/개입/세션 목록이
+봇이 기대하는 wire 형식대로 동작하는지 검증합니다.
+"""
+
+import json
+
+import aiohttp
+import pytest
+
+from seosoyoung.slackbot.soulstream.service_client import (
+    RateLimitError,
+    SoulServiceClient,
+)
+from seosoyoung.testing import (
+    FailurePlan,
+    FakeSoulServer,
+    StreamProfile,
+    load_recording,
+    synthetic_events,
+)
+
+
+@pytest.fixture
+async def soul():
+    servers = []
+
+    async def start(**kwargs):
+        server = FakeSoulServer(**kwargs)
+        url = await server.start()
+        servers.append(server)
+        return server, url
+
+    yield start
+    for server in servers:
+        await server.stop()
+
+
+class _Recorder:
+    def __init__(self):
+        self.deltas: list[str] = []
+        self.tools: list[str] = []
+        self.event_ids: list[int] = []
+
+    async def on_text_delta(self, text, event_id):
+        self.deltas.append(text)
+
+    async def on_tool_start(self, name, tool_input, tool_use_id, event_id):
+        self.tools.append(tool_use_id)
+
+    async def on_event_id(self, event_id):
+        self.event_ids.append(event_id)
+
+    def callbacks(self):
+        return dict(
+            on_text_delta=self.on_text_delta,
+            on_tool_start=self.on_tool_start,
+            on_event_id=self.on_event_id,
+        )
+
+
+async def test_execute_streams_synthetic_turn(soul):
+    profile = StreamProfile(text_deltas=5, delta_size=8, tool_calls=3)
+    server, url = await soul(profile=profile)
+    rec = _Recorder()
+
+    async with SoulServiceClient(base_url=url) as client:
+        result = await client.execute("안녕", **rec.callbacks())
+
+    expected = synthetic_events(profile)
+    assert result.success
+    assert result.result == expected[-1][1]["result"]
+    assert result.agent_session_id in server.sessions
+    assert len(rec.deltas) == 5 and all(len(d) == 8 for d in rec.deltas)
+    assert rec.tools == ["toolu_0", "toolu_1", "toolu_2"]
+    assert rec.event_ids == list(range(1, len(expected) + 2))
+
+
+async def test_drops_are_resumed_with_after_id(soul, monkeypatch):
+    from seosoyoung.slackbot.soulstream import service_client
+
+    backoff = service_client.ExponentialBackoff
+    monkeypatch.setattr(
+        service_client,
+        "ExponentialBackoff",
+        lambda: backoff(base_delay=0.01, max_delay=0.05, max_retries=20),
+    )
+    server, url = await soul(
+        profile=StreamProfile(text_deltas=40),
+        failures=FailurePlan(drop_probability=0.7, seed=3),
+    )
+    rec = _Recorder()
+
+    async with SoulServiceClient(base_url=url) as client:
+        result = await client.execute("hi", **rec.callbacks())
+
+    assert result.success
+    assert server.stats["dropped"] > 0
+    assert server.stats["reconnects"] >= server.stats["dropped"]
+    assert len(rec.deltas) == 40
+    assert rec.event_ids == sorted(set(rec.event_ids))
+
+
+async def test_injected_error_and_rejection(soul):
+    _, url = await soul(failures=FailurePlan(error_probability=1.0))
+    async with SoulServiceClient(base_url=url) as client:
+        result = await client.execute("hi")
+    assert not result.success
+    assert "주입된 실행 오류" in result.error
+
+    _, url = await soul(failures=FailurePlan(reject_probability=1.0))
+    async with SoulServiceClient(base_url=url) as client:
+        with pytest.raises(RateLimitError):
+            await client.execute("hi")
+
+
+async def test_intervene_runs_followup_turn_and_lists_sessions(soul):
+    server, url = await soul(profile=StreamProfile(text_deltas=2, events_per_second=200))
+
+    async with SoulServiceClient(base_url=url) as client:
+        first = await client.execute("첫 요청")
+        session_id = first.agent_session_id
+        assert (await client.intervene(session_id, "두 번째", "U1"))["queued"] is True
+
+        # orch 경로로 구독하면 개입 턴이 끝날 때까지 따라간다
+        orch = SoulServiceClient(base_url=f"{url}/api", event_stream_path="/sessions/{session_id}/events")
+        async with orch:
+            followup = await orch.listen_session_events(session_id, last_event_id=len(
+                server.sessions[session_id].log) - 1)
+        assert followup.success
+        assert (await client.health_check())["status"] == "ok"
+
+    async with aiohttp.ClientSession() as http:
+        async with http.get(f"{url}/sessions", params={"status": "completed,error", "limit": 5}) as resp:
+            listing = await resp.json()
+    assert listing["total"] == 1
+    assert listing["sessions"][0]["agent_session_id"] == session_id
+    assert server.stats["interventions"] == 1
+
+
+async def test_replays_recording(soul, tmp_path):
+    path = tmp_path / "turn.jsonl"
+    lines = [
+        {"event": "init", "data": {"agent_session_id": "recorded"}},
+        {"event": "text_start", "data": {}},
+        {"event": "text_delta", "data": {"text": "녹화"}},
+        {"event": "text_end", "data": {}},
+        {"event": "complete", "data": {"result": "녹화"}},
+    ]
+    path.write_text("\n".join(json.dumps(line, ensure_ascii=False) for line in lines), encoding="utf-8")
+    _, url = await soul(recording=load_recording(path))
+    rec = _Recorder()
+
+    async with SoulServiceClient(base_url=url) as client:
+        result = await client.execute("hi", **rec.callbacks())
+
+    assert result.result == "녹화"
+    assert rec.deltas == ["녹화"]
@@ -0,0 +1,177 @@
+"""인덱스 채널 저장소 기반 세션 컨텍스트 테스트
+
+ChannelMessageIndex의 조회/우선순위 동작, 기존 load_judged/load_pending 경로와의
+결과 동일성, 그리고 50k 저장 메시지에서 컨텍스트 구성 시간을 검증합니다.
+"""
+
+import json
+import random
+import time
+
+import pytest
+
+from seosoyoung.plugin_sdk.channel_index import ChannelMessageIndex
+from seosoyoung.slackbot.soulstream.session_context import (
+    build_followup_context,
+    build_initial_context,
+)
+
+CH = "C_MON"
+
+
+def _msg(ts, text="", linked=None):
+    m = {"ts": ts, "user": "U1", "text": text or f"m{ts}"}
+    if linked:
+        m["linked_message_ts"] = linked
+    return m
+
+
+class _JsonlStore:
+    """judged/pending을 JSONL로 보관하고 매번 전체를 파싱하는 기존 방식 저장소"""
+
+    def __init__(self):
+        self.judged: dict[str, list[str]] = {}
+        self.pending: dict[str, list[str]] = {}
+
+    def add(self, channel_id, messages, judged=False):
+        target = self.judged if judged else self.pending
+        target.setdefault(channel_id, []).extend(json.dumps(m) for m in messages)
+
+    def load_judged(self, channel_id):
+        return [json.loads(line) for line in self.judged.get(channel_id, [])]
+
+    def load_pending(self, channel_id):
+        return [json.loads(line) for line in self.pending.get(channel_id, [])]
+
+
+def _populate(stores, n, seed=0):
+    """n개의 메시지(일부는 judged/pending 중복, 일부는 linked)를 두 저장소에 동일하게 넣는다."""
+    rng = random.Random(seed)
+    judged, pending = [], []
+    for i in range(1, n + 1):
+        ts = f"{1700000000 + i}.{i % 1000:06d}"
+        linked = None
+        if i > 20 and rng.random() < 0.1:
+            j = rng.randint(1, i - 1)
+            linked = f"{1700000000 + j}.{j % 1000:06d}"
+        msg = _msg(ts, linked=linked)
+        (judged if rng.random() < 0.7 else pending).append(msg)
+        if rng.random() < 0.05:
+            # 같은 ts가 pending에도 남아있는 경우 (judged가 우선)
+            pending.append(dict(msg, text="stale"))
+    for store in stores:
+        store.add(CH, pending)
+        store.add(CH, judged, judged=True)
+    return judged + pending
+
+
+class TestChannelMessageIndex:
+    def test_judged_wins_over_pending(self):
+        index = ChannelMessageIndex()
+        index.add(CH, [_msg("1.0", "judged")], judged=True)
+        index.add(CH, [_msg("1.0", "pending")])
+        assert index.load_judged(CH)[0]["text"] == "judged"
+        assert index.load_pending(CH) == []
+
+        index.add(CH, [_msg("2.0", "p")])
+        index.add(CH, [_msg("2.0", "j")], judged=True)
+        assert [m["text"] for m in index.load_judged(CH)] == ["judged", "j"]
+
+    def test_range_queries_are_ascending(self):
+        index = ChannelMessageIndex()
+        index.add(CH, [_msg(f"{i}.5") for i in (3, 1, 10, 2, 7)])
+        index.add("OTHER", [_msg("99.0")])
+
+        assert [m["ts"] for m in index.last_messages(CH, 3)] == ["3.5", "7.5", "10.5"]
+        assert [m["ts"] for m in index.messages_after(CH, "2.5", 2)] == ["7.5", "10.5"]
+        assert [m["ts"] for m in index.messages_after(CH, "2.5", 10)] == ["3.5", "7.5", "10.5"]
+        assert [m["ts"] for m in index.get_messages(CH, ["7.5", "1.5", "nope"])] == ["1.5", "7.5"]
+        assert index.count(CH) == 5
+
+    def test_skips_messages_without_numeric_ts(self):
+        index = ChannelMessageIndex()
+        assert index.add(CH, [{"text": "no ts"}, _msg("bad"), _msg("1.0")]) == 1
+
+    def test_persists_to_file(self, tmp_path):
+        path = tmp_path / "idx" / "channels.db"
+        index = ChannelMessageIndex(path)
+        index.add(CH, [_msg("1.0")], judged=True)
+        index.close()
+
+        reopened = ChannelMessageIndex(path)
+        assert reopened.load_judged(CH) == [_msg("1.0")]
+        reopened.remove(CH, ["1.0"])
+        assert reopened.count(CH) == 0
+
+    def test_import_store(self):
+        legacy = _JsonlStore()
+        _populate([legacy], 200)
+        index = ChannelMessageIndex()
+        index.import_store(legacy, CH)
+        assert index.load_judged(CH) == sorted(
+            {m["ts"]: m for m in legacy.load_judged(CH)}.values(), key=lambda m: float(m["ts"])
+        )
+
+
+@pytest.fixture(scope="module")
+def stores():
+    legacy, index = _JsonlStore(), ChannelMessageIndex()
+    messages = _populate([legacy, index], 2000, seed=7)
+    return legacy, index, sorted({m["ts"] for m in messages}, key=float)
+
+
+class TestIndexedContextMatchesLegacy:
+    """인덱스 경로가 기존 전체 로드 경로와 같은 결과를 낸다"""
+
+    def test_initial_context(self, stores):
+        legacy, index, all_ts = stores
+        slack_messages = [_msg(all_ts[-3], "from slack"), _msg("1800000000.0", "newest")]
+        for store_slack in (slack_messages, []):
+            expected = build_initial_context(CH, store_slack, [CH], legacy)
+            assert build_initial_context(CH, store_slack, [CH], index) == expected
+
+    def test_followup_context(self, stores):
+        legacy, index, all_ts = stores
+        rng = random.Random(1)
+        cutoffs = [all_ts[-k] for k in (1, 2, 5, 9, 10, 11, 30)] + rng.sample(all_ts, 20)
+        for cutoff in cutoffs:
+            expected = build_followup_context(CH, cutoff, legacy, [CH])
+            assert build_followup_context(CH, cutoff, index, [CH]) == expected, cutoff
+
+    def test_followup_with_linked_chain(self):
+        legacy, index = _JsonlStore(), ChannelMessageIndex()
+        base = [_msg(f"{i}.0") for i in range(1, 50)]
+        tail = [_msg("60.0", linked="3.0"), _msg("61.0", linked="60.0")]
+        for store in (legacy, index):
+            store.add(CH, base + tail, judged=True)
+
+        expected = build_followup_context(CH, "55.0", legacy, [CH])
+        assert [m["ts"] for m in expected["messages"]] == ["3.0", "60.0", "61.0"]
+        assert build_followup_context(CH, "55.0", index, [CH]) == expected
+
+
+class TestContextBuildBenchmark:
+    N = 50_000
+
+    def test_context_build_time_at_50k(self):
+        legacy, index = _JsonlStore(), ChannelMessageIndex()
+        _populate([legacy, index], self.N, seed=3)
+        last_ts = index.last_messages(CH, 1)[0]["ts"]
+        cutoff = index.last_messages(CH, 5)[0]["ts"]
+
+        def measure(store, rounds):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                build_initial_context(CH, [], [CH], store)
+                build_followup_context(CH, cutoff, store, [CH])
+            return (time.perf_counter() - start) / rounds
+
+        legacy_s = measure(legacy, 3)
+        indexed_s = measure(index, 50)
+        print(
+            f"\ncontext build @ {self.N} msgs: legacy={legacy_s * 1000:.1f}ms "
+            f"indexed={indexed_s * 1000:.2f}ms ({legacy_s / indexed_s:.0f}x)"
+        )
+        assert build_initial_context(CH, [], [CH], index)["last_seen_ts"] == last_ts
+        assert indexed_s < 0.01
+        assert indexed_s * 20 < legacy_s
@@ -50,6 +50,26 @@ def test_start_or_refresh_reuses_existing_listener():
     assert FakeThread.created[0].started is True
 
 
+def test_start_or_refresh_seeds_cursor_from_caller():
+    """턴에서 이미 렌더링한 이벤트 이후부터 구독하고, 커서는 뒤로 가지 않는다."""
+    manager = PersistentSessionListenerManager(
+        client_factory=MagicMock(),
+        thread_factory=FakeThread,
+    )
+
+    state = manager.start_or_refresh(
+        "sess-1", channel="C123", thread_ts="1000.0001", slack_client=MagicMock(),
+        last_event_id=57,
+    )
+    assert state.last_event_id == 57
+
+    manager.start_or_refresh(
+        "sess-1", channel="C123", thread_ts="1000.0001", slack_client=MagicMock(),
+        last_event_id=30,
+    )
+    assert state.last_event_id == 57
+
+
 def test_record_slack_input_resets_activity_timer():
     now = [100.0]
     manager = PersistentSessionListenerManager(
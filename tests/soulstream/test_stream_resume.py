@@ -0,0 +1,175 @@
+"""SSE 스트림 이어받기(after_id) 장애 주입 테스트
+
+실행 중 스트림을 임의의 바이트 위치에서 끊는 stub soul-server를 상대로
+execute()가 마지막 이벤트 id부터 재연결하고, 프레젠테이션 콜백이
+이벤트당 정확히 한 번만 슬랙 메시지를 만들고 갱신하는지 검증합니다.
+"""
+
+import json
+import random
+from itertools import count
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from seosoyoung.slackbot.formatting import format_thinking_complete
+from seosoyoung.slackbot.presentation.node_map import SlackNodeMap
+from seosoyoung.slackbot.presentation.progress import build_event_callbacks
+from seosoyoung.slackbot.presentation.types import PresentationContext
+from seosoyoung.slackbot.soulstream import service_client
+from seosoyoung.slackbot.soulstream.service_client import (
+    ExponentialBackoff,
+    SoulServiceClient,
+)
+
+SESSION_ID = "sess-resume"
+WORDS = [f"w{i} " for i in range(20)]
+FULL_TEXT = "".join(WORDS)
+
+
+def _event_log() -> list[bytes]:
+    """id 1부터 시작하는 고정 이벤트 로그 (SSE로 인코딩)"""
+    events = [("init", {"agent_session_id": SESSION_ID}), ("text_start", {})]
+    events += [("text_delta", {"text": w}) for w in WORDS]
+    events += [
+        ("text_end", {}),
+        ("tool_start", {"tool_name": "Read", "tool_input": {}, "tool_use_id": "tu1"}),
+        ("tool_result", {"result": "ok", "tool_use_id": "tu1", "is_error": False}),
+        ("complete", {"result": FULL_TEXT}),
+    ]
+    return [
+        f"id: {i}\nevent: {name}\ndata: {json.dumps(data)}\n\n".encode()
+        for i, (name, data) in enumerate(events, start=1)
+    ]
+
+
+class _FlakySoulServer:
+    """연결마다 임의 위치에서 스트림을 끊는 stub (drops회까지)
+
+    honour_after_id=False면 after_id를 무시하고 처음부터 재생하는
+    구버전 서버를 흉내냅니다.
+    """
+
+    def __init__(self, rng: random.Random, drops: int, honour_after_id: bool = True):
+        self.log = _event_log()
+        self.rng = rng
+        self.drops_left = drops
+        self.honour_after_id = honour_after_id
+        self.after_ids: list = []
+        self.sent_events = 0
+
+    async def _serve(self, request: web.Request, start: int) -> web.StreamResponse:
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await resp.prepare(request)
+        events = self.log[start:]
+        payload = b"".join(events)
+        if self.drops_left > 0:
+            self.drops_left -= 1
+            # 첫 연결은 init 이후에서 끊어 세션 id는 확보되게 한다
+            low = len(self.log[0]) if start == 0 else 1
+            cut = self.rng.randint(low, len(payload) - 1)
+            await resp.write(payload[:cut])
+            self.sent_events += payload[:cut].count(b"\n\n")
+            request.transport.close()
+            return resp
+        await resp.write(payload)
+        self.sent_events += len(events)
+        await resp.write_eof()
+        return resp
+
+    async def execute(self, request: web.Request) -> web.StreamResponse:
+        await request.json()
+        return await self._serve(request, 0)
+
+    async def events(self, request: web.Request) -> web.StreamResponse:
+        after_id = request.query.get("after_id")
+        self.after_ids.append(after_id)
+        start = int(after_id) if (after_id and self.honour_after_id) else 0
+        return await self._serve(request, start)
+
+
+@pytest.fixture
+def fast_backoff(monkeypatch):
+    monkeypatch.setattr(
+        service_client,
+        "ExponentialBackoff",
+        lambda: ExponentialBackoff(base_delay=0.01, max_delay=0.05),
+    )
+
+
+def _pctx():
+    ts = count(1)
+    client = MagicMock()
+    client.chat_postMessage.side_effect = lambda **kw: {"ts": f"ts{next(ts)}"}
+    return PresentationContext(
+        channel="C1", thread_ts="1.0", msg_ts="1.0", say=MagicMock(), client=client,
+    )
+
+
+async def _run(server: _FlakySoulServer):
+    app = web.Application()
+    app.router.add_post("/execute", server.execute)
+    app.router.add_get("/events/{session_id}/stream", server.events)
+    http = TestServer(app)
+    await http.start_server()
+
+    pctx = _pctx()
+    cbs = build_event_callbacks(pctx, SlackNodeMap(), mode="keep")
+    delivered: list[int] = []
+
+    async def on_event_id(event_id):
+        delivered.append(event_id)
+
+    client = SoulServiceClient(base_url=str(http.make_url("")).rstrip("/"))
+    try:
+        result = await client.execute(
+            "hello",
+            on_event_id=on_event_id,
+            **{k: v for k, v in cbs.items() if k not in ("cleanup", "on_compact")},
+        )
+    finally:
+        await client.close()
+        await http.close()
+    return result, pctx, delivered
+
+
+def _assert_rendered_once(pctx):
+    slack = pctx.client
+    # text 노드 1개 + tool 노드 1개
+    assert slack.chat_postMessage.call_count == 2
+    updates = [c.kwargs for c in slack.chat_update.call_args_list]
+    text_updates = [u["text"] for u in updates if u["ts"] == "ts1"]
+    assert text_updates[-1] == format_thinking_complete(FULL_TEXT)
+    assert len(text_updates) == len(WORDS) + 1
+    assert sum(1 for u in updates if u["ts"] == "ts2") == 1
+
+
+@pytest.mark.parametrize("seed", range(10))
+async def test_resume_after_random_drops(seed, fast_backoff):
+    server = _FlakySoulServer(random.Random(seed), drops=3)
+
+    result, pctx, delivered = await _run(server)
+
+    assert result.success, result.error
+    assert result.result == FULL_TEXT
+    assert result.agent_session_id == SESSION_ID
+    _assert_rendered_once(pctx)
+    # 재연결은 모두 after_id 커서로 이어받았고, 같은 이벤트가 두 번 오지 않았다
+    assert len(server.after_ids) == 3
+    assert all(a is not None for a in server.after_ids)
+    assert delivered == list(range(1, len(server.log) + 1))
+    assert pctx.last_event_id == len(server.log) - 1  # complete 직전(tool_result)까지 렌더링
+
+
+@pytest.mark.parametrize("seed", range(5))
+async def test_replaying_server_still_renders_once(seed, fast_backoff):
+    """after_id를 무시하고 처음부터 재생하는 서버여도 프레젠테이션은 멱등이다"""
+    server = _FlakySoulServer(random.Random(seed), drops=2, honour_after_id=False)
+
+    result, pctx, _ = await _run(server)
+
+    assert result.success, result.error
+    _assert_rendered_once(pctx)
+    assert server.sent_events > len(server.log)
@@ -0,0 +1,198 @@
+"""fake Slack 서버 테스트
+
+slack_sdk 클라이언트를 그대로 붙여 Web API 메서드, rate limit, 호출 수 집계,
+files_upload_v2 흐름, Socket Mode 이벤트 왕복이 실제 Slack과 같은 형태로
+동작하는지 검증합니다.
+"""
+
+import asyncio
+import random
+
+import pytest
+from slack_sdk.errors import SlackApiError
+from slack_sdk.socket_mode.aiohttp import SocketModeClient
+from slack_sdk.socket_mode.response import SocketModeResponse
+from slack_sdk.web import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
+
+from seosoyoung.testing import FakeSlackServer, LatencyModel, RateLimits
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+async def slack():
+    servers = []
+
+    async def start(**kwargs):
+        kwargs.setdefault("rate_limits", RateLimits(enabled=False))
+        server = FakeSlackServer(**kwargs)
+        api_url = await server.start()
+        servers.append(server)
+        return server, AsyncWebClient(token="xoxb-fake", base_url=api_url)
+
+    yield start
+    for server in servers:
+        await server.stop()
+
+
+async def test_message_lifecycle_and_call_counts(slack):
+    server, client = await slack()
+
+    parent = await client.chat_postMessage(channel="C1", text="부모")
+    reply = await client.chat_postMessage(channel="C1", text="답글", thread_ts=parent["ts"])
+    await client.chat_update(channel="C1", ts=reply["ts"], text="수정됨")
+    await client.reactions_add(channel="C1", timestamp=parent["ts"], name="eyes")
+    with pytest.raises(SlackApiError) as exc:
+        await client.reactions_add(channel="C1", timestamp=parent["ts"], name="eyes")
+    assert exc.value.response["error"] == "already_reacted"
+
+    replies = await client.conversations_replies(channel="C1", ts=parent["ts"])
+    assert [m["text"] for m in replies["messages"]] == ["부모", "수정됨"]
+    assert replies["messages"][0]["reactions"][0]["count"] == 1
+
+    await client.chat_delete(channel="C1", ts=reply["ts"])
+    with pytest.raises(SlackApiError) as exc:
+        await client.chat_update(channel="C1", ts=reply["ts"], text="x")
+    assert exc.value.response["error"] == "message_not_found"
+
+    assert server.calls == {
+        "chat.postMessage": 2,
+        "chat.update": 2,
+        "chat.delete": 1,
+        "reactions.add": 2,
+        "conversations.replies": 1,
+    }
+    assert server.errors == {"reactions.add": 1, "chat.update": 1}
+
+
+async def test_history_pagination_users_and_views(slack):
+    server, client = await slack()
+    for i in range(5):
+        server.add_message("C2", f"m{i}")
+    server.add_user("U9", real_name="서소영", profile={"display_name": "소영"})
+
+    first = await client.conversations_history(channel="C2", limit=3)
+    second = await client.conversations_history(
+        channel="C2", limit=3, cursor=first["response_metadata"]["next_cursor"],
+    )
+    assert [m["text"] for m in first["messages"] + second["messages"]] == ["m4", "m3", "m2", "m1", "m0"]
+    assert not second["has_more"]
+
+    user = (await client.users_info(user="U9"))["user"]
+    assert user["real_name"] == "서소영"
+    assert user["profile"]["display_name"] == "소영"
+    assert (await client.users_info(user="U1"))["user"]["id"] == "U1"
+
+    dm = await client.conversations_open(users="U9")
+    assert dm["channel"]["id"].startswith("D")
+    assert (await client.conversations_open(users="U9"))["channel"]["id"] == dm["channel"]["id"]
+
+    await client.views_publish(user_id="U9", view={"type": "home", "blocks": []})
+    assert server.views["U9"]["type"] == "home"
+    assert (await client.auth_test())["user_id"] == server.bot_user_id
+
+
+async def test_files_upload_v2_flow(slack, tmp_path):
+    server, client = await slack()
+    parent = await client.chat_postMessage(channel="C3", text="스레드")
+    path = tmp_path / "report.txt"
+    path.write_bytes(b"x" * 1000)
+
+    result = await client.files_upload_v2(
+        channel="C3", thread_ts=parent["ts"], file=str(path), title="보고서", initial_comment="첨부",
+    )
+
+    assert result["file"]["title"] == "보고서"
+    assert result["file"]["size"] == 1000
+    assert server.calls["files.getUploadURLExternal"] == 1
+    assert server.calls["files.completeUploadExternal"] == 1
+    assert server.stats["upload_bytes"] == 1000
+    shared = server.messages("C3", parent["ts"])[-1]
+    assert shared["text"] == "첨부" and shared["files"][0]["id"] == result["file"]["id"]
+
+
+async def test_sync_web_client(slack):
+    server, _ = await slack()
+    client = WebClient(token="xoxb-fake", base_url=f"{server.base_url}/api/")
+
+    response = await asyncio.to_thread(
+        client.chat_postMessage, channel="C4", text="동기", blocks=[{"type": "divider"}],
+    )
+
+    assert response["message"]["blocks"] == [{"type": "divider"}]
+    assert server.calls["chat.postMessage"] == 1
+
+
+async def test_tier_rate_limits(slack):
+    clock = _Clock()
+    server, client = await slack(rate_limits=RateLimits(), clock=clock)
+    ts = (await client.chat_postMessage(channel="C5", text="x"))["ts"]
+
+    # chat.update는 Tier 3(분당 50): 버스트 50건 뒤 429
+    for _ in range(50):
+        await client.chat_update(channel="C5", ts=ts, text="y")
+    with pytest.raises(SlackApiError) as exc:
+        await client.chat_update(channel="C5", ts=ts, text="y")
+    assert exc.value.response.status_code == 429
+    assert int(exc.value.response.headers["Retry-After"]) >= 1
+    assert server.rate_limited["chat.update"] == 1
+
+    # 다른 티어 메서드는 영향을 받지 않고, 시간이 지나면 다시 허용된다
+    await client.users_info(user="U1")
+    clock.now += 1.2
+    await client.chat_update(channel="C5", ts=ts, text="z")
+
+    # chat.postMessage는 채널별 제한 (버스트 3건)
+    for _ in range(3):
+        await client.chat_postMessage(channel="C5", text="x")
+    with pytest.raises(SlackApiError):
+        await client.chat_postMessage(channel="C5", text="x")
+    await client.chat_postMessage(channel="C6", text="다른 채널")
+
+
+def test_latency_model_distribution():
+    model = LatencyModel(median_ms=40, p99_ms=400)
+    rng = random.Random(1)
+    samples = sorted(model.sample(rng) for _ in range(5000))
+    assert 0.035 < samples[2500] < 0.045
+    assert 0.3 < samples[4950] < 0.55
+    assert LatencyModel().sample(rng) == 0.0
+
+
+async def test_socket_mode_round_trip(slack):
+    server, web_client = await slack()
+    socket = SocketModeClient(app_token="xapp-fake", web_client=web_client)
+    received = []
+
+    async def on_request(client, req):
+        await client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id))
+        event = req.payload["event"]
+        received.append(event)
+        await web_client.chat_postMessage(channel=event["channel"], thread_ts=event["ts"], text="응답")
+
+    socket.socket_mode_request_listeners.append(on_request)
+    await socket.connect()
+    try:
+        await server.wait_for_connection()
+        event, envelope_id = await server.post_user_message("C7", "안녕", mention=True)
+        ack = await server.wait_for_ack(envelope_id)
+        for _ in range(50):
+            if server.calls["chat.postMessage"]:
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        await socket.close()
+
+    assert ack == {"envelope_id": envelope_id}
+    assert received[0]["type"] == "app_mention"
+    assert received[0]["text"].startswith(f"<@{server.bot_user_id}>")
+    assert server.calls["apps.connections.open"] == 1
+    assert server.stats["events_acked"] == 1
+    assert [m["text"] for m in server.messages("C7", event["ts"])] == [event["text"], "응답"]
@@ -0,0 +1,166 @@
+"""plugin_sdk soulstream.run_batch() 테스트
+
+동시 실행 상한, 완료 순서 반환, 조기 종료 시 취소, 블록 단위 utterance 추출,
+그리고 stub soul-server 상대로 순차 실행 대비 처리량을 검증한다.
+"""
+
+import asyncio
+import json
+from contextlib import aclosing
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from seosoyoung.plugin_sdk import soulstream
+from seosoyoung.plugin_sdk.soulstream import (
+    RunRequest,
+    StreamEvent,
+    StreamEventType as T,
+)
+
+
+class _StreamBackend:
+    """prompt로 지연/출력을 정하는 fake stream backend"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.thread_keys: list[str] = []
+        self.closed = 0
+
+    async def stream(self, prompt, channel, thread_ts, **kwargs):
+        self.thread_keys.append(thread_ts)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay, _, text = prompt.partition(":")
+            yield StreamEvent(T.SESSION, f"sess-{text}")
+            await asyncio.sleep(float(delay))
+            if text == "fail":
+                yield StreamEvent(T.ERROR, "boom")
+                return
+            yield StreamEvent(T.THINKING, "<utterance>생각</utterance>")
+            yield StreamEvent(T.TEXT_START)
+            yield StreamEvent(T.TEXT_DELTA, "<utter")
+            yield StreamEvent(T.TEXT_DELTA, "ance>말</utterance>")
+            yield StreamEvent(T.TEXT_END)
+            yield StreamEvent(T.COMPLETE, text)
+        finally:
+            self.in_flight -= 1
+            self.closed += 1
+
+
+@pytest.fixture
+def fake_backend():
+    prev = soulstream.get_backend()
+    backend = _StreamBackend()
+    soulstream.set_backend(backend)
+    try:
+        yield backend
+    finally:
+        soulstream._backend = prev
+
+
+def _requests(*prompts):
+    return [RunRequest(prompt=p, channel="C1", thread_ts="1.0") for p in prompts]
+
+
+class TestRunBatch:
+    async def test_results_in_completion_order_with_bounded_parallelism(self, fake_backend):
+        batch = soulstream.run_batch(
+            _requests("0.15:a", "0.01:b", "0.05:c", "0.01:d", "0.01:e"), concurrency=2,
+        )
+        order = [(i, r.output) async for i, r in batch]
+
+        assert [i for i, _ in order] != [0, 1, 2, 3, 4]
+        assert sorted(order) == [(0, "a"), (1, "b"), (2, "c"), (3, "d"), (4, "e")]
+        assert fake_backend.max_in_flight == 2
+        # 같은 원본 스레드여도 항목마다 다른 합성 키를 쓴다
+        assert len(set(fake_backend.thread_keys)) == 5
+        assert batch.stats.succeeded == 5 and batch.stats.failed == 0
+        assert batch.stats.throughput > 0
+
+    async def test_collect_keeps_input_order_and_utterances(self, fake_backend):
+        results = await soulstream.run_batch(_requests("0.02:x", "0:fail", "0:y")).collect()
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[0].session_id == "sess-x"
+        assert results[0].utterances == ["생각", "말"]
+        assert results[1].error == "boom"
+
+    async def test_early_exit_cancels_in_flight(self, fake_backend):
+        batch = soulstream.run_batch(_requests("0:fast", "5:slow", "5:slow"), concurrency=3)
+        async with aclosing(batch):
+            async for _index, _result in batch:
+                break
+        assert fake_backend.in_flight == 0
+        assert fake_backend.closed == 3
+
+
+class _StubSoulServer:
+    """한 턴에 TURN_SECONDS 걸리는 stub soul-server"""
+
+    TURN_SECONDS = 0.2
+
+    def __init__(self):
+        self.peers: set = set()
+
+    async def execute(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        self.peers.add(request.transport.get_extra_info("peername"))
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await resp.prepare(request)
+        await resp.write(b'event: init\ndata: {"agent_session_id": "s"}\n\n')
+        await asyncio.sleep(self.TURN_SECONDS)
+        payload = json.dumps({"result": f"judged:{body['prompt']}"})
+        await resp.write(f"event: complete\ndata: {payload}\n\n".encode())
+        return resp
+
+
+class TestRunBatchAgainstStubServer:
+    N = 12
+    CONCURRENCY = 4
+
+    async def test_throughput_beats_sequential(self):
+        from seosoyoung.slackbot.plugin_backends import SoulstreamBackendImpl
+        from seosoyoung.slackbot.soulstream.service_client import SoulServiceClient
+
+        stub = _StubSoulServer()
+        app = web.Application()
+        app.router.add_post("/execute", stub.execute)
+        server = TestServer(app)
+        await server.start_server()
+        base_url = str(server.make_url("")).rstrip("/")
+
+        session_manager = MagicMock()
+        session_manager.get.return_value = None
+        backend = SoulstreamBackendImpl(
+            executor=MagicMock(),
+            session_manager=session_manager,
+            restart_manager=MagicMock(),
+            data_dir=MagicMock(),
+            role_tools={"admin": []},
+            client_factory=lambda: SoulServiceClient(base_url=base_url),
+        )
+        prev = soulstream.get_backend()
+        soulstream.set_backend(backend)
+        try:
+            prompts = [f"m{i}" for i in range(self.N)]
+            batch = soulstream.run_batch(_requests(*prompts), concurrency=self.CONCURRENCY)
+            results = await batch.collect()
+            await backend.close_stream_client()
+        finally:
+            soulstream._backend = prev
+            await server.close()
+
+        assert [r.output for r in results] == [f"judged:{p}" for p in prompts]
+        sequential = self.N * _StubSoulServer.TURN_SECONDS
+        print(
+            f"\nbatch: {batch.stats.throughput:.1f} req/s in {batch.stats.elapsed:.2f}s "
+            f"(sequential ≈ {sequential:.2f}s), connections={len(stub.peers)}"
+        )
+        assert batch.stats.elapsed < sequential / 2
+        # 워밍된 연결을 공유: 연결 수가 동시 실행 상한을 넘지 않는다
+        assert len(stub.peers) <= self.CONCURRENCY
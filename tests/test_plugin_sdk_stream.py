@@ -0,0 +1,170 @@
+"""plugin_sdk soulstream.stream() 테스트
+
+로컬 aiohttp SSE 서버를 띄워 SoulstreamBackendImpl.stream이 호출자 루프에서
+추가 스레드 없이 이벤트를 흘려보내는지, 소비자가 일찍 빠져나가면 연결이
+닫히는지, 루프별 클라이언트가 재사용되는지 검증한다.
+"""
+
+import asyncio
+import json
+import threading
+from contextlib import aclosing
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from seosoyoung.plugin_sdk import soulstream
+from seosoyoung.plugin_sdk.soulstream import StreamEventType
+from seosoyoung.slackbot.plugin_backends import SoulstreamBackendImpl
+from seosoyoung.slackbot.soulstream.service_client import SoulServiceClient
+
+
+def _sse(event: str, data: dict, eid: int) -> bytes:
+    return f"id: {eid}\nevent: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+class _FakeSoulServer:
+    """POST /execute에 텍스트 delta N개를 천천히 흘려보내는 서버"""
+
+    def __init__(self, n_deltas: int = 50, delay: float = 0.01):
+        self.n_deltas = n_deltas
+        self.delay = delay
+        self.requests: list[dict] = []
+        self.sent = 0
+        self.disconnected = asyncio.Event()
+        self.peers: set = set()
+
+    async def execute(self, request: web.Request) -> web.StreamResponse:
+        self.requests.append(await request.json())
+        self.peers.add(request.transport.get_extra_info("peername"))
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await resp.prepare(request)
+        eid = 0
+        try:
+            await resp.write(_sse("init", {"agent_session_id": "sess-1"}, eid))
+            await resp.write(_sse("thinking", {"thinking": "hmm"}, eid := eid + 1))
+            await resp.write(_sse("text_start", {}, eid := eid + 1))
+            for i in range(self.n_deltas):
+                await asyncio.sleep(self.delay)
+                await resp.write(_sse("text_delta", {"text": f"chunk{i} "}, eid := eid + 1))
+                self.sent += 1
+            await resp.write(_sse("text_end", {}, eid := eid + 1))
+            await resp.write(_sse("complete", {"result": "done"}, eid := eid + 1))
+        except (ConnectionResetError, asyncio.CancelledError):
+            self.disconnected.set()
+            raise
+        return resp
+
+
+@pytest.fixture
+async def soul_server():
+    fake = _FakeSoulServer()
+    app = web.Application()
+    app.router.add_post("/execute", fake.execute)
+    server = TestServer(app)
+    await server.start_server()
+    fake.url = str(server.make_url("")).rstrip("/")
+    try:
+        yield fake
+    finally:
+        await server.close()
+
+
+@pytest.fixture
+def backend(soul_server):
+    session_manager = MagicMock()
+    session_manager.get.return_value = None
+    impl = SoulstreamBackendImpl(
+        executor=MagicMock(),
+        session_manager=session_manager,
+        restart_manager=MagicMock(),
+        data_dir=MagicMock(),
+        role_tools={"admin": ["Read"]},
+        client_factory=lambda: SoulServiceClient(base_url=soul_server.url),
+    )
+    prev = soulstream.get_backend()
+    soulstream.set_backend(impl)
+    try:
+        yield impl
+    finally:
+        soulstream._backend = prev
+
+
+class TestStream:
+    async def test_yields_events_on_caller_loop(self, backend, soul_server):
+        threads_before = threading.active_count()
+        events = []
+        async with aclosing(soulstream.stream(prompt="hi", channel="C1", thread_ts="1.0")) as stream:
+            async for event in stream:
+                events.append(event)
+                assert threading.active_count() == threads_before
+        await backend.close_stream_client()
+
+        types = [e.type for e in events]
+        assert types[0] is StreamEventType.SESSION and events[0].text == "sess-1"
+        assert types[1] is StreamEventType.THINKING
+        assert types.count(StreamEventType.TEXT_DELTA) == soul_server.n_deltas
+        assert events[-1].type is StreamEventType.COMPLETE and events[-1].text == "done"
+        assert soul_server.requests[0]["allowed_tools"] == ["Read"]
+
+    async def test_early_exit_closes_connection(self, backend, soul_server):
+        async with aclosing(soulstream.stream(prompt="hi", channel="C1", thread_ts="1.0")) as stream:
+            async for event in stream:
+                if event.type is StreamEventType.TEXT_DELTA and event.text.startswith("chunk2"):
+                    break
+
+        await asyncio.wait_for(soul_server.disconnected.wait(), 2)
+        # 소비자가 멈춘 뒤 서버는 더 보내지 못하고 끊김을 감지
+        assert soul_server.sent < soul_server.n_deltas
+        await backend.close_stream_client()
+
+    async def test_client_and_connection_reused_across_runs(self, backend, soul_server):
+        soul_server.n_deltas = 1
+        for _ in range(3):
+            async with aclosing(soulstream.stream(prompt="hi", channel="C1", thread_ts="1.0")) as stream:
+                async for _event in stream:
+                    pass
+        assert len(backend._stream_clients) == 1
+        assert len(soul_server.peers) == 1
+        await backend.close_stream_client()
+
+    async def test_short_lived_loop_closes_its_client(self, backend, soul_server):
+        from seosoyoung.utils.async_bridge import run_in_new_loop
+
+        soul_server.n_deltas = 1
+        clients = []
+        factory = backend._client_factory
+        backend._client_factory = lambda: clients.append(factory()) or clients[-1]
+
+        async def consume():
+            return [e.type async for e in soulstream.stream(prompt="hi", channel="C1", thread_ts="1.0")]
+
+        # 플러그인 디스패치처럼 호출마다 새 루프에서 실행
+        for _ in range(2):
+            types = await asyncio.to_thread(run_in_new_loop, consume())
+            assert types[-1] is StreamEventType.COMPLETE
+
+        assert len(clients) == 2
+        assert all(c._session is None for c in clients)
+        assert len(backend._stream_clients) == 0
+
+    async def test_thread_session_is_not_resumed_implicitly(self, backend, soul_server):
+        soul_server.n_deltas = 0
+        backend._session_manager.get.return_value = MagicMock(session_id="sess-thread")
+
+        [e async for e in soulstream.stream(prompt="hi", channel="C1", thread_ts="1.0")]
+        [e async for e in soulstream.stream(
+            prompt="hi", channel="C1", thread_ts="1.0", session_id="sess-explicit",
+        )]
+        await backend.close_stream_client()
+
+        assert soul_server.requests[0].get("agent_session_id") is None
+        assert soul_server.requests[1]["agent_session_id"] == "sess-explicit"
+
+    async def test_server_error_becomes_error_event(self, backend):
+        backend._client_factory = lambda: SoulServiceClient(base_url="http://127.0.0.1:9")
+        events = [e async for e in soulstream.stream(prompt="hi", channel="C1", thread_ts="1.0")]
+        assert [e.type for e in events] == [StreamEventType.ERROR]
+        await backend.close_stream_client()